@@ -55,18 +55,15 @@ class DocumentComparator:
         """문서 간 공통적으로 등장하는 콘텐츠 탐색."""
         logger.info("🔍 문서 간 공통 콘텐츠 분석 시작...")
 
+        # 블록 쌍을 비교하는 카티전 자기 조인 대신 content별로 한 번 그룹화합니다.
+        # 근사 중복(MinHash/LSH) 탐지는 src.analysis.document_compare를 사용하세요.
         query = """
-        MATCH (p1:Page)-[:HAS_BLOCK]->(b1:Block)
-        MATCH (p2:Page)-[:HAS_BLOCK]->(b2:Block)
-        WHERE p1.id < p2.id  // 중복 쌍 제거 및 자기 자신 비교 제외
-          AND b1.content = b2.content
-          AND b1.content IS NOT NULL 
-          AND b1.content <> ''
-          AND size(b1.content) > 10  // 너무 짧은 콘텐츠 제외
-        
-        WITH b1.content AS content, collect(DISTINCT p1.title) + collect(DISTINCT p2.title) AS pages, count(*) as match_count
+        MATCH (p:Page)-[:HAS_BLOCK]->(:Block)-[:HAS_CHILD*0..]->(b:Block)
+        WHERE b.content IS NOT NULL
+          AND size(b.content) > 10  // 너무 짧은 콘텐츠 제외
+        WITH b.content AS content, collect(DISTINCT p.title) AS pages
         WHERE size(pages) > 1
-        
+
         RETURN content, pages, size(pages) as page_count
         ORDER BY page_count DESC, size(content) DESC
         LIMIT 10
@@ -1,10 +1,20 @@
-"""Import Pipeline module."""
+"""Import Pipeline module.
 
+``NOTION_SYNC_MODE=incremental`` 이면 DB를 초기화하지 않고 변경분만 반영합니다.
+페이지의 ``last_edited_time`` 워터마크가 같으면 블록 조회를 건너뛰고, 변경된
+페이지는 블록별 콘텐츠 해시를 저장된 해시와 비교해 삽입/수정/삭제만 기록한 뒤
+``rules_dirty`` 로 표시하여 ``src.graph.builder`` 가 해당 페이지의 규칙만
+다시 추출·임베딩·연결하도록 합니다.
+"""
+
+import hashlib
+import json
 import logging
 import os
 import re
 from contextlib import contextmanager
-from typing import Any, Dict, List
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 from dotenv import load_dotenv
 from neo4j import GraphDatabase, Session
@@ -32,6 +42,68 @@ class DataValidator:
         return not ("id" not in block or "type" not in block)
 
 
+def block_hash(block_data: Dict[str, Any]) -> str:
+    """블록 콘텐츠 해시 (타입/내용/트리 위치 포함)."""
+    raw = json.dumps(
+        [
+            block_data["type"],
+            block_data["content"],
+            block_data["parent_id"],
+            block_data["prev_sibling_id"],
+            block_data["order"],
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def page_hash(blocks_data: List[Dict[str, Any]]) -> str:
+    """페이지 전체 블록 해시를 순서대로 합친 페이지 콘텐츠 해시."""
+    digest = hashlib.sha256()
+    for block_data in blocks_data:
+        digest.update(block_data["id"].encode("utf-8"))
+        digest.update(block_data["hash"].encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class BlockDiff:
+    """저장된 블록 해시와 추출된 블록 트리의 차이."""
+
+    inserts: List[Dict[str, Any]] = field(default_factory=list)
+    updates: List[Dict[str, Any]] = field(default_factory=list)
+    deletes: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> bool:
+        """삽입/수정/삭제가 하나라도 있는지 여부."""
+        return bool(self.inserts or self.updates or self.deletes)
+
+    @property
+    def touched_ids(self) -> List[str]:
+        """삽입/수정된 블록 ID (교차 참조 재계산 대상)."""
+        return [b["id"] for b in self.inserts + self.updates]
+
+    @classmethod
+    def compute(
+        cls, stored: Dict[str, Optional[str]], blocks_data: List[Dict[str, Any]]
+    ) -> "BlockDiff":
+        """저장된 ``{block_id: hash}`` 와 새 블록 목록을 비교."""
+        diff = cls()
+        seen: Set[str] = set()
+        for block_data in blocks_data:
+            seen.add(block_data["id"])
+            if block_data["id"] not in stored:
+                diff.inserts.append(block_data)
+            elif stored[block_data["id"]] != block_data["hash"]:
+                diff.updates.append(block_data)
+            else:
+                diff.unchanged += 1
+        diff.deletes = [block_id for block_id in stored if block_id not in seen]
+        return diff
+
+
 class NotionExtractor:
     """Notion 데이터 추출 클래스."""
 
@@ -137,38 +209,58 @@ class Neo4jAuraImporter:
     def import_page(self, page_data: Dict[str, Any], blocks: List[Dict[str, Any]]):
         """페이지와 블록 전체 임포트."""
         page_id = page_data["id"].replace("-", "")
-        title = "Untitled"
+        logger.info(f"📥 페이지 임포트 시작: {self._page_title(page_data)} ({page_id})")
+
+        with self.session_context() as session:
+            # 1. 페이지 노드 생성 (다음 증분 동기화의 기준 해시/워터마크 포함)
+            blocks_data = self._flatten_blocks(page_id, blocks)
+            self._upsert_page(session, page_data, page_hash(blocks_data))
+
+            # 2. 블록 임포트 (반복적 방식)
+            for batch in self._batches(blocks_data, self.BATCH_SIZE):
+                self._batch_create_blocks(session, batch)
 
-        # 제목 추출
+    @staticmethod
+    def _page_title(page_data: Dict[str, Any]) -> str:
+        title = "Untitled"
         props = page_data.get("properties", {})
         title_prop = props.get("title") or props.get("Name")
         if title_prop and "title" in title_prop:
             title = "".join([t["plain_text"] for t in title_prop["title"]])
+        return title
+
+    def _upsert_page(
+        self,
+        session: Session,
+        page_data: Dict[str, Any],
+        content_hash: str,
+        rules_dirty: bool = False,
+    ):
+        session.run(
+            """
+            MERGE (p:Page {id: $id})
+            SET p.title = $title,
+                p.url = $url,
+                p.updated_at = datetime(),
+                p.last_edited_time = $last_edited_time,
+                p.content_hash = $content_hash,
+                p.rules_dirty = coalesce(p.rules_dirty, false) OR $rules_dirty
+        """,
+            id=page_data["id"].replace("-", ""),
+            title=self._page_title(page_data),
+            url=page_data.get("url", ""),
+            last_edited_time=page_data.get("last_edited_time"),
+            content_hash=content_hash,
+            rules_dirty=rules_dirty,
+        )
 
-        url = page_data.get("url", "")
-
-        logger.info(f"📥 페이지 임포트 시작: {title} ({page_id})")
-
-        with self.session_context() as session:
-            # 1. 페이지 노드 생성
-            session.run(
-                """
-                MERGE (p:Page {id: $id})
-                SET p.title = $title,
-                    p.url = $url,
-                    p.updated_at = datetime()
-            """,
-                id=page_id,
-                title=title,
-                url=url,
-            )
-
-            # 2. 블록 임포트 (반복적 방식)
-            self._import_blocks_iterative(session, page_id, blocks)
+    @staticmethod
+    def _batches(items: List[Any], size: int) -> Iterator[List[Any]]:
+        for i in range(0, len(items), size):
+            yield items[i : i + size]
 
-    def _import_blocks_iterative(
-        self, session: Session, page_id: str, blocks: List[Dict]
-    ):
+    def _flatten_blocks(self, page_id: str, blocks: List[Dict]) -> List[Dict]:
+        """블록 트리를 부모 우선(pre-order) 순서의 행 목록으로 변환."""
         # 원본 순서 유지: order는 입력 순서 기준, 스택 push만 역순
         top_level = [(idx, block) for idx, block in enumerate(blocks)]
         stack = [(block, None, None, 0, idx) for idx, block in reversed(top_level)]
@@ -190,18 +282,18 @@ class Neo4jAuraImporter:
                     [t["plain_text"] for t in block[block_type]["rich_text"]]
                 )
 
-            processed_blocks.append(
-                {
-                    "id": block_id,
-                    "type": block_type,
-                    "content": content,
-                    "parent_id": parent_id,
-                    "page_id": page_id if parent_id is None else None,
-                    "prev_sibling_id": prev_sibling_id,
-                    "depth": depth,
-                    "order": order,
-                }
-            )
+            block_data = {
+                "id": block_id,
+                "type": block_type,
+                "content": content,
+                "parent_id": parent_id,
+                "page_id": page_id if parent_id is None else None,
+                "prev_sibling_id": prev_sibling_id,
+                "depth": depth,
+                "order": order,
+            }
+            block_data["hash"] = block_hash(block_data)
+            processed_blocks.append(block_data)
 
             if block.get("children"):
                 children = block["children"]
@@ -226,12 +318,86 @@ class Neo4jAuraImporter:
                         (child, block_id, prev_map.get(child_idx), depth + 1, child_idx)
                     )
 
-            if len(processed_blocks) >= self.BATCH_SIZE:
-                self._batch_create_blocks(session, processed_blocks)
-                processed_blocks = []
+        return processed_blocks
 
-        if processed_blocks:
-            self._batch_create_blocks(session, processed_blocks)
+    def get_page_state(self, page_id: str) -> Dict[str, Any]:
+        """저장된 페이지 워터마크(last_edited_time)와 콘텐츠 해시 조회."""
+        with self.session_context() as session:
+            record = session.run(
+                """
+                MATCH (p:Page {id: $id})
+                RETURN p.last_edited_time AS last_edited_time,
+                       p.content_hash AS content_hash
+                """,
+                id=page_id.replace("-", ""),
+            ).single()
+        return dict(record) if record else {}
+
+    def _fetch_block_hashes(
+        self, session: Session, page_id: str
+    ) -> Dict[str, Optional[str]]:
+        """페이지에 속한 모든 블록의 저장된 해시를 한 번에 조회."""
+        result = session.run(
+            """
+            MATCH (:Page {id: $page_id})-[:HAS_BLOCK]->(:Block)-[:HAS_CHILD*0..]->(b:Block)
+            RETURN DISTINCT b.id AS id, b.hash AS hash
+            """,
+            page_id=page_id,
+        )
+        return {record["id"]: record["hash"] for record in result}
+
+    def sync_page(
+        self, page_data: Dict[str, Any], blocks: List[Dict[str, Any]]
+    ) -> BlockDiff:
+        """변경된 블록만 반영하는 증분 임포트.
+
+        저장된 블록 해시와 비교해 삭제 → 수정 → 삽입 순서로 기록합니다.
+        수정된 블록은 트리 관계(HAS_BLOCK/HAS_CHILD/NEXT)와 MENTIONS를 먼저
+        끊고 다시 연결하므로 부모나 순서가 바뀐 경우도 처리됩니다.
+        """
+        page_id = page_data["id"].replace("-", "")
+        blocks_data = self._flatten_blocks(page_id, blocks)
+        content_hash = page_hash(blocks_data)
+
+        with self.session_context() as session:
+            diff = BlockDiff.compute(
+                self._fetch_block_hashes(session, page_id), blocks_data
+            )
+            # 최상위 블록의 HAS_BLOCK 연결을 위해 페이지 노드를 먼저 갱신합니다.
+            self._upsert_page(
+                session, page_data, content_hash, rules_dirty=diff.changed
+            )
+            for batch in self._batches(diff.deletes, self.BATCH_SIZE):
+                session.run(
+                    """
+                    UNWIND $ids AS id
+                    MATCH (b:Block {id: id})
+                    DETACH DELETE b
+                    """,
+                    ids=batch,
+                )
+            for batch in self._batches(diff.updates, self.BATCH_SIZE):
+                session.run(
+                    """
+                    UNWIND $ids AS id
+                    MATCH (b:Block {id: id})
+                    OPTIONAL MATCH (b)<-[r:HAS_BLOCK|HAS_CHILD|NEXT]-()
+                    OPTIONAL MATCH (b)-[m:MENTIONS]->()
+                    DELETE r, m
+                    """,
+                    ids=[b["id"] for b in batch],
+                )
+            # 블록 목록이 부모 우선 순서이므로 부모가 항상 먼저 생성됩니다.
+            touched_ids = set(diff.touched_ids)
+            touched = [b for b in blocks_data if b["id"] in touched_ids]
+            for batch in self._batches(touched, self.BATCH_SIZE):
+                self._batch_create_blocks(session, batch)
+
+        logger.info(
+            f"   - 증분 동기화: 삽입 {len(diff.inserts)}, 수정 {len(diff.updates)}, "
+            f"삭제 {len(diff.deletes)}, 변경 없음 {diff.unchanged}"
+        )
+        return diff
 
     def _batch_create_blocks(self, session: Session, blocks_data: List[Dict]):
         """블록 배치 생성 및 관계 설정."""
@@ -241,7 +407,8 @@ class Neo4jAuraImporter:
         SET b.type = block_data.type,
             b.content = block_data.content,
             b.depth = block_data.depth,
-            b.order = block_data.order
+            b.order = block_data.order,
+            b.hash = block_data.hash
         
         // 페이지 연결 (최상위 블록인 경우)
         WITH b, block_data
@@ -273,47 +440,51 @@ class Neo4jAuraImporter:
         """
         session.run(query, blocks=blocks_data)
 
-    def create_cross_references(self):
-        """페이지 간 교차 참조(멘션) 관계 생성."""
-        pattern = re.compile(self.NOTION_URL_PATTERN)
+    def create_cross_references(self, block_ids: Optional[List[str]] = None):
+        """페이지 간 교차 참조(멘션) 관계 생성.
 
+        Args:
+            block_ids: 지정 시 해당 블록(증분 동기화에서 삽입/수정된 블록)만 처리.
+        """
         with self.session_context() as session:
-            offset = 0
             total_refs = 0
 
-            while True:
-                result = session.run(
-                    """
-                    MATCH (b:Block)
-                    WHERE b.content CONTAINS 'notion.so'
-                    RETURN b.id AS block_id, b.content AS content
-                    ORDER BY b.id
-                    SKIP $offset
-                    LIMIT $limit
-                """,
-                    offset=offset,
-                    limit=self.REFERENCE_BATCH_SIZE,
-                )
-
-                records = list(result)
-                if not records:
-                    break
-
-                references = []
-                for record in records:
-                    block_id = record["block_id"]
-                    content = record["content"]
+            if block_ids is not None:
+                for batch in self._batches(block_ids, self.REFERENCE_BATCH_SIZE):
+                    result = session.run(
+                        """
+                        UNWIND $ids AS id
+                        MATCH (b:Block {id: id})
+                        WHERE b.content CONTAINS 'notion.so'
+                        RETURN b.id AS block_id, b.content AS content
+                    """,
+                        ids=batch,
+                    )
+                    total_refs += self._link_references(session, list(result))
+            else:
+                offset = 0
+                while True:
+                    result = session.run(
+                        """
+                        MATCH (b:Block)
+                        WHERE b.content CONTAINS 'notion.so'
+                        RETURN b.id AS block_id, b.content AS content
+                        ORDER BY b.id
+                        SKIP $offset
+                        LIMIT $limit
+                    """,
+                        offset=offset,
+                        limit=self.REFERENCE_BATCH_SIZE,
+                    )
 
-                    for page_id_raw in pattern.findall(content):
-                        clean_id = page_id_raw.replace("-", "")
-                        references.append({"block_id": block_id, "page_id": clean_id})
+                    records = list(result)
+                    if not records:
+                        break
 
-                if references:
-                    session.execute_write(self._create_references_tx, references)
-                    total_refs += len(references)
+                    total_refs += self._link_references(session, records)
 
-                offset += self.REFERENCE_BATCH_SIZE
-                logger.info(f"   참조 처리 중... ({offset}개 블록 완료)")
+                    offset += self.REFERENCE_BATCH_SIZE
+                    logger.info(f"   참조 처리 중... ({offset}개 블록 완료)")
 
             logger.info(
                 "✅ 교차 참조 %d개 생성 완료" % total_refs
@@ -321,6 +492,21 @@ class Neo4jAuraImporter:
                 else "ℹ️  교차 참조 없음"
             )
 
+    def _link_references(self, session: Session, records: List[Any]) -> int:
+        pattern = re.compile(self.NOTION_URL_PATTERN)
+        references = []
+        for record in records:
+            block_id = record["block_id"]
+            content = record["content"]
+
+            for page_id_raw in pattern.findall(content):
+                clean_id = page_id_raw.replace("-", "")
+                references.append({"block_id": block_id, "page_id": clean_id})
+
+        if references:
+            session.execute_write(self._create_references_tx, references)
+        return len(references)
+
     @staticmethod
     def _create_references_tx(tx, references):
         query = """
@@ -332,6 +518,42 @@ class Neo4jAuraImporter:
         tx.run(query, refs=references)
 
 
+def import_pages(
+    extractor: NotionExtractor,
+    importer: Neo4jAuraImporter,
+    page_ids: List[str],
+    incremental: bool,
+) -> List[str]:
+    """페이지별 추출 및 임포트. 증분 모드에서 삽입/수정된 블록 ID를 반환."""
+    touched_blocks: List[str] = []
+    for page_id in page_ids:
+        logger.info(f"🔄 처리 중: {page_id}")
+
+        # Notion 데이터 추출
+        page_data = extractor.get_page(page_id)
+        if not page_data:
+            continue
+
+        if incremental:
+            state = importer.get_page_state(page_id)
+            watermark = page_data.get("last_edited_time")
+            if watermark and state.get("last_edited_time") == watermark:
+                logger.info("   - 변경 없음 (last_edited_time 동일), 건너뜀")
+                continue
+
+        blocks = extractor.get_blocks(page_id)
+        logger.info(f"   - 블록 {len(blocks)}개 추출 완료")
+
+        # Neo4j 임포트
+        if incremental:
+            diff = importer.sync_page(page_data, blocks)
+            touched_blocks.extend(diff.touched_ids)
+        else:
+            importer.import_page(page_data, blocks)
+        logger.info("   - Neo4j 저장 완료")
+    return touched_blocks
+
+
 def main():
     """Notion 데이터 가져오기 및 Neo4j 저장 메인 함수."""
     # 환경 변수 확인
@@ -340,6 +562,7 @@ def main():
     neo4j_uri = os.environ.get("NEO4J_URI")
     neo4j_user = os.environ.get("NEO4J_USER", "neo4j")
     neo4j_password = os.environ.get("NEO4J_PASSWORD")
+    incremental = os.environ.get("NOTION_SYNC_MODE", "full").lower() == "incremental"
 
     if not all([notion_token, page_ids_str, neo4j_uri, neo4j_password]):
         logger.error("❌ 필수 환경 변수가 누락되었습니다 (.env 확인 필요)")
@@ -352,29 +575,17 @@ def main():
     importer = Neo4jAuraImporter(neo4j_uri, (neo4j_user, neo4j_password))
 
     try:
-        # 1. DB 초기화 및 스키마 설정
-        importer.clear_database()
+        # 1. DB 초기화 및 스키마 설정 (증분 모드는 기존 그래프 유지)
+        if not incremental:
+            importer.clear_database()
         importer.create_constraints()
 
         # 2. 페이지별 데이터 추출 및 임포트
-        for page_id in page_ids:
-            logger.info(f"🔄 처리 중: {page_id}")
-
-            # Notion 데이터 추출
-            page_data = extractor.get_page(page_id)
-            if not page_data:
-                continue
-
-            blocks = extractor.get_blocks(page_id)
-            logger.info(f"   - 블록 {len(blocks)}개 추출 완료")
-
-            # Neo4j 임포트
-            importer.import_page(page_data, blocks)
-            logger.info("   - Neo4j 저장 완료")
+        touched_blocks = import_pages(extractor, importer, page_ids, incremental)
 
         # 3. 교차 참조 생성
         logger.info("🔗 교차 참조(Mentions) 연결 중...")
-        importer.create_cross_references()
+        importer.create_cross_references(touched_blocks if incremental else None)
 
         logger.info("🎉 모든 작업이 성공적으로 완료되었습니다!")
 
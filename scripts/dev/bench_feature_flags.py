@@ -0,0 +1,80 @@
+"""Hot-path benchmark for feature flag evaluation.
+
+Compares the previous per-call evaluation (raw dict lookups plus a SHA-256
+hash on every call) with the compiled table in ``FeatureFlags`` on the flags
+shipped in ``config/feature_flags.json``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from src.infra.feature_flags import FeatureFlags
+
+
+def _legacy_is_enabled(
+    flags: dict[str, Any], flag_name: str, user_id: str | None
+) -> bool:
+    flag = flags.get(flag_name)
+    if not flag or not flag.get("enabled", False):
+        return False
+    allowed_envs = flag.get("environments", ["development", "staging", "production"])
+    if os.getenv("ENVIRONMENT", "development") not in allowed_envs:
+        return False
+    whitelist = flag.get("whitelist", [])
+    if whitelist:
+        return user_id in whitelist
+    rollout_percent = flag.get("rollout_percent", 100)
+    if rollout_percent < 100:
+        if not user_id:
+            return False
+        user_hash = int(
+            hashlib.sha256(f"{flag_name}:{user_id}".encode()).hexdigest(), 16
+        )
+        if user_hash % 100 >= rollout_percent:
+            return False
+    return True
+
+
+def _time(label: str, fn: Any, calls: int) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {elapsed * 1e9 / calls:>10.0f} ns/call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Feature flag evaluation benchmark")
+    parser.add_argument("--calls", type=int, default=200_000, help="Evaluations.")
+    parser.add_argument("--users", type=int, default=1_000, help="Distinct users.")
+    parser.add_argument(
+        "--config", type=Path, default=Path("config/feature_flags.json")
+    )
+    args = parser.parse_args()
+
+    flags = FeatureFlags(config_file=args.config)
+    names = list(flags.flags) or ["missing"]
+    users = [f"user-{i}" for i in range(args.users)]
+    pairs = [(names[i % len(names)], users[i % len(users)]) for i in range(args.calls)]
+
+    def legacy() -> None:
+        raw = flags.flags
+        for name, user in pairs:
+            _legacy_is_enabled(raw, name, user)
+
+    def compiled() -> None:
+        for name, user in pairs:
+            flags.is_enabled(name, user_id=user)
+
+    print(f"\nFeature flag evaluation ({args.calls} calls, {args.users} users)")
+    _time("legacy", legacy, args.calls)
+    _time("compiled", compiled, args.calls)
+
+
+if __name__ == "__main__":
+    main()
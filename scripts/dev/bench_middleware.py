@@ -0,0 +1,171 @@
+"""Throughput and streaming TTFB benchmark for the web middleware chain.
+
+Compares the previous stack of four ``BaseHTTPMiddleware`` layers (session,
+request-id, error logging, performance logging) with the pure ASGI chain
+(``SessionMiddleware`` + ``ObservabilityMiddleware``) on a minimal FastAPI
+app. Requests are driven straight through the ASGI interface so the numbers
+exclude any HTTP client or server overhead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import AsyncIterator
+from time import perf_counter
+from typing import Any
+from uuid import uuid4
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import ASGIApp, Message
+
+from src.web.middleware import ObservabilityMiddleware
+from src.web.session import SessionManager, SessionMiddleware, session_middleware
+
+
+async def _legacy_request_id(
+    request: Request, call_next: RequestResponseEndpoint
+) -> Response:
+    req_id = request.headers.get("X-Request-Id") or uuid4().hex
+    request.state.request_id = req_id
+    response = await call_next(request)
+    response.headers["X-Request-Id"] = req_id
+    return response
+
+
+async def _legacy_errors(
+    request: Request, call_next: RequestResponseEndpoint
+) -> Response:
+    try:
+        return await call_next(request)
+    except Exception:  # noqa: BLE001
+        return JSONResponse(status_code=500, content={"detail": "error"})
+
+
+async def _legacy_timing(
+    request: Request, call_next: RequestResponseEndpoint
+) -> Response:
+    start = perf_counter()
+    response = await call_next(request)
+    response.headers["X-Response-Time"] = f"{(perf_counter() - start) * 1000:.2f}ms"
+    return response
+
+
+def _build_app(variant: str, chunk_delay: float) -> FastAPI:
+    app = FastAPI()
+    manager = SessionManager()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str) -> dict[str, str]:
+        return {"item_id": item_id}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[str]:
+            yield "data: first\n\n"
+            for i in range(3):
+                await asyncio.sleep(chunk_delay)
+                yield f"data: {i}\n\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    if variant == "legacy":
+        app.add_middleware(BaseHTTPMiddleware, dispatch=session_middleware(manager))
+        app.add_middleware(BaseHTTPMiddleware, dispatch=_legacy_request_id)
+        app.add_middleware(BaseHTTPMiddleware, dispatch=_legacy_errors)
+        app.add_middleware(BaseHTTPMiddleware, dispatch=_legacy_timing)
+    else:
+        app.add_middleware(SessionMiddleware, manager=manager)
+        app.add_middleware(ObservabilityMiddleware, slow_request_ms=float("inf"))
+    return app
+
+
+async def _request(app: ASGIApp, path: str) -> tuple[float, float]:
+    """Return (time to first non-empty body chunk, total time) for one GET."""
+    scope: dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    sent = False
+    start = perf_counter()
+    first_byte = 0.0
+
+    async def receive() -> Message:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal first_byte
+        if message["type"] == "http.response.body" and message.get("body"):
+            first_byte = first_byte or perf_counter() - start
+
+    await app(scope, receive, send)
+    return first_byte, perf_counter() - start
+
+
+async def _throughput(app: ASGIApp, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            await _request(app, f"/items/{i}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+async def _ttfb(app: ASGIApp, samples: int) -> float:
+    results = [await _request(app, "/stream") for _ in range(samples)]
+    return statistics.median(first for first, _ in results) * 1000
+
+
+async def _run(args: argparse.Namespace) -> None:
+    print("\nMiddleware chain benchmark")
+    print(f"{'variant':<8} {'req/s':>10} {'stream TTFB (ms)':>18}")
+    for variant in ("legacy", "fused"):
+        app = _build_app(variant, args.chunk_delay)
+        await _throughput(app, 50, args.concurrency)  # warm-up
+        rps = await _throughput(app, args.requests, args.concurrency)
+        ttfb = await _ttfb(app, args.stream_samples)
+        print(f"{variant:<8} {rps:>10.0f} {ttfb:>18.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Middleware chain benchmark")
+    parser.add_argument("--requests", type=int, default=2000, help="JSON requests.")
+    parser.add_argument(
+        "--concurrency", type=int, default=50, help="Concurrent requests."
+    )
+    parser.add_argument(
+        "--stream-samples", type=int, default=10, help="Streaming requests."
+    )
+    parser.add_argument(
+        "--chunk-delay",
+        type=float,
+        default=0.05,
+        help="Seconds between SSE chunks after the first one.",
+    )
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
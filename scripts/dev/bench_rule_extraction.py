@@ -0,0 +1,256 @@
+"""Benchmark legacy N+1 vs bulk block-tree rule extraction.
+
+Generates a Notion-like block fixture (50k blocks by default) and runs
+``QAGraphBuilder.extract_rules_from_notion`` against an in-memory fake driver
+that charges a fixed latency per query round-trip. The legacy strategy
+(siblings query per heading + ``HAS_CHILD*`` query per column block) is
+replayed on the same fixture for comparison; both must write the same rules.
+
+Usage:
+    python -m scripts.dev.bench_rule_extraction --blocks 50000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+import types
+from typing import Any
+
+from typing_extensions import Self
+
+from src.graph.builder import QAGraphBuilder
+
+RULE_TYPES = ("paragraph", "bulleted_list_item", "callout")
+
+
+def make_fixture(blocks: int, pages: int) -> dict[str, list[dict[str, Any]]]:
+    """Return page id -> block rows (``parent_id`` None for top-level)."""
+    per_page = max(1, blocks // pages)
+    fixture: dict[str, list[dict[str, Any]]] = {}
+    for p in range(pages):
+        rows: list[dict[str, Any]] = []
+        order = 0
+        while len(rows) < per_page:
+            rows.append(
+                _row(None, f"{p}-{order}", "heading_1", f"자주 틀리는 {order}", order)
+            )
+            for i in range(4):
+                rows.append(
+                    _row(
+                        None,
+                        f"{p}-{order}-{i}",
+                        RULE_TYPES[i % 3],
+                        f"페이지 {p} 규칙 {order}-{i}",
+                        order + 1 + i,
+                    )
+                )
+            col = f"{p}-{order}-col"
+            rows.append(_row(None, col, "column_list", None, order + 5))
+            for c in range(2):
+                column = f"{col}-{c}"
+                rows.append(_row(col, column, "column", None, c))
+                for i in range(3):
+                    rows.append(
+                        _row(
+                            column,
+                            f"{column}-{i}",
+                            "paragraph",
+                            f"페이지 {p} 중첩 {order}-{c}-{i}",
+                            i,
+                        )
+                    )
+            order += 6
+        fixture[f"page-{p}"] = rows
+    return fixture
+
+
+def _row(
+    parent: str | None, block_id: str, block_type: str, content: str | None, order: int
+) -> dict[str, Any]:
+    return {
+        "parent_id": parent,
+        "id": block_id,
+        "type": block_type,
+        "content": content,
+        "order": order,
+    }
+
+
+class FakeDriver:
+    """Answers the builder's queries from the fixture with per-query latency."""
+
+    def __init__(
+        self, fixture: dict[str, list[dict[str, Any]]], latency: float
+    ) -> None:
+        self.fixture = fixture
+        self.latency = latency
+        self.queries = 0
+        self.written: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._children: dict[str, list[dict[str, Any]]] = {}
+        for rows in fixture.values():
+            for row in rows:
+                if row["parent_id"] is not None:
+                    self._children.setdefault(row["parent_id"], []).append(row)
+
+    def session(self) -> FakeSession:
+        return FakeSession(self)
+
+    def descendants(self, block_id: str) -> list[dict[str, Any]]:
+        out: list[dict[str, Any]] = []
+        stack = list(self._children.get(block_id, []))
+        while stack:
+            row = stack.pop()
+            out.append(row)
+            stack.extend(self._children.get(row["id"], []))
+        return out
+
+
+class FakeSession:
+    def __init__(self, driver: FakeDriver) -> None:
+        self.driver = driver
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def run(self, query: str, **params: Any) -> Any:
+        driver = self.driver
+        with driver._lock:
+            driver.queries += 1
+        time.sleep(driver.latency)
+        if "자주 틀리는" in query:
+            rows = [
+                {"page_id": pid, "start_order": r["order"], "section": r["content"]}
+                for pid, page in driver.fixture.items()
+                for r in page
+                if r["parent_id"] is None and r["type"] == "heading_1"
+            ]
+            return types.SimpleNamespace(data=lambda: rows)
+        if "UNION ALL" in query:
+            page = driver.fixture[params["page_id"]]
+            top = [r for r in page if r["parent_id"] is None]
+            roots = [r["id"] for r in top if r["type"] in ("column_list", "column")]
+            return top + [d for root in roots for d in driver.descendants(root)]
+        if "WHERE b.order > $start_order" in query:
+            page = driver.fixture[params["page_id"]]
+            top = [
+                r
+                for r in page
+                if r["parent_id"] is None and r["order"] > params["start_order"]
+            ]
+            return sorted(top, key=lambda r: r["order"])
+        if "HAS_CHILD*]->(d:Block)" in query:
+            return [
+                {"content": d["content"]}
+                for d in driver.descendants(params["id"])
+                if d["type"] in RULE_TYPES
+            ]
+        if "MERGE (r:Rule" in query:
+            driver.written = list(params["batch"])
+        return None
+
+
+class LegacyBuilder(QAGraphBuilder):
+    """Replays the per-heading / per-column query strategy."""
+
+    def extract_rules_from_notion(self, max_workers: int = 1) -> None:
+        with self.driver.session() as session:
+            headings = self._fetch_rule_headings(session)
+            rules_per_heading = [
+                self._collect_rules_for_heading(session, h) for h in headings
+            ]
+            batch = [
+                {"id": text, "text": text, "section": h["section"]}
+                for h, rules in zip(headings, rules_per_heading)
+                for text in rules
+                if text and len(text) > 10
+            ]
+            session.run(
+                "UNWIND $batch AS item MERGE (r:Rule {id: item.id})", batch=batch
+            )
+
+    def _collect_rules_for_heading(
+        self, session: Any, heading: dict[str, Any]
+    ) -> list[str]:
+        rules: list[str] = []
+        siblings = session.run(
+            "MATCH (p:Page {id: $page_id})-[:HAS_BLOCK]->(b:Block) WHERE b.order > $start_order",
+            page_id=heading["page_id"],
+            start_order=heading["start_order"],
+        )
+        for sib in siblings:
+            if sib["type"] == "heading_1":
+                break
+            if sib["type"] in RULE_TYPES:
+                rules.append(sib["content"])
+            elif sib["type"] in ("column_list", "column"):
+                descendants = session.run(
+                    "MATCH (b:Block {id: $id})-[:HAS_CHILD*]->(d:Block)", id=sib["id"]
+                )
+                rules.extend(d["content"] for d in descendants if d["content"])
+        return rules
+
+
+def _run(
+    builder_cls: type[QAGraphBuilder], driver: FakeDriver, workers: int
+) -> tuple[float, int]:
+    builder = builder_cls.__new__(builder_cls)
+    builder.driver = driver  # type: ignore[assignment]
+    start = time.perf_counter()
+    builder.extract_rules_from_notion(max_workers=workers)
+    return time.perf_counter() - start, driver.queries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rule extraction benchmark")
+    parser.add_argument(
+        "--blocks", type=int, default=50_000, help="Total blocks in the fixture."
+    )
+    parser.add_argument("--pages", type=int, default=50, help="Pages in the fixture.")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.002,
+        help="Simulated seconds per query round-trip.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Parallel page sessions for the bulk run.",
+    )
+    args = parser.parse_args()
+
+    fixture = make_fixture(args.blocks, args.pages)
+    total = sum(len(rows) for rows in fixture.values())
+    print(
+        f"fixture: {total} blocks, {args.pages} pages, latency {args.latency * 1000:.1f}ms/query"
+    )
+
+    legacy = FakeDriver(fixture, args.latency)
+    legacy_time, legacy_queries = _run(LegacyBuilder, legacy, 1)
+    print(f"legacy N+1        : {legacy_time:7.2f}s  {legacy_queries:6d} queries")
+
+    results = []
+    for workers in sorted({1, args.workers}):
+        bulk = FakeDriver(fixture, args.latency)
+        elapsed, queries = _run(QAGraphBuilder, bulk, workers)
+        results.append(bulk)
+        print(
+            f"bulk (workers={workers}) : {elapsed:7.2f}s  {queries:6d} queries  speedup {legacy_time / elapsed:5.1f}x"
+        )
+
+    # The legacy HAS_CHILD* query had no ORDER BY, so compare rule multisets.
+    legacy_rules = sorted((r["text"], r["section"]) for r in legacy.written)
+    for bulk in results:
+        assert sorted((r["text"], r["section"]) for r in bulk.written) == legacy_rules
+    print(f"rules: {len(legacy_rules)} (identical across strategies)")
+
+
+if __name__ == "__main__":
+    main()
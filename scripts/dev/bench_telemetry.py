@@ -0,0 +1,60 @@
+"""Per-call overhead benchmark for the tracing decorators.
+
+Times a trivial function bare and wrapped by ``traced``/``measure_latency``
+inside a trace that lost the head sampling coin flip, which is the path most
+calls take once ``TRACE_SAMPLE_RATE`` is below 1. Tail sampling is pushed out
+of reach so the unsampled buffers are always discarded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from src.infra.metrics import measure_latency
+from src.infra.telemetry import TraceSampler, configure_sampling, start_span, traced
+
+
+def _noop() -> None:
+    return None
+
+
+def _per_call_ns(fn: Callable[[], None], calls: int, batch: int) -> float:
+    """Best-of-5 time per call; a root span is reopened every ``batch`` calls."""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter_ns()
+        for _ in range(calls // batch):
+            with start_span("/bench"):
+                for _ in range(batch):
+                    fn()
+        best = min(best, (time.perf_counter_ns() - start) / calls)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tracing decorator overhead")
+    parser.add_argument("--calls", type=int, default=100_000, help="Calls per run.")
+    parser.add_argument(
+        "--batch", type=int, default=100, help="Decorated calls per root span."
+    )
+    args = parser.parse_args()
+
+    cases: dict[str, Callable[[], None]] = {
+        "bare": _noop,
+        "traced": traced("bench.traced")(_noop),
+        "measure": measure_latency("bench.measure")(_noop),  # type: ignore[arg-type]
+    }
+
+    print(f"\nDecorator overhead ({args.calls} calls, {args.batch} per trace)")
+    configure_sampling(TraceSampler(0.0, tail_latency_ms=1e9))
+    baseline = _per_call_ns(cases["bare"], args.calls, args.batch)
+    for label, fn in cases.items():
+        per_call = _per_call_ns(fn, args.calls, args.batch)
+        print(f"{label:<10} {per_call:>8.0f} ns/call  (+{per_call - baseline:.0f} ns)")
+    configure_sampling(None)
+
+
+if __name__ == "__main__":
+    main()
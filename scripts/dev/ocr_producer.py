@@ -1,5 +1,6 @@
 import asyncio
 import sys
+import time
 from pathlib import Path
 
 # Add project root to path
@@ -28,6 +29,7 @@ async def main():
         request_id=f"req-{int(asyncio.get_event_loop().time())}",
         image_path="sample_image.txt",  # Using txt for pilot as per worker logic
         session_id="sess-001",
+        enqueued_at=time.time(),
     )
 
     # Create a dummy file if it doesn't exist
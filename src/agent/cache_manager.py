@@ -16,6 +16,10 @@ from typing import Any, cast
 from src.config import AppConfig
 from src.config.constants import CacheConfig
 from src.core.type_aliases import CachedContentProtocol, CachingModuleProtocol
+from src.infra.file_lock import FileLock, FileLockError
+
+# 여러 프로세스가 매니페스트를 공유할 때 락 대기 상한 (초)
+MANIFEST_LOCK_TIMEOUT_SECONDS = 2.0
 
 
 class CacheManager:
@@ -107,12 +111,29 @@ class CacheManager:
             base = self.config.base_dir / base
         return base / "context_cache.json"
 
+    def _manifest_lock(self, *, shared: bool = False) -> FileLock:
+        """Return a cross-process lock for the manifest file."""
+        return FileLock(
+            self._local_cache_manifest_path(),
+            timeout=MANIFEST_LOCK_TIMEOUT_SECONDS,
+            shared=shared,
+        )
+
     def cleanup_expired_cache(self, ttl_minutes: int) -> None:
         """Remove expired entries from the cache manifest.
 
         Args:
             ttl_minutes: Time‑to‑live in minutes for cache entries.
         """
+        if not self._local_cache_manifest_path().exists():
+            return
+        try:
+            with self._manifest_lock():
+                self._cleanup_expired_locked(ttl_minutes)
+        except FileLockError as e:
+            self.logger.debug("Cache cleanup skipped (lock busy): %s", e)
+
+    def _cleanup_expired_locked(self, ttl_minutes: int) -> None:
         manifest_path = self._local_cache_manifest_path()
         if not manifest_path.exists():
             return
@@ -167,9 +188,12 @@ class CacheManager:
             return None
         self.cleanup_expired_cache(ttl_minutes)
         try:
-            with open(manifest_path, encoding="utf-8") as f:
+            with (
+                self._manifest_lock(shared=True),
+                open(manifest_path, encoding="utf-8") as f,
+            ):
                 data = json.load(f)
-        except (OSError, json.JSONDecodeError) as e:
+        except (OSError, json.JSONDecodeError, FileLockError) as e:
             self.logger.debug("Local cache load skipped: %s", e)
             return None
         entry = data.get(fingerprint)
@@ -208,22 +232,23 @@ class CacheManager:
         """
         manifest_path = self._local_cache_manifest_path()
         manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        data: dict[str, Any] = {}
-        if manifest_path.exists():
-            try:
-                with open(manifest_path, encoding="utf-8") as f:
-                    data = json.load(f)
-            except (OSError, json.JSONDecodeError):
-                data = {}
-        data[fingerprint] = {
-            "name": cache_name,
-            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-            "ttl_minutes": ttl_minutes,
-        }
         try:
-            with open(manifest_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except OSError as e:
+            with self._manifest_lock():
+                data: dict[str, Any] = {}
+                if manifest_path.exists():
+                    try:
+                        with open(manifest_path, encoding="utf-8") as f:
+                            data = json.load(f)
+                    except (OSError, json.JSONDecodeError):
+                        data = {}
+                data[fingerprint] = {
+                    "name": cache_name,
+                    "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                    "ttl_minutes": ttl_minutes,
+                }
+                with open(manifest_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+        except (OSError, FileLockError) as e:
             self.logger.debug("Local cache manifest write skipped: %s", e)
 
     # ---------------------------------------------------------------------
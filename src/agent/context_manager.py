@@ -87,8 +87,10 @@ class AgentContextManager:
             MIN_CACHE_TOKENS,
         )
 
-        # Try to load existing cache from local manifest
-        local_cached = self.load_local_cache(
+        # Try to load existing cache from local manifest (the manifest lock
+        # may wait, so keep it off the event loop)
+        local_cached = await asyncio.to_thread(
+            self.load_local_cache,
             fingerprint,
             ttl_minutes,
             self.agent._caching,
@@ -137,7 +139,9 @@ class AgentContextManager:
                 ttl_minutes,
             )
             try:
-                self.store_local_cache(fingerprint, cache.name, ttl_minutes)
+                await asyncio.to_thread(
+                    self.store_local_cache, fingerprint, cache.name, ttl_minutes
+                )
             except OSError as e:
                 self.agent.logger.debug("Local cache manifest write skipped: %s", e)
             return cache
@@ -240,6 +240,11 @@ class GeminiAgent:
         """Set cache misses count."""
         self._cache_manager.cache_misses = value
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """API 동시성/RPM 제한기 (LATS 등 다른 호출 경로와 공유)."""
+        return self._rate_limiter_module
+
     @property
     def _budget_warned_thresholds(self) -> set[int]:
         """예산 경고 임계치."""
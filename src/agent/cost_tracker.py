@@ -1,6 +1,10 @@
 """비용 추적 모듈.
 
 API 호출 비용 계산 및 예산 관리 기능 제공.
+누적 토큰 합계만 보관하며, 예산 원장(``RedisBudgetLedger``)이 있으면 비용
+증가분을 원장에 반영하고 예산 판정도 원장 합계(전체 워커)로 합니다.
+원장에 접근할 수 없으면 세션 합계로 판정하고, 반영하지 못한 증가분은 다음
+기록 때 다시 더합니다.
 """
 
 from __future__ import annotations
@@ -11,6 +15,7 @@ from typing import TYPE_CHECKING, Any
 
 from src.config import constants as _constants
 from src.config.exceptions import BudgetExceededError
+from src.infra.budget import RedisBudgetLedger, ledger_from_env
 
 if TYPE_CHECKING:
     from src.config import AppConfig
@@ -39,11 +44,16 @@ class CostTracker:
     토큰 사용량에 기반한 비용 계산과 예산 초과 감지를 담당합니다.
     """
 
-    def __init__(self, config: AppConfig) -> None:
+    def __init__(
+        self,
+        config: AppConfig,
+        ledger: RedisBudgetLedger | None = None,
+    ) -> None:
         """CostTracker 초기화.
 
         Args:
             config: 애플리케이션 설정 (모델명, 예산 한도 등)
+            ledger: 프로세스 간 공유 예산 원장 (기본: ``ledger_from_env()``)
         """
         self.config = config
         self.logger = logging.getLogger("GeminiWorkflow")
@@ -51,6 +61,8 @@ class CostTracker:
         self.total_output_tokens = 0
         self._budget_warned_thresholds: set[int] = set()
         self._model_name_override: str | None = None
+        self.ledger = ledger if ledger is not None else ledger_from_env()
+        self._ledger_synced_cost = 0.0
 
     @property
     def model_name(self) -> str:
@@ -71,6 +83,29 @@ class CostTracker:
         """
         self.total_input_tokens += input_tokens
         self.total_output_tokens += output_tokens
+        if self.ledger is not None:
+            self._sync_ledger(self.ledger)
+
+    def _sync_ledger(self, ledger: RedisBudgetLedger) -> None:
+        """마지막 반영 이후 늘어난 비용만 원장에 더합니다."""
+        try:
+            cost = self.get_total_cost()
+        except ValueError:
+            return
+        delta = cost - self._ledger_synced_cost
+        if delta > 0 and ledger.add(delta) is not None:
+            self._ledger_synced_cost = cost
+
+    def _shared_cost(self) -> float | None:
+        return self.ledger.spent_usd() if self.ledger is not None else None
+
+    def get_spent_cost(self) -> float:
+        """예산 판정에 쓰는 비용 (원장이 있으면 전체 워커 합계).
+
+        원장을 읽지 못하면 세션 비용을 반환합니다.
+        """
+        shared = self._shared_cost()
+        return shared if shared is not None else self.get_total_cost()
 
     # Backward compatibility: alias for tests expecting record_usage
     def record_usage(self, input_tokens: int, output_tokens: int) -> None:
@@ -120,7 +155,7 @@ class CostTracker:
         """
         if not self.config.budget_limit_usd:
             return 0.0
-        return (self.get_total_cost() / self.config.budget_limit_usd) * 100
+        return (self.get_spent_cost() / self.config.budget_limit_usd) * 100
 
     def check_budget(self) -> None:
         """예산 초과 여부 확인.
@@ -132,8 +167,9 @@ class CostTracker:
         """
         if not self.config.budget_limit_usd:
             return
-        total = self.get_total_cost()
-        usage_pct = self.get_budget_usage_percent()
+        shared = self._shared_cost()
+        total = shared if shared is not None else self.get_total_cost()
+        usage_pct = (total / self.config.budget_limit_usd) * 100
 
         budget_thresholds = _get_budget_warning_thresholds()
         for threshold, level in budget_thresholds:
@@ -149,7 +185,8 @@ class CostTracker:
                 self._budget_warned_thresholds.add(threshold)
 
         if total > self.config.budget_limit_usd:
+            scope = "Shared" if shared is not None else "Session"
             raise BudgetExceededError(
-                f"Session cost ${total:.4f} exceeded budget "
+                f"{scope} cost ${total:.4f} exceeded budget "
                 f"${self.config.budget_limit_usd:.2f}",
             )
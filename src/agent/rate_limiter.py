@@ -30,6 +30,7 @@ class RateLimiter:
             max_concurrency: Maximum number of concurrent operations.
         """
         self.logger = logging.getLogger("GeminiWorkflow")
+        self.max_concurrency = max_concurrency
         self._semaphore = asyncio.Semaphore(max_concurrency)
         self._rate_limiter: AsyncLimiter | None = None
         self._init_rate_limiter()
@@ -2,91 +2,86 @@
 
 from __future__ import annotations
 
-import asyncio
-from collections.abc import Awaitable, Callable
-from typing import TYPE_CHECKING, Any, cast
-
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_random_exponential,  # Jitter 포함된 exponential backoff
-)
+from typing import TYPE_CHECKING, Any
 
 from src.config.exceptions import APIRateLimitError
+from src.infra.retry import (
+    DEFAULT_HEDGE_QUANTILE,
+    DEFAULT_RETRY_BUDGET_RATIO,
+    HedgePolicy,
+    RetryBudget,
+    RetryEngine,
+    RetryPolicy,
+)
 
 if TYPE_CHECKING:
     from src.agent import GeminiAgent
 
 
+def _setting(agent: Any, name: str, default: float) -> float:
+    """Read a numeric setting from ``agent.config``, tolerating stub configs."""
+    value = getattr(getattr(agent, "config", None), name, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return default
+    return float(value)
+
+
 class RetryHandler:
-    """Isolated retry/backoff logic extracted from `GeminiAgent`."""
+    """Isolated retry/backoff logic extracted from `GeminiAgent`.
+
+    Calls go through one shared ``RetryEngine`` per agent, so the request
+    deadline (``deadline_scope``), hedging on slow responses and the retry
+    budget apply to every Gemini call the agent makes.
+    """
 
     def __init__(self, agent: GeminiAgent) -> None:
         """Initialize the retry handler."""
         self.agent = agent
+        quantile = _setting(agent, "hedge_quantile", DEFAULT_HEDGE_QUANTILE)
+        ratio = _setting(agent, "retry_budget_ratio", DEFAULT_RETRY_BUDGET_RATIO)
+        self.engine = RetryEngine(
+            budget=RetryBudget(ratio),
+            hedge=HedgePolicy(quantile) if 0 < quantile < 1 else None,
+            name="gemini",
+        )
+        self._policy: RetryPolicy | None = None
 
     async def call(self, model: Any, prompt: str) -> str:
         """Execute an API call with retry/backoff."""
-        exceptions = self.agent._google_exceptions()  # noqa: SLF001
-        retry_exceptions = (
-            exceptions.ResourceExhausted,
-            exceptions.ServiceUnavailable,
-            exceptions.DeadlineExceeded,
-            exceptions.Cancelled,
-            TimeoutError,
-        )
-
-        async def _adaptive_backoff(attempt: int) -> None:
-            self.agent.api_retries += 1
-            delay = min(10, 2 * attempt)
-            self.agent.logger.warning(
-                "Retrying API call (attempt=%s, delay=%ss)",
-                attempt,
-                delay,
+        if self._policy is None:
+            exceptions = self.agent._google_exceptions()  # noqa: SLF001
+            self._policy = RetryPolicy(
+                retry_on=(
+                    exceptions.ResourceExhausted,
+                    exceptions.ServiceUnavailable,
+                    exceptions.DeadlineExceeded,
+                    exceptions.Cancelled,
+                    TimeoutError,
+                ),
             )
-            await asyncio.sleep(delay)
-
-        async def _execute_with_retry_raw() -> str:
-            def _get_retry_attempt() -> int:
-                """Extract attempt number from tenacity retry statistics."""
-                retry_obj = getattr(_execute_with_retry_raw, "retry", None)
-                stats_dict: dict[str, Any] = {}
-                if retry_obj is not None and hasattr(retry_obj, "statistics"):
-                    stats_dict = retry_obj.statistics
-                return stats_dict.get("attempt_number", 1) or 1
 
+        async def _execute() -> str:
             limiter = self.agent._rate_limiter  # noqa: SLF001
             semaphore = self.agent._semaphore  # noqa: SLF001
             if limiter:
                 async with limiter, semaphore:
-                    try:
-                        return await self.agent.client.execute(model, prompt)
-                    except retry_exceptions:
-                        attempt = _get_retry_attempt()
-                        await _adaptive_backoff(attempt)
-                        raise
-            async with semaphore:
-                try:
                     return await self.agent.client.execute(model, prompt)
-                except retry_exceptions:
-                    attempt = _get_retry_attempt()
-                    await _adaptive_backoff(attempt)
-                    raise
+            async with semaphore:
+                return await self.agent.client.execute(model, prompt)
 
-        _execute_with_retry = cast(
-            "Callable[[], Awaitable[str]]",
-            retry(
-                stop=stop_after_attempt(3),
-                wait=wait_random_exponential(multiplier=1, max=10),  # Jitter 포함
-                retry=retry_if_exception_type(retry_exceptions),
-                reraise=True,
-            )(_execute_with_retry_raw),
-        )
+        def _on_retry(attempt: int, exc: BaseException, delay: float) -> None:
+            self.agent.api_retries += 1
+            self.agent.logger.warning(
+                "Retrying API call (attempt=%s, delay=%.2fs, error=%s)",
+                attempt,
+                delay,
+                exc.__class__.__name__,
+            )
 
         try:
-            result: str = await _execute_with_retry()
-            return result
+            return await self.engine.run(
+                _execute, policy=self._policy, on_retry=_on_retry
+            )
         except Exception as exc:
             self.agent.api_failures += 1
             self.agent.logger.error(
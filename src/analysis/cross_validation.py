@@ -5,30 +5,86 @@ Validates generated question-answer pairs across multiple dimensions:
 - Groundedness: answer references to source content via Neo4j.
 - Rule compliance: adherence to constraints and error pattern detection.
 - Novelty: avoidance of duplicate questions via vector similarity.
+
+ErrorPattern은 컴파일된 정규식 스냅샷으로 보관하고 일정 간격마다만 다시
+읽으며, 내용 지문이 바뀐 경우에만 다시 컴파일합니다. 여러 쌍을 한 번에
+검증하는 ``validate_many`` 는 참신성 조회를 벡터 쿼리 하나로 묶습니다.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
-from typing import Any
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, TypeVar, overload
 
 from neo4j.exceptions import Neo4jError
 
+from src.infra.kg_registry import shared_for_kg
 from src.qa.rag_system import QAKnowledgeGraph
 
+ERROR_PATTERN_CHECK_INTERVAL_SECONDS = 60.0
+NOVELTY_SIMILARITY_THRESHOLD = 0.95
+
+T = TypeVar("T")
+
+_ERROR_PATTERN_QUERY = """
+MATCH (e:ErrorPattern)
+RETURN e.pattern AS pattern, e.description AS description
+"""
+
+_NOVELTY_QUERY = """
+UNWIND $rows AS row
+CALL db.index.vector.queryNodes($index_name, 1, row.embedding) YIELD score
+RETURN row.i AS i, max(score) AS score
+"""
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+@dataclass(frozen=True)
+class ErrorPatternSnapshot:
+    """컴파일된 ErrorPattern 목록과 그 내용 지문.
+
+    Attributes:
+        version: (pattern, description) 목록의 SHA-1 지문.
+        patterns: (컴파일된 정규식, 설명) 튜플.
+        checked_at: 마지막으로 그래프와 비교한 시각(monotonic).
+    """
+
+    version: str
+    patterns: tuple[tuple[re.Pattern[str], str], ...] = ()
+    checked_at: float = field(default_factory=time.monotonic)
+
 
 class CrossValidationSystem:
     """생성된 질의-답변 쌍을 다각도로 검증합니다."""
 
-    def __init__(self, kg: QAKnowledgeGraph):
+    def __init__(
+        self,
+        kg: QAKnowledgeGraph,
+        pattern_check_interval: float = ERROR_PATTERN_CHECK_INTERVAL_SECONDS,
+    ):
         """Initialize the cross validation system.
 
         Args:
             kg: QAKnowledgeGraph instance for graph queries.
+            pattern_check_interval: ErrorPattern 스냅샷을 다시 확인하기까지의
+                최소 간격(초).
         """
         self.kg = kg
         self.logger = logging.getLogger(__name__)
+        self.pattern_check_interval = pattern_check_interval
+        self._snapshot: ErrorPatternSnapshot | None = None
+        self._snapshot_lock = threading.Lock()
 
     def cross_validate_qa_pair(
         self,
@@ -38,11 +94,49 @@ class CrossValidationSystem:
         image_meta: dict[str, Any],
     ) -> dict[str, Any]:
         """질문과 답변의 일관성/근거/규칙/참신성을 통합 검증합니다."""
+        return self._combine(
+            question,
+            answer,
+            query_type,
+            image_meta,
+            self._check_novelty(question),
+        )
+
+    def validate_many(self, pairs: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+        """여러 질의-답변 쌍을 한 번에 검증합니다.
+
+        Args:
+            pairs: ``question``, ``answer``, ``query_type`` 과 선택적
+                ``image_meta`` 를 가진 매핑 목록.
+
+        Returns:
+            ``cross_validate_qa_pair`` 와 같은 형식의 결과 목록(입력 순서 유지).
+        """
+        novelty = self._check_novelty_many([str(p.get("question", "")) for p in pairs])
+        return [
+            self._combine(
+                str(pair.get("question", "")),
+                str(pair.get("answer", "")),
+                str(pair.get("query_type", "")),
+                dict(pair.get("image_meta") or {}),
+                novelty_result,
+            )
+            for pair, novelty_result in zip(pairs, novelty, strict=True)
+        ]
+
+    def _combine(
+        self,
+        question: str,
+        answer: str,
+        query_type: str,
+        image_meta: dict[str, Any],
+        novelty: dict[str, Any],
+    ) -> dict[str, Any]:
         validation_results = {
             "consistency": self._check_qa_consistency(question, answer),
             "groundedness": self._check_image_grounding(answer, image_meta),
             "rule_compliance": self._check_rule_compliance(answer, query_type),
-            "novelty": self._check_novelty(question),
+            "novelty": novelty,
         }
 
         validation_results["overall_score"] = sum(
@@ -291,7 +385,7 @@ class CrossValidationSystem:
         if (
             constraint.get("type") == "prohibition"
             and pattern
-            and re.search(pattern, answer)
+            and _compile_pattern(pattern).search(answer)
         ):
             return [constraint.get("description", pattern)]
         if constraint_id == "temporal_expression_check":
@@ -303,27 +397,94 @@ class CrossValidationSystem:
         return []
 
     def _collect_error_pattern_violations(self, answer: str) -> list[str]:
+        snapshot = self._error_pattern_snapshot()
+        if snapshot is None:
+            return []
+        return [
+            description
+            for regex, description in snapshot.patterns
+            if regex.search(answer)
+        ]
+
+    def _error_pattern_snapshot(self) -> ErrorPatternSnapshot | None:
+        """ErrorPattern 스냅샷을 반환하고, 확인 간격이 지났으면 갱신합니다.
+
+        조회에 실패하면 직전 스냅샷을 그대로 사용합니다.
+        """
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if (
+            snapshot is not None
+            and now - snapshot.checked_at < self.pattern_check_interval
+        ):
+            return snapshot
+
+        with self._snapshot_lock:
+            snapshot = self._snapshot
+            if (
+                snapshot is not None
+                and now - snapshot.checked_at < self.pattern_check_interval
+            ):
+                return snapshot
+            rows = self._fetch_error_patterns()
+            if rows is None:
+                return snapshot
+            version = hashlib.sha1(
+                "\n".join(f"{p}\t{d}" for p, d in rows).encode("utf-8")
+            ).hexdigest()
+            if snapshot is not None and snapshot.version == version:
+                self._snapshot = ErrorPatternSnapshot(version, snapshot.patterns, now)
+            else:
+                self._snapshot = ErrorPatternSnapshot(
+                    version, self._compile_error_patterns(rows), now
+                )
+                self.logger.debug(
+                    "ErrorPattern snapshot compiled: %d patterns",
+                    len(self._snapshot.patterns),
+                )
+            return self._snapshot
+
+    def invalidate_error_patterns(self) -> None:
+        """다음 검증에서 ErrorPattern을 다시 읽도록 스냅샷을 만료시킵니다."""
+        with self._snapshot_lock:
+            if self._snapshot is not None:
+                self._snapshot = ErrorPatternSnapshot(
+                    self._snapshot.version, self._snapshot.patterns, float("-inf")
+                )
+
+    def _fetch_error_patterns(self) -> list[tuple[str, str]] | None:
         session_ctx = self._get_graph_session_ctx_for_error_patterns()
         if session_ctx is None:
-            return []
+            return None
         try:
             with session_ctx() as session:
                 if session is None:
                     self.logger.debug("ErrorPattern check skipped: graph unavailable")
-                    return []
-                eps = session.run(
-                    """
-                    MATCH (e:ErrorPattern)
-                    RETURN e.pattern AS pattern, e.description AS description
-                    """,
-                )
-                return self._match_error_patterns(answer, eps)
+                    return None
+                return [
+                    (ep.get("pattern"), ep.get("description") or ep.get("pattern"))
+                    for ep in session.run(_ERROR_PATTERN_QUERY)
+                    if ep.get("pattern")
+                ]
         except Neo4jError as exc:
             self.logger.warning("ErrorPattern lookup failed: %s", exc)
-            return []
+            return None
         except Exception as exc:  # noqa: BLE001
             self.logger.warning("ErrorPattern lookup failed (unknown): %s", exc)
-            return []
+            return None
+
+    def _compile_error_patterns(
+        self, rows: list[tuple[str, str]]
+    ) -> tuple[tuple[re.Pattern[str], str], ...]:
+        compiled = ((self._try_compile(p), d) for p, d in rows)
+        return tuple((regex, d) for regex, d in compiled if regex is not None)
+
+    def _try_compile(self, pattern: str) -> re.Pattern[str] | None:
+        try:
+            return _compile_pattern(pattern)
+        except re.error as exc:
+            self.logger.warning("Invalid ErrorPattern %r skipped: %s", pattern, exc)
+            return None
 
     def _get_graph_session_ctx_for_error_patterns(self) -> Any | None:
         graph_session = getattr(self.kg, "graph_session", None)
@@ -335,26 +496,86 @@ class CrossValidationSystem:
             return None
         return graph.session
 
-    def _match_error_patterns(self, answer: str, eps: Any) -> list[str]:
-        violations: list[str] = []
-        for ep in eps:
-            pat = ep.get("pattern")
-            if pat and re.search(pat, answer):
-                violations.append(ep.get("description", pat))
-        return violations
-
     def _check_novelty(self, question: str) -> dict[str, Any]:
         """질문의 참신함(중복 방지)을 간단히 평가합니다."""
+        return self._check_novelty_many([question])[0]
+
+    def _check_novelty_many(self, questions: list[str]) -> list[dict[str, Any]]:
+        """여러 질문의 참신함을 평가합니다.
+
+        Neo4j 벡터 인덱스 스토어이면 임베딩 후 한 번의 쿼리로 모든 질문의
+        최고 유사도를 조회하고, 그 밖의 스토어는 질문별로 검색합니다.
+        """
         store = getattr(self.kg, "_vector_store", None)
         if not store:
-            return {"score": 1.0, "novel": True, "note": "벡터 스토어 없음"}
+            return [
+                {"score": 1.0, "novel": True, "note": "벡터 스토어 없음"}
+                for _ in questions
+            ]
+        if not isinstance(getattr(store, "index_name", None), str):
+            return [self._search_novelty(store, q) for q in questions]
 
+        try:
+            embeddings = store.embeddings.embed_documents(questions)
+            rows = store.query(
+                _NOVELTY_QUERY,
+                params={
+                    "index_name": store.index_name,
+                    "rows": [
+                        {"i": i, "embedding": embedding}
+                        for i, embedding in enumerate(embeddings)
+                    ],
+                },
+            )
+        except Exception as exc:  # noqa: BLE001
+            self.logger.warning("Novelty check failed: %s", exc)
+            return [
+                {"score": 0.5, "novel": False, "note": "유사도 조회 실패"}
+                for _ in questions
+            ]
+
+        scores = {row["i"]: row["score"] or 0.0 for row in rows}
+        return [
+            {"score": 0.3, "too_similar": True}
+            if scores.get(i, 0.0) > NOVELTY_SIMILARITY_THRESHOLD
+            else {"score": 1.0, "novel": True}
+            for i in range(len(questions))
+        ]
+
+    def _search_novelty(self, store: Any, question: str) -> dict[str, Any]:
         try:
             similar = store.similarity_search(question, k=1)
-            if similar and similar[0].metadata.get("similarity", 0) > 0.95:
+            if (
+                similar
+                and similar[0].metadata.get("similarity", 0)
+                > NOVELTY_SIMILARITY_THRESHOLD
+            ):
                 return {"score": 0.3, "too_similar": True}
         except Exception as exc:  # noqa: BLE001
             self.logger.warning("Novelty check failed: %s", exc)
             return {"score": 0.5, "novel": False, "note": "유사도 조회 실패"}
 
         return {"score": 1.0, "novel": True}
+
+
+@overload
+def get_cross_validator(kg: Any) -> CrossValidationSystem: ...
+
+
+@overload
+def get_cross_validator(kg: Any, factory: Callable[[Any], T]) -> T: ...
+
+
+def get_cross_validator(
+    kg: Any, factory: Callable[[Any], Any] = CrossValidationSystem
+) -> Any:
+    """프로세스 전역에서 공유하는 검증기를 반환합니다.
+
+    Args:
+        kg: QAKnowledgeGraph 인스턴스.
+        factory: 검증기 클래스. 호출 측 모듈에서 교체할 수 있도록 받습니다.
+
+    Returns:
+        ``(factory, kg)`` 마다 한 번만 만들어지는 검증기.
+    """
+    return shared_for_kg(kg, factory)
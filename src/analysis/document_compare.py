@@ -5,25 +5,33 @@
 - 드라이버/세션을 컨텍스트로 관리해 자원 정리 보장
 - 블록이 없는 페이지에서 null 타입이 섞이는 문제 방지
 - 공통 콘텐츠 탐색 시 카티전 곱을 피하고 content별 그룹화로 성능/정확도 개선
+- 블록 shingle의 MinHash 서명과 LSH 버킷으로 근사 중복까지 거의 선형 시간에
+  탐지하고, 서명은 ``Block.minhash`` 속성에 저장해 재사용
 """
 
 from __future__ import annotations
 
 import sys
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any
 
 from dotenv import load_dotenv
 from neo4j import GraphDatabase
 from neo4j.exceptions import Neo4jError
 
+from src.analysis.minhash import SIMILARITY_THRESHOLD, MinHasher, cluster_signatures
 from src.config.utils import require_env
 
+MIN_CONTENT_LENGTH = 20
+SIGNATURE_BATCH_SIZE = 500
+
 
 def compare_structure(driver: Any) -> list[dict[str, Any]]:
     """페이지별 블록 구조 요약."""
     query = """
     MATCH (p:Page)
-    OPTIONAL MATCH (p)-[:CONTAINS*]->(b:Block)
+    OPTIONAL MATCH (p)-[:HAS_BLOCK]->(:Block)-[:HAS_CHILD*0..]->(b:Block)
     WITH p, collect(DISTINCT b.type) AS block_types, count(DISTINCT b) AS total_blocks
     RETURN p.title AS title,
            total_blocks AS total_blocks,
@@ -42,23 +50,107 @@ def compare_structure(driver: Any) -> list[dict[str, Any]]:
         ]
 
 
-def find_common_content(driver: Any, limit: int = 10) -> list[tuple[str, list[str]]]:
-    """여러 페이지에서 동일하게 등장하는 블록 콘텐츠 찾기.
+@dataclass
+class _ContentGroup:
+    """정규화된 콘텐츠가 같은 블록 묶음."""
+
+    content: str
+    signature: Sequence[int]
+    pages: dict[str, None] = field(default_factory=dict)
+
+
+def _collect_content_groups(
+    driver: Any, hasher: MinHasher, min_length: int
+) -> tuple[list[_ContentGroup], list[dict[str, Any]]]:
+    """블록을 한 번 스트리밍해 콘텐츠별로 묶고, 갱신할 서명을 모읍니다.
 
-    content별로 그룹화하여 카티전 곱을 피함.
+    저장된 ``b.minhash_key`` 가 현재 콘텐츠/파라미터와 같으면 ``b.minhash`` 를
+    그대로 사용하고, 아니면 새로 계산해 쓰기 대상에 추가합니다.
     """
     query = """
-    MATCH (p:Page)-[:CONTAINS*]->(b:Block)
-    WHERE b.content IS NOT NULL AND size(b.content) > 20
-    WITH b.content AS content, collect(DISTINCT p.title) AS pages
-    WHERE size(pages) > 1
-    RETURN content, pages
-    ORDER BY size(pages) DESC, size(content) DESC
-    LIMIT $limit
+    MATCH (p:Page)-[:HAS_BLOCK]->(:Block)-[:HAS_CHILD*0..]->(b:Block)
+    WHERE b.content IS NOT NULL AND size(b.content) > $min_length
+    RETURN p.title AS title, b.id AS id, b.content AS content,
+           b.minhash AS minhash, b.minhash_key AS minhash_key
+    """
+    groups: dict[str, _ContentGroup] = {}
+    stale: list[dict[str, Any]] = []
+    with driver.session() as session:
+        for record in session.run(query, min_length=min_length):
+            content = record["content"]
+            key = hasher.content_key(content)
+            group = groups.get(key)
+            if group is None:
+                stored = record["minhash"]
+                if record["minhash_key"] == key and stored:
+                    signature: Sequence[int] = stored
+                else:
+                    signature = hasher.signature(content)
+                group = groups[key] = _ContentGroup(content, signature)
+            if record["minhash_key"] != key:
+                stale.append(
+                    {"id": record["id"], "key": key, "minhash": list(group.signature)}
+                )
+            group.pages[record["title"]] = None
+    return list(groups.values()), stale
+
+
+def _store_signatures(driver: Any, rows: list[dict[str, Any]]) -> None:
+    """계산한 서명을 블록 노드 속성으로 저장해 다음 실행에서 재사용합니다."""
+    query = """
+    UNWIND $rows AS row
+    MATCH (b:Block {id: row.id})
+    SET b.minhash = row.minhash, b.minhash_key = row.key
     """
     with driver.session() as session:
-        result = session.run(query, limit=limit)
-        return [(record["content"], record["pages"]) for record in result]
+        for start in range(0, len(rows), SIGNATURE_BATCH_SIZE):
+            session.run(query, rows=rows[start : start + SIGNATURE_BATCH_SIZE])
+
+
+def find_common_content(
+    driver: Any,
+    limit: int = 10,
+    threshold: float = SIMILARITY_THRESHOLD,
+    hasher: MinHasher | None = None,
+) -> list[tuple[str, list[str]]]:
+    """여러 페이지에서 동일하거나 거의 같은 블록 콘텐츠 찾기.
+
+    블록 쌍을 Cypher에서 비교하는 대신 블록별 MinHash 서명을 LSH 버킷으로
+    나눠 후보 쌍만 검증하므로 블록 수에 대해 거의 선형으로 동작합니다.
+
+    Args:
+        driver: Neo4j 드라이버.
+        limit: 반환할 최대 항목 수.
+        threshold: 같은 내용으로 볼 최소 Jaccard 유사도 추정치.
+        hasher: 서명 생성기. 기본값은 ``MinHasher()``.
+
+    Returns:
+        (대표 콘텐츠, 등장 페이지 제목 목록) 쌍. 페이지 수, 콘텐츠 길이 내림차순.
+    """
+    hasher = hasher or MinHasher()
+    groups, stale = _collect_content_groups(driver, hasher, MIN_CONTENT_LENGTH)
+    if stale:
+        _store_signatures(driver, stale)
+
+    clusters = cluster_signatures([g.signature for g in groups], threshold=threshold)
+    clustered = {i for members in clusters for i in members}
+    clusters.extend([i] for i in range(len(groups)) if i not in clustered)
+
+    commons: list[tuple[str, list[str]]] = []
+    for members in clusters:
+        pages: dict[str, None] = {}
+        for i in members:
+            pages.update(groups[i].pages)
+        if len(pages) < 2:
+            continue
+        representative = max(
+            (groups[i] for i in members),
+            key=lambda g: (len(g.pages), len(g.content)),
+        )
+        commons.append((representative.content, list(pages)))
+
+    commons.sort(key=lambda item: (len(item[1]), len(item[0])), reverse=True)
+    return commons[:limit]
 
 
 def main() -> None:
@@ -0,0 +1,200 @@
+"""블록 콘텐츠 근사 중복 탐지를 위한 shingle/MinHash/LSH 엔진.
+
+Cypher에서 블록 쌍을 직접 비교하면 문서 수에 대해 제곱으로 비용이 늘어납니다.
+여기서는 블록마다 문자 shingle 집합의 MinHash 서명을 한 번 계산하고, 서명을
+band 단위로 버킷에 나눠(LSH) 같은 버킷을 공유하는 블록만 후보 쌍으로 검증합니다.
+전체 비용은 블록 수에 대해 거의 선형입니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+
+SHINGLE_SIZE = 5
+NUM_PERM = 64
+LSH_BANDS = 16
+SIMILARITY_THRESHOLD = 0.8
+SIGNATURE_SEED = 1
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_content(text: str) -> str:
+    """소문자화하고 연속 공백을 하나로 줄입니다."""
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def _hash64(data: str) -> int:
+    digest = hashlib.blake2b(data.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[int]:
+    """정규화된 텍스트의 문자 ``size``-gram 해시 집합.
+
+    Args:
+        text: 원본 블록 콘텐츠.
+        size: shingle 길이(문자 수). 텍스트가 더 짧으면 전체를 하나로 사용합니다.
+
+    Returns:
+        64비트 shingle 해시 집합. 빈 텍스트는 빈 집합입니다.
+    """
+    normalized = normalize_content(text)
+    if not normalized:
+        return set()
+    if len(normalized) <= size:
+        return {_hash64(normalized)}
+    return {
+        _hash64(normalized[i : i + size]) for i in range(len(normalized) - size + 1)
+    }
+
+
+class MinHasher:
+    """고정 시드의 ``(a * x + b) mod p`` 순열로 MinHash 서명을 만듭니다.
+
+    Args:
+        num_perm: 서명 길이(순열 수).
+        shingle_size: shingle 길이.
+        seed: 순열 계수 시드. 저장된 서명을 재사용하려면 고정해야 합니다.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = NUM_PERM,
+        shingle_size: int = SHINGLE_SIZE,
+        seed: int = SIGNATURE_SEED,
+    ) -> None:
+        """순열 계수를 준비합니다."""
+        if num_perm <= 0:
+            raise ValueError("num_perm must be positive")
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self._coefficients = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    @property
+    def version(self) -> str:
+        """서명 파라미터 식별자. 파라미터가 바뀌면 저장된 서명을 무효화합니다."""
+        return f"minhash:{self.num_perm}:{self.shingle_size}:{self.seed}"
+
+    def content_key(self, text: str) -> str:
+        """정규화된 콘텐츠와 서명 파라미터에 대한 해시 키."""
+        payload = f"{self.version}\x00{normalize_content(text)}"
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def signature(self, text: str) -> array[int]:
+        """``text`` 의 MinHash 서명(길이 ``num_perm``)."""
+        values = shingles(text, self.shingle_size)
+        if not values:
+            return array("q", [_MERSENNE_PRIME] * self.num_perm)
+        prime = _MERSENNE_PRIME
+        return array(
+            "q",
+            (min((a * x + b) % prime for x in values) for a, b in self._coefficients),
+        )
+
+
+def estimate_jaccard(left: Sequence[int], right: Sequence[int]) -> float:
+    """두 MinHash 서명이 일치하는 비율(Jaccard 유사도 추정치)."""
+    if len(left) != len(right) or not left:
+        raise ValueError("signatures must have the same non-zero length")
+    return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+@dataclass
+class LSHIndex:
+    """band 단위 버킷으로 후보 쌍을 찾는 LSH 인덱스.
+
+    Attributes:
+        bands: 서명을 나눌 band 수. ``num_perm`` 의 약수여야 합니다.
+        buckets: (band 번호, band 값) -> 항목 번호 목록.
+    """
+
+    bands: int = LSH_BANDS
+    buckets: dict[tuple[int, int], list[int]] = field(default_factory=dict)
+
+    def add(self, index: int, signature: Sequence[int]) -> None:
+        """``index`` 번 항목의 서명을 각 band 버킷에 등록합니다."""
+        if len(signature) % self.bands:
+            raise ValueError(
+                f"signature length {len(signature)} is not divisible by {self.bands} bands"
+            )
+        rows = len(signature) // self.bands
+        for band in range(self.bands):
+            key = hash(tuple(signature[band * rows : (band + 1) * rows]))
+            self.buckets.setdefault((band, key), []).append(index)
+
+    def candidate_pairs(self) -> Iterator[tuple[int, int]]:
+        """하나 이상의 버킷을 공유하는 (작은 번호, 큰 번호) 쌍을 중복 없이 반환."""
+        seen: set[tuple[int, int]] = set()
+        for members in self.buckets.values():
+            for i, left in enumerate(members):
+                for right in members[i + 1 :]:
+                    pair = (left, right) if left < right else (right, left)
+                    if pair not in seen:
+                        seen.add(pair)
+                        yield pair
+
+
+def cluster_signatures(
+    signatures: Sequence[Sequence[int]],
+    threshold: float = SIMILARITY_THRESHOLD,
+    bands: int = LSH_BANDS,
+) -> list[list[int]]:
+    """LSH 후보 쌍 중 추정 유사도가 ``threshold`` 이상인 항목을 묶습니다.
+
+    Args:
+        signatures: 항목별 MinHash 서명.
+        threshold: 같은 군집으로 볼 최소 Jaccard 추정치.
+        bands: LSH band 수.
+
+    Returns:
+        두 개 이상 항목을 가진 군집 목록(각 군집은 항목 번호 오름차순).
+    """
+    index = LSHIndex(bands=bands)
+    for i, signature in enumerate(signatures):
+        index.add(i, signature)
+
+    parent = list(range(len(signatures)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for left, right in index.candidate_pairs():
+        root_left, root_right = find(left), find(right)
+        if root_left == root_right:
+            continue
+        if estimate_jaccard(signatures[left], signatures[right]) >= threshold:
+            parent[max(root_left, root_right)] = min(root_left, root_right)
+
+    groups: dict[int, list[int]] = {}
+    for i in range(len(signatures)):
+        groups.setdefault(find(i), []).append(i)
+    return [members for members in groups.values() if len(members) > 1]
+
+
+__all__ = [
+    "LSH_BANDS",
+    "NUM_PERM",
+    "SHINGLE_SIZE",
+    "SIMILARITY_THRESHOLD",
+    "LSHIndex",
+    "MinHasher",
+    "cluster_signatures",
+    "estimate_jaccard",
+    "normalize_content",
+    "shingles",
+]
@@ -8,16 +8,22 @@
 - 빈도 기준으로 상위 키워드만 Topic으로 생성
 - 파이썬에서 토큰-블록 매핑을 계산해 Neo4j에서의 전체 조인(카티전 곱) 회피
 - 관계 생성은 MERGE로 중복 없이 배치 처리
+- 스트리밍 파이프라인: 내부 ID 기반 keyset 페이지 조회, Space-Saving
+  스케치로 상위 키워드 집계, 단일 컴파일 정규식으로 토픽 매칭, 읽기와
+  병행되는 관계 쓰기로 피크 메모리를 코퍼스 크기와 무관하게 유지
 """
 
 from __future__ import annotations
 
+import heapq
 import logging
-from pathlib import Path
+import queue
 import re
 import sys
+import threading
 from collections import Counter
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 from typing import Any
 
 from dotenv import load_dotenv
@@ -34,6 +40,9 @@ MIN_WORD_LEN = 3
 MIN_FREQ = 5
 TOP_K = 30
 REL_BATCH_SIZE = 500
+BLOCK_PAGE_SIZE = 1000
+SKETCH_CAPACITY = 2000
+MAX_PENDING_BATCHES = 4
 
 STOPWORDS = {
     # English
@@ -84,7 +93,8 @@ STOPWORDS = {
     "하는",
 }
 
-TOKEN_PATTERN = re.compile(r"[A-Za-z0-9가-힣']+")
+TOKEN_CHARS = "A-Za-z0-9가-힣'"
+TOKEN_PATTERN = re.compile(f"[{TOKEN_CHARS}]+")
 
 # Ensure log directory exists to avoid import-time failures in test/CI.
 LOG_PATH = Path("logs/semantic_analysis.log")
@@ -137,6 +147,100 @@ def count_keywords(contents: Iterable[str]) -> Counter[str]:
     return counter
 
 
+class SpaceSaving:
+    """Space-Saving heavy-hitters sketch with bounded memory.
+
+    최대 ``capacity`` 개의 후보만 유지하며, 가득 찬 상태에서 새 키워드가
+    들어오면 최소 빈도 후보를 대체합니다. 보고되는 빈도는 실제 빈도의
+    상한이며 오차는 대체 시점의 최소 빈도(``error``)를 넘지 않습니다.
+    ``capacity`` 가 상위 K보다 충분히 크면 상위 키워드 순위는 정확합니다.
+
+    Args:
+        capacity: 유지할 최대 후보 수.
+    """
+
+    def __init__(self, capacity: int = SKETCH_CAPACITY) -> None:
+        """Initialize an empty sketch."""
+        self.capacity = max(1, capacity)
+        self.counts: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        self._heap: list[tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        """Number of tracked candidates."""
+        return len(self.counts)
+
+    def add(self, item: str) -> None:
+        """Count one occurrence of ``item``."""
+        counts = self.counts
+        if item in counts:
+            counts[item] += 1
+        elif len(counts) < self.capacity:
+            counts[item] = 1
+            self.errors[item] = 0
+        else:
+            floor, victim = self._pop_min()
+            del counts[victim]
+            del self.errors[victim]
+            counts[item] = floor + 1
+            self.errors[item] = floor
+        heapq.heappush(self._heap, (counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            # 오래된 (count, item) 항목을 정리해 힙 크기를 제한합니다.
+            self._heap = [(c, w) for w, c in counts.items()]
+            heapq.heapify(self._heap)
+
+    def update(self, items: Iterable[str]) -> None:
+        """Count each item in ``items``."""
+        for item in items:
+            self.add(item)
+
+    def _pop_min(self) -> tuple[int, str]:
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return count, item
+
+    def most_common(self, n: int | None = None) -> list[tuple[str, int]]:
+        """Return up to ``n`` candidates by estimated frequency."""
+        ranked = sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0]))
+        return ranked if n is None else ranked[:n]
+
+
+def sketch_keywords(
+    contents: Iterable[str],
+    top_k: int = TOP_K,
+    capacity: int = SKETCH_CAPACITY,
+) -> list[tuple[str, int]]:
+    """Top keywords from a stream using bounded memory.
+
+    Args:
+        contents: Iterable of text strings to analyze.
+        top_k: Number of keywords to return.
+        capacity: Space-Saving candidate capacity (memory bound).
+
+    Returns:
+        (keyword, estimated frequency) pairs meeting ``MIN_FREQ``.
+    """
+    sketch = SpaceSaving(max(capacity, top_k))
+    for text in contents:
+        sketch.update(tokenize(text))
+    return [(w, f) for w, f in sketch.most_common(top_k) if f >= MIN_FREQ]
+
+
+def compile_topic_matcher(topics: Iterable[str]) -> re.Pattern[str] | None:
+    """Compile topics into one pattern matching whole tokens.
+
+    토큰 경계(``TOKEN_CHARS`` 이외 문자)로 감싼 단일 정규식으로, 블록마다
+    토큰화 후 집합 교집합을 구하는 것과 같은 결과를 한 번의 스캔으로 얻습니다.
+    """
+    words = sorted({t.lower() for t in topics}, key=lambda w: (-len(w), w))
+    if not words:
+        return None
+    alternation = "|".join(re.escape(w) for w in words)
+    return re.compile(f"(?<![{TOKEN_CHARS}])(?:{alternation})(?![{TOKEN_CHARS}])")
+
+
 def create_topics(driver: Driver, keywords: list[tuple[str, int]]) -> None:
     """Create Topic nodes in Neo4j from keyword frequencies.
 
@@ -164,26 +268,41 @@ def create_topics(driver: Driver, keywords: list[tuple[str, int]]) -> None:
     logger.info("Topic %d개 생성/업데이트 완료", len(keywords))
 
 
-def link_blocks_to_topics(
-    driver: Driver,
-    blocks: list[dict[str, Any]],
-    topics: list[tuple[str, int]],
-) -> None:
-    """Create TAGGED_WITH relationships between blocks and topics.
+class _LinkWriter:
+    """Background writer that flushes link batches while blocks are read.
 
-    Args:
-        driver: Neo4j driver instance.
-        blocks: List of block dictionaries with id and content.
-        topics: List of (keyword, frequency) tuples.
+    대기 배치 수를 ``max_pending`` 으로 제한해 쓰기가 느리면 읽기가
+    기다리도록 하여 메모리를 일정하게 유지합니다.
     """
-    topic_set = {w for w, _ in topics}
-    links: list[dict[str, str]] = []
 
-    def flush(batch: list[dict[str, str]]) -> None:
+    def __init__(self, driver: Driver, max_pending: int = MAX_PENDING_BATCHES) -> None:
+        self.driver = driver
+        self.written = 0
+        self._queue: queue.Queue[list[dict[str, str]] | None] = queue.Queue(
+            maxsize=max(1, max_pending)
+        )
+        self._error: Exception | None = None
+        self._thread = threading.Thread(
+            target=self._run, name="semantic-link-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            if self._error is not None:
+                continue
+            try:
+                self._flush(batch)
+                self.written += len(batch)
+            except Exception as exc:  # noqa: BLE001
+                self._error = exc
+
+    def _flush(self, batch: list[dict[str, str]]) -> None:
         """Flush a batch of block-topic relationships to the database."""
-        if not batch:
-            return
-        with driver.session() as session:
+        with self.driver.session() as session:
             session.execute_write(
                 lambda tx, rows: tx.run(
                     """
@@ -197,20 +316,62 @@ def link_blocks_to_topics(
                 batch,
             )
 
-    for block in blocks:
-        content = block.get("content") or ""
-        block_id = block.get("id")
-        if not block_id or not content:
-            continue
-        tokens = set(tokenize(content))
-        matched = tokens.intersection(topic_set)
-        links.extend({"block_id": block_id, "topic": topic} for topic in matched)
-        if len(links) >= REL_BATCH_SIZE:
-            flush(links)
-            links = []
+    def submit(self, batch: list[dict[str, str]]) -> None:
+        """Queue a batch, blocking while ``max_pending`` batches wait."""
+        if self._error is not None:
+            raise self._error
+        if batch:
+            self._queue.put(batch)
+
+    def close(self) -> int:
+        """Wait for queued batches and return the number of links written."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self.written
+
+
+def link_blocks_to_topics(
+    driver: Driver,
+    blocks: Iterable[dict[str, Any]],
+    topics: list[tuple[str, int]],
+) -> int:
+    """Create TAGGED_WITH relationships between blocks and topics.
+
+    블록은 스트림으로 소비되며 ``REL_BATCH_SIZE`` 단위 관계 배치는 백그라운드
+    스레드에서 기록되어 읽기와 쓰기가 겹칩니다.
+
+    Args:
+        driver: Neo4j driver instance.
+        blocks: Iterable of block dictionaries with id and content.
+        topics: List of (keyword, frequency) tuples.
 
-    flush(links)
-    logger.info("Block-Topic 관계 생성 완료")
+    Returns:
+        Number of block-topic links written.
+    """
+    matcher = compile_topic_matcher(w for w, _ in topics)
+    if matcher is None:
+        return 0
+
+    writer = _LinkWriter(driver)
+    links: list[dict[str, str]] = []
+    try:
+        for block in blocks:
+            content = block.get("content") or ""
+            block_id = block.get("id")
+            if not block_id or not content:
+                continue
+            matched = set(matcher.findall(content.lower()))
+            links.extend({"block_id": block_id, "topic": topic} for topic in matched)
+            if len(links) >= REL_BATCH_SIZE:
+                writer.submit(links)
+                links = []
+        writer.submit(links)
+    finally:
+        written = writer.close()
+    logger.info("Block-Topic 관계 %d개 생성 완료", written)
+    return written
 
 
 def fetch_blocks(driver: Driver) -> list[dict[str, Any]]:
@@ -222,15 +383,80 @@ def fetch_blocks(driver: Driver) -> list[dict[str, Any]]:
     Returns:
         List of block dictionaries with id and content.
     """
-    with driver.session() as session:
-        result = session.run(
-            """
-            MATCH (b:Block)
-            WHERE coalesce(b.content, '') <> '' AND size(b.content) > 10
-            RETURN b.id AS id, b.content AS content
-            """,
-        )
-        return [dict(record) for record in result]
+    return list(iter_blocks(driver))
+
+
+def iter_blocks(
+    driver: Driver,
+    page_size: int = BLOCK_PAGE_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Stream blocks with content using keyset pagination on internal ids.
+
+    ``SKIP`` 없이 마지막으로 읽은 내부 ID 이후부터 ``page_size`` 개씩 조회하므로
+    페이지마다 비용이 일정하고 한 번에 한 페이지만 메모리에 올라옵니다.
+
+    Args:
+        driver: Neo4j driver instance.
+        page_size: Blocks fetched per round-trip.
+
+    Yields:
+        Block dictionaries with id and content.
+    """
+    after = -1
+    while True:
+        with driver.session() as session:
+            records = list(
+                session.run(
+                    """
+                    MATCH (b:Block)
+                    WHERE id(b) > $after
+                      AND coalesce(b.content, '') <> '' AND size(b.content) > 10
+                    RETURN id(b) AS key, b.id AS id, b.content AS content
+                    ORDER BY key
+                    LIMIT $limit
+                    """,
+                    after=after,
+                    limit=page_size,
+                )
+            )
+        for record in records:
+            yield {"id": record["id"], "content": record["content"]}
+        if len(records) < page_size:
+            return
+        after = records[-1]["key"]
+
+
+def run_semantic_pipeline(
+    driver: Driver,
+    top_k: int = TOP_K,
+    page_size: int = BLOCK_PAGE_SIZE,
+) -> dict[str, Any]:
+    """Stream blocks twice: sketch top keywords, then link blocks to topics.
+
+    Args:
+        driver: Neo4j driver instance.
+        top_k: Number of topics to create.
+        page_size: Blocks fetched per round-trip.
+
+    Returns:
+        Summary with ``blocks_processed``, ``keywords`` and ``links``.
+    """
+    processed = 0
+
+    def contents() -> Iterator[str]:
+        nonlocal processed
+        for block in iter_blocks(driver, page_size):
+            processed += 1
+            yield block["content"]
+
+    keywords = sketch_keywords(contents(), top_k=top_k)
+    if not processed:
+        return {"blocks_processed": 0, "keywords": [], "links": 0}
+
+    logger.info("Top %d 키워드: %s", len(keywords), keywords[:10])
+    create_topics(driver, keywords)
+    links = link_blocks_to_topics(driver, iter_blocks(driver, page_size), keywords)
+    return {"blocks_processed": processed, "keywords": keywords, "links": links}
 
 
 # --------------------
@@ -262,20 +488,11 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        blocks = fetch_blocks(driver)
-        if not blocks:
+        summary = run_semantic_pipeline(driver, top_k=TOP_K)
+        if not summary["blocks_processed"]:
             logger.info("처리할 Block이 없습니다.")
             return
 
-        contents = [b["content"] for b in blocks if b.get("content")]
-        keyword_counter = count_keywords(contents)
-        keywords = keyword_counter.most_common(TOP_K)
-
-        logger.info("Top %d 키워드: %s", len(keywords), keywords[:10])
-
-        create_topics(driver, keywords)
-        link_blocks_to_topics(driver, blocks, keywords)
-
     except Neo4jError as e:
         logger.error("Neo4j 오류 발생: %s", e, exc_info=True)
         sys.exit(1)
@@ -21,3 +21,25 @@ class DatabaseSettingsMixin(BaseSettings):
         alias="REDIS_URL",
         description="Redis URL for FastStream",
     )
+
+    # FastStream worker runtime
+    worker_concurrency: int = Field(4, ge=1, alias="WORKER_CONCURRENCY")
+    worker_prefetch: int = Field(16, ge=1, alias="WORKER_PREFETCH")
+    worker_rate_limit: int = Field(
+        10,
+        ge=1,
+        alias="WORKER_RATE_LIMIT",
+        description="Tasks allowed per rate window across all workers",
+    )
+    worker_rate_window_seconds: int = Field(
+        60,
+        ge=1,
+        alias="WORKER_RATE_WINDOW_SECONDS",
+    )
+    worker_result_batch_size: int = Field(20, ge=1, alias="WORKER_RESULT_BATCH_SIZE")
+    worker_result_flush_interval: float = Field(
+        1.0,
+        gt=0,
+        alias="WORKER_RESULT_FLUSH_INTERVAL",
+    )
+    worker_drain_timeout: float = Field(30.0, ge=0, alias="WORKER_DRAIN_TIMEOUT")
@@ -15,6 +15,18 @@ class FeatureSettingsMixin(BaseSettings):
 
     enable_rag: bool = Field(False, alias="ENABLE_RAG")
     enable_lats: bool = Field(False, alias="ENABLE_LATS")
+    lats_max_llm_evaluations: int | None = Field(
+        16,
+        ge=1,
+        alias="LATS_MAX_LLM_EVALUATIONS",
+        description="Evaluator calls allowed per LATS search (unset = no cap)",
+    )
+    lats_parallelism: int = Field(
+        1,
+        ge=1,
+        alias="LATS_PARALLELISM",
+        description="Concurrent LATS search iterations (capped by GEMINI_MAX_CONCURRENCY)",
+    )
     enable_data2neo: bool = Field(False, alias="ENABLE_DATA2NEO")
     enable_metrics: bool = Field(True, alias="ENABLE_METRICS")
     llm_provider_type: str = Field(
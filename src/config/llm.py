@@ -53,6 +53,8 @@ class LLMSettingsMixin(BaseSettings):
     timeout: int = Field(120, alias="GEMINI_TIMEOUT")
     timeout_max: int = Field(3600, alias="GEMINI_TIMEOUT_MAX")
     max_concurrency: int = Field(10, alias="GEMINI_MAX_CONCURRENCY")
+    hedge_quantile: float = Field(0.95, ge=0.0, lt=1.0, alias="GEMINI_HEDGE_QUANTILE")
+    retry_budget_ratio: float = Field(0.1, ge=0.0, alias="GEMINI_RETRY_BUDGET_RATIO")
     cache_size: int = Field(50, alias="GEMINI_CACHE_SIZE")
     temperature: float = Field(1.0, alias="GEMINI_TEMPERATURE")  # Gemini 3 권장값
     thinking_level: Literal["minimal", "low", "medium", "high"] = Field(
@@ -8,6 +8,8 @@ Handles API-specific error mapping, token counting, and batch operations.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
+from pathlib import Path
 from typing import Any, cast
 
 import google.generativeai as genai
@@ -23,6 +25,7 @@ from src.core.interfaces import (
     TimeoutError,
 )
 from src.infra.neo4j import Neo4jGraphProvider
+from src.infra.neo4j_bulk import BulkLoadStats, NodeBatch, RelationshipBatch
 
 logger = logging.getLogger(__name__)
 
@@ -301,3 +304,19 @@ class Neo4jProvider(GraphProvider):
             from_key,
             to_key,
         )
+
+    async def bulk_load(
+        self,
+        nodes: Sequence[NodeBatch] = (),
+        relationships: Sequence[RelationshipBatch] = (),
+        *,
+        csv_dir: str | Path | None = None,
+        csv_threshold: int | None = None,
+    ) -> BulkLoadStats:
+        """Bulk load nodes then relationships using the shared provider."""
+        return await self._provider.bulk_load(
+            nodes,
+            relationships,
+            csv_dir=csv_dir,
+            csv_threshold=csv_threshold,
+        )
@@ -2,34 +2,89 @@
 
 Provides intelligent suggestions for next query types based on session history
 and validates draft outputs against constraints from the knowledge graph.
+Prefix suggestions are answered from an in-process ``PrefixIndex`` that is
+refreshed in the background, so typing never waits on Neo4j.
 """
 
 from __future__ import annotations
 
 import logging
 import re
+import threading
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 from typing import Any
 
 from checks.detect_forbidden_patterns import find_violations
+from src.features.prefix_index import PrefixIndex, Suggestion
 from src.qa.rag_system import QAKnowledgeGraph
 
 logger = logging.getLogger(__name__)
 
+_shared_index: PrefixIndex | None = None
+_shared_index_lock = threading.Lock()
+
+
+def get_prefix_index() -> PrefixIndex:
+    """프로세스 전역에서 공유하는 자동 완성 인덱스를 반환합니다."""
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            _shared_index = PrefixIndex()
+        return _shared_index
+
 
 class SmartAutocomplete:
     """그래프 기반 자동 완성/검증 보조.
 
     - 다음 질의 유형 추천
+    - 입력 접두사 기반 자동 완성(질의 유형, 규칙 키워드, 성공 질의)
     - 출력 초안의 제약 위반 감지 및 제안
     """
 
-    def __init__(self, kg: QAKnowledgeGraph):
+    def __init__(self, kg: QAKnowledgeGraph, index: PrefixIndex | None = None):
         """Initialize the smart autocomplete system.
 
         Args:
             kg: QAKnowledgeGraph instance for graph queries.
+            index: Prefix index to answer from. Defaults to the shared index.
         """
         self.kg = kg
+        self.index = index if index is not None else get_prefix_index()
+
+    def _session_factory(
+        self,
+    ) -> Callable[[], AbstractContextManager[Any]] | None:
+        graph_session = getattr(self.kg, "graph_session", None)
+        if graph_session is not None:
+            return graph_session  # type: ignore[no-any-return]
+        graph = getattr(self.kg, "_graph", None)
+        return graph.session if graph is not None else None
+
+    def refresh_index(self, *, background: bool = True) -> bool:
+        """그래프에서 자동 완성 인덱스를 갱신합니다.
+
+        Args:
+            background: True면 주기가 지났을 때만 백그라운드 스레드로 갱신.
+
+        Returns:
+            갱신(또는 갱신 스레드 시작)이 일어났으면 True.
+        """
+        session_factory = self._session_factory()
+        if session_factory is None:
+            return False
+        if background:
+            return self.index.refresh_in_background(session_factory)
+        return self.index.refresh(session_factory)
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[Suggestion]:
+        """입력 접두사에 맞는 자동 완성 후보를 반환합니다.
+
+        요청 경로에서는 메모리 인덱스만 조회하고, 그래프 갱신은 백그라운드에서
+        진행됩니다. 첫 적재가 끝나기 전에는 빈 목록을 반환할 수 있습니다.
+        """
+        self.refresh_index()
+        return self.index.search(prefix, limit)
 
     def suggest_next_query_type(
         self,
@@ -42,6 +97,12 @@ class SmartAutocomplete:
         used_types = [t["type"] for t in current_session if t.get("type")]
         counts = {t: used_types.count(t) for t in set(used_types)}
 
+        if self.index.loaded:
+            self.refresh_index()
+            return self._rank_query_types(
+                [dict(r) for r in self.index.query_types], used_types, counts
+            )
+
         cypher = """
         MATCH (qt:QueryType)
         RETURN qt.name AS name, qt.korean AS korean, qt.session_limit AS limit, coalesce(qt.priority, 0) AS priority
@@ -63,6 +124,14 @@ class SmartAutocomplete:
                 return []
             records = [dict(r) for r in session.run(cypher)]
 
+        return self._rank_query_types(records, used_types, counts)
+
+    @staticmethod
+    def _rank_query_types(
+        records: list[dict[str, Any]],
+        used_types: list[str],
+        counts: dict[str, int],
+    ) -> list[dict[str, Any]]:
         suggestions = []
         for r in records:
             limit = r.get("limit")
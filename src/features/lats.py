@@ -3,16 +3,29 @@
 This module provides the LATS reasoning engine, which uses Monte Carlo Tree Search (MCTS)
 to enable the agent to explore multiple reasoning paths, perform self-reflection,
 and backtrack from dead ends. It supports parallel child node evaluation for performance.
+
+With ``parallelism > 1`` several select/expand/evaluate/backprop iterations run
+concurrently (tree-parallel MCTS). Nodes on an in-flight path carry a virtual
+loss, so concurrent workers spread over different branches instead of waiting
+on the same one.
+
+Equivalent states reached through different action orders share one entry in a
+transposition table, so their visit counts and values are merged and each is
+expanded and evaluated only once per search. Evaluation scores can be reused
+across runs through ``RedisEvalCache`` and are capped by a per-search budget.
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
 import math
+import random
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -20,10 +33,30 @@ from src.config.constants import LATS_EXPANSION_MAX_OUTPUT_TOKENS
 from src.core.interfaces import GenerationResult, LLMProvider
 
 if TYPE_CHECKING:
+    from src.agent.rate_limiter import RateLimiter
+    from src.caching.redis_cache import RedisEvalCache
     from src.features.action_executor import ActionExecutor
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+async def _gather_or_cancel(*aws: Awaitable[T]) -> list[T]:
+    """Gather awaitables, cancelling the rest as soon as one fails.
+
+    Plain ``asyncio.gather`` leaves sibling tasks running after the first
+    error, which would keep spending evaluator calls on a failed search.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
 
 class SearchState(BaseModel):
     """Tree 탐색용 상태 객체. 직렬화/예산 추적을 지원합니다."""
@@ -74,6 +107,24 @@ class SearchState(BaseModel):
             hash((tuple(self.focus_history), len(self.turns), self.cumulative_tokens)),
         )
 
+    def canonical_key(self) -> str:
+        """Stable, order-insensitive key for transposition lookups.
+
+        Actions are compared as a multiset, so states reached through different
+        action orders collide. The last action is kept because flow validation
+        depends on it; budget counters are ignored. Unlike ``hash_key`` the
+        result is stable across processes and can be used as a Redis key.
+        """
+        payload = {
+            "actions": sorted(self.focus_history),
+            "last": self.focus_history[-1] if self.focus_history else None,
+            "query": self.query,
+            "ocr_text": self.ocr_text,
+            "current_answer": self.current_answer,
+        }
+        raw = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
 
 @dataclass
 class ValidationResult:
@@ -96,6 +147,8 @@ class SearchNode:
     reflection: str | None = None
     children: list[SearchNode] = field(default_factory=list)
     result: dict[str, Any] | None = None
+    key: str | None = None  # canonical state key (set by LATSSearcher)
+    virtual_visits: int = 0  # in-flight iterations through this node
 
     @property
     def depth(self) -> int:
@@ -108,6 +161,48 @@ class SearchNode:
         return d
 
 
+@dataclass
+class TranspositionEntry:
+    """Statistics shared by all nodes with the same canonical state."""
+
+    visits: int = 0
+    reward: float = -math.inf
+    score: float | None = None
+    actions: list[str] | None = None
+    result: dict[str, Any] | None = None
+
+
+@dataclass
+class LATSSearchStats:
+    """Per-search counters for transposition and evaluation reuse."""
+
+    lookups: int = 0
+    transposition_hits: int = 0
+    cache_hits: int = 0
+    llm_evaluations: int = 0
+    budget_skips: int = 0
+    expansions_reused: int = 0
+
+    @property
+    def transposition_hit_rate(self) -> float:
+        """Share of score lookups answered without calling the evaluator."""
+        if not self.lookups:
+            return 0.0
+        return (self.transposition_hits + self.cache_hits) / self.lookups
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the counters as a plain dict for logging."""
+        return {
+            "lookups": self.lookups,
+            "transposition_hits": self.transposition_hits,
+            "cache_hits": self.cache_hits,
+            "llm_evaluations": self.llm_evaluations,
+            "budget_skips": self.budget_skips,
+            "expansions_reused": self.expansions_reused,
+            "transposition_hit_rate": round(self.transposition_hit_rate, 3),
+        }
+
+
 GraphValidator = Callable[[SearchState, str], Awaitable[ValidationResult]]
 ActionProposer = Callable[[SearchNode], Awaitable[list[str]]]
 ActionEvaluator = Callable[[SearchNode], Awaitable[float]]
@@ -131,6 +226,14 @@ class LATSSearcher:
         cost_budget: float = 1.0,
         concurrency_limit: int = 5,
         validation_penalty: float = 0.3,
+        eval_cache: RedisEvalCache | None = None,
+        max_llm_evaluations: int | None = None,
+        cache_namespace: str = "",
+        parallelism: int = 1,
+        virtual_loss: float = 1.0,
+        seed: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        target_score: float | None = None,
     ):
         """Initialize the LATS searcher.
 
@@ -148,6 +251,16 @@ class LATSSearcher:
             cost_budget: Maximum cost budget.
             concurrency_limit: Maximum concurrent LLM API calls (for rate limiting).
             validation_penalty: Penalty applied to nodes that fail concrete validation.
+            eval_cache: Optional cache for evaluation scores reused across runs.
+            max_llm_evaluations: Maximum evaluator calls per search (None = no cap).
+            cache_namespace: Prefix separating eval_cache keys of different tasks.
+            parallelism: Search iterations run concurrently (1 = sequential).
+            virtual_loss: Reward subtracted per in-flight iteration through a node.
+            seed: Seed for UCT tie-breaking, for reproducible benchmarks.
+            rate_limiter: Agent rate limiter; caps parallelism and evaluator
+                concurrency at its ``max_concurrency`` and paces evaluator
+                calls with its request limiter.
+            target_score: Stop as soon as a node reaches this reward.
         """
         self.llm_provider = llm_provider
         self.graph_validator = graph_validator
@@ -162,8 +275,46 @@ class LATSSearcher:
         self.cost_budget = cost_budget
         self.concurrency_limit = concurrency_limit
         self.validation_penalty = validation_penalty
+        self.eval_cache = eval_cache
+        self.max_llm_evaluations = max_llm_evaluations
+        self.cache_namespace = cache_namespace
+        self.rate_limiter = rate_limiter
+        if rate_limiter is not None:
+            parallelism = min(parallelism, rate_limiter.max_concurrency)
+            self.concurrency_limit = min(
+                concurrency_limit, rate_limiter.max_concurrency
+            )
+        self.parallelism = max(1, parallelism)
+        self.virtual_loss = virtual_loss
+        self.seed = seed
+        self.target_score = target_score
+        self._rng = random.Random(seed)
+        self._expanding: dict[int, asyncio.Event] = {}
         self._semaphore: asyncio.Semaphore | None = None
         self.total_visits = 0
+        self.transpositions: dict[str, TranspositionEntry] = {}
+        self.stats = LATSSearchStats()
+        self._inflight: dict[str, asyncio.Future[float]] = {}
+
+    @property
+    def evaluation_budget_exhausted(self) -> bool:
+        """Whether the per-search evaluator budget is used up."""
+        return (
+            self.max_llm_evaluations is not None
+            and self.stats.llm_evaluations >= self.max_llm_evaluations
+        )
+
+    def _entry(self, node: SearchNode) -> TranspositionEntry:
+        if node.key is None:
+            node.key = node.state.canonical_key()
+        entry = self.transpositions.get(node.key)
+        if entry is None:
+            entry = TranspositionEntry()
+            self.transpositions[node.key] = entry
+        return entry
+
+    def _target_reached(self, best: SearchNode) -> bool:
+        return self.target_score is not None and best.reward >= self.target_score
 
     def should_terminate(self, node: SearchNode) -> bool:
         """Check if the search should terminate at this node."""
@@ -185,31 +336,105 @@ class LATSSearcher:
         """
         # Initialize semaphore for rate limiting
         self._semaphore = asyncio.Semaphore(self.concurrency_limit)
+        self.transpositions = {}
+        self.stats = LATSSearchStats()
+        self._inflight = {}
+        self._expanding = {}
+        self._rng = random.Random(self.seed)
         root = SearchNode(state=initial_state or SearchState())
+
+        if self.parallelism > 1:
+            best = await self._run_parallel(root)
+        else:
+            best = root
+            while self.total_visits < self.max_visits:
+                if self.evaluation_budget_exhausted:
+                    logger.debug("LATS evaluation budget exhausted, stopping search")
+                    break
+                leaf, reward = await self._simulate(self._select(root))
+                best = self._better(best, root, leaf, reward)
+                self._backpropagate(leaf, reward)
+                self.total_visits += 1
+                if self._target_reached(best):
+                    break
+
+        logger.info("LATS search stats: %s", self.stats.as_dict())
+        return best
+
+    async def _run_parallel(self, root: SearchNode) -> SearchNode:
+        """Run ``parallelism`` search iterations concurrently on one tree.
+
+        Each worker claims an iteration, marks its selected path with a
+        virtual loss and releases it after backpropagation. A worker that
+        selects a leaf another worker is still expanding waits for that
+        expansion and selects again.
+        """
         best = root
+        claimed = self.total_visits
+
+        async def worker() -> None:
+            nonlocal best, claimed
+            while claimed < self.max_visits and not self._target_reached(best):
+                if self.evaluation_budget_exhausted:
+                    logger.debug("LATS evaluation budget exhausted, stopping search")
+                    return
+                leaf = self._select(root)
+                busy = self._expanding.get(id(leaf))
+                if busy is not None:
+                    await busy.wait()
+                    continue
+                claimed += 1
+                done = asyncio.Event()
+                self._expanding[id(leaf)] = done
+                self._add_virtual_loss(leaf, 1)
+                try:
+                    node, reward = await self._simulate(leaf)
+                finally:
+                    self._add_virtual_loss(leaf, -1)
+                    del self._expanding[id(leaf)]
+                    done.set()
+                best = self._better(best, root, node, reward)
+                self._backpropagate(node, reward)
+                self.total_visits += 1
+
+        await _gather_or_cancel(*(worker() for _ in range(self.parallelism)))
+        return best
 
-        while self.total_visits < self.max_visits:
-            leaf = self._select(root)
-            if self.should_terminate(leaf):
-                reward = leaf.reward
-            else:
-                expanded = await self._expand(leaf)
-                if expanded:
-                    # Parallel evaluation of expanded children with rate limiting
-                    rewards = await self._evaluate_children_parallel(expanded)
-                    # Find best child from this expansion
-                    best_idx = max(range(len(rewards)), key=lambda i, r=rewards: r[i])  # type: ignore[misc]
-                    leaf = expanded[best_idx]
-                    reward = rewards[best_idx]
-                else:
-                    reward = await self._evaluate(leaf)
-            if reward > best.reward or (leaf.reflection and best is root):
-                best = leaf
-            self._backpropagate(leaf, reward)
-            self.total_visits += 1
+    async def _simulate(self, leaf: SearchNode) -> tuple[SearchNode, float]:
+        """Expand and evaluate a selected leaf.
 
+        Returns:
+            The node to backpropagate from and its reward.
+        """
+        if self.should_terminate(leaf):
+            return leaf, leaf.reward
+        expanded = await self._expand(leaf)
+        if not expanded:
+            return leaf, await self._evaluate(leaf)
+        # Parallel evaluation of expanded children with rate limiting
+        rewards = await self._evaluate_children_parallel(expanded)
+        # Find best child from this expansion
+        best_idx = max(range(len(rewards)), key=lambda i, r=rewards: r[i])  # type: ignore[misc]
+        return expanded[best_idx], rewards[best_idx]
+
+    @staticmethod
+    def _better(
+        best: SearchNode,
+        root: SearchNode,
+        node: SearchNode,
+        reward: float,
+    ) -> SearchNode:
+        if reward > best.reward or (node.reflection and best is root):
+            return node
         return best
 
+    @staticmethod
+    def _add_virtual_loss(node: SearchNode, delta: int) -> None:
+        cur: SearchNode | None = node
+        while cur:
+            cur.virtual_visits += delta
+            cur = cur.parent
+
     async def _evaluate_children_parallel(
         self,
         children: list[SearchNode],
@@ -230,16 +455,14 @@ class LATSSearcher:
             async with self._semaphore or asyncio.Semaphore(self.concurrency_limit):
                 return await self._evaluate(child)
 
-        # Use asyncio.gather for parallel evaluation
-        rewards = await asyncio.gather(
+        return await _gather_or_cancel(
             *[evaluate_with_semaphore(child) for child in children],
         )
-        return list(rewards)
 
     def _select(self, node: SearchNode) -> SearchNode:
         current = node
         while current.children:
-            parent_visits = current.visits or 1
+            parent_visits = (current.visits + current.virtual_visits) or 1
 
             def _uct(
                 child: SearchNode,
@@ -247,7 +470,14 @@ class LATSSearcher:
             ) -> float:
                 return self._uct_score(child, parent_visits)
 
-            current = max(current.children, key=_uct)
+            if self.seed is None:
+                current = max(current.children, key=_uct)
+            else:
+                # Seeded random tie-breaking keeps benchmark runs reproducible.
+                current = max(
+                    current.children,
+                    key=lambda c: (_uct(c), self._rng.random()),
+                )
         return current
 
     async def _expand(self, node: SearchNode) -> list[SearchNode]:
@@ -262,6 +492,16 @@ class LATSSearcher:
         return self._create_children(node, valid_pairs)
 
     async def _propose_actions_for_expand(self, node: SearchNode) -> list[str]:
+        entry = self._entry(node)
+        if entry.actions is not None:
+            # An equivalent state was already expanded: reuse its proposals.
+            self.stats.expansions_reused += 1
+            return list(entry.actions)
+        actions = await self._propose_new_actions(node)
+        entry.actions = list(actions)
+        return actions
+
+    async def _propose_new_actions(self, node: SearchNode) -> list[str]:
         if self.propose_actions:
             return await self.propose_actions(node)
         if not self.llm_provider:
@@ -333,7 +573,12 @@ class LATSSearcher:
         new_children: list[SearchNode] = []
         for action, validation in valid_pairs:
             child_state = node.state.add_turn(action)
-            child = SearchNode(state=child_state, action=action, parent=node)
+            child = SearchNode(
+                state=child_state,
+                action=action,
+                parent=node,
+                key=child_state.canonical_key(),
+            )
             child.reward -= validation.penalty
             node.children.append(child)
             new_children.append(child)
@@ -342,22 +587,7 @@ class LATSSearcher:
     async def _evaluate(self, node: SearchNode) -> float:
         """Evaluate a node's score, integrating ActionExecutor for concrete validation."""
         try:
-            if self.evaluate_action:
-                score = await self.evaluate_action(node)
-            elif self.llm_provider:
-                prompt = f"Score this action from 0-1: {node.action}"
-                result: GenerationResult = (
-                    await self.llm_provider.generate_content_async(prompt=prompt)
-                )
-                try:
-                    score = float(result.content.strip())
-                except ValueError:
-                    score = 0.0
-                tokens = result.usage.get("total_tokens", 0)
-                if tokens:
-                    node.state = node.state.update_budget(tokens=tokens)
-            else:
-                score = 0.0
+            score = await self._lookup_or_score(node)
 
             # Concrete validation using ActionExecutor (if available)
             validation_passed = await self._run_concrete_validation(node)
@@ -388,6 +618,93 @@ class LATSSearcher:
         )
         return effective
 
+    async def _lookup_or_score(self, node: SearchNode) -> float:
+        """Return a node's raw score from the transposition table or cache.
+
+        Only misses call the evaluator. Concurrent lookups of the same
+        canonical state wait for the single in-flight evaluation.
+        """
+        entry = self._entry(node)
+        key = node.key or ""
+        self.stats.lookups += 1
+        if entry.score is not None:
+            self.stats.transposition_hits += 1
+            if node.result is None and entry.result is not None:
+                node.result = dict(entry.result)
+            return entry.score
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats.transposition_hits += 1
+            score = await asyncio.shield(pending)
+            if node.result is None and entry.result is not None:
+                node.result = dict(entry.result)
+            return score
+
+        future: asyncio.Future[float] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            score = await self._score_uncached(node, entry)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters re-raise; mark retrieved so an unobserved error is not logged.
+            future.exception()
+            raise
+        else:
+            future.set_result(score)
+            return score
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _score_uncached(
+        self,
+        node: SearchNode,
+        entry: TranspositionEntry,
+    ) -> float:
+        cache_key = f"{self.cache_namespace}{node.key}"
+        if self.eval_cache is not None:
+            cached = await self.eval_cache.get(cache_key)
+            if cached is not None:
+                self.stats.cache_hits += 1
+                entry.score = cached
+                return cached
+
+        if self.evaluation_budget_exhausted:
+            self.stats.budget_skips += 1
+            return 0.0
+
+        self.stats.llm_evaluations += 1
+        score = await self._call_evaluator(node)
+        entry.score = score
+        entry.result = node.result
+        if self.eval_cache is not None:
+            await self.eval_cache.set(cache_key, score)
+        return score
+
+    async def _call_evaluator(self, node: SearchNode) -> float:
+        limiter = self.rate_limiter.limiter if self.rate_limiter else None
+        if limiter is not None:
+            await limiter.acquire()
+        if self.evaluate_action:
+            return await self.evaluate_action(node)
+        if self.llm_provider:
+            prompt = f"Score this action from 0-1: {node.action}"
+            result: GenerationResult = await self.llm_provider.generate_content_async(
+                prompt=prompt
+            )
+            try:
+                score = float(result.content.strip())
+            except ValueError:
+                score = 0.0
+            tokens = result.usage.get("total_tokens", 0)
+            if tokens:
+                node.state = node.state.update_budget(tokens=tokens)
+            return score
+        return 0.0
+
     async def _run_concrete_validation(self, node: SearchNode) -> bool:
         """Run concrete validation using ActionExecutor.
 
@@ -431,14 +748,26 @@ class LATSSearcher:
         while cur:
             cur.visits += 1
             cur.reward = max(cur.reward, reward)
+            entry = self._entry(cur)
+            entry.visits += 1
+            entry.reward = max(entry.reward, reward)
             cur = cur.parent
 
     def _uct_score(self, node: SearchNode, total_parent_visits: int) -> float:
-        if node.visits == 0:
+        # Merge statistics of equivalent nodes reached through other paths.
+        visits, reward = node.visits, node.reward
+        entry = self.transpositions.get(node.key) if node.key else None
+        if entry is not None and entry.visits > visits:
+            visits, reward = entry.visits, entry.reward
+        if node.virtual_visits:
+            # Pending iterations count as losing visits until they finish.
+            visits += node.virtual_visits
+            reward -= self.virtual_loss * node.virtual_visits
+        if visits == 0:
             return math.inf
-        exploitation = node.reward / node.visits
+        exploitation = reward / visits
         exploration = self.exploration_constant * math.sqrt(
-            math.log(total_parent_visits + 1) / node.visits,
+            math.log(total_parent_visits + 1) / visits,
         )
         return exploitation + exploration
 
@@ -0,0 +1,452 @@
+"""자동 완성을 위한 프로세스 내 자모 단위 접두사 인덱스.
+
+``SmartAutocomplete`` 가 입력마다 Neo4j를 조회하지 않도록 질의 유형, 규칙
+키워드, 성공한 과거 질의를 메모리의 trie에 올려 두고 빈도 가중치로 정렬한
+후보를 반환합니다.
+
+- 한글 음절을 키 입력 단위 자모로 분해해 조합 중인 입력("갈" → "가로")도
+  접두사로 일치시키고, 초성만 입력한 경우("ㄱㄹ")도 찾습니다.
+- 노드별 상위 후보를 지연 계산해 캐시하므로 반복 조회는 접두사 길이에만
+  비례합니다.
+- 그래프 스냅샷 버전(Rule id 집합, QueryType 속성, Example 수와 최근
+  ``updated_at`` 의 지문)이 바뀔 때만 갱신하며, 규칙 키워드는 추가/삭제된
+  규칙만 증분 반영합니다. Rule id는 본문 해시이므로 본문 변경도 id 변경으로
+  나타납니다.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from typing import Any
+
+from src.infra.graph_snapshot import read_graph_snapshot
+
+logger = logging.getLogger(__name__)
+
+KIND_QUERY_TYPE = "query_type"
+KIND_RULE_KEYWORD = "rule_keyword"
+KIND_QUERY = "query"
+
+TOP_CACHE_SIZE = 20
+MAX_WORD_STARTS = 5
+MIN_KEYWORD_LEN = 2
+REFRESH_INTERVAL_SECONDS = 60.0
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = (
+    "",
+    "ㄱ",
+    "ㄲ",
+    "ㄳ",
+    "ㄴ",
+    "ㄵ",
+    "ㄶ",
+    "ㄷ",
+    "ㄹ",
+    "ㄺ",
+    "ㄻ",
+    "ㄼ",
+    "ㄽ",
+    "ㄾ",
+    "ㄿ",
+    "ㅀ",
+    "ㅁ",
+    "ㅂ",
+    "ㅄ",
+    "ㅅ",
+    "ㅆ",
+    "ㅇ",
+    "ㅈ",
+    "ㅊ",
+    "ㅋ",
+    "ㅌ",
+    "ㅍ",
+    "ㅎ",
+)
+# 겹받침/이중모음은 키 입력 순서대로 풀어 조합 중인 음절과 일치시킵니다.
+_COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+}
+_KEYWORD_PATTERN = re.compile(r"[0-9A-Za-z가-힣]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _is_syllable(char: str) -> bool:
+    return _HANGUL_BASE <= ord(char) <= _HANGUL_LAST
+
+
+def decompose_jamo(text: str) -> str:
+    """한글 음절을 키 입력 단위 호환 자모열로 분해합니다.
+
+    Args:
+        text: 임의의 문자열. 한글 외 문자는 소문자화만 합니다.
+
+    Returns:
+        자모 분해된 문자열. 예: ``"닭"`` → ``"ㄷㅏㄹㄱ"``.
+    """
+    out: list[str] = []
+    for char in _WHITESPACE.sub(" ", text.strip().lower()):
+        if _is_syllable(char):
+            code = ord(char) - _HANGUL_BASE
+            jamo = (
+                _CHOSEONG[code // 588]
+                + _JUNGSEONG[(code % 588) // 28]
+                + _JONGSEONG[code % 28]
+            )
+            out.extend(_COMPOUND_JAMO.get(j, j) for j in jamo)
+        else:
+            out.append(_COMPOUND_JAMO.get(char, char))
+    return "".join(out)
+
+
+def choseong(text: str) -> str:
+    """한글 음절의 초성만 남긴 문자열(한글이 없으면 빈 문자열)."""
+    if not any(_is_syllable(c) for c in text):
+        return ""
+    return "".join(
+        _CHOSEONG[(ord(c) - _HANGUL_BASE) // 588] if _is_syllable(c) else c
+        for c in _WHITESPACE.sub("", text.lower())
+    )
+
+
+def extract_keywords(text: str) -> set[str]:
+    """규칙 본문에서 자동 완성 키워드(2글자 이상 토큰)를 추출합니다."""
+    return {
+        token.lower()
+        for token in _KEYWORD_PATTERN.findall(text or "")
+        if len(token) >= MIN_KEYWORD_LEN
+    }
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    """자동 완성 후보."""
+
+    text: str
+    kind: str
+    weight: float
+
+
+_EntryKey = tuple[str, str]
+
+
+class _Node:
+    __slots__ = ("children", "entries", "top")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.entries: set[_EntryKey] = set()
+        self.top: list[_EntryKey] | None = None
+
+
+class PrefixIndex:
+    """빈도 가중치로 정렬하는 자모 단위 접두사 trie.
+
+    조회와 갱신은 하나의 락으로 직렬화되며, Neo4j 조회는 락 밖에서 수행되므로
+    갱신 중에도 조회는 직전 스냅샷으로 즉시 응답합니다.
+    """
+
+    def __init__(self) -> None:
+        """빈 인덱스를 만듭니다."""
+        self._root = _Node()
+        self._weights: dict[_EntryKey, float] = {}
+        self._keys: dict[_EntryKey, list[str]] = {}
+        self._lock = threading.RLock()
+        self._rule_keywords: dict[str, set[str]] = {}
+        self._keyword_counts: Counter[str] = Counter()
+        self._refresh_thread: threading.Thread | None = None
+        self._last_refresh = 0.0
+        self.version: str | None = None
+        self.query_types: list[dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        """등록된 후보 수."""
+        return len(self._weights)
+
+    @property
+    def loaded(self) -> bool:
+        """그래프에서 한 번 이상 적재되었는지 여부."""
+        return self.version is not None
+
+    # ------------------------------------------------------------------
+    # 후보 등록/삭제
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _index_keys(text: str, kind: str) -> list[str]:
+        starts = [0]
+        if kind == KIND_QUERY:
+            starts += [m.end() for m in re.finditer(r"\s+", text)][
+                : MAX_WORD_STARTS - 1
+            ]
+        keys = {decompose_jamo(text[i:]) for i in starts}
+        initials = choseong(text)
+        if initials:
+            keys.add(initials)
+        return sorted(k for k in keys if k)
+
+    def add(self, text: str, kind: str, weight: float) -> None:
+        """후보를 등록하거나 가중치를 갱신합니다."""
+        entry = (kind, text)
+        with self._lock:
+            if entry in self._weights:
+                self.remove(text, kind)
+            keys = self._index_keys(text, kind)
+            self._weights[entry] = weight
+            self._keys[entry] = keys
+            for key in keys:
+                node = self._root
+                node.top = None
+                for char in key:
+                    node = node.children.setdefault(char, _Node())
+                    node.top = None
+                node.entries.add(entry)
+
+    def remove(self, text: str, kind: str) -> None:
+        """후보를 삭제합니다. 없으면 무시합니다."""
+        entry = (kind, text)
+        with self._lock:
+            keys = self._keys.pop(entry, None)
+            if keys is None:
+                return
+            del self._weights[entry]
+            for key in keys:
+                path = [self._root]
+                for char in key:
+                    path.append(path[-1].children[char])
+                path[-1].entries.discard(entry)
+                for node in path:
+                    node.top = None
+                # 비어 버린 가지는 잘라 냅니다.
+                for depth in range(len(key), 0, -1):
+                    node = path[depth]
+                    if node.entries or node.children:
+                        break
+                    del path[depth - 1].children[key[depth - 1]]
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def _ranked(self, node: _Node, count: int) -> list[_EntryKey]:
+        entries: set[_EntryKey] = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            entries.update(current.entries)
+            stack.extend(current.children.values())
+        return heapq.nsmallest(
+            count, entries, key=lambda e: (-self._weights[e], e[1], e[0])
+        )
+
+    def search(self, prefix: str, limit: int = 10) -> list[Suggestion]:
+        """``prefix`` 로 시작하는 후보를 가중치 내림차순으로 반환합니다."""
+        key = decompose_jamo(prefix)
+        if not key or limit <= 0:
+            return []
+        with self._lock:
+            node: _Node | None = self._root
+            for char in key:
+                node = node.children.get(char) if node else None
+                if node is None:
+                    return []
+            assert node is not None
+            if limit > TOP_CACHE_SIZE:
+                ranked = self._ranked(node, limit)
+            else:
+                if node.top is None:
+                    node.top = self._ranked(node, TOP_CACHE_SIZE)
+                ranked = node.top[:limit]
+            return [
+                Suggestion(text, kind, self._weights[(kind, text)])
+                for kind, text in ranked
+            ]
+
+    # ------------------------------------------------------------------
+    # 그래프 동기화
+    # ------------------------------------------------------------------
+
+    def _apply_rules(self, removed: Iterable[str], added: dict[str, str]) -> None:
+        touched: set[str] = set()
+        for rule_id in removed:
+            for keyword in self._rule_keywords.pop(rule_id, set()):
+                self._keyword_counts[keyword] -= 1
+                touched.add(keyword)
+        for rule_id, text in added.items():
+            keywords = extract_keywords(text)
+            self._rule_keywords[rule_id] = keywords
+            self._keyword_counts.update(keywords)
+            touched.update(keywords)
+        for keyword in touched:
+            count = self._keyword_counts[keyword]
+            if count > 0:
+                self.add(keyword, KIND_RULE_KEYWORD, float(count))
+            else:
+                del self._keyword_counts[keyword]
+                self.remove(keyword, KIND_RULE_KEYWORD)
+
+    def _replace_kind(self, kind: str, weights: dict[str, float]) -> None:
+        stale = [text for k, text in self._weights if k == kind and text not in weights]
+        for text in stale:
+            self.remove(text, kind)
+        for text, weight in weights.items():
+            if self._weights.get((kind, text)) != weight:
+                self.add(text, kind, weight)
+
+    def refresh(
+        self, session_factory: Callable[[], AbstractContextManager[Any]]
+    ) -> bool:
+        """그래프 스냅샷 버전이 바뀌었으면 인덱스를 증분 갱신합니다.
+
+        Args:
+            session_factory: Neo4j 세션 컨텍스트를 반환하는 callable.
+
+        Returns:
+            인덱스가 갱신되었으면 True.
+        """
+        self._last_refresh = time.monotonic()
+        with session_factory() as session:
+            if session is None:
+                return False
+            snapshot = read_graph_snapshot(session)
+            if snapshot.version == self.version:
+                return False
+            rule_ids = snapshot.rule_ids
+
+            known = set(self._rule_keywords)
+            added_ids = [i for i in rule_ids if i not in known]
+            removed_ids = known.difference(rule_ids)
+            added = (
+                {
+                    r["id"]: r["text"] or ""
+                    for r in session.run(
+                        "MATCH (r:Rule) WHERE r.id IN $ids RETURN r.id AS id, r.text AS text",
+                        ids=added_ids,
+                    )
+                }
+                if added_ids
+                else {}
+            )
+            query_types = [
+                dict(r)
+                for r in session.run(
+                    """
+                    MATCH (qt:QueryType)
+                    RETURN qt.name AS name, qt.korean AS korean, qt.session_limit AS limit, coalesce(qt.priority, 0) AS priority
+                    """
+                )
+            ]
+            queries = {
+                r["text"]: float(r["usage"]) + 1.0
+                for r in session.run(
+                    """
+                    MATCH (e:Example)
+                    WHERE e.type = 'positive' AND coalesce(e.success_rate, 0) > 0.8
+                      AND e.text IS NOT NULL
+                    RETURN e.text AS text, coalesce(e.usage_count, 0) AS usage
+                    """
+                )
+            }
+
+        type_weights: dict[str, float] = {}
+        for qt in query_types:
+            weight = float(max(qt.get("priority") or 0, 0)) + 1.0
+            for label in (qt.get("name"), qt.get("korean")):
+                if label:
+                    type_weights[label] = max(weight, type_weights.get(label, 0.0))
+
+        with self._lock:
+            self._apply_rules(removed_ids, added)
+            self._replace_kind(KIND_QUERY_TYPE, type_weights)
+            self._replace_kind(KIND_QUERY, queries)
+            self.query_types = query_types
+            self.version = snapshot.version
+        logger.info(
+            "PrefixIndex refreshed: +%d/-%d rules, %d entries",
+            len(added),
+            len(removed_ids),
+            len(self),
+        )
+        return True
+
+    def refresh_in_background(
+        self,
+        session_factory: Callable[[], AbstractContextManager[Any]],
+        interval: float = REFRESH_INTERVAL_SECONDS,
+    ) -> bool:
+        """마지막 확인 후 ``interval`` 초가 지났으면 백그라운드 갱신을 시작합니다.
+
+        Returns:
+            새 갱신 스레드를 시작했으면 True.
+        """
+        with self._lock:
+            running = (
+                self._refresh_thread is not None and self._refresh_thread.is_alive()
+            )
+            if running or (
+                self.loaded and time.monotonic() - self._last_refresh < interval
+            ):
+                return False
+            self._last_refresh = time.monotonic()
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_safely,
+                args=(session_factory,),
+                name="prefix-index-refresh",
+                daemon=True,
+            )
+            self._refresh_thread.start()
+            return True
+
+    def _refresh_safely(
+        self, session_factory: Callable[[], AbstractContextManager[Any]]
+    ) -> None:
+        try:
+            self.refresh(session_factory)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("PrefixIndex refresh failed: %s", exc)
+
+    def wait_for_refresh(self, timeout: float | None = None) -> None:
+        """진행 중인 백그라운드 갱신이 끝날 때까지 기다립니다."""
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+
+__all__ = [
+    "KIND_QUERY",
+    "KIND_QUERY_TYPE",
+    "KIND_RULE_KEYWORD",
+    "PrefixIndex",
+    "Suggestion",
+    "choseong",
+    "decompose_jamo",
+    "extract_keywords",
+]
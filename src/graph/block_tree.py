@@ -0,0 +1,147 @@
+"""Notion 블록 트리의 메모리 내 재구성과 규칙 섹션 그룹화.
+
+``QAGraphBuilder.extract_rules_from_notion`` 은 과거 heading마다 형제 블록을
+조회하고 column 블록마다 ``HAS_CHILD*`` 가변 길이 탐색을 실행했습니다(N+1).
+여기서는 페이지별 최상위 블록 목록과 ``HAS_CHILD`` 간선을 한 번씩만 받아
+트리를 메모리에서 재구성한 뒤, heading별 규칙 텍스트를 로컬에서 계산합니다.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+RULE_BLOCK_TYPES = frozenset({"paragraph", "bulleted_list_item", "callout"})
+CONTAINER_BLOCK_TYPES = frozenset({"column_list", "column"})
+
+
+@dataclass(frozen=True)
+class BlockRecord:
+    """Block fields needed for rule extraction."""
+
+    id: str
+    type: str | None
+    content: str | None
+    order: float | None = None
+
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> BlockRecord:
+        """Build from a Neo4j record or dict with id/type/content/order keys."""
+        return cls(
+            id=record["id"],
+            type=record.get("type"),
+            content=record.get("content"),
+            order=record.get("order"),
+        )
+
+    def sort_key(self) -> tuple[bool, float]:
+        """Sort by ``order`` with unordered blocks last."""
+        return (self.order is None, self.order or 0)
+
+
+class BlockForest:
+    """Children index built from streamed ``HAS_CHILD`` edges.
+
+    Args:
+        edges: Records with ``parent_id`` plus the child's block fields.
+    """
+
+    def __init__(self, edges: Iterable[Mapping[str, Any]] = ()) -> None:
+        """Index edges by parent id."""
+        self._children: dict[str, list[BlockRecord]] = {}
+        for edge in edges:
+            self._children.setdefault(edge["parent_id"], []).append(
+                BlockRecord.from_record(edge)
+            )
+        for children in self._children.values():
+            children.sort(key=BlockRecord.sort_key)
+
+    def __len__(self) -> int:
+        """Number of parents with children."""
+        return len(self._children)
+
+    def descendants(self, block_id: str) -> Iterator[BlockRecord]:
+        """Yield descendants of ``block_id`` in document (pre-)order."""
+        stack = list(reversed(self._children.get(block_id, [])))
+        seen: set[str] = set()
+        while stack:
+            block = stack.pop()
+            if block.id in seen:
+                continue
+            seen.add(block.id)
+            yield block
+            stack.extend(reversed(self._children.get(block.id, [])))
+
+
+def section_rules(
+    blocks: Sequence[BlockRecord],
+    start_order: float,
+    forest: BlockForest,
+) -> list[str]:
+    """Collect rule texts following a heading until the next ``heading_1``.
+
+    Args:
+        blocks: Top-level blocks of the page sorted by ``order``.
+        start_order: ``order`` of the heading block.
+        forest: Children index used to expand column containers.
+
+    Returns:
+        Rule texts in document order.
+    """
+    return group_page_rules(blocks, [{"start_order": start_order}], forest)[0][1]
+
+
+def _section_rules(
+    blocks: Sequence[BlockRecord],
+    orders: Sequence[float],
+    start_order: float,
+    forest: BlockForest,
+) -> list[str]:
+    rules: list[str] = []
+    for block in blocks[bisect.bisect_right(orders, start_order) :]:
+        if block.type == "heading_1":
+            break
+        if block.type in RULE_BLOCK_TYPES:
+            rules.append(block.content or "")
+        elif block.type in CONTAINER_BLOCK_TYPES:
+            rules.extend(
+                d.content
+                for d in forest.descendants(block.id)
+                if d.type in RULE_BLOCK_TYPES and d.content
+            )
+    return rules
+
+
+def group_page_rules(
+    blocks: Sequence[BlockRecord],
+    headings: Sequence[Mapping[str, Any]],
+    forest: BlockForest,
+) -> list[tuple[Mapping[str, Any], list[str]]]:
+    """Group rule texts under each heading of one page.
+
+    Args:
+        blocks: Top-level blocks of the page sorted by ``order``.
+        headings: Heading records (``start_order``, ``section``) of the page.
+        forest: Children index used to expand column containers.
+
+    Returns:
+        (heading, rule texts) pairs in the order of ``headings``.
+    """
+    # ``b.order > $start_order`` 와 같이 order가 없는 블록은 제외합니다.
+    ordered = [b for b in blocks if b.order is not None]
+    orders = [b.order for b in ordered if b.order is not None]
+    return [
+        (h, _section_rules(ordered, orders, h["start_order"], forest)) for h in headings
+    ]
+
+
+__all__ = [
+    "CONTAINER_BLOCK_TYPES",
+    "RULE_BLOCK_TYPES",
+    "BlockForest",
+    "BlockRecord",
+    "group_page_rules",
+    "section_rules",
+]
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
 import sys
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from dotenv import load_dotenv
@@ -13,6 +16,8 @@ from neo4j.exceptions import Neo4jError
 
 from src.config.utils import require_env
 
+from .block_tree import BlockForest, BlockRecord, group_page_rules
+from .linking import LinkStats, chunked, contains_pairs
 from .mappings import CONSTRAINT_KEYWORDS, EXAMPLE_RULE_MAPPINGS, QUERY_TYPE_KEYWORDS
 from .schema import (
     BEST_PRACTICES,
@@ -70,96 +75,240 @@ class QAGraphBuilder:
             )
         self.logger.info("스키마 고유 제약 생성/확인 완료")
 
-    def extract_rules_from_notion(self) -> None:
-        """Notion 문서에서 규칙 추출 및 그래프화 (UNWIND 배치 처리)."""
+    def extract_rules_from_notion(self, max_workers: int = 4) -> None:
+        """Notion 문서에서 규칙 추출 및 그래프화 (UNWIND 배치 처리).
+
+        페이지마다 블록 트리를 한 번의 쿼리로 가져와 heading별 규칙을
+        메모리에서 계산합니다. 여러 페이지는 ``max_workers`` 개의 세션으로
+        병렬 조회합니다.
+
+        Args:
+            max_workers: 페이지 블록 트리를 병렬 조회할 최대 세션 수.
+        """
         with self.driver.session() as session:
             # 1. Find headings
             headings = self._fetch_rule_headings(session)
 
-            # 2. Collect all rules into batch
-            rules_batch: list[dict[str, Any]] = []
-            for h in headings:
-                current_rules = self._collect_rules_for_heading(session, h)
-
-                for rule_text in current_rules:
-                    if not rule_text or len(rule_text) <= 10:
-                        continue
-
-                    # 접두사를 포함한 해시 기반 ID로 중복 방지
-                    rid = f"rule_{hashlib.sha256(rule_text.encode('utf-8')).hexdigest()[:16]}"
-                    rules_batch.append(
-                        {
-                            "id": rid,
-                            "text": rule_text,
-                            "section": h["section"],
-                        }
-                    )
+            # 2. Group rules per heading from one block tree per page
+            rules_batch = self._build_rule_batch(session, headings, max_workers)
 
             # 3. Batch insert using UNWIND
-            if rules_batch:
-                session.run(
-                    """
-                    UNWIND $batch AS item
-                    MERGE (r:Rule {id: item.id})
-                    SET r.text = item.text,
-                        r.section = item.section,
-                        r.priority = 'high'
-                    """,
-                    batch=rules_batch,
-                )
+            self._merge_rules(session, rules_batch)
             print(f"✅ 규칙 {len(rules_batch)}개 추출/병합 완료 (배치 처리)")
 
-    def _fetch_rule_headings(self, session: Any) -> list[dict[str, Any]]:
+    def sync_rules_for_pages(
+        self,
+        page_ids: list[str] | None = None,
+        max_workers: int = 4,
+    ) -> set[str]:
+        """변경된 페이지의 규칙만 다시 추출하고 새 규칙만 연결 (증분 모드).
+
+        규칙 ID가 텍스트 해시이므로 내용이 그대로인 규칙은 임베딩과 연결을
+        유지합니다. 새 규칙 노드는 ``embedding`` 이 없어 다음 벡터 인덱스
+        초기화(``Neo4jVector.from_existing_graph``) 때 해당 노드만 임베딩되고,
+        페이지에서 사라진 규칙은 다른 페이지가 참조하지 않으면 삭제됩니다.
+
+        Args:
+            page_ids: 대상 페이지 ID. None이면 ``rules_dirty`` 로 표시된 페이지.
+            max_workers: 페이지 블록 트리를 병렬 조회할 최대 세션 수.
+
+        Returns:
+            새로 생성되어 임베딩/연결 대상이 된 규칙 ID 집합.
+        """
+        with self.driver.session() as session:
+            if page_ids is None:
+                page_ids = [
+                    r["id"]
+                    for r in session.run(
+                        "MATCH (p:Page) WHERE p.rules_dirty RETURN p.id AS id",
+                    ).data()
+                ]
+            if not page_ids:
+                print("ℹ️  변경된 페이지 없음 (규칙 동기화 생략)")
+                return set()
+
+            headings = self._fetch_rule_headings(session, page_ids)
+            rules_batch = self._build_rule_batch(session, headings, max_workers)
+            rule_ids = sorted({item["id"] for item in rules_batch})
+            existing = {
+                r["id"]
+                for r in session.run(
+                    "UNWIND $ids AS id MATCH (r:Rule {id: id}) RETURN r.id AS id",
+                    ids=rule_ids,
+                )
+            }
+            self._merge_rules(session, rules_batch)
+
+            keep: dict[str, set[str]] = {pid: set() for pid in page_ids}
+            for item in rules_batch:
+                keep[item["page_id"]].add(item["id"])
+            result = session.run(
+                """
+                UNWIND $pages AS item
+                MATCH (r:Rule)
+                WHERE item.page IN coalesce(r.page_ids, []) AND NOT r.id IN item.keep
+                SET r.page_ids = [p IN r.page_ids WHERE p <> item.page]
+                WITH DISTINCT r
+                WHERE size(r.page_ids) = 0
+                DETACH DELETE r
+                RETURN count(r) AS deleted
+                """,
+                pages=[{"page": pid, "keep": sorted(ids)} for pid, ids in keep.items()],
+            ).single()
+            deleted = result["deleted"] if result else 0
+
+        touched = set(rule_ids) - existing
+        if touched:
+            self.link_rules_to_constraints(rule_ids=touched)
+            self.link_rules_to_query_types(rule_ids=touched)
+            self.link_examples_to_rules(rule_ids=touched)
+
+        # 연결까지 끝난 뒤에 표시를 지워 실패 시 다음 실행에서 재시도합니다.
+        with self.driver.session() as session:
+            session.run(
+                "UNWIND $ids AS id MATCH (p:Page {id: id}) SET p.rules_dirty = false",
+                ids=page_ids,
+            )
+        print(
+            f"✅ 규칙 증분 동기화: 페이지 {len(page_ids)}개, "
+            f"신규 {len(touched)}개, 삭제 {deleted}개"
+        )
+        return touched
+
+    def _build_rule_batch(
+        self,
+        session: Any,
+        headings: list[dict[str, Any]],
+        max_workers: int,
+    ) -> list[dict[str, Any]]:
+        rules_per_heading = self._collect_rules_by_page(session, headings, max_workers)
+
+        rules_batch: list[dict[str, Any]] = []
+        for h, current_rules in zip(headings, rules_per_heading):
+            for rule_text in current_rules:
+                if not rule_text or len(rule_text) <= 10:
+                    continue
+
+                # 접두사를 포함한 해시 기반 ID로 중복 방지
+                rid = (
+                    f"rule_{hashlib.sha256(rule_text.encode('utf-8')).hexdigest()[:16]}"
+                )
+                rules_batch.append(
+                    {
+                        "id": rid,
+                        "text": rule_text,
+                        "section": h["section"],
+                        "page_id": h["page_id"],
+                    }
+                )
+        return rules_batch
+
+    def _merge_rules(self, session: Any, rules_batch: list[dict[str, Any]]) -> None:
+        if not rules_batch:
+            return
+        # section이 바뀌면 임베딩 입력(text, section)이 달라지므로 임베딩을 비웁니다.
+        session.run(
+            """
+            UNWIND $batch AS item
+            MERGE (r:Rule {id: item.id})
+            SET r.embedding = CASE
+                    WHEN r.section = item.section THEN r.embedding
+                    ELSE null
+                END,
+                r.text = item.text,
+                r.section = item.section,
+                r.priority = 'high',
+                r.page_ids = CASE
+                    WHEN item.page_id IN coalesce(r.page_ids, []) THEN r.page_ids
+                    ELSE coalesce(r.page_ids, []) + item.page_id
+                END
+            """,
+            batch=rules_batch,
+        )
+
+    def _fetch_rule_headings(
+        self,
+        session: Any,
+        page_ids: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
         headings: list[dict[str, Any]] = session.run(
             """
             MATCH (p:Page)-[:HAS_BLOCK]->(h:Block)
             WHERE h.type = 'heading_1' AND h.content CONTAINS '자주 틀리는'
+              AND ($page_ids IS NULL OR p.id IN $page_ids)
             RETURN p.id as page_id, h.order as start_order, h.content as section
             """,
+            page_ids=page_ids,
         ).data()
         return headings
 
-    def _collect_rules_for_heading(
+    def _collect_rules_by_page(
+        self,
+        session: Any,
+        headings: list[dict[str, Any]],
+        max_workers: int,
+    ) -> list[list[str]]:
+        """Return rule texts for each heading, in the order of ``headings``."""
+        by_page: dict[str, list[int]] = {}
+        for i, h in enumerate(headings):
+            by_page.setdefault(h["page_id"], []).append(i)
+
+        def page_rules(
+            page_session: Any, page_id: str, indexes: list[int]
+        ) -> list[tuple[Any, list[str]]]:
+            blocks, forest = self._fetch_page_tree(page_session, page_id)
+            return group_page_rules(blocks, [headings[i] for i in indexes], forest)
+
+        def page_rules_in_new_session(
+            item: tuple[str, list[int]],
+        ) -> list[tuple[Any, list[str]]]:
+            # Neo4j 세션은 스레드 간 공유할 수 없으므로 페이지마다 새로 엽니다.
+            with self.driver.session() as page_session:
+                return page_rules(page_session, *item)
+
+        workers = min(max_workers, len(by_page))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                grouped = list(executor.map(page_rules_in_new_session, by_page.items()))
+        else:
+            grouped = [page_rules(session, *item) for item in by_page.items()]
+
+        rules_per_heading: list[list[str]] = [[] for _ in headings]
+        for indexes, page_groups in zip(by_page.values(), grouped):
+            for i, (_, rules) in zip(indexes, page_groups):
+                rules_per_heading[i] = rules
+        return rules_per_heading
+
+    def _fetch_page_tree(
         self,
         session: Any,
-        heading: dict[str, Any],
-    ) -> list[str]:
-        siblings = session.run(
+        page_id: str,
+    ) -> tuple[list[BlockRecord], BlockForest]:
+        """페이지의 최상위 블록과 column 하위 ``HAS_CHILD`` 간선을 한 번에 조회."""
+        records = session.run(
             """
-            MATCH (p:Page {id: $page_id})-[:HAS_BLOCK]->(b:Block)
-            WHERE b.order > $start_order
-            RETURN b.id as id, b.content as content, b.type as type
-            ORDER BY b.order ASC
+            MATCH (:Page {id: $page_id})-[:HAS_BLOCK]->(b:Block)
+            RETURN null AS parent_id, b.id AS id, b.type AS type,
+                   b.content AS content, b.order AS order
+            UNION ALL
+            MATCH (:Page {id: $page_id})-[:HAS_BLOCK]->(root:Block)
+            WHERE root.type IN ['column_list', 'column']
+            MATCH (root)-[:HAS_CHILD*0..]->(parent:Block)-[:HAS_CHILD]->(d:Block)
+            RETURN DISTINCT parent.id AS parent_id, d.id AS id, d.type AS type,
+                   d.content AS content, d.order AS order
             """,
-            page_id=heading["page_id"],
-            start_order=heading["start_order"],
+            page_id=page_id,
         )
-        siblings_list = list(siblings)
-
-        current_rules: list[str] = []
-        for sib in siblings_list:
-            if sib["type"] == "heading_1":
-                break
-
-            if sib["type"] in ["paragraph", "bulleted_list_item", "callout"]:
-                current_rules.append(sib["content"])
-                continue
-
-            if sib["type"] in ["column_list", "column"]:
-                descendants = session.run(
-                    """
-                    MATCH (b:Block {id: $id})-[:HAS_CHILD*]->(d:Block)
-                    WHERE d.type IN ['paragraph', 'bulleted_list_item', 'callout']
-                    RETURN d.content as content
-                    """,
-                    id=sib["id"],
-                )
-                desc_list: list[dict[str, Any]] = [dict(d) for d in descendants]
-                current_rules.extend(
-                    d.get("content", "") for d in desc_list if d.get("content")
-                )
-
-        return current_rules
+        blocks: list[BlockRecord] = []
+        edges: list[dict[str, Any]] = []
+        for record in records:
+            row = dict(record)
+            if row.get("parent_id") is None:
+                blocks.append(BlockRecord.from_record(row))
+            else:
+                edges.append(row)
+        blocks.sort(key=BlockRecord.sort_key)
+        return blocks, BlockForest(edges)
 
     def extract_query_types(self) -> None:
         """질의 유형 정의 추출 (UNWIND 배치 처리)."""
@@ -261,27 +410,83 @@ class QAGraphBuilder:
 
         print(f"✅ 제약 조건 {len(CONSTRAINTS)}개 생성/병합 (배치 처리)")
 
-    def link_rules_to_constraints(self) -> None:
-        """규칙과 제약 조건 연결(기본 포함 매칭 + 키워드 기반 보강)."""
+    @staticmethod
+    def _select_rules(
+        rules: dict[str, str], rule_ids: Collection[str] | None
+    ) -> dict[str, str]:
+        """``rule_ids`` 가 주어지면 해당 규칙만 남깁니다 (증분 연결)."""
+        if rule_ids is None:
+            return rules
+        return {rid: text for rid, text in rules.items() if rid in rule_ids}
+
+    def _fetch_id_map(self, session: Any, query: str) -> dict[str, str]:
+        """``id`` -> ``text`` 매핑 조회 (id/text가 없는 레코드는 제외)."""
+        rows: dict[str, str] = {}
+        for record in session.run(query):
+            node_id, text = record.get("id"), record.get("text")
+            if node_id is not None and text is not None:
+                rows[node_id] = text
+        return rows
+
+    def _merge_links(
+        self, session: Any, query: str, pairs: set[tuple[str, str]]
+    ) -> None:
+        """계산된 (src, dst) 쌍을 청크 단위 UNWIND로 기록."""
+        rows = [{"src": src, "dst": dst} for src, dst in sorted(pairs)]
+        for batch in chunked(rows):
+            session.run(query, batch=batch)
+
+    def link_rules_to_constraints(
+        self, rule_ids: Collection[str] | None = None
+    ) -> None:
+        """규칙과 제약 조건 연결(기본 포함 매칭 + 키워드 기반 보강).
+
+        포함 매칭은 클라이언트에서 Aho-Corasick으로 계산하고 결과 쌍만
+        UNWIND 배치로 기록하여 Rule x Constraint 카티전 곱을 피합니다.
+
+        Args:
+            rule_ids: 지정 시 해당 규칙만 연결 (증분 동기화).
+        """
         with self.driver.session() as session:
-            session.run(
+            rules = self._select_rules(
+                self._fetch_id_map(
+                    session, "MATCH (r:Rule) RETURN r.id AS id, r.text AS text"
+                ),
+                rule_ids,
+            )
+            constraints = self._fetch_id_map(
+                session,
+                "MATCH (c:Constraint) RETURN c.id AS id, c.description AS text",
+            )
+            stats = LinkStats("Rule-Constraint", len(rules), len(constraints))
+            # r.text CONTAINS c.description OR r.text CONTAINS c.id
+            base_patterns = [
+                *constraints.items(),
+                *((cid, cid) for cid in constraints),
+            ]
+            pairs = contains_pairs(rules, base_patterns, stats=stats)
+            # 키워드 기반 추가 연결 (대소문자 무시)
+            keyword_patterns = [
+                (cid, kw)
+                for cid, keywords in CONSTRAINT_KEYWORDS.items()
+                if cid in constraints
+                for kw in keywords
+            ]
+            pairs |= contains_pairs(
+                rules, keyword_patterns, case_insensitive=True, stats=stats
+            )
+            stats.links = len(pairs)
+            self._merge_links(
+                session,
                 """
-                MATCH (r:Rule), (c:Constraint)
-                WHERE (r.text CONTAINS c.description) OR (r.text CONTAINS c.id)
+                UNWIND $batch AS item
+                MATCH (r:Rule {id: item.src})
+                MATCH (c:Constraint {id: item.dst})
                 MERGE (r)-[:ENFORCES]->(c)
                 """,
+                pairs,
             )
-            # 키워드 기반 추가 연결
-            for cid, keywords in CONSTRAINT_KEYWORDS.items():
-                session.run(
-                    """
-                    MATCH (r:Rule), (c:Constraint {id: $cid})
-                    WHERE ANY(kw IN $keywords WHERE toLower(r.text) CONTAINS toLower(kw))
-                    MERGE (r)-[:ENFORCES]->(c)
-                    """,
-                    cid=cid,
-                    keywords=keywords,
-                )
+            self.logger.info(stats.summary())
             result = session.run(
                 "MATCH (r:Rule)-[:ENFORCES]->(c:Constraint) RETURN count(*) AS links",
             ).single()
@@ -333,25 +538,56 @@ class QAGraphBuilder:
                 for ex in examples_batch[:3]:
                     print(f"   [{ex['type']}] {ex['text'][:50]}...")
 
-    def link_examples_to_rules(self) -> None:
-        """예시와 규칙 연결 (텍스트 포함 + 수동 매핑 기반, UNWIND 배치 처리)."""
+    def link_examples_to_rules(self, rule_ids: Collection[str] | None = None) -> None:
+        """예시와 규칙 연결 (텍스트 포함 + 수동 매핑 기반, UNWIND 배치 처리).
+
+        Args:
+            rule_ids: 지정 시 해당 규칙만 연결 (증분 동기화).
+        """
         with self.driver.session() as session:
-            # 긍정 예시: DEMONSTRATES
-            session.run(
-                """
-                MATCH (e:Example {type: 'positive'}), (r:Rule)
-                WHERE e.text CONTAINS r.text OR r.text CONTAINS e.text
-                MERGE (e)-[:DEMONSTRATES]->(r)
-                """,
-            )
-            # 부정 예시: VIOLATES
-            session.run(
-                """
-                MATCH (e:Example {type: 'negative'}), (r:Rule)
-                WHERE e.text CONTAINS r.text OR r.text CONTAINS e.text
-                MERGE (e)-[:VIOLATES]->(r)
-                """,
+            rules = self._select_rules(
+                self._fetch_id_map(
+                    session, "MATCH (r:Rule) RETURN r.id AS id, r.text AS text"
+                ),
+                rule_ids,
             )
+            examples: dict[str, dict[str, str]] = {"positive": {}, "negative": {}}
+            for record in session.run(
+                "MATCH (e:Example) RETURN e.id AS id, e.text AS text, e.type AS type",
+            ):
+                bucket = examples.get(record.get("type"))
+                if (
+                    bucket is not None
+                    and record.get("id") is not None
+                    and record.get("text") is not None
+                ):
+                    bucket[record["id"]] = record["text"]
+
+            # 긍정 예시: DEMONSTRATES, 부정 예시: VIOLATES
+            for ex_type, rel_type in (
+                ("positive", "DEMONSTRATES"),
+                ("negative", "VIOLATES"),
+            ):
+                texts = examples[ex_type]
+                stats = LinkStats(f"Example({ex_type})-Rule", len(texts), len(rules))
+                # e.text CONTAINS r.text OR r.text CONTAINS e.text
+                pairs = contains_pairs(texts, rules.items(), stats=stats)
+                pairs |= {
+                    (eid, rid)
+                    for rid, eid in contains_pairs(rules, texts.items(), stats=stats)
+                }
+                stats.links = len(pairs)
+                self._merge_links(
+                    session,
+                    f"""
+                    UNWIND $batch AS item
+                    MATCH (e:Example {{id: item.src}})
+                    MATCH (r:Rule {{id: item.dst}})
+                    MERGE (e)-[:{rel_type}]->(r)
+                    """,
+                    pairs,
+                )
+                self.logger.info(stats.summary())
 
             # 수동 매핑 테이블 배치 처리
             mapping_batch = [
@@ -471,24 +707,42 @@ class QAGraphBuilder:
             )
         print(f"✅ 모범 사례 {len(BEST_PRACTICES)}개 생성/연결 (배치 처리)")
 
-    def link_rules_to_query_types(self) -> None:
-        """Rule을 QueryType과 연계 (키워드 기반 배치 매핑)."""
-        # 키워드 배치 수집
-        keyword_batch = [
-            {"qt": qt, "keywords": keywords}
-            for qt, keywords in QUERY_TYPE_KEYWORDS.items()
-        ]
+    def link_rules_to_query_types(
+        self, rule_ids: Collection[str] | None = None
+    ) -> None:
+        """Rule을 QueryType과 연계 (키워드 기반 배치 매핑).
+
+        Args:
+            rule_ids: 지정 시 해당 규칙만 연결 (증분 동기화).
+        """
         with self.driver.session() as session:
-            for item in keyword_batch:
-                session.run(
-                    """
-                    MATCH (r:Rule), (q:QueryType {name: $qt})
-                    WHERE ANY(kw IN $keywords WHERE toLower(r.text) CONTAINS toLower(kw))
-                    MERGE (r)-[:APPLIES_TO]->(q)
-                    """,
-                    qt=item["qt"],
-                    keywords=item["keywords"],
-                )
+            rules = self._select_rules(
+                self._fetch_id_map(
+                    session, "MATCH (r:Rule) RETURN r.id AS id, r.text AS text"
+                ),
+                rule_ids,
+            )
+            stats = LinkStats("Rule-QueryType", len(rules), len(QUERY_TYPE_KEYWORDS))
+            keyword_patterns = [
+                (qt, kw)
+                for qt, keywords in QUERY_TYPE_KEYWORDS.items()
+                for kw in keywords
+            ]
+            pairs = contains_pairs(
+                rules, keyword_patterns, case_insensitive=True, stats=stats
+            )
+            stats.links = len(pairs)
+            self._merge_links(
+                session,
+                """
+                UNWIND $batch AS item
+                MATCH (r:Rule {id: item.src})
+                MATCH (q:QueryType {name: item.dst})
+                MERGE (r)-[:APPLIES_TO]->(q)
+                """,
+                pairs,
+            )
+            self.logger.info(stats.summary())
         print("✅ Rule→QueryType 매핑 (키워드 확장) 완료")
 
 
@@ -500,6 +754,12 @@ def main() -> None:
 
     builder = QAGraphBuilder(uri, user, password)
     try:
+        if os.getenv("NOTION_SYNC_MODE", "full").lower() == "incremental":
+            print("🔨 QA 그래프 증분 동기화 중...\n")
+            builder.create_schema_constraints()
+            builder.sync_rules_for_pages()
+            print("\n✅ QA 그래프 증분 동기화 완료!")
+            return
         print("🔨 QA 그래프 스키마 구축 중...\n")
         builder.create_schema_constraints()
         builder.extract_rules_from_notion()
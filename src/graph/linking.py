@@ -0,0 +1,175 @@
+"""클라이언트 측 문자열 포함 매칭 기반 노드 연결 엔진.
+
+``QAGraphBuilder`` 의 Rule-Constraint, Example-Rule 연결은 Neo4j 안에서
+``MATCH (a), (b) WHERE a.text CONTAINS b.text`` 카티전 곱으로 계산되어
+O(|A| x |B|) 문자열 비교가 필요했습니다. 이 모듈은 패턴 쪽 텍스트로
+Aho-Corasick 오토마톤을 만들고 각 텍스트를 한 번씩만 스캔해
+``CONTAINS`` 와 동일한 결과를 O(전체 텍스트 길이 + 매치 수)로 계산합니다.
+
+토큰 기반 역색인은 토큰 경계 안쪽의 부분 문자열 매치와 한 글자 키워드
+(예: "표")를 놓치므로, 기존 링크와 동일한 결과를 위해 원문 문자 단위로
+매칭합니다.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Hashable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+LINK_BATCH_SIZE = 1000
+
+
+class AhoCorasick(Generic[T]):
+    """Multi-pattern substring matcher.
+
+    Each pattern carries payloads (e.g. node ids); ``search`` returns the
+    payloads of every pattern occurring in a text. An empty pattern occurs in
+    every text, as with Cypher ``CONTAINS ''``.
+
+    Args:
+        case_insensitive: Lower-case patterns and texts before matching.
+    """
+
+    def __init__(self, *, case_insensitive: bool = False) -> None:
+        """Initialize an empty automaton."""
+        self.case_insensitive = case_insensitive
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[set[T]] = [set()]
+        self._always: set[T] = set()
+        self._built = True
+
+    def add(self, pattern: str, payload: T) -> None:
+        """Register ``payload`` for ``pattern``."""
+        if self.case_insensitive:
+            pattern = pattern.lower()
+        if not pattern:
+            self._always.add(payload)
+            return
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(set())
+            state = nxt
+        self._out[state].add(payload)
+        self._built = False
+
+    def _build(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] |= self._out[self._fail[nxt]]
+        self._built = True
+
+    def iter_matches(self, text: str) -> Iterator[T]:
+        """Yield payloads of pattern occurrences (repeats included)."""
+        if not self._built:
+            self._build()
+        yield from self._always
+        if self.case_insensitive:
+            text = text.lower()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                yield from out[state]
+
+    def search(self, text: str) -> set[T]:
+        """Return payloads of all patterns contained in ``text``."""
+        return set(self.iter_matches(text))
+
+
+@dataclass
+class LinkStats:
+    """Matching statistics for one linking pass."""
+
+    name: str
+    sources: int = 0
+    targets: int = 0
+    candidate_pairs: int = 0
+    links: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def cartesian_pairs(self) -> int:
+        """Pairs the Cypher cross product would have compared."""
+        return self.sources * self.targets
+
+    def summary(self) -> str:
+        """One-line summary for logs."""
+        return (
+            f"{self.name}: {self.links} links from {self.candidate_pairs} candidates "
+            f"(cartesian {self.cartesian_pairs}) in {self.elapsed_seconds:.3f}s"
+        )
+
+
+def contains_pairs(
+    texts: dict[str, str],
+    patterns: Iterable[tuple[str, str]],
+    *,
+    case_insensitive: bool = False,
+    stats: LinkStats | None = None,
+) -> set[tuple[str, str]]:
+    """Return (text_id, pattern_id) pairs where the text contains the pattern.
+
+    Args:
+        texts: Text id -> text.
+        patterns: (pattern_id, pattern) pairs; one id may have many patterns.
+        case_insensitive: Compare lower-cased strings (Cypher ``toLower``).
+        stats: Optional stats object; candidate count and timing are added.
+    """
+    start = time.perf_counter()
+    automaton: AhoCorasick[str] = AhoCorasick(case_insensitive=case_insensitive)
+    for pattern_id, pattern in patterns:
+        automaton.add(pattern, pattern_id)
+
+    pairs: set[tuple[str, str]] = set()
+    candidates = 0
+    for text_id, text in texts.items():
+        for pattern_id in automaton.iter_matches(text):
+            candidates += 1
+            pairs.add((text_id, pattern_id))
+
+    if stats is not None:
+        stats.candidate_pairs += candidates
+        stats.elapsed_seconds += time.perf_counter() - start
+    return pairs
+
+
+def chunked(
+    rows: list[dict[str, Any]], size: int = LINK_BATCH_SIZE
+) -> Iterator[list[dict[str, Any]]]:
+    """Split UNWIND parameter rows into chunks of ``size``."""
+    for i in range(0, len(rows), size):
+        yield rows[i : i + size]
+
+
+__all__ = [
+    "LINK_BATCH_SIZE",
+    "AhoCorasick",
+    "LinkStats",
+    "chunked",
+    "contains_pairs",
+]
@@ -26,9 +26,11 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "Neo4jLoggingCallback": ("src.infra.callbacks", "Neo4jLoggingCallback"),
     "AdaptiveRateLimiter": ("src.infra.adaptive_limiter", "AdaptiveRateLimiter"),
     "AdaptiveStats": ("src.infra.adaptive_limiter", "AdaptiveStats"),
+    "LimiterPriority": ("src.infra.adaptive_limiter", "LimiterPriority"),
     "TwoTierIndexManager": ("src.infra.neo4j_optimizer", "TwoTierIndexManager"),
     "OptimizedQueries": ("src.infra.neo4j_optimizer", "OptimizedQueries"),
     "FeatureFlags": ("src.infra.feature_flags", "FeatureFlags"),
+    "RedisFlagSource": ("src.infra.feature_flags", "RedisFlagSource"),
     "measure_latency": ("src.infra.metrics", "measure_latency"),
     "measure_latency_async": ("src.infra.metrics", "measure_latency_async"),
 }
@@ -53,9 +55,11 @@ __all__ = [
     "BudgetTracker",
     "CustomCallback",
     "FeatureFlags",
+    "LimiterPriority",
     "Neo4jLoggingCallback",
     "OptimizedQueries",
     "RealTimeConstraintEnforcer",
+    "RedisFlagSource",
     "SafeDriver",
     "TwoTierIndexManager",
     "clean_markdown_code_block",
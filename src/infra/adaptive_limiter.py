@@ -1,23 +1,39 @@
-"""Adaptive Rate Limiter implementing a TCP Vegas-like algorithm.
+"""Adaptive Rate Limiter implementing a gradient (TCP Vegas-like) algorithm.
 
 Dynamically adjusts concurrency based on response latency and errors
 to optimize throughput while preventing 429 Too Many Requests errors.
+
+Waiters are parked on futures and woken explicitly when a slot is released
+or the limit grows, so idle queues cost no timer wakeups. Slots are handed
+out FIFO within a priority class, and interactive callers are served before
+batch callers.
 """
 
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import logging
+import math
 import time
+from collections import deque
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from enum import IntEnum
 
 logger = logging.getLogger(__name__)
 
-# Polling interval for checking slot availability (seconds)
-_POLL_INTERVAL = 0.1
+# p90 이 기준 RTT 의 이 배수 이내면 혼잡하지 않은 것으로 봅니다.
+_RTT_TOLERANCE = 1.5
+# 한 윈도우에서 줄일 수 있는 최대 비율 (gradient 하한)
+_MIN_GRADIENT = 0.5
+
+
+class LimiterPriority(IntEnum):
+    """Priority classes; lower values are served first."""
+
+    INTERACTIVE = 0
+    BATCH = 1
 
 
 @dataclass
@@ -28,22 +44,29 @@ class AdaptiveStats:
     success_count: int = 0
     throttle_count: int = 0
     avg_latency: float = 0.0
+    p90_latency: float = 0.0
+    min_rtt: float = 0.0
 
 
 class AdaptiveRateLimiter:
-    """Adaptive Rate Limiter implementing a TCP Vegas-like algorithm.
+    """Adaptive Rate Limiter implementing a gradient (TCP Vegas-like) algorithm.
 
-    Dynamically adjusts concurrency based on response latency and errors.
-    Uses Additive Increase/Multiplicative Decrease (AIMD) approach:
-    - Additive Increase: When latency is below target, increase limit linearly
+    After every window the limit is scaled by a gradient computed from the
+    windowed minimum RTT and the window's p90 latency:
+    - Additive Increase: When p90 stays within tolerance of the baseline RTT
+    - Proportional Decrease: When p90 inflates, scale by baseline / p90
     - Multiplicative Decrease: When errors occur, decrease limit by half
 
+    The baseline is ``min(min_rtt, target_latency)``, so a p90 above the
+    target latency also shrinks the limit.
+
     Args:
         initial_concurrency: Starting concurrency limit (default: 1)
         max_concurrency: Maximum allowed concurrency (default: 10)
         min_concurrency: Minimum allowed concurrency (default: 1)
         target_latency: Target response latency in seconds (default: 2.0)
         window_size: Number of requests before updating limits (default: 10)
+        rtt_windows: Number of recent windows the minimum RTT spans (default: 10)
     """
 
     def __init__(
@@ -53,6 +76,7 @@ class AdaptiveRateLimiter:
         min_concurrency: int = 1,
         target_latency: float = 2.0,
         window_size: int = 10,
+        rtt_windows: int = 10,
     ) -> None:
         """Initialize the adaptive rate limiter.
 
@@ -62,6 +86,7 @@ class AdaptiveRateLimiter:
             min_concurrency: Minimum allowed concurrency.
             target_latency: Target response latency in seconds.
             window_size: Number of requests before updating limits.
+            rtt_windows: Number of recent windows the minimum RTT spans.
         """
         self._current_limit = float(initial_concurrency)
         self._max_limit = max_concurrency
@@ -70,10 +95,12 @@ class AdaptiveRateLimiter:
         self._window_size = window_size
 
         self._latencies: list[float] = []
+        self._window_min_rtts: deque[float] = deque(maxlen=max(1, rtt_windows))
         self._errors = 0
-        self._lock = asyncio.Lock()
         self._active_count = 0
-        self._condition = asyncio.Condition(self._lock)
+        self._waiters: dict[LimiterPriority, deque[asyncio.Future[None]]] = {
+            priority: deque() for priority in LimiterPriority
+        }
 
         # Statistics
         self.stats = AdaptiveStats()
@@ -83,18 +110,25 @@ class AdaptiveRateLimiter:
         """Current concurrency limit."""
         return int(self._current_limit)
 
+    @property
+    def waiting(self) -> int:
+        """Number of callers queued for a slot."""
+        return sum(len(queue) for queue in self._waiters.values())
+
     def _update_limits(self) -> None:
         """Update concurrency limits based on recent performance."""
         if not self._latencies:
             return
 
-        avg_latency = sum(self._latencies) / len(self._latencies)
-        self.stats.avg_latency = avg_latency
-
-        # Vegas Algorithm Logic:
-        # If latency is below target (fast) -> increase rate
-        # If latency is above target (slow) -> decrease rate
+        ordered = sorted(self._latencies)
+        p90 = ordered[min(len(ordered) - 1, math.ceil(0.9 * len(ordered)) - 1)]
+        self._window_min_rtts.append(ordered[0])
+        min_rtt = min(self._window_min_rtts)
+        self.stats.avg_latency = sum(ordered) / len(ordered)
+        self.stats.p90_latency = p90
+        self.stats.min_rtt = min_rtt
 
+        previous = self.current_limit
         if self._errors > 0:
             # Error occurred: Multiplicative Decrease (halve the limit)
             self._current_limit = max(self._min_limit, self._current_limit * 0.5)
@@ -102,14 +136,18 @@ class AdaptiveRateLimiter:
                 "Throttling: Error detected. Limit reduced to %d",
                 self.current_limit,
             )
-
-        elif avg_latency < self._target_latency:
-            # Under target latency: Additive Increase
-            self._current_limit = min(self._max_limit, self._current_limit + 1)
-
         else:
-            # Above target latency: Additive Decrease
-            self._current_limit = max(self._min_limit, self._current_limit - 0.5)
+            baseline = min(min_rtt, self._target_latency)
+            gradient = _RTT_TOLERANCE * baseline / p90 if p90 > 0 else 1.0
+            if gradient >= 1.0:
+                # Queueing delay within tolerance: Additive Increase
+                self._current_limit = min(self._max_limit, self._current_limit + 1)
+            else:
+                # Latency inflated: decrease in proportion to the gradient
+                self._current_limit = max(
+                    self._min_limit,
+                    self._current_limit * max(_MIN_GRADIENT, gradient),
+                )
 
         self.stats.concurrency = self.current_limit
 
@@ -117,50 +155,79 @@ class AdaptiveRateLimiter:
         self._latencies.clear()
         self._errors = 0
 
+        if self.current_limit > previous:
+            self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to queued callers, highest priority first."""
+        for priority in LimiterPriority:
+            queue = self._waiters[priority]
+            while queue and self._active_count < self.current_limit:
+                waiter = queue.popleft()
+                if waiter.done():
+                    continue
+                self._active_count += 1
+                waiter.set_result(None)
+            if queue:
+                return
+
+    def _release_slot(self) -> None:
+        self._active_count -= 1
+        self._wake_waiters()
+
+    async def _take_slot(self, priority: LimiterPriority) -> None:
+        if self._active_count < self.current_limit and not self.waiting:
+            self._active_count += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue = self._waiters[priority]
+        queue.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was granted just before cancellation: give it back.
+                self._release_slot()
+            elif waiter in queue:
+                queue.remove(waiter)
+            raise
+
     @asynccontextmanager
-    async def acquire(self) -> AsyncIterator[None]:
+    async def acquire(
+        self,
+        priority: LimiterPriority = LimiterPriority.INTERACTIVE,
+    ) -> AsyncIterator[None]:
         """Acquire permission to send a request.
 
         Blocks if current concurrency limit is reached.
         Automatically tracks latency and adjusts limits based on performance.
 
+        Args:
+            priority: Priority class; queued interactive callers are
+                granted slots before any queued batch caller.
+
         Yields:
             None: Context manager that tracks request timing
 
         Raises:
             Exception: Re-raises any exception from the wrapped code
         """
-        # Wait until a slot becomes available using condition variable
-        async with self._condition:
-            while self._active_count >= self.current_limit:
-                # Use wait_for with timeout to periodically re-check the dynamic limit
-                with contextlib.suppress(TimeoutError):
-                    await asyncio.wait_for(
-                        self._condition.wait(),
-                        timeout=_POLL_INTERVAL,
-                    )
-            self._active_count += 1
+        await self._take_slot(priority)
 
         start_time = time.monotonic()
         error_occurred = False
 
         try:
             yield
-            async with self._lock:
-                self.stats.success_count += 1
+            self.stats.success_count += 1
         except Exception:
             error_occurred = True
-            async with self._lock:
-                self._errors += 1
-                self.stats.throttle_count += 1
+            self._errors += 1
+            self.stats.throttle_count += 1
             raise
         finally:
-            latency = time.monotonic() - start_time
-
-            async with self._condition:
-                self._active_count -= 1
-                self._latencies.append(latency)
-                if len(self._latencies) >= self._window_size or error_occurred:
-                    self._update_limits()
-                # Notify waiting coroutines that a slot is available
-                self._condition.notify()
+            self._latencies.append(time.monotonic() - start_time)
+            if len(self._latencies) >= self._window_size or error_occurred:
+                self._update_limits()
+            self._release_slot()
@@ -2,13 +2,28 @@
 
 Tracks token usage and calculates costs based on Gemini Flash pricing tiers.
 Provides budget enforcement, usage statistics, and cost alerts.
+
+사용량은 누적 합계, (모델, 질의 유형)별 집계, 고정 개수의 시간 버킷으로만
+보관하므로 메모리는 호출 수와 무관합니다. 원본 기록이 필요하면 회전되는
+JSONL 파일로 내보내고, 여러 프로세스가 같은 예산을 쓰려면
+``RedisBudgetLedger`` 로 비용을 ``INCRBYFLOAT`` 누적합니다.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import json
+import logging
+import logging.handlers
+import os
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
 # Gemini Flash pricing (USD per 1M tokens)
 # Source: Google AI Studio pricing page (<=200K tokens tier)
 GEMINI_FLASH_PRICING = {
@@ -20,12 +35,26 @@ GEMINI_FLASH_PRICING = {
 # Note: >200K tokens tier has higher rates:
 # Input: $4.00/1M, Output: $18.00/1M
 
+DEFAULT_MODEL = "gemini-flash-latest"
+# 시간 버킷 기본값: 1시간 × 24개
+DEFAULT_BUCKET_SECONDS = 3600
+DEFAULT_BUCKET_COUNT = 24
+# 최근 원본 기록 보관 개수
+DEFAULT_RECENT_RECORDS = 100
+# 원본 기록 스필 파일 회전 기준
+DEFAULT_SPILL_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_SPILL_BACKUPS = 3
+# 공유 예산 원장: 기본 기간(1일), Redis 타임아웃, 실패 후 재시도 대기
+DEFAULT_LEDGER_PERIOD_SECONDS = 86_400
+LEDGER_SOCKET_TIMEOUT_SECONDS = 0.5
+LEDGER_RETRY_AFTER_SECONDS = 30.0
+
 
 @dataclass
 class UsageRecord:
     """단일 LLM 호출의 사용량 기록."""
 
-    model: str = "gemini-flash-latest"
+    model: str = DEFAULT_MODEL
     input_tokens: int = 0
     output_tokens: int = 0
     cached_input_tokens: int = 0
@@ -35,21 +64,228 @@ class UsageRecord:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class UsageAggregate:
+    """사용량 누적 집계."""
+
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    cost_usd: float = 0.0
+
+    def add(self, record: UsageRecord) -> None:
+        """기록 하나를 더합니다."""
+        self.calls += 1
+        self.input_tokens += record.input_tokens
+        self.output_tokens += record.output_tokens
+        self.cached_input_tokens += record.cached_input_tokens
+        self.cost_usd += record.cost_usd
+
+
+@dataclass
+class _UsageBucket:
+    epoch: int
+    usage: UsageAggregate = field(default_factory=UsageAggregate)
+
+
+class RedisBudgetLedger:
+    """여러 프로세스가 공유하는 Redis 예산 원장.
+
+    ``add`` 는 ``INCRBYFLOAT`` 로 원자적으로 누적하고 새 합계를 캐시합니다.
+    ``spent_usd`` 는 캐시가 ``max_age`` 초보다 오래됐을 때만 ``GET`` 합니다.
+    ``period_seconds`` 가 주어지면 키를 ``{key}:{기간 번호}`` 로 나눠 기간마다
+    새로 누적하고, 지난 기간의 키는 TTL 로 만료됩니다.
+
+    Redis 호출이 실패하면 경고를 남기고 ``retry_after`` 초 동안 원장을
+    건너뛰며 None 을 반환합니다. 호출 측은 이때 로컬 합계로 판정합니다.
+
+    Args:
+        client: 동기 Redis 클라이언트 (``redis.Redis``)
+        key: 누적 비용 키 (기간을 쓰면 접두사)
+        period_seconds: 예산 기간 길이 (None 이면 기간 구분 없음)
+        ttl_seconds: 첫 기록 시 키에 설정할 만료 (기본: ``period_seconds``)
+        retry_after: 실패 후 원장을 다시 시도하기까지의 시간 (초)
+        clock: 시간 함수 (테스트용)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        key: str = "budget:spent_usd",
+        *,
+        period_seconds: int | None = None,
+        ttl_seconds: int | None = None,
+        retry_after: float = LEDGER_RETRY_AFTER_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the ledger."""
+        self.client = client
+        self.prefix = key
+        self.period_seconds = period_seconds
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else period_seconds
+        self.retry_after = retry_after
+        self._clock = clock
+        self._spent = 0.0
+        self._cached_key: str | None = None
+        self._fetched_at = 0.0
+        self._down_until = 0.0
+
+    @property
+    def key(self) -> str:
+        """현재 기간의 누적 비용 키."""
+        if not self.period_seconds:
+            return self.prefix
+        return f"{self.prefix}:{int(self._clock() // self.period_seconds)}"
+
+    def _failed(self, action: str, exc: Exception) -> None:
+        self._down_until = self._clock() + self.retry_after
+        logger.warning(
+            "Budget ledger %s failed, using local totals for %.0fs: %s",
+            action,
+            self.retry_after,
+            exc,
+        )
+
+    def add(self, cost_usd: float) -> float | None:
+        """비용을 누적하고 전체 합계를 반환합니다 (실패하면 None)."""
+        if cost_usd <= 0:
+            return self.spent_usd()
+        if self._clock() < self._down_until:
+            return None
+        key = self.key
+        try:
+            total = float(self.client.incrbyfloat(key, cost_usd))
+            if self.ttl_seconds and total == cost_usd:
+                self.client.expire(key, self.ttl_seconds)
+        except Exception as exc:  # noqa: BLE001
+            self._failed("update", exc)
+            return None
+        self._spent = total
+        self._cached_key = key
+        self._fetched_at = self._clock()
+        return total
+
+    def spent_usd(self, max_age: float = 1.0) -> float | None:
+        """전체 누적 비용 (``max_age`` 초 이내 값은 캐시, 실패하면 None)."""
+        now = self._clock()
+        key = self.key
+        if key == self._cached_key and now - self._fetched_at <= max_age:
+            return self._spent
+        if now < self._down_until:
+            return None
+        try:
+            raw = self.client.get(key)
+        except Exception as exc:  # noqa: BLE001
+            self._failed("read", exc)
+            return None
+        self._spent = float(raw) if raw else 0.0
+        self._cached_key = key
+        self._fetched_at = now
+        return self._spent
+
+
+def ledger_from_env() -> RedisBudgetLedger | None:
+    """``BUDGET_LEDGER_KEY`` 와 ``REDIS_URL`` 이 설정되면 원장을 만듭니다.
+
+    키는 ``BUDGET_LEDGER_PERIOD_SECONDS`` (기본 1일) 단위로 나뉘고 같은 시간의
+    TTL 이 붙습니다. 느린 Redis 가 호출 경로를 오래 막지 않도록 연결/읽기
+    타임아웃을 짧게 둡니다.
+    """
+    key = os.getenv("BUDGET_LEDGER_KEY")
+    url = os.getenv("REDIS_URL")
+    if not key or not url:
+        return None
+    try:
+        import redis
+    except ImportError:
+        logger.warning("BUDGET_LEDGER_KEY is set but redis is not installed")
+        return None
+    period = int(
+        os.getenv("BUDGET_LEDGER_PERIOD_SECONDS", str(DEFAULT_LEDGER_PERIOD_SECONDS))
+    )
+    client = redis.Redis.from_url(
+        url,
+        socket_connect_timeout=LEDGER_SOCKET_TIMEOUT_SECONDS,
+        socket_timeout=LEDGER_SOCKET_TIMEOUT_SECONDS,
+    )
+    return RedisBudgetLedger(client, key, period_seconds=period or None)
+
+
+class _SpillWriter:
+    """원본 사용량 기록을 회전되는 JSONL 파일에 덧붙입니다."""
+
+    def __init__(self, path: Path, max_bytes: int, backups: int) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._handler = logging.handlers.RotatingFileHandler(
+            path,
+            maxBytes=max_bytes,
+            backupCount=backups,
+            encoding="utf-8",
+            delay=True,
+        )
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def write(self, record: UsageRecord) -> None:
+        line = json.dumps(asdict(record), ensure_ascii=False, default=str)
+        self._handler.emit(logging.makeLogRecord({"msg": line}))
+
+    def close(self) -> None:
+        self._handler.close()
+
+
 class BudgetTracker:
-    """gemini-flash-latest 모델의 비용 추적 및 예산 관리."""
+    """gemini-flash-latest 모델의 비용 추적 및 예산 관리.
+
+    ``records`` 는 최근 ``recent_records`` 건만 보관합니다. 전체 기록이
+    필요하면 ``spill_path`` 를 지정하세요.
+    """
 
-    def __init__(self, budget_limit_usd: float = 1.0):
+    def __init__(
+        self,
+        budget_limit_usd: float = 1.0,
+        *,
+        bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+        bucket_count: int = DEFAULT_BUCKET_COUNT,
+        recent_records: int = DEFAULT_RECENT_RECORDS,
+        spill_path: Path | None = None,
+        spill_max_bytes: int = DEFAULT_SPILL_MAX_BYTES,
+        spill_backups: int = DEFAULT_SPILL_BACKUPS,
+        ledger: RedisBudgetLedger | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
         """Initialize the budget tracker.
 
         Args:
             budget_limit_usd: Maximum budget in USD.
+            bucket_seconds: 시간 버킷 길이 (초).
+            bucket_count: 보관할 시간 버킷 수.
+            recent_records: 메모리에 남길 최근 기록 수.
+            spill_path: 원본 기록을 덧붙일 JSONL 파일 (None 이면 기록 안 함).
+            spill_max_bytes: 스필 파일 회전 크기.
+            spill_backups: 보관할 회전 파일 수.
+            ledger: 프로세스 간 공유 예산 원장 (None 이면 로컬 합계만 사용).
+            clock: 시간 함수 (테스트용).
         """
         self.budget_limit_usd = budget_limit_usd
-        self.records: list[UsageRecord] = []
+        self.records: deque[UsageRecord] = deque(maxlen=recent_records)
+        self.total_calls = 0
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.total_cached_tokens = 0
         self.total_cost_usd = 0.0
+        self.by_model: dict[str, UsageAggregate] = {}
+        self.by_query_type: dict[str, UsageAggregate] = {}
+        self.bucket_seconds = bucket_seconds
+        self._buckets: list[_UsageBucket | None] = [None] * bucket_count
+        self._clock = clock
+        self.ledger = ledger
+        self._ledger_synced_cost = 0.0
+        self._spill = (
+            _SpillWriter(spill_path, spill_max_bytes, spill_backups)
+            if spill_path is not None
+            else None
+        )
 
     def record_usage(
         self,
@@ -61,10 +297,12 @@ class BudgetTracker:
         output_tokens: int | None = None,
         cached_input_tokens: int | None = None,
         total_tokens: int | None = None,
+        model: str | None = None,
     ) -> UsageRecord:
         """LLM 사용량 기록 및 비용 계산.
 
         `usage` 딕셔너리 혹은 개별 토큰 수 인자를 모두 지원한다.
+        질의 유형은 ``metadata["query_type"]`` 으로 집계된다.
         """
         usage = usage or {}
         if input_tokens is not None:
@@ -98,24 +336,90 @@ class BudgetTracker:
         ]
         total_cost = cost_input + cost_output + cost_cached
 
+        metadata = metadata or {}
         record = UsageRecord(
+            model=model or metadata.get("model") or DEFAULT_MODEL,
             input_tokens=input_tokens_val,
             output_tokens=output_tokens_val,
             cached_input_tokens=cached_tokens_val,
             total_tokens=total_tokens_val,
             cost_usd=total_cost,
             timestamp=timestamp,
-            metadata=metadata or {},
+            metadata=metadata,
         )
 
         self.records.append(record)
+        self.total_calls += 1
         self.total_input_tokens += input_tokens_val
         self.total_output_tokens += output_tokens_val
         self.total_cached_tokens += cached_tokens_val
         self.total_cost_usd += total_cost
+        self._aggregate(record, str(metadata.get("query_type", "unknown")))
+        if self._spill is not None:
+            self._spill.write(record)
+        if self.ledger is not None:
+            self._sync_ledger(self.ledger)
 
         return record
 
+    def _sync_ledger(self, ledger: RedisBudgetLedger) -> None:
+        """마지막 반영 이후 늘어난 비용만 원장에 더합니다.
+
+        원장 장애 동안 밀린 비용은 다음 성공한 ``add`` 에서 함께 반영됩니다.
+        """
+        delta = self.total_cost_usd - self._ledger_synced_cost
+        if delta > 0 and ledger.add(delta) is not None:
+            self._ledger_synced_cost = self.total_cost_usd
+
+    def _aggregate(self, record: UsageRecord, query_type: str) -> None:
+        model_usage = self.by_model.get(record.model)
+        if model_usage is None:
+            model_usage = self.by_model[record.model] = UsageAggregate()
+        model_usage.add(record)
+        type_usage = self.by_query_type.get(query_type)
+        if type_usage is None:
+            type_usage = self.by_query_type[query_type] = UsageAggregate()
+        type_usage.add(record)
+
+        epoch = int(self._clock() // self.bucket_seconds)
+        index = epoch % len(self._buckets)
+        bucket = self._buckets[index]
+        if bucket is None or bucket.epoch != epoch:
+            bucket = self._buckets[index] = _UsageBucket(epoch)
+        bucket.usage.add(record)
+
+    def get_recent_usage(self) -> list[dict[str, Any]]:
+        """보관 중인 시간 버킷별 사용량 (오래된 순).
+
+        Returns:
+            ``bucket_start`` (epoch 초)와 집계 필드를 가진 딕셔너리 리스트.
+        """
+        oldest = int(self._clock() // self.bucket_seconds) - len(self._buckets) + 1
+        live = sorted(
+            (b for b in self._buckets if b is not None and b.epoch >= oldest),
+            key=lambda b: b.epoch,
+        )
+        return [
+            {"bucket_start": b.epoch * self.bucket_seconds, **asdict(b.usage)}
+            for b in live
+        ]
+
+    def get_spent_usd(self) -> float:
+        """예산 판정에 쓰는 누적 비용 (원장이 있으면 전체 프로세스 합계).
+
+        원장을 읽지 못하면 이 프로세스의 합계를 반환합니다.
+        """
+        if self.ledger is not None:
+            shared = self.ledger.spent_usd()
+            if shared is not None:
+                return shared
+        return self.total_cost_usd
+
+    def close(self) -> None:
+        """스필 파일을 닫습니다."""
+        if self._spill is not None:
+            self._spill.close()
+
     def get_total_cost(self) -> float:
         """Get the total cost incurred so far."""
         return self.total_cost_usd
@@ -124,7 +428,7 @@ class BudgetTracker:
         """Get the percentage of budget used."""
         if self.budget_limit_usd <= 0:
             return 0.0
-        return (self.total_cost_usd / self.budget_limit_usd) * 100
+        return (self.get_spent_usd() / self.budget_limit_usd) * 100
 
     def is_budget_exceeded(self, threshold: float = 1.0) -> bool:
         """Check if budget has been exceeded.
@@ -140,12 +444,16 @@ class BudgetTracker:
     def get_statistics(self) -> dict[str, Any]:
         """Get usage statistics as a dictionary."""
         return {
-            "total_calls": len(self.records),
+            "total_calls": self.total_calls,
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
             "total_cached_tokens": self.total_cached_tokens,
             "total_cost_usd": self.total_cost_usd,
             "budget_limit_usd": self.budget_limit_usd,
             "budget_usage_percent": self.get_budget_usage_percent(),
-            "remaining_budget_usd": max(0, self.budget_limit_usd - self.total_cost_usd),
+            "remaining_budget_usd": max(
+                0, self.budget_limit_usd - self.get_spent_usd()
+            ),
+            "by_model": {k: asdict(v) for k, v in self.by_model.items()},
+            "by_query_type": {k: asdict(v) for k, v in self.by_query_type.items()},
         }
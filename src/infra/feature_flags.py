@@ -1,4 +1,9 @@
-"""Feature Flag 시스템 - Safe feature rollout and A/B testing."""
+"""Feature Flag 시스템 - Safe feature rollout and A/B testing.
+
+플래그 설정은 불변 평가 테이블(``_CompiledFlag``)로 컴파일되며, 설정 파일의
+mtime 이 바뀌거나 ``RedisFlagSource`` 로 갱신이 전파되면 테이블 참조를 통째로
+교체합니다. 평가 경로는 dict 조회 + 캐시된 사용자 해시로 끝납니다.
+"""
 
 from __future__ import annotations
 
@@ -6,12 +11,21 @@ import hashlib
 import json
 import logging
 import os
-from pathlib import Path
+import time
 from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# 설정 파일 mtime 확인 최소 간격 (초)
+DEFAULT_RELOAD_INTERVAL = 1.0
+# 사용자 해시 캐시 크기 (flag, user_id 쌍)
+USER_HASH_CACHE_SIZE = 65536
+
 
 def _op_equals(ctx_value: Any, value: Any) -> bool:
     return bool(ctx_value == value)
@@ -53,27 +67,175 @@ _RULE_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
 }
 
 
-def _evaluate_rule(operator: str, ctx_value: Any, value: Any) -> bool:
-    checker = _RULE_OPERATORS.get(operator)
-    if checker is None:
-        return True
-    return checker(ctx_value, value)
+def _op_unknown(ctx_value: Any, value: Any) -> bool:
+    return True
+
+
+@lru_cache(maxsize=USER_HASH_CACHE_SIZE)
+def _user_hash(flag_name: str, user_id: str) -> int:
+    """일관된 해시 기반 버킷 값 (SHA-256, feature 스코프 포함)."""
+    digest = hashlib.sha256(f"{flag_name}:{user_id}".encode()).digest()
+    return int.from_bytes(digest, "big")
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledFlag:
+    """평가용으로 미리 정규화된 플래그."""
+
+    name: str
+    enabled: bool
+    environments: frozenset[str]
+    whitelist: frozenset[str]
+    rollout_percent: int
+    rules: tuple[tuple[str, Callable[[Any, Any], bool], Any], ...]
+    variants: tuple[str, ...]
+
+
+_DEFAULT_ENVIRONMENTS = ("development", "staging", "production")
+
+
+def _compile_flags(flags: dict[str, Any]) -> MappingProxyType[str, _CompiledFlag]:
+    """원본 플래그 설정을 불변 평가 테이블로 컴파일합니다."""
+    table: dict[str, _CompiledFlag] = {}
+    for name, config in flags.items():
+        if not config:
+            continue
+        variants_raw = config.get("variants", ["control"])
+        variants = (
+            tuple(str(v) for v in variants_raw) or ("control",)
+            if isinstance(variants_raw, list)
+            else ("control",)
+        )
+        table[name] = _CompiledFlag(
+            name=name,
+            enabled=bool(config.get("enabled", False)),
+            environments=frozenset(config.get("environments", _DEFAULT_ENVIRONMENTS)),
+            whitelist=frozenset(config.get("whitelist", [])),
+            rollout_percent=config.get("rollout_percent", 100),
+            rules=tuple(
+                (
+                    rule.get("field", ""),
+                    _RULE_OPERATORS.get(rule.get("operator", ""), _op_unknown),
+                    rule.get("value"),
+                )
+                for rule in config.get("rules", [])
+            ),
+            variants=variants,
+        )
+    return MappingProxyType(table)
+
+
+class RedisFlagSource:
+    """Redis 로 플래그 설정을 공유하는 소스.
+
+    ``publish`` 는 전체 설정 JSON 을 ``key`` 에 저장하고 ``channel`` 로
+    알립니다. 구독한 모든 워커가 같은 설정으로 동시에 전환됩니다.
+
+    Args:
+        client: 동기 Redis 클라이언트 (``redis.Redis``)
+        key: 설정 JSON 저장 키
+        channel: 갱신 알림 pub/sub 채널
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        key: str = "feature_flags",
+        channel: str = "feature_flags:updates",
+    ) -> None:
+        """Initialize the Redis flag source."""
+        self.client = client
+        self.key = key
+        self.channel = channel
+        self._thread: Any = None
+
+    def load(self) -> dict[str, Any] | None:
+        """저장된 설정을 읽습니다 (없거나 실패하면 None)."""
+        try:
+            raw = self.client.get(self.key)
+            return dict(json.loads(raw)) if raw else None
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Failed to load feature flags from Redis: {e}")
+            return None
+
+    def publish(self, flags: dict[str, Any]) -> None:
+        """설정을 저장하고 모든 구독자에게 알립니다."""
+        payload = json.dumps(flags, ensure_ascii=False)
+        self.client.set(self.key, payload)
+        self.client.publish(self.channel, payload)
+
+    def subscribe(self, on_update: Callable[[dict[str, Any]], None]) -> None:
+        """백그라운드 스레드에서 갱신 알림을 구독합니다."""
+
+        def _handle(message: dict[str, Any]) -> None:
+            try:
+                on_update(dict(json.loads(message["data"])))
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"Ignoring invalid feature flag update: {e}")
+
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{self.channel: _handle})
+        self._thread = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def close(self) -> None:
+        """구독 스레드를 멈춥니다."""
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.stop()
 
 
 class FeatureFlags:
     """Feature Flag 관리.
 
     Manage feature flags for safe feature rollout and A/B testing.
+
+    설정 파일이 바뀌면(최대 ``reload_interval`` 초마다 mtime 확인) 다음 평가
+    시점에 새 테이블로 교체됩니다. ``source`` 가 주어지면 Redis 설정이 유일한
+    기준이 됩니다. 설정 파일은 Redis 에 저장된 설정이 없을 때의 초기값으로만
+    읽고, 이후 파일 변경 감지와 ``save_flags`` 의 파일 쓰기는 하지 않습니다.
     """
 
-    def __init__(self, config_file: Path | None = None) -> None:
+    def __init__(
+        self,
+        config_file: Path | None = None,
+        *,
+        source: RedisFlagSource | None = None,
+        reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+    ) -> None:
         """Initialize feature flags.
 
         Args:
             config_file: Path to the feature flags JSON config file
+            source: Optional Redis source shared by all workers
+            reload_interval: Minimum seconds between config file mtime checks
         """
         self.config_file = config_file or Path("config/feature_flags.json")
+        self.source = source
+        self.reload_interval = reload_interval
+        self._mtime_ns = self._stat_mtime_ns()
+        self._next_check = time.monotonic() + reload_interval
         self.flags = self._load_flags()
+        if source is not None:
+            shared = source.load()
+            if shared is not None:
+                self.flags = shared
+            source.subscribe(self._apply)
+        self._table = _compile_flags(self.flags)
+
+    def _stat_mtime_ns(self) -> int | None:
+        try:
+            return self.config_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _read_flags(self) -> dict[str, Any] | None:
+        try:
+            content = self.config_file.read_text(encoding="utf-8")
+            return dict(json.loads(content))
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Failed to load feature flags: {e}")
+            return None
 
     def _load_flags(self) -> dict[str, Any]:
         """설정 파일 로드.
@@ -85,29 +247,59 @@ class FeatureFlags:
         """
         if not self.config_file.exists():
             return {}
-
-        try:
-            content = self.config_file.read_text(encoding="utf-8")
-            return dict(json.loads(content))
-        except json.JSONDecodeError as e:
-            logger.warning(f"Failed to load feature flags: {e}")
-            return {}
-        except Exception as e:  # noqa: BLE001
-            logger.warning(f"Failed to load feature flags: {e}")
-            return {}
+        return self._read_flags() or {}
+
+    def _apply(self, flags: dict[str, Any]) -> None:
+        """새 설정을 컴파일한 뒤 평가 테이블을 원자적으로 교체합니다."""
+        table = _compile_flags(flags)
+        self.flags = flags
+        self._table = table
+
+    def _maybe_reload(self) -> None:
+        if self.source is not None:
+            return  # Redis 구독으로만 갱신
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.reload_interval
+        mtime_ns = self._stat_mtime_ns()
+        if mtime_ns == self._mtime_ns:
+            return
+        flags = {} if mtime_ns is None else self._read_flags()
+        if flags is None:
+            return  # 잘못된 파일이면 기존 테이블 유지 (다음 변경 시 재시도)
+        self._mtime_ns = mtime_ns
+        self._apply(flags)
+        logger.info("Feature flags reloaded from %s", self.config_file)
+
+    def reload(self) -> None:
+        """설정 파일을 즉시 다시 확인합니다."""
+        self._next_check = 0.0
+        self._maybe_reload()
+
+    def close(self) -> None:
+        """Redis 구독을 정리합니다."""
+        if self.source is not None:
+            self.source.close()
 
     def save_flags(self) -> bool:
-        """Save flags to the configuration file.
+        """Save flags to the configuration file, or to Redis if configured.
 
         Returns:
             True if save was successful, False otherwise
         """
         try:
+            if self.source is not None:
+                self.source.publish(self.flags)
+                self._apply(self.flags)
+                return True
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
             self.config_file.write_text(
                 json.dumps(self.flags, indent=2, ensure_ascii=False),
                 encoding="utf-8",
             )
+            self._mtime_ns = self._stat_mtime_ns()
+            self._apply(self.flags)
             return True
         except Exception as e:
             logger.error(f"Failed to save feature flags: {e}")
@@ -131,74 +323,35 @@ class FeatureFlags:
         Returns:
             True if the feature is enabled, False otherwise
         """
-        flag = self.flags.get(flag_name)
-        if not flag:
+        self._maybe_reload()
+        flag = self._table.get(flag_name)
+        if flag is None:
             return False  # 정의되지 않은 플래그는 비활성화
 
         # 1. 전역 스위치
-        if not flag.get("enabled", False):
+        if not flag.enabled:
             return False
 
         # 2. 환경 제한
-        allowed_envs = flag.get(
-            "environments",
-            ["development", "staging", "production"],
-        )
-        current_env = os.getenv("ENVIRONMENT", "development")
-        if current_env not in allowed_envs:
+        if os.getenv("ENVIRONMENT", "development") not in flag.environments:
             return False
 
         # 3. 화이트리스트 (특정 사용자만) - whitelist가 비어있으면 무시
-        whitelist = flag.get("whitelist", [])
-        if whitelist:
+        if flag.whitelist:
             # whitelist에 있으면 rollout 체크 스킵, 없으면 False
-            return user_id in whitelist
+            return user_id in flag.whitelist
 
         # 4. 롤아웃 비율 (0-100)
-        rollout_percent = flag.get("rollout_percent", 100)
-        if rollout_percent < 100:
+        if flag.rollout_percent < 100:
             if not user_id:
                 return False  # user_id 없으면 랜덤 선택 불가
-
-            # 일관된 해시 기반 선택 (SHA-256, feature 스코프 포함)
-            user_hash = int(
-                hashlib.sha256(f"{flag_name}:{user_id}".encode("utf-8")).hexdigest(),
-                16,
-            )
-            bucket = user_hash % 100
-            if bucket >= rollout_percent:
+            if _user_hash(flag_name, user_id) % 100 >= flag.rollout_percent:
                 return False
 
         # 5. 컨텍스트 규칙
-        rules = flag.get("rules", [])
-        if rules and context:
-            return self._check_rules(rules, context)
-
-        return True
-
-    def _check_rules(
-        self,
-        rules: list[dict[str, Any]],
-        context: dict[str, Any],
-    ) -> bool:
-        """컨텍스트 기반 규칙 확인.
-
-        Check if the context matches all rules.
-
-        Args:
-            rules: List of rule dictionaries
-            context: Context dictionary to evaluate against
+        if flag.rules and context:
+            return all(check(context.get(f), v) for f, check, v in flag.rules)
 
-        Returns:
-            True if all rules match, False otherwise
-        """
-        for rule in rules:
-            field = rule.get("field", "")
-            operator = rule.get("operator", "")
-            value = rule.get("value")
-            ctx_value = context.get(field)
-            if not _evaluate_rule(operator, ctx_value, value):
-                return False
         return True
 
     def get_variant(self, flag_name: str, user_id: str) -> str:
@@ -213,24 +366,13 @@ class FeatureFlags:
         Returns:
             Variant name (defaults to "control" if not found)
         """
-        flag = self.flags.get(flag_name, {})
-        variants_raw = flag.get("variants", ["control"])
-        if not isinstance(variants_raw, list):
-            return "control"
-
-        variants: list[str] = [str(v) for v in variants_raw] or ["control"]
-
-        if len(variants) <= 1:
-            return variants[0]
+        self._maybe_reload()
+        flag = self._table.get(flag_name)
+        if flag is None or len(flag.variants) <= 1:
+            return flag.variants[0] if flag else "control"
 
         # 일관된 해시 기반 변형 선택 (SHA-256, feature 스코프 포함)
-        user_hash = int(
-            hashlib.sha256(f"{flag_name}:{user_id}".encode("utf-8")).hexdigest(),
-            16,
-        )
-        variant_index = user_hash % len(variants)
-
-        return str(variants[variant_index])
+        return flag.variants[_user_hash(flag_name, user_id) % len(flag.variants)]
 
     def enable_flag(self, flag_name: str) -> bool:
         """Enable a feature flag.
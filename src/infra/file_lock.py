@@ -1,18 +1,30 @@
-"""Simple cross-platform file locking utility.
-
-Provides a context manager for exclusive file locking to prevent
-race conditions when multiple processes write to the same file.
+"""Cross-process file locking utility.
+
+Provides sync and async context managers for shared (read) and exclusive
+(write) locks on a sibling ``.lock`` file, so multiple processes can safely
+share files such as JSONL logs and the context cache manifest.
+
+On Unix the lock is ``fcntl.flock`` on an open file description: the kernel
+releases it when the holder exits or crashes, so a leftover ``.lock`` file
+never blocks anyone. Contended waits block in ``flock`` on a small bounded
+thread pool, so they wake as soon as the holder releases; a timed-out or
+cancelled waiter hands its descriptor to the worker, which closes (and so
+unlocks) it once ``flock`` returns. The async API never blocks the event
+loop. Windows falls back to ``msvcrt`` byte-range locking with polling
+(exclusive only).
 """
 
 from __future__ import annotations
 
-import contextlib
-import errno
+import asyncio
+import concurrent.futures
 import os
 import sys
+import threading
 import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import IO, Any
+from typing import Any
 
 # Platform detection
 _WINDOWS = sys.platform == "win32"
@@ -32,13 +44,112 @@ class FileLockError(Exception):
     """Raised when a lock cannot be acquired."""
 
 
+@dataclass
+class LockStats:
+    """Contention counters for one lock file."""
+
+    acquisitions: int = 0
+    contended: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+# Upper bound on threads blocked in ``flock``; further waits queue behind them.
+_WAIT_WORKERS = 8
+
+_wait_executor: concurrent.futures.ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+_stats: dict[str, LockStats] = {}
+_stats_lock = threading.Lock()
+
+
+def _record(lock_path: Path, waited: float | None, *, timed_out: bool = False) -> None:
+    with _stats_lock:
+        stats = _stats.get(str(lock_path))
+        if stats is None:
+            stats = _stats[str(lock_path)] = LockStats()
+        if timed_out:
+            stats.timeouts += 1
+        else:
+            stats.acquisitions += 1
+        if waited is not None:
+            stats.contended += 1
+            stats.total_wait_seconds += waited
+            stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+
+
+def get_lock_stats() -> dict[str, dict[str, Any]]:
+    """Return contention counters keyed by lock file path."""
+    with _stats_lock:
+        return {path: asdict(stats) for path, stats in _stats.items()}
+
+
+def _get_wait_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _wait_executor
+    with _executor_lock:
+        if _wait_executor is None:
+            _wait_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_WAIT_WORKERS, thread_name_prefix="file-lock-wait"
+            )
+        return _wait_executor
+
+
+class _BlockingWait:
+    """A blocking ``flock`` run on the wait pool.
+
+    If the waiter is abandoned (timeout or cancellation) before ``flock``
+    returns, the worker closes the descriptor itself, which releases a lock
+    granted too late.
+    """
+
+    def __init__(self, fd: int, operation: int) -> None:
+        self.fd = fd
+        self.operation = operation
+        self._guard = threading.Lock()
+        self._abandoned = False
+        self._done = False
+
+    def run(self) -> None:
+        try:
+            _fcntl.flock(self.fd, self.operation)
+        finally:
+            with self._guard:
+                self._done = True
+                if self._abandoned:
+                    os.close(self.fd)
+
+    def abandon(self, future: concurrent.futures.Future[None]) -> bool:
+        """Give up waiting; return True if ``flock`` already returned.
+
+        In that case the caller still owns the descriptor and must settle
+        ``future``; otherwise the worker (or nobody, if it never started)
+        has closed it.
+        """
+        if future.cancel():
+            os.close(self.fd)
+            return False
+        with self._guard:
+            if self._done:
+                return True
+            self._abandoned = True
+            return False
+
+
 class FileLock:
-    """A simple file-based lock with timeout support.
+    """A cross-process file lock with timeout support.
 
     Usage:
         with FileLock("/path/to/file"):
             # exclusive access to file
             file.write_text(...)
+
+        async with FileLock("/path/to/file", shared=True):
+            # concurrent readers, no writers
+            data = await asyncio.to_thread(file.read_text)
+
+    A lock instance is not reentrant; use one instance per holder.
     """
 
     def __init__(
@@ -46,90 +157,71 @@ class FileLock:
         path: str | Path,
         timeout: float = 10.0,
         poll_interval: float = 0.1,
+        *,
+        shared: bool = False,
     ) -> None:
         """Initialize the file lock.
 
         Args:
-            path: Path to the file to lock (creates .lock suffix file)
+            path: Path to the file to lock (locks a ``.lock`` suffix file)
             timeout: Maximum time to wait for lock acquisition (seconds)
-            poll_interval: Time between lock acquisition attempts (seconds)
+            poll_interval: Retry interval where blocking waits are unavailable
+                (Windows only, seconds)
+            shared: Take a shared (read) lock instead of an exclusive one
         """
         self.path = Path(path)
         self.lock_path = self.path.with_suffix(self.path.suffix + ".lock")
         self.timeout = timeout
         self.poll_interval = poll_interval
-        self._lock_file: IO[str] | None = None
+        self.shared = shared
+        self._fd: int | None = None
 
-    def _try_create_lock_file(self) -> bool:
-        """Try to create and acquire the lock file.
+    @property
+    def is_locked(self) -> bool:
+        """Whether this instance currently holds the lock."""
+        return self._fd is not None
 
-        Returns:
-            True if lock was successfully created and acquired.
+    def _operation(self) -> int:
+        return int(_fcntl.LOCK_SH if self.shared else _fcntl.LOCK_EX)
 
-        Raises:
-            FileExistsError: If lock file already exists.
-            OSError: If other file operation fails.
-        """
-        # Open file exclusively - will raise FileExistsError if exists
-        self._lock_file = open(  # noqa: SIM115
-            self.lock_path, "x", encoding="utf-8"
-        )
-        # Write PID for debugging
-        self._lock_file.write(str(os.getpid()))
-        self._lock_file.flush()
-
-        # Apply OS-level lock if available
-        if _WINDOWS and _msvcrt is not None:
-            _msvcrt.locking(
-                self._lock_file.fileno(),
-                _msvcrt.LK_NBLCK,
-                1,
-            )
-        elif _UNIX and _fcntl is not None:
-            _fcntl.flock(self._lock_file.fileno(), _fcntl.LOCK_EX | _fcntl.LOCK_NB)
+    def _open(self) -> int:
+        if self._fd is not None:
+            raise FileLockError(f"Lock on {self.path} is already held")
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            return os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            raise FileLockError(f"Lock acquisition failed: {e}") from e
 
+    def _try_lock(self, fd: int) -> bool:
+        """Attempt a non-blocking lock on ``fd``."""
+        try:
+            if _WINDOWS:
+                _msvcrt.locking(fd, _msvcrt.LK_NBLCK, 1)
+            else:
+                _fcntl.flock(fd, self._operation() | _fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        except PermissionError:
+            if _WINDOWS:
+                return False
+            raise
         return True
 
-    def _cleanup_failed_lock(self) -> None:
-        """Clean up after a failed lock attempt."""
-        if self._lock_file:
-            self._lock_file.close()
-            self._lock_file = None
-        with contextlib.suppress(OSError):
-            self.lock_path.unlink()
-
-    def _attempt_lock(self) -> tuple[bool, Exception | None]:
-        """Attempt to acquire the lock once.
+    def _timeout_error(self) -> FileLockError:
+        _record(self.lock_path, None, timed_out=True)
+        return FileLockError(
+            f"Could not acquire lock on {self.path} within {self.timeout}s timeout"
+        )
 
-        Returns:
-            Tuple of (success, error). If success is True, lock was acquired.
-            If success is False and error is None, lock file exists (retry).
-            If success is False and error is set, a fatal error occurred.
-        """
-        try:
-            self._try_create_lock_file()
-            return (True, None)
-        except FileExistsError:
-            return (False, None)  # Retry
-        except (OSError, IOError) as e:
-            # If OS-level locking failed due to contention, don't delete the lock file.
-            # This can happen on some filesystems where exclusive file creation is not
-            # strictly atomic under concurrency; deleting here would break mutual exclusion.
-            if getattr(e, "errno", None) in {
-                errno.EACCES,
-                errno.EAGAIN,
-                errno.EWOULDBLOCK,
-            }:
-                if self._lock_file:
-                    self._lock_file.close()
-                    self._lock_file = None
-                return (False, None)
-
-            self._cleanup_failed_lock()
-            return (False, e)
+    def _granted(self, fd: int, started: float | None) -> bool:
+        self._fd = fd
+        waited = None if started is None else time.monotonic() - started
+        _record(self.lock_path, waited)
+        return True
 
     def acquire(self) -> bool:
-        """Acquire the file lock.
+        """Acquire the file lock, blocking the calling thread.
 
         Returns:
             True if lock was acquired successfully.
@@ -137,48 +229,103 @@ class FileLock:
         Raises:
             FileLockError: If lock cannot be acquired within timeout.
         """
-        start_time = time.monotonic()
-
-        while True:
-            success, error = self._attempt_lock()
+        fd = self._open()
+        try:
+            if self._try_lock(fd):
+                return self._granted(fd, None)
+        except OSError as e:
+            os.close(fd)
+            raise FileLockError(f"Lock acquisition failed: {e}") from e
+
+        started = time.monotonic()
+        if _WINDOWS:
+            deadline = started + self.timeout
+            while time.monotonic() < deadline:
+                time.sleep(self.poll_interval)
+                if self._try_lock(fd):
+                    return self._granted(fd, started)
+            os.close(fd)
+            raise self._timeout_error()
+
+        wait = _BlockingWait(fd, self._operation())
+        future = _get_wait_executor().submit(wait.run)
+        try:
+            future.result(self.timeout)
+        except concurrent.futures.TimeoutError:
+            if not wait.abandon(future):
+                raise self._timeout_error() from None
+        except OSError:
+            pass  # reported by _finish_wait
+        return self._finish_wait(future, fd, started)
+
+    def _finish_wait(
+        self, future: concurrent.futures.Future[None], fd: int, started: float
+    ) -> bool:
+        try:
+            future.result()
+        except OSError as e:
+            os.close(fd)
+            raise FileLockError(f"Lock acquisition failed: {e}") from e
+        return self._granted(fd, started)
 
-            if success:
-                return True
+    async def acquire_async(self) -> bool:
+        """Acquire the file lock without blocking the event loop.
 
-            elapsed = time.monotonic() - start_time
-            if elapsed >= self.timeout:
-                if error:
-                    raise FileLockError(f"Lock acquisition failed: {error}") from error
-                raise FileLockError(
-                    f"Could not acquire lock on {self.path} "
-                    f"within {self.timeout}s timeout"
-                )
+        Returns:
+            True if lock was acquired successfully.
 
-            time.sleep(self.poll_interval)
+        Raises:
+            FileLockError: If lock cannot be acquired within timeout.
+        """
+        fd = self._open()
+        try:
+            if self._try_lock(fd):
+                return self._granted(fd, None)
+        except OSError as e:
+            os.close(fd)
+            raise FileLockError(f"Lock acquisition failed: {e}") from e
+
+        started = time.monotonic()
+        if _WINDOWS:
+            deadline = started + self.timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.poll_interval)
+                if self._try_lock(fd):
+                    return self._granted(fd, started)
+            os.close(fd)
+            raise self._timeout_error()
+
+        wait = _BlockingWait(fd, self._operation())
+        future = _get_wait_executor().submit(wait.run)
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)), self.timeout
+            )
+        except asyncio.TimeoutError:
+            if not wait.abandon(future):
+                raise self._timeout_error() from None
+        except asyncio.CancelledError:
+            if wait.abandon(future):
+                os.close(fd)
+            raise
+        except OSError:
+            pass  # reported by _finish_wait
+        return self._finish_wait(future, fd, started)
 
     def release(self) -> None:
-        """Release the file lock."""
-        if self._lock_file:
-            try:
-                # Release OS-level lock
-                if _WINDOWS and _msvcrt is not None:
-                    with contextlib.suppress(OSError):
-                        _msvcrt.locking(
-                            self._lock_file.fileno(),
-                            _msvcrt.LK_UNLCK,
-                            1,
-                        )
-                elif _UNIX and _fcntl is not None:
-                    with contextlib.suppress(OSError):
-                        _fcntl.flock(self._lock_file.fileno(), _fcntl.LOCK_UN)
-
-                self._lock_file.close()
-            finally:
-                self._lock_file = None
-
-            # Remove lock file
-            with contextlib.suppress(OSError):
-                self.lock_path.unlink()
+        """Release the file lock (the ``.lock`` file is left in place)."""
+        fd, self._fd = self._fd, None
+        if fd is None:
+            return
+        try:
+            if _WINDOWS:
+                _msvcrt.locking(fd, _msvcrt.LK_UNLCK, 1)
+            else:
+                _fcntl.flock(fd, _fcntl.LOCK_UN)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
     def __enter__(self) -> FileLock:
         """Enter context manager."""
@@ -194,5 +341,19 @@ class FileLock:
         """Exit context manager."""
         self.release()
 
+    async def __aenter__(self) -> FileLock:
+        """Enter async context manager."""
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: Any,
+    ) -> None:
+        """Exit async context manager."""
+        self.release()
+
 
-__all__ = ["FileLock", "FileLockError"]
+__all__ = ["FileLock", "FileLockError", "LockStats", "get_lock_stats"]
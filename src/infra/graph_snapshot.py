@@ -0,0 +1,70 @@
+"""그래프 스냅샷 버전 조회.
+
+메모리에 그래프 파생 데이터를 캐시하는 컴포넌트(자동 완성 접두사 인덱스,
+예시 후보 풀)가 다시 읽어야 하는지 판단하는 지문을 한 번의 왕복으로
+계산합니다. 지문에는 다음이 포함됩니다.
+
+- Rule id 집합 (Rule id는 본문 해시이므로 본문 변경도 반영됩니다)
+- QueryType 노드의 이름/한글명/세션 한도/우선순위
+- Example 노드 수와 가장 최근 ``updated_at``
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+SNAPSHOT_QUERY = """
+MATCH (r:Rule)
+WITH collect(r.id) AS rule_ids
+OPTIONAL MATCH (qt:QueryType)
+WITH rule_ids, collect(qt) AS qts
+OPTIONAL MATCH (e:Example)
+RETURN rule_ids,
+       [qt IN qts | [qt.name, qt.korean, qt.session_limit, qt.priority]] AS query_types,
+       count(e) AS examples,
+       toString(max(e.updated_at)) AS examples_updated_at
+"""
+
+
+@dataclass(frozen=True)
+class GraphSnapshot:
+    """캐시 무효화 판단용 그래프 스냅샷."""
+
+    version: str
+    rule_ids: tuple[str, ...]
+
+
+def read_graph_snapshot(session: Any) -> GraphSnapshot:
+    """Rule/QueryType/Example 노드 집합의 지문을 조회합니다.
+
+    Args:
+        session: ``run`` 메서드를 가진 Neo4j 세션.
+
+    Returns:
+        정렬된 Rule id 목록과 세 노드 집합을 합친 버전 해시.
+    """
+    record = next(iter(session.run(SNAPSHOT_QUERY)), None)
+    row: dict[str, Any] = dict(record) if record else {}
+    rule_ids = tuple(sorted(i for i in row.get("rule_ids") or () if i))
+    query_types = sorted(
+        json.dumps(qt, ensure_ascii=False, default=str)
+        for qt in row.get("query_types") or ()
+    )
+    payload = json.dumps(
+        [
+            rule_ids,
+            query_types,
+            row.get("examples") or 0,
+            row.get("examples_updated_at"),
+        ],
+        ensure_ascii=False,
+        default=str,
+    )
+    version = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    return GraphSnapshot(version=version, rule_ids=rule_ids)
+
+
+__all__ = ["SNAPSHOT_QUERY", "GraphSnapshot", "read_graph_snapshot"]
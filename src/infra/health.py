@@ -3,6 +3,11 @@
 
 Provides async/sync health checks for Redis, Neo4j, Gemini API, disk, and memory.
 Includes Kubernetes-compatible liveness/readiness probes and structured health reporting.
+
+The module-level ``check_*`` functions open a fresh connection per call and are
+meant for one-shot diagnostics. Served probes go through ``HealthChecker``,
+which refreshes each check on its own schedule over pooled connections
+(``RedisProbe``, ``Neo4jProbe``) and answers from the cached results.
 """
 
 from __future__ import annotations
@@ -14,6 +19,7 @@ import logging
 import os
 import sys
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -41,6 +47,8 @@ logger = logging.getLogger(__name__)
 
 # 타임아웃 설정 (초)
 DEFAULT_TIMEOUT = 3.0
+# HealthChecker 백그라운드 갱신 기본 주기 (초)
+DEFAULT_CHECK_INTERVAL = 15.0
 
 
 async def check_redis() -> dict[str, Any]:
@@ -407,6 +415,8 @@ async def liveness_check() -> dict[str, Any]:
 
 
 class HealthStatus(str, Enum):
+    """컴포넌트 및 시스템 전체의 헬스 상태."""
+
     HEALTHY = "healthy"
     DEGRADED = "degraded"
     UNHEALTHY = "unhealthy"
@@ -445,49 +455,214 @@ class SystemHealth:
         }
 
 
+_UNHEALTHY_RESULTS = frozenset({"down", "error", "critical"})
+
+
+def _component_from_result(
+    name: str, result: Any, latency_ms: float
+) -> ComponentHealth:
+    """체크 함수 반환값을 ComponentHealth 로 변환합니다.
+
+    ``{"status": "down" | "error" | "critical"}`` 은 UNHEALTHY,
+    ``"warning"`` 은 DEGRADED, 그 외에는 HEALTHY 로 봅니다.
+    """
+    details = result if isinstance(result, dict) else {"result": result}
+    reported = details.get("status")
+    status = HealthStatus.HEALTHY
+    if reported in _UNHEALTHY_RESULTS:
+        status = HealthStatus.UNHEALTHY
+    elif reported == "warning":
+        status = HealthStatus.DEGRADED
+    return ComponentHealth(
+        name=name,
+        status=status,
+        latency_ms=round(latency_ms, 2),
+        message=details.get("error") if status != HealthStatus.HEALTHY else None,
+        details=details,
+    )
+
+
+@dataclass
+class _RegisteredCheck:
+    fn: Callable[[], Any]
+    interval: float
+    timeout: float
+    result: ComponentHealth | None = None
+    checked_at: float = 0.0  # time.monotonic()
+
+
 class HealthChecker:
-    """시스템 헬스 체커."""
+    """시스템 헬스 체커.
+
+    ``start()`` 후에는 체크마다 자체 주기로 백그라운드 갱신하고,
+    ``check_all()`` 은 캐시된 결과만으로 즉시 응답합니다(연결 생성 없음).
+    ``start()`` 이후 등록한 체크도 바로 갱신을 시작합니다. 동기 체크는
+    이벤트 루프를 막지 않도록 스레드에서 타임아웃과 함께 실행합니다.
+    결과가 ``max_staleness`` (기본: 2 × 주기 + 타임아웃)보다 오래되면 해당
+    컴포넌트는 UNHEALTHY 로 보고됩니다.
+
+    Args:
+        version: 보고할 애플리케이션 버전
+        default_interval: 체크 기본 갱신 주기 (초)
+        max_staleness: 캐시 결과 허용 최대 나이 (초, None 이면 체크별 기본값)
+    """
 
-    def __init__(self, version: str = "unknown"):
+    def __init__(
+        self,
+        version: str = "unknown",
+        *,
+        default_interval: float = DEFAULT_CHECK_INTERVAL,
+        max_staleness: float | None = None,
+    ):
+        """Initialize the checker with no registered checks."""
         self.version = version
-        self._checks: dict[str, Any] = {}
+        self.default_interval = default_interval
+        self.max_staleness = max_staleness
+        self._checks: dict[str, _RegisteredCheck] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+
+    @property
+    def running(self) -> bool:
+        """백그라운드 갱신 실행 여부."""
+        return bool(self._tasks)
+
+    def register_check(
+        self,
+        name: str,
+        check_fn: Any,
+        *,
+        interval: float | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """헬스 체크 함수 등록.
+
+        Args:
+            name: 컴포넌트 이름
+            check_fn: 동기/비동기 체크 함수 (dict 반환 또는 예외)
+            interval: 백그라운드 갱신 주기 (초, 기본: ``default_interval``)
+            timeout: 체크 타임아웃 (초)
+        """
+        check = _RegisteredCheck(
+            fn=check_fn,
+            interval=interval if interval is not None else self.default_interval,
+            timeout=timeout,
+        )
+        self._checks[name] = check
+        if self._tasks:
+            previous = self._tasks.pop(name, None)
+            if previous is not None:
+                previous.cancel()
+            self._spawn(name, check)
+
+    async def _call(self, check: _RegisteredCheck) -> Any:
+        fn = check.fn
+        if inspect.iscoroutinefunction(fn) or inspect.iscoroutinefunction(
+            type(fn).__call__
+        ):
+            return await asyncio.wait_for(fn(), timeout=check.timeout)
+        result = await asyncio.wait_for(asyncio.to_thread(fn), timeout=check.timeout)
+        if inspect.isawaitable(result):
+            result = await asyncio.wait_for(result, timeout=check.timeout)
+        return result
+
+    async def _run_check(self, name: str, check: _RegisteredCheck) -> ComponentHealth:
+        start = time.perf_counter()
+        try:
+            result = await self._call(check)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Health check failed for %s: %s", name, exc)
+            message = str(exc) or f"Timeout (>{check.timeout}s)"
+            return ComponentHealth(
+                name=name,
+                status=HealthStatus.UNHEALTHY,
+                message=message,
+            )
+        return _component_from_result(
+            name, result, (time.perf_counter() - start) * 1000
+        )
 
-    def register_check(self, name: str, check_fn: Any) -> None:
-        """헬스 체크 함수 등록."""
-        self._checks[name] = check_fn
+    async def _refresh_forever(self, name: str, check: _RegisteredCheck) -> None:
+        while True:
+            check.result = await self._run_check(name, check)
+            check.checked_at = time.monotonic()
+            await asyncio.sleep(check.interval)
 
-    async def check_all(self) -> SystemHealth:
-        """모든 컴포넌트 헬스 체크."""
-        components: dict[str, ComponentHealth] = {}
-        overall_status = HealthStatus.HEALTHY
+    def _spawn(self, name: str, check: _RegisteredCheck) -> None:
+        self._tasks[name] = asyncio.create_task(
+            self._refresh_forever(name, check), name=f"health:{name}"
+        )
 
-        for name, check_fn in self._checks.items():
+    def start(self) -> None:
+        """체크별 백그라운드 갱신 태스크를 시작합니다 (이미 실행 중이면 무시)."""
+        if self._tasks:
+            return
+        for name, check in self._checks.items():
+            self._spawn(name, check)
+
+    async def stop(self) -> None:
+        """갱신 태스크를 멈추고 체크가 가진 풀 연결을 닫습니다."""
+        tasks = list(self._tasks.values())
+        self._tasks = {}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for check in self._checks.values():
+            aclose = getattr(check.fn, "aclose", None)
+            if aclose is None:
+                continue
             try:
-                start = asyncio.get_event_loop().time()
-                result = check_fn()
-                if inspect.isawaitable(result):
-                    result = await result
-                latency = (asyncio.get_event_loop().time() - start) * 1000
+                await aclose()
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Health probe close failed: %s", exc)
 
+    def snapshot(self) -> SystemHealth:
+        """캐시된 결과로 SystemHealth 를 만듭니다 (I/O 없음)."""
+        now = time.monotonic()
+        components: dict[str, ComponentHealth] = {}
+        for name, check in self._checks.items():
+            limit = self.max_staleness
+            if limit is None:
+                limit = 2 * check.interval + check.timeout
+            if check.result is None:
                 components[name] = ComponentHealth(
                     name=name,
-                    status=HealthStatus.HEALTHY,
-                    latency_ms=round(latency, 2),
-                    details=result if isinstance(result, dict) else {"result": result},
+                    status=HealthStatus.UNHEALTHY,
+                    message="Check pending",
                 )
-            except Exception as exc:  # noqa: BLE001, PERF203
-                logger.warning("Health check failed for %s: %s", name, exc)
+            elif now - check.checked_at > limit:
                 components[name] = ComponentHealth(
                     name=name,
                     status=HealthStatus.UNHEALTHY,
-                    message=str(exc),
+                    message=f"Stale result ({now - check.checked_at:.0f}s old)",
+                    details=check.result.details,
                 )
-                overall_status = HealthStatus.UNHEALTHY
+            else:
+                components[name] = check.result
+        return self._summarize(components)
 
+    async def check_all(self) -> SystemHealth:
+        """모든 컴포넌트 헬스 체크.
+
+        백그라운드 갱신 중이면 캐시된 결과를 반환하고, 아니면 즉시 실행합니다.
+        """
+        if self._tasks:
+            return self.snapshot()
+        components = {
+            name: await self._run_check(name, check)
+            for name, check in self._checks.items()
+        }
+        return self._summarize(components)
+
+    def _summarize(self, components: dict[str, ComponentHealth]) -> SystemHealth:
         unhealthy_count = sum(
             1 for c in components.values() if c.status == HealthStatus.UNHEALTHY
         )
-        if 0 < unhealthy_count < len(components):
+        overall_status = HealthStatus.HEALTHY
+        if unhealthy_count:
+            overall_status = HealthStatus.UNHEALTHY
+            if unhealthy_count < len(components):
+                overall_status = HealthStatus.DEGRADED
+        elif any(c.status == HealthStatus.DEGRADED for c in components.values()):
             overall_status = HealthStatus.DEGRADED
 
         return SystemHealth(
@@ -498,6 +673,87 @@ class HealthChecker:
         )
 
 
+class RedisProbe:
+    """하나의 Redis 클라이언트(커넥션 풀)를 재사용하는 PING 체크."""
+
+    def __init__(self, url: str) -> None:
+        """Initialize with the Redis URL."""
+        self.url = url
+        self._client: Any = None
+
+    async def __call__(self) -> dict[str, Any]:
+        """PING 후 상태 딕셔너리를 반환합니다."""
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            return {"status": "skipped", "reason": "redis package not installed"}
+
+        if self._client is None:
+            self._client = aioredis.from_url(
+                self.url, socket_connect_timeout=DEFAULT_TIMEOUT
+            )
+        start = time.perf_counter()
+        try:
+            await self._client.ping()
+        except Exception as exc:  # noqa: BLE001
+            return {"status": "down", "error": str(exc)}
+        return {
+            "status": "up",
+            "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+            "message": "Redis is healthy",
+        }
+
+    async def aclose(self) -> None:
+        """풀 연결을 닫습니다."""
+        client, self._client = self._client, None
+        if client is not None:
+            close = getattr(client, "aclose", None) or client.close
+            await close()
+
+
+class Neo4jProbe:
+    """하나의 비동기 Neo4j 드라이버(커넥션 풀)를 재사용하는 ``RETURN 1`` 체크."""
+
+    def __init__(self, uri: str, user: str, password: str) -> None:
+        """Initialize with Neo4j connection parameters."""
+        self.uri = uri
+        self._auth = (user, password)
+        self._driver: Any = None
+
+    async def __call__(self) -> dict[str, Any]:
+        """``RETURN 1`` 실행 후 상태 딕셔너리를 반환합니다."""
+        try:
+            from neo4j import AsyncGraphDatabase
+        except ImportError:
+            return {"status": "skipped", "reason": "neo4j package not installed"}
+
+        if self._driver is None:
+            self._driver = AsyncGraphDatabase.driver(
+                self.uri,
+                auth=self._auth,
+                max_connection_pool_size=2,
+                connection_timeout=DEFAULT_TIMEOUT,
+            )
+        start = time.perf_counter()
+        try:
+            async with self._driver.session() as session:
+                result = await session.run("RETURN 1")
+                await result.single()
+        except Exception as exc:  # noqa: BLE001
+            return {"status": "down", "error": str(exc)}
+        return {
+            "status": "up",
+            "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+            "message": "Neo4j is healthy",
+        }
+
+    async def aclose(self) -> None:
+        """드라이버를 닫습니다."""
+        driver, self._driver = self._driver, None
+        if driver is not None:
+            await driver.close()
+
+
 async def check_neo4j_with_params(uri: str, user: str, password: str) -> dict[str, Any]:
     """Parameterized Neo4j check using existing helper."""
     os.environ["NEO4J_URI"] = uri
@@ -550,7 +806,12 @@ async def readiness_check() -> dict[str, Any]:
 
 
 __all__ = [
+    "DEFAULT_CHECK_INTERVAL",
     "DEFAULT_TIMEOUT",
+    "HealthChecker",
+    "HealthStatus",
+    "Neo4jProbe",
+    "RedisProbe",
     "check_dependencies",
     "check_disk",
     "check_gemini_api",
@@ -0,0 +1,68 @@
+"""지식 그래프별 공유 인스턴스 레지스트리.
+
+예시 선택기나 교차 검증기처럼 그래프 파생 데이터를 메모리에 캐시하는
+객체를 그래프(``kg``)마다 하나씩 공유합니다. 레지스트리는 ``kg`` 를 약한
+참조로만 붙잡고, 만들어진 인스턴스에도 ``kg`` 의 약한 프록시를 넘기므로
+그래프가 해제되면 인스턴스도 함께 사라집니다. 종료 시에는 ``atexit`` 한
+번으로 남아 있는 인스턴스의 ``close`` 를 호출합니다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import weakref
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_instances: weakref.WeakKeyDictionary[Any, dict[Callable[[Any], Any], Any]] = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def shared_for_kg(kg: Any, factory: Callable[[Any], T]) -> T:
+    """``(kg, factory)`` 마다 한 번만 만들어지는 인스턴스를 반환합니다.
+
+    Args:
+        kg: 인스턴스를 공유할 그래프 객체. 약한 참조를 지원해야 공유됩니다.
+        factory: ``kg`` 를 받아 인스턴스를 만드는 호출 가능 객체.
+
+    Returns:
+        공유 인스턴스. ``kg`` 가 약한 참조를 지원하지 않으면 새 인스턴스.
+    """
+    try:
+        proxy = weakref.proxy(kg)
+    except TypeError:
+        return factory(kg)
+    with _lock:
+        per_kg = _instances.setdefault(kg, {})
+        if factory not in per_kg:
+            per_kg[factory] = factory(proxy)
+        return per_kg[factory]  # type: ignore[no-any-return]
+
+
+def close_all() -> None:
+    """등록된 모든 인스턴스의 ``close`` 를 호출하고 레지스트리를 비웁니다."""
+    with _lock:
+        instances = [inst for per_kg in _instances.values() for inst in per_kg.values()]
+        _instances.clear()
+    for inst in instances:
+        close = getattr(inst, "close", None)
+        if not callable(close):
+            continue
+        try:
+            close()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Shared instance close failed: %s", exc)
+
+
+atexit.register(close_all)
+
+
+__all__ = ["close_all", "shared_for_kg"]
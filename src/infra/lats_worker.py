@@ -361,6 +361,12 @@ async def run_lats_search(
         return await validate_action(state, action, graph_provider)
 
     propose_actions = make_proposer(task, lats_agent, llm_provider)
+    # Share the agent's limiter so search workers and evaluator calls count
+    # against the same concurrency/RPM budget as the agent's own calls.
+    rate_limiter = getattr(lats_agent, "rate_limiter", None)
+    parallelism = getattr(config, "lats_parallelism", 1)
+    if rate_limiter is None:
+        parallelism = min(parallelism, getattr(config, "max_concurrency", 1))
 
     async def evaluate_action(node: Any) -> float:
         executor = ActionExecutor(llm_provider=llm_provider)
@@ -368,12 +374,6 @@ async def run_lats_search(
         original_text = result.get("ocr_text", "")
         tokens = len(original_text.split())
 
-        cache_key = f"{node.state.hash_key()}::{node.action}"
-        cached_score = await eval_cache.get(cache_key)
-        if cached_score is not None:
-            node.state = node.state.update_budget(tokens=tokens)
-            return float(cached_score + node.reward)
-
         action_output = await executor.execute_action(
             action=node.action or "clean",
             text=original_text,
@@ -399,7 +399,6 @@ async def run_lats_search(
         node.result = result
 
         update_budget(node, tokens, executor, budget_tracker)
-        await eval_cache.set(cache_key, final_score)
 
         return float(final_score + node.reward)
 
@@ -414,6 +413,12 @@ async def run_lats_search(
         exploration_constant=2.0,
         token_budget=getattr(config, "max_output_tokens", 8192),
         cost_budget=0.5,
+        # Scores are reused across equivalent states and worker retries.
+        eval_cache=eval_cache,
+        max_llm_evaluations=getattr(config, "lats_max_llm_evaluations", None),
+        cache_namespace=f"{task.request_id}:",
+        parallelism=parallelism,
+        rate_limiter=rate_limiter,
     )
     best = await searcher.run(SearchState())
     return best.result or {}
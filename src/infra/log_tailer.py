@@ -0,0 +1,409 @@
+"""Incremental log file tailer with reverse seek and change notification.
+
+Serves log viewers without re-reading whole log files:
+- ``read_last_lines`` seeks backwards block by block, so fetching the last
+  N lines costs O(N) bytes regardless of file size.
+- ``LogTailer`` reads only appended bytes, waking on inotify events (Linux)
+  or on a polling interval elsewhere, and survives rotation and truncation.
+- ``get_log_tailer`` keeps one tailer per file and fans its lines out to
+  every subscriber queue.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import BinaryIO
+
+logger = logging.getLogger(__name__)
+
+_BLOCK_SIZE = 64 * 1024
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def read_last_lines(
+    path: Path,
+    max_lines: int,
+    *,
+    end: int | None = None,
+    block_size: int = _BLOCK_SIZE,
+) -> tuple[list[str], bool]:
+    """Read the last ``max_lines`` lines of a file by seeking backwards.
+
+    Args:
+        path: File to read.
+        max_lines: Maximum number of lines to return.
+        end: Byte offset treated as end of file (defaults to the current size).
+        block_size: Bytes read per backwards step.
+
+    Returns:
+        (lines, has_more) - ``has_more`` is True when earlier lines exist.
+    """
+    if max_lines <= 0:
+        return [], True
+
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        pos = size if end is None else min(end, size)
+        chunks: list[bytes] = []
+        newlines = 0
+        # One extra newline marks the start of the oldest wanted line
+        # (the trailing newline of the file is not a separator).
+        while pos > 0 and newlines <= max_lines:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+
+    lines = b"".join(reversed(chunks)).decode("utf-8", errors="replace").splitlines()
+    if pos > 0 and lines:
+        # The first line starts somewhere inside a block and is incomplete.
+        lines = lines[1:]
+    has_more = pos > 0 or len(lines) > max_lines
+    return lines[-max_lines:], has_more
+
+
+def _complete_lines_end(path: Path, size: int, block_size: int = _BLOCK_SIZE) -> int:
+    """Return the offset just past the last newline before ``size``.
+
+    Bytes after it belong to a line that is still being written.
+    """
+    with open(path, "rb") as f:
+        pos = size
+        while pos > 0:
+            step = min(block_size, pos)
+            f.seek(pos - step)
+            newline = f.read(step).rfind(b"\n")
+            if newline >= 0:
+                return pos - step + newline + 1
+            pos -= step
+    return 0
+
+
+class _InotifyWatch:
+    """Minimal ctypes binding to Linux inotify watching one directory entry."""
+
+    def __init__(self, libc: ctypes.CDLL, path: Path) -> None:
+        self._name = path.name.encode()
+        self.fd: int = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # Watch the directory so renames and re-creation (rotation) are seen.
+        wd = libc.inotify_add_watch(self.fd, str(path.parent).encode(), _WATCH_MASK)
+        if wd < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+
+    def read_events(self) -> bool:
+        """Drain pending events; return True if any concerned the watched file."""
+        matched = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return matched
+            if not data:
+                return matched
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _wd, _mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + name_len].rstrip(b"\0")
+                offset += name_len
+                if name == self._name:
+                    matched = True
+
+    def close(self) -> None:
+        """Release the inotify descriptor."""
+        with contextlib.suppress(OSError):
+            os.close(self.fd)
+
+
+def _create_inotify_watch(path: Path) -> _InotifyWatch | None:
+    """Create an inotify watch for ``path`` or return None when unsupported."""
+    if not sys.platform.startswith("linux"):
+        return None
+    libc_name = ctypes.util.find_library("c")
+    if libc_name is None:
+        return None
+    try:
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        return _InotifyWatch(libc, path)
+    except (AttributeError, OSError) as e:
+        logger.debug("inotify unavailable, falling back to polling: %s", e)
+        return None
+
+
+class LogTailer:
+    """Follow one log file and fan appended lines out to subscribers.
+
+    The background task only runs while at least one subscriber exists.
+    Each subscriber receives batches of lines through its own bounded
+    queue; a slow subscriber loses its oldest batches instead of stalling
+    the others. ``None`` in a queue marks the end of the stream: the
+    reader failed and the subscriber has been dropped.
+
+    Args:
+        path: Log file to follow.
+        poll_interval: Seconds between checks when inotify is unavailable.
+        safety_interval: Seconds between checks when inotify is active, to
+            recover from missed events (e.g. network filesystems).
+        queue_size: Maximum pending batches per subscriber.
+        use_inotify: Set False to force polling.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        poll_interval: float = 1.0,
+        safety_interval: float = 30.0,
+        queue_size: int = 1000,
+        use_inotify: bool = True,
+    ) -> None:
+        """Initialize the tailer without touching the file."""
+        self.path = path
+        self.poll_interval = poll_interval
+        self.safety_interval = safety_interval
+        self.queue_size = queue_size
+        self.use_inotify = use_inotify
+
+        self._subscribers: set[asyncio.Queue[list[str] | None]] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._changed: asyncio.Event | None = None
+        self._watch: _InotifyWatch | None = None
+
+        # Published offset: every byte before it was delivered to subscribers.
+        self._position = 0
+        # Reader state, only touched from the worker thread.
+        self._file: BinaryIO | None = None
+        self._inode: int | None = None
+        self._read_offset = 0
+        self._partial = b""
+
+        self.dropped_batches = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of active subscribers."""
+        return len(self._subscribers)
+
+    @property
+    def uses_inotify(self) -> bool:
+        """Whether change notification (rather than polling) is active."""
+        return self._watch is not None
+
+    def subscribe(self) -> asyncio.Queue[list[str] | None]:
+        """Register a subscriber, starting the tailer if needed."""
+        queue: asyncio.Queue[list[str] | None] = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._start()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[list[str] | None]) -> None:
+        """Remove a subscriber, stopping the tailer after the last one."""
+        self._subscribers.discard(queue)
+        if not self._subscribers:
+            self._stop()
+
+    async def read_initial(self, max_lines: int) -> tuple[list[str], bool]:
+        """Return the last lines already delivered, without overlap with updates.
+
+        Args:
+            max_lines: Maximum number of lines to return.
+
+        Returns:
+            (lines, has_more) as returned by ``read_last_lines``.
+        """
+        return await asyncio.to_thread(
+            read_last_lines,
+            self.path,
+            max_lines,
+            end=self._position,
+        )
+
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            stat = os.stat(self.path)
+            # Start after the last complete line; a trailing partial line is
+            # published once, when its newline arrives.
+            self._position = _complete_lines_end(self.path, stat.st_size)
+            self._inode = stat.st_ino
+        except FileNotFoundError:
+            self._position = 0
+            self._inode = None
+        self._read_offset = self._position
+        self._partial = b""
+        self._changed = asyncio.Event()
+
+        if self.use_inotify:
+            self._watch = _create_inotify_watch(self.path)
+            if self._watch is not None:
+                loop.add_reader(self._watch.fd, self._on_inotify_event)
+
+        self._task = loop.create_task(self._run())
+
+    def _stop(self) -> None:
+        if self._watch is not None:
+            with contextlib.suppress(Exception):
+                asyncio.get_running_loop().remove_reader(self._watch.fd)
+            self._watch.close()
+            self._watch = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._close_file()
+
+    def _on_inotify_event(self) -> None:
+        if self._watch is not None and self._watch.read_events():
+            assert self._changed is not None
+            self._changed.set()
+
+    async def _wait_for_change(self) -> None:
+        if self._watch is None:
+            await asyncio.sleep(self.poll_interval)
+            return
+        assert self._changed is not None
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._changed.wait(), timeout=self.safety_interval)
+        self._changed.clear()
+
+    async def _run(self) -> None:
+        try:
+            while self._subscribers:
+                await self._wait_for_change()
+                lines, position = await asyncio.to_thread(self._read_appended)
+                self._position = position
+                if lines:
+                    self._publish(lines)
+        except OSError as e:
+            logger.warning("Log tailer for %s stopped: %s", self.path, e)
+            self._close_subscribers()
+        except Exception:
+            self._close_subscribers()
+            raise
+
+    def _close_subscribers(self) -> None:
+        """Send the end-of-stream marker to every subscriber and drop them."""
+        # The failing task is finishing on its own; cancelling it here would
+        # swallow the exception it is about to raise.
+        self._task = None
+        self._stop()
+        for queue in self._subscribers:
+            self._put(queue, None)
+        self._subscribers.clear()
+
+    def _publish(self, lines: list[str]) -> None:
+        for queue in self._subscribers:
+            self._put(queue, lines)
+
+    def _put(
+        self, queue: asyncio.Queue[list[str] | None], item: list[str] | None
+    ) -> None:
+        if queue.full():
+            with contextlib.suppress(asyncio.QueueEmpty):
+                queue.get_nowait()
+            self.dropped_batches += 1
+        queue.put_nowait(item)
+
+    def _read_appended(self) -> tuple[list[str], int]:
+        """Read bytes appended since the last call (runs in a worker thread)."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            # Rotated away and not yet re-created: flush what the old handle holds.
+            return self._drain(), self._read_offset - len(self._partial)
+
+        lines: list[str] = []
+        if self._file is not None and stat.st_ino != self._inode:
+            # Rotated: finish the old file, then follow the new one from the start.
+            lines.extend(self._drain())
+            if self._partial:
+                # The old file will not grow any more, so its last line is done.
+                lines.append(self._decode(self._partial))
+            self._close_file()
+            self._reset_offset()
+        if self._file is None:
+            self._file = open(self.path, "rb")  # noqa: SIM115
+            inode = os.fstat(self._file.fileno()).st_ino
+            if self._inode is not None and inode != self._inode:
+                self._reset_offset()
+            self._inode = inode
+        if stat.st_size < self._read_offset:
+            # Truncated in place.
+            self._reset_offset()
+
+        lines.extend(self._drain())
+        return lines, self._read_offset - len(self._partial)
+
+    def _reset_offset(self) -> None:
+        self._read_offset = 0
+        self._partial = b""
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            with contextlib.suppress(OSError):
+                self._file.close()
+            self._file = None
+
+    def _drain(self) -> list[str]:
+        if self._file is None:
+            return []
+        self._file.seek(self._read_offset)
+        lines: list[str] = []
+        while data := self._file.read(_BLOCK_SIZE):
+            self._read_offset += len(data)
+            *complete, self._partial = (self._partial + data).split(b"\n")
+            lines.extend(self._decode(line) for line in complete)
+        return lines
+
+    @staticmethod
+    def _decode(line: bytes) -> str:
+        return line.rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+_tailers: dict[Path, LogTailer] = {}
+
+
+def get_log_tailer(path: Path) -> LogTailer:
+    """Return the shared tailer for ``path``, creating it on first use."""
+    key = path.resolve()
+    tailer = _tailers.get(key)
+    if tailer is None:
+        tailer = LogTailer(key)
+        _tailers[key] = tailer
+    return tailer
+
+
+__all__ = ["LogTailer", "get_log_tailer", "read_last_lines"]
@@ -2,17 +2,23 @@
 
 Implements a non-blocking logging system using QueueHandler/QueueListener patterns.
 Features include:
-- Sensitive data masking (API Keys).
+- Bounded log queue with a drop-or-sample overflow policy.
+- Per-logger sampling for high-volume debug events.
+- Sensitive data masking (API Keys) on the listener thread.
 - Environment-specific formatting (JSON for Prod, Rich for Dev).
 - Dynamic log level adjustment.
 - Structured logging for metrics and workflows.
 """
 
+import json
 import logging
 import logging.handlers
+import math
 import os
 import queue
 import re
+import threading
+from collections.abc import Callable, Mapping
 from datetime import datetime
 from typing import Any
 
@@ -21,6 +27,16 @@ from rich.logging import RichHandler
 
 from src.config.constants import SENSITIVE_PATTERN
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+DEFAULT_LOG_QUEUE_SIZE = 10_000
+# 큐 사용률이 이 비율을 넘으면 WARNING 미만 레코드를 샘플링합니다.
+QUEUE_HIGH_WATERMARK = 0.8
+QUEUE_OVERFLOW_SAMPLE_EVERY = 10
+
 
 def _resolve_log_level(explicit: str | None = None) -> int:
     """Resolve log level from explicit value or LOG_LEVEL env var, defaulting to INFO."""
@@ -31,12 +47,18 @@ def _resolve_log_level(explicit: str | None = None) -> int:
 
 
 class SensitiveDataFilter(logging.Filter):
-    """[Security] 로그에서 민감한 정보(API Key 등)를 마스킹하는 필터."""
+    """[Security] 로그에서 민감한 정보(API Key 등)를 마스킹하는 필터.
+
+    리스너 스레드의 핸들러에 붙으므로 호출 스레드에서는 실행되지 않습니다.
+    메시지 템플릿과 문자열 인자에 ``AIza`` 가 없으면 포맷팅 없이 통과합니다.
+    """
 
     sensitive_regex = re.compile(SENSITIVE_PATTERN)
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter and mask sensitive data in log records."""
+        if not _may_contain_key(record):
+            return True
         msg = record.getMessage()
         if "AIza" in msg:
             record.msg = self.sensitive_regex.sub("[FILTERED_API_KEY]", msg)
@@ -55,6 +77,191 @@ class SensitiveDataFilter(logging.Filter):
         return True
 
 
+def _may_contain_key(record: logging.LogRecord) -> bool:
+    if "AIza" in str(record.msg):
+        return True
+    args = record.args
+    if isinstance(args, Mapping):
+        args = tuple(args.values())
+    return any("AIza" in arg for arg in args or () if isinstance(arg, str))
+
+
+class SamplingFilter(logging.Filter):
+    """로거별로 고빈도 DEBUG 레코드를 결정적으로 샘플링하는 필터.
+
+    ``rates`` 의 키는 로거 이름 접두사이며 가장 긴 접두사가 적용됩니다.
+    비율 0.1 은 10건 중 1건만 남긴다는 뜻입니다. ``level`` 이상 레코드는
+    샘플링하지 않습니다.
+
+    Args:
+        rates: {로거 접두사: 유지 비율(0~1)}
+        level: 이 레벨 미만만 샘플링 (기본: INFO 미만 = DEBUG)
+    """
+
+    def __init__(self, rates: Mapping[str, float], level: int = logging.INFO) -> None:
+        """Initialize with per-logger keep rates."""
+        super().__init__()
+        self.rates = {
+            prefix: max(0.0, min(1.0, rate)) for prefix, rate in rates.items()
+        }
+        self.level = level
+        self.sampled = 0
+        self._seen: dict[str, int] = {}
+        self._resolved: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _rate_for(self, name: str) -> float:
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate = 1.0
+            best = -1
+            for prefix, value in self.rates.items():
+                matches = name == prefix or name.startswith(prefix + ".")
+                if matches and len(prefix) > best:
+                    rate, best = value, len(prefix)
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Keep one record out of every ``1 / rate`` for sampled loggers."""
+        if record.levelno >= self.level:
+            return True
+        rate = self._rate_for(record.name)
+        if rate >= 1.0:
+            return True
+        with self._lock:
+            seen = self._seen.get(record.name, 0)
+            self._seen[record.name] = seen + 1
+            # 0번째, 1/rate 번째, ... 레코드를 유지
+            keep = rate > 0 and math.floor(seen * rate) != math.floor((seen - 1) * rate)
+            if not keep:
+                self.sampled += 1
+        return keep
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """크기 제한 큐에 넣고, 가득 차면 기다리지 않고 버리는 QueueHandler.
+
+    - 사용률이 ``QUEUE_HIGH_WATERMARK`` 를 넘으면 WARNING 미만 레코드는
+      ``QUEUE_OVERFLOW_SAMPLE_EVERY`` 건 중 1건만 넣습니다 (``sampled``).
+    - 큐가 가득 차면 레벨과 무관하게 버립니다 (``dropped``).
+    """
+
+    def __init__(self, log_queue: "queue.Queue[Any]") -> None:
+        """Initialize with a bounded queue."""
+        super().__init__(log_queue)
+        self.bounded_queue = log_queue
+        self.dropped = 0
+        self.sampled = 0
+        self._overflow_seen = 0
+        maxsize = log_queue.maxsize
+        self._high_watermark = int(maxsize * QUEUE_HIGH_WATERMARK) if maxsize > 0 else 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue without blocking the calling thread."""
+        if (
+            self._high_watermark
+            and record.levelno < logging.WARNING
+            and self.bounded_queue.qsize() >= self._high_watermark
+        ):
+            self._overflow_seen += 1
+            if self._overflow_seen % QUEUE_OVERFLOW_SAMPLE_EVERY:
+                self.sampled += 1
+                return
+        try:
+            self.bounded_queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def fast_json_dumps(
+    obj: Any,
+    *,
+    default: Callable[[Any], Any] | None = None,
+    cls: type[json.JSONEncoder] | None = None,
+    **_kwargs: Any,
+) -> str:
+    """``json.dumps`` 호환 직렬화 함수 (orjson 이 있으면 사용)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=default or str,
+                option=orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, default=default, cls=cls, ensure_ascii=False)
+
+
+def _parse_sample_rates(raw: str | None) -> dict[str, float]:
+    """``"src.caching=0.1,src.agent=0.5"`` 형식을 파싱합니다."""
+    rates: dict[str, float] = {}
+    for item in (raw or "").split(","):
+        name, sep, value = item.partition("=")
+        if not sep or not name.strip():
+            continue
+        try:
+            rates[name.strip()] = float(value)
+        except ValueError:
+            continue
+    return rates
+
+
+def _resolve_queue_size(explicit: int | None = None) -> int:
+    if explicit is not None:
+        return max(1, explicit)
+    try:
+        return max(1, int(os.getenv("LOG_QUEUE_SIZE", str(DEFAULT_LOG_QUEUE_SIZE))))
+    except ValueError:
+        return DEFAULT_LOG_QUEUE_SIZE
+
+
+def build_queue_handler(
+    queue_size: int | None = None,
+    sample_rates: Mapping[str, float] | None = None,
+) -> tuple[BoundedQueueHandler, "queue.Queue[Any]"]:
+    """호출 스레드 쪽 QueueHandler 를 만듭니다.
+
+    Args:
+        queue_size: 큐 최대 크기 (기본: ``LOG_QUEUE_SIZE`` 또는 10000)
+        sample_rates: 로거별 DEBUG 유지 비율 (기본: ``LOG_SAMPLE_RATES``)
+
+    Returns:
+        (QueueHandler, 큐)
+    """
+    log_queue: queue.Queue[Any] = queue.Queue(_resolve_queue_size(queue_size))
+    handler = BoundedQueueHandler(log_queue)
+    rates = (
+        dict(sample_rates)
+        if sample_rates is not None
+        else _parse_sample_rates(os.getenv("LOG_SAMPLE_RATES"))
+    )
+    if rates:
+        handler.addFilter(SamplingFilter(rates))
+    return handler, log_queue
+
+
+def get_logging_stats() -> dict[str, int]:
+    """루트 로거 큐 핸들러의 드롭/샘플링 카운터를 반환합니다.
+
+    Returns:
+        {"dropped": 큐 포화로 버린 수, "sampled": 샘플링으로 제외된 수,
+         "queued": 현재 큐 길이}
+    """
+    stats = {"dropped": 0, "sampled": 0, "queued": 0}
+    for handler in logging.getLogger().handlers:
+        if not isinstance(handler, BoundedQueueHandler):
+            continue
+        stats["dropped"] += handler.dropped
+        stats["sampled"] += handler.sampled
+        stats["queued"] += handler.bounded_queue.qsize()
+        for filt in handler.filters:
+            if isinstance(filt, SamplingFilter):
+                stats["sampled"] += filt.sampled
+    return stats
+
+
 def _build_file_handler(
     log_level: int,
     use_json: bool,
@@ -71,7 +278,10 @@ def _build_file_handler(
     file_handler.setLevel(log_level)
     formatter: logging.Formatter
     if use_json:
-        formatter = JsonFormatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+        formatter = JsonFormatter(
+            "%(asctime)s %(levelname)s %(name)s %(message)s",
+            json_serializer=fast_json_dumps,
+        )
     else:
         formatter = logging.Formatter(
             "[%(asctime)s] %(levelname)s | %(message)s",
@@ -100,16 +310,28 @@ def _build_console_handler(
 def setup_logging(
     env: str | None = None,
     log_level: str | None = None,
+    *,
+    queue_size: int | None = None,
+    sample_rates: Mapping[str, float] | None = None,
 ) -> tuple[logging.Logger, logging.handlers.QueueListener]:
     """[Non-Blocking Logging] QueueHandler 패턴 + 환경별 포맷/출력 제어.
 
     - production: JSON 포맷, 파일만(회전)
     - local/dev: 텍스트 포맷, 콘솔 + 파일(회전)
+
+    호출 스레드는 크기 제한 큐에 넣기만 하고, 마스킹/포맷/디스크 쓰기는
+    리스너 스레드에서 처리합니다. 큐가 차면 기다리지 않고 버립니다.
+
+    Args:
+        env: 실행 환경 (기본: ``APP_ENV``)
+        log_level: 로그 레벨 (기본: ``LOG_LEVEL``)
+        queue_size: 큐 최대 크기 (기본: ``LOG_QUEUE_SIZE``)
+        sample_rates: 로거별 DEBUG 유지 비율 (기본: ``LOG_SAMPLE_RATES``)
     """
     log_env = (env or os.getenv("APP_ENV") or "local").lower()
     is_production = log_env in {"prod", "production"}
 
-    log_queue: queue.Queue[Any] = queue.Queue(-1)  # 무제한 큐
+    queue_handler, log_queue = build_queue_handler(queue_size, sample_rates)
     resolved_level = _resolve_log_level(log_level)
     sensitive_filter = SensitiveDataFilter()
 
@@ -143,8 +365,6 @@ def setup_logging(
         respect_handler_level=True,
     )
 
-    queue_handler = logging.handlers.QueueHandler(log_queue)
-
     root_logger = logging.getLogger()
     root_logger.setLevel(resolved_level)
 
@@ -227,6 +447,8 @@ def log_metrics(
     api_failures: int | None = None,
 ) -> None:
     """표준화된 메트릭 로깅: latency, 토큰 처리율, 캐시 히트율을 계산해 기록."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     metrics: dict[str, float | int] = {}
     total_tokens = _add_token_metrics(metrics, prompt_tokens, completion_tokens)
     _add_latency_metrics(metrics, latency_ms, total_tokens)
@@ -410,13 +632,18 @@ class StructuredLogger:
 
 
 __all__ = [
+    "BoundedQueueHandler",
+    "SamplingFilter",
     "SensitiveDataFilter",
     "StructuredLogger",
     "_build_console_handler",
     "_build_file_handler",
     "_resolve_log_level",
+    "build_queue_handler",
+    "fast_json_dumps",
     "get_current_log_level",
     "get_log_level",
+    "get_logging_stats",
     "log_metrics",
     "set_log_level",
     "setup_logging",
@@ -1,4 +1,8 @@
-"""Lightweight metrics utilities for structured latency logging."""
+"""Lightweight metrics utilities for structured latency logging.
+
+Inside an active trace (see ``src.infra.telemetry``) each measured call also
+becomes a child span, so sampled and tail-kept traces show these operations.
+"""
 
 from __future__ import annotations
 
@@ -10,6 +14,8 @@ from typing import Any, TypeVar
 
 from typing_extensions import ParamSpec
 
+from src.infra.telemetry import begin_span, end_span
+
 logger = logging.getLogger(__name__)
 
 P = ParamSpec("P")
@@ -51,32 +57,40 @@ def measure_latency(
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             start = time.perf_counter()
+            scope = begin_span(operation, child_only=True)
             success = False
+            error: BaseException | None = None
             result: R | None = None
             try:
                 result = func(*args, **kwargs)
                 success = True
                 return result
+            except BaseException as exc:
+                error = exc
+                raise
             finally:
-                elapsed_ms = max((time.perf_counter() - start) * 1000, 0.001)
-                extra_fields = _safe_extra(
-                    get_extra,
-                    args,
-                    kwargs,
-                    result,
-                    success,
-                    elapsed_ms,
-                )
-                logger.info(
-                    "Operation completed",
-                    extra={
-                        "metric": "latency",
-                        "operation": operation,
-                        "duration_ms": elapsed_ms,
-                        "success": success,
-                        **extra_fields,
-                    },
-                )
+                if scope is not None:
+                    end_span(scope, error)
+                if logger.isEnabledFor(logging.INFO):
+                    elapsed_ms = max((time.perf_counter() - start) * 1000, 0.001)
+                    extra_fields = _safe_extra(
+                        get_extra,
+                        args,
+                        kwargs,
+                        result,
+                        success,
+                        elapsed_ms,
+                    )
+                    logger.info(
+                        "Operation completed",
+                        extra={
+                            "metric": "latency",
+                            "operation": operation,
+                            "duration_ms": elapsed_ms,
+                            "success": success,
+                            **extra_fields,
+                        },
+                    )
 
         return wrapper
 
@@ -97,33 +111,41 @@ def measure_latency_async(
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             start = time.perf_counter()
+            scope = begin_span(operation, child_only=True)
             success = False
+            error: BaseException | None = None
             result: R | None = None
             try:
                 awaitable = func(*args, **kwargs)
                 result = await awaitable
                 success = True
                 return result
+            except BaseException as exc:
+                error = exc
+                raise
             finally:
-                elapsed_ms = max((time.perf_counter() - start) * 1000, 0.001)
-                extra_fields = _safe_extra(
-                    get_extra,
-                    args,
-                    kwargs,
-                    result,
-                    success,
-                    elapsed_ms,
-                )
-                logger.info(
-                    "Operation completed",
-                    extra={
-                        "metric": "latency",
-                        "operation": operation,
-                        "duration_ms": elapsed_ms,
-                        "success": success,
-                        **extra_fields,
-                    },
-                )
+                if scope is not None:
+                    end_span(scope, error)
+                if logger.isEnabledFor(logging.INFO):
+                    elapsed_ms = max((time.perf_counter() - start) * 1000, 0.001)
+                    extra_fields = _safe_extra(
+                        get_extra,
+                        args,
+                        kwargs,
+                        result,
+                        success,
+                        elapsed_ms,
+                    )
+                    logger.info(
+                        "Operation completed",
+                        extra={
+                            "metric": "latency",
+                            "operation": operation,
+                            "duration_ms": elapsed_ms,
+                            "success": success,
+                            **extra_fields,
+                        },
+                    )
 
         return wrapper
 
@@ -4,13 +4,22 @@ from __future__ import annotations
 
 import atexit
 import os
-from collections.abc import AsyncIterator, Callable, Iterator
+from collections.abc import AsyncIterator, Callable, Sequence
 from contextlib import asynccontextmanager, suppress
+from pathlib import Path
 from typing import Any
 
 from neo4j import AsyncDriver, AsyncGraphDatabase, Driver, GraphDatabase
 
 from src.core.interfaces import GraphProvider
+from src.infra.neo4j_bulk import (
+    DEFAULT_CONCURRENCY,
+    BulkLoadStats,
+    Neo4jBulkLoader,
+    NodeBatch,
+    RelationshipBatch,
+    dedupe_rows,
+)
 
 __all__ = [
     "Neo4jGraphProvider",
@@ -146,6 +155,7 @@ class Neo4jGraphProvider(GraphProvider):
         password: str,
         *,
         batch_size: int = 100,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
     ) -> None:
         """Initialize Neo4jGraphProvider.
 
@@ -154,18 +164,15 @@ class Neo4jGraphProvider(GraphProvider):
             user: Neo4j username.
             password: Neo4j password.
             batch_size: Default batch size for write operations.
+            max_concurrency: Number of sessions writing batches in parallel.
         """
         self._uri = uri
         self._user = user
         self._password = password
         self._batch_size = batch_size
+        self._max_concurrency = max_concurrency
         self._driver: AsyncDriver | None = None
 
-    def _chunk(self, items: list[dict[str, Any]]) -> Iterator[list[dict[str, Any]]]:
-        """Yield fixed-size chunks to reuse batch logic."""
-        for i in range(0, len(items), self._batch_size):
-            yield items[i : i + self._batch_size]
-
     def _get_driver(self) -> AsyncDriver:
         """Lazily initialize and return the async driver.
 
@@ -209,21 +216,26 @@ class Neo4jGraphProvider(GraphProvider):
         driver = self._get_driver()
         await driver.verify_connectivity()
 
+    def _loader(self, **kwargs: Any) -> Neo4jBulkLoader:
+        return Neo4jBulkLoader(
+            self.session,
+            chunk_size=self._batch_size,
+            concurrency=self._max_concurrency,
+            **kwargs,
+        )
+
     async def _execute_batches(
         self,
         query: str,
         param_name: str,
         items: list[dict[str, Any]],
     ) -> int:
-        """Execute a write query in batches and accumulate counts."""
-        total_count = 0
-        async with self.session() as session:
-            for batch in self._chunk(items):
-                result = await session.run(query, **{param_name: batch})
-                record = await result.single()
-                if record:
-                    total_count += record["count"]
-        return total_count
+        """Execute a write query in parallel batches and accumulate counts.
+
+        ``items`` must not repeat a MERGE key: chunks run in separate sessions,
+        so the same key in two chunks could be merged twice concurrently.
+        """
+        return await self._loader().write_chunks(query, param_name, items)
 
     async def create_nodes(
         self,
@@ -236,23 +248,11 @@ class Neo4jGraphProvider(GraphProvider):
         if not nodes:
             return 0
 
-        # Build merge keys
-        keys = [merge_on] + (merge_keys or [])
-        merge_clause = ", ".join(f"{k}: node.{k}" for k in keys)
-
-        # Build SET clause for remaining properties
-        set_props = [k for k in nodes[0] if k not in keys]
-        set_clause = ", ".join(f"n.{k} = node.{k}" for k in set_props)
-
-        query = f"""
-        UNWIND $nodes AS node
-        MERGE (n:{label} {{{merge_clause}}})
-        """
-        if set_clause:
-            query += f"SET {set_clause}\n"
-        query += "RETURN count(n) AS count"
-
-        return await self._execute_batches(query, "nodes", nodes)
+        batch = NodeBatch(label, nodes, merge_on, merge_keys or [])
+        query = f"UNWIND $nodes AS node\n{batch.clause()}RETURN count(n) AS count"
+        return await self._execute_batches(
+            query, "nodes", dedupe_rows(nodes, batch.keys)
+        )
 
     async def create_relationships(
         self,
@@ -267,19 +267,30 @@ class Neo4jGraphProvider(GraphProvider):
         if not rels:
             return 0
 
-        # Extract property keys (excluding from_id and to_id)
-        prop_keys = [k for k in rels[0] if k not in ("from_id", "to_id")]
-        props_clause = ", ".join(f"{k}: rel.{k}" for k in prop_keys)
+        batch = RelationshipBatch(
+            rel_type, from_label, to_label, rels, from_key, to_key
+        )
+        query = f"UNWIND $rels AS rel\n{batch.clause()}RETURN count(r) AS count"
+        return await self._execute_batches(query, "rels", dedupe_rows(rels, batch.keys))
 
-        query = f"""
-        UNWIND $rels AS rel
-        MATCH (a:{from_label} {{{from_key}: rel.from_id}})
-        MATCH (b:{to_label} {{{to_key}: rel.to_id}})
-        MERGE (a)-[r:{rel_type}"""
+    async def bulk_load(
+        self,
+        nodes: Sequence[NodeBatch] = (),
+        relationships: Sequence[RelationshipBatch] = (),
+        *,
+        csv_dir: str | Path | None = None,
+        csv_threshold: int | None = None,
+    ) -> BulkLoadStats:
+        """Load nodes, then relationships, with parallel chunked transactions.
 
-        if props_clause:
-            query += f" {{{props_clause}}}"
-        query += """]->(b)
-        RETURN count(r) AS count"""
+        Args:
+            nodes: Node batches, one per label.
+            relationships: Relationship batches, written after all nodes commit.
+            csv_dir: Neo4j import directory for the ``LOAD CSV`` path.
+            csv_threshold: Batches with at least this many rows use ``LOAD CSV``.
 
-        return await self._execute_batches(query, "rels", rels)
+        Returns:
+            Counts and nodes/sec, relationships/sec throughput.
+        """
+        loader = self._loader(csv_dir=csv_dir, csv_threshold=csv_threshold)
+        return await loader.load(nodes, relationships)
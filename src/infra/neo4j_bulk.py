@@ -0,0 +1,415 @@
+"""Neo4j 대량 적재 엔진.
+
+노드/관계 목록을 청크로 나눠 여러 세션에서 동시에 ``UNWIND`` 로 기록합니다.
+
+- 동시 실행 수는 세마포어로 제한합니다.
+- 모든 노드 청크가 커밋된 뒤에만 관계 청크를 시작하므로 관계의 양 끝 노드가
+  항상 먼저 존재합니다.
+- 같은 MERGE 키를 가진 행은 청크로 나누기 전에 하나로 합칩니다. 키에 유니크
+  제약이 없어도 서로 다른 세션이 같은 키를 동시에 MERGE 해 중복 노드/관계가
+  생기지 않습니다.
+- 교착(deadlock) 등 일시적 오류는 지터를 섞은 지수 백오프로 재시도합니다.
+- ``csv_dir`` 가 설정되면 ``csv_threshold`` 이상인 배치를 CSV로 내보내
+  ``LOAD CSV ... IN TRANSACTIONS`` 로 적재합니다. ``csv_dir`` 는 Neo4j 서버의
+  import 디렉터리와 같은 위치여야 하며, CSV로 적재한 속성 값은 문자열입니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import logging
+import random
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from neo4j.exceptions import TransientError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_CONCURRENCY = 4
+DEFAULT_MAX_RETRIES = 3
+RETRY_BASE_DELAY_SECONDS = 0.2
+CSV_TRANSACTION_ROWS = 10_000
+
+
+def node_merge_clause(
+    label: str, keys: Sequence[str], set_props: Sequence[str], row: str = "node"
+) -> str:
+    """``row`` 변수의 값으로 ``n`` 을 MERGE/SET 하는 절을 만듭니다."""
+    merge_clause = ", ".join(f"{k}: {row}.{k}" for k in keys)
+    clause = f"MERGE (n:{label} {{{merge_clause}}})\n"
+    if set_props:
+        clause += "SET " + ", ".join(f"n.{k} = {row}.{k}" for k in set_props) + "\n"
+    return clause
+
+
+def relationship_merge_clause(
+    rel_type: str,
+    from_label: str,
+    to_label: str,
+    from_key: str,
+    to_key: str,
+    prop_keys: Sequence[str],
+    row: str = "rel",
+) -> str:
+    """``row`` 변수의 끝점으로 관계 ``r`` 을 MERGE 하는 절을 만듭니다."""
+    clause = (
+        f"MATCH (a:{from_label} {{{from_key}: {row}.from_id}})\n"
+        f"MATCH (b:{to_label} {{{to_key}: {row}.to_id}})\n"
+        f"MERGE (a)-[r:{rel_type}"
+    )
+    if prop_keys:
+        clause += " {" + ", ".join(f"{k}: {row}.{k}" for k in prop_keys) + "}"
+    return clause + "]->(b)\n"
+
+
+def dedupe_rows(
+    rows: Sequence[dict[str, Any]], keys: Sequence[str]
+) -> list[dict[str, Any]]:
+    """``keys`` 값이 같은 행을 마지막 행 하나로 합칩니다.
+
+    직렬로 적재할 때 같은 키의 마지막 행 속성이 남는 것과 결과가 같습니다.
+    행 순서는 각 키가 처음 나온 위치를 따릅니다.
+    """
+    unique: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        key = json.dumps([row.get(k) for k in keys], default=str)
+        unique[key] = row
+    return list(unique.values())
+
+
+@dataclass
+class NodeBatch:
+    """한 레이블의 노드 목록.
+
+    Attributes:
+        label: 노드 레이블.
+        rows: 노드 속성 딕셔너리 목록.
+        merge_on: MERGE 기준 키.
+        merge_keys: 추가 MERGE 키.
+    """
+
+    label: str
+    rows: list[dict[str, Any]]
+    merge_on: str = "id"
+    merge_keys: list[str] = field(default_factory=list)
+
+    @property
+    def keys(self) -> list[str]:
+        """MERGE 에 쓰이는 속성 이름."""
+        return [self.merge_on, *self.merge_keys]
+
+    def clause(self, row: str = "node") -> str:
+        """MERGE/SET 절."""
+        keys = self.keys
+        set_props = [k for k in self.rows[0] if k not in keys] if self.rows else []
+        return node_merge_clause(self.label, keys, set_props, row)
+
+
+@dataclass
+class RelationshipBatch:
+    """한 관계 유형의 관계 목록.
+
+    Attributes:
+        rel_type: 관계 유형.
+        from_label: 시작 노드 레이블.
+        to_label: 끝 노드 레이블.
+        rows: ``from_id``/``to_id`` 와 관계 속성을 담은 딕셔너리 목록.
+        from_key: 시작 노드 매칭 키.
+        to_key: 끝 노드 매칭 키.
+    """
+
+    rel_type: str
+    from_label: str
+    to_label: str
+    rows: list[dict[str, Any]]
+    from_key: str = "id"
+    to_key: str = "id"
+
+    @property
+    def prop_keys(self) -> list[str]:
+        """관계 패턴에 들어가는 속성 이름."""
+        if not self.rows:
+            return []
+        return [k for k in self.rows[0] if k not in ("from_id", "to_id")]
+
+    @property
+    def keys(self) -> list[str]:
+        """MERGE 패턴을 결정하는 행 필드."""
+        return ["from_id", "to_id", *self.prop_keys]
+
+    def clause(self, row: str = "rel") -> str:
+        """MATCH/MERGE 절."""
+        return relationship_merge_clause(
+            self.rel_type,
+            self.from_label,
+            self.to_label,
+            self.from_key,
+            self.to_key,
+            self.prop_keys,
+            row,
+        )
+
+
+@dataclass
+class BulkLoadStats:
+    """적재 결과와 처리량."""
+
+    nodes: int = 0
+    relationships: int = 0
+    node_seconds: float = 0.0
+    relationship_seconds: float = 0.0
+    chunks: int = 0
+    retries: int = 0
+    failed_chunks: int = 0
+    csv_batches: int = 0
+
+    @property
+    def nodes_per_second(self) -> float:
+        """노드 처리량."""
+        return self.nodes / self.node_seconds if self.node_seconds else 0.0
+
+    @property
+    def relationships_per_second(self) -> float:
+        """관계 처리량."""
+        if not self.relationship_seconds:
+            return 0.0
+        return self.relationships / self.relationship_seconds
+
+    def as_dict(self) -> dict[str, float]:
+        """JSON 직렬화 가능한 지표."""
+        return {
+            "nodes": float(self.nodes),
+            "relationships": float(self.relationships),
+            "nodes_per_second": round(self.nodes_per_second, 1),
+            "relationships_per_second": round(self.relationships_per_second, 1),
+            "chunks": float(self.chunks),
+            "retries": float(self.retries),
+            "failed_chunks": float(self.failed_chunks),
+            "csv_batches": float(self.csv_batches),
+        }
+
+
+def export_csv(rows: Sequence[dict[str, Any]], path: Path) -> Path:
+    """``rows`` 를 헤더가 있는 CSV로 씁니다. None은 빈 칸으로 기록됩니다."""
+    columns: list[str] = []
+    for row in rows:
+        for key in row:
+            if key not in columns:
+                columns.append(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+class Neo4jBulkLoader:
+    """청크 병렬 쓰기와 재시도를 담당하는 적재기.
+
+    Args:
+        session_factory: 비동기 세션 컨텍스트를 반환하는 callable
+            (예: ``Neo4jGraphProvider.session``).
+        chunk_size: 한 트랜잭션에 담을 행 수.
+        concurrency: 동시에 열 세션 수.
+        max_retries: 일시적 오류 시 청크당 최대 재시도 횟수.
+        retry_base_delay: 재시도 백오프 기준 시간(초).
+        csv_dir: ``LOAD CSV`` 용 파일을 쓸 Neo4j import 디렉터리.
+        csv_threshold: 이 행 수 이상인 배치를 CSV 경로로 적재. None이면 사용 안 함.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_base_delay: float = RETRY_BASE_DELAY_SECONDS,
+        csv_dir: str | Path | None = None,
+        csv_threshold: int | None = None,
+    ) -> None:
+        """적재 설정을 저장합니다."""
+        self._session_factory = session_factory
+        self.chunk_size = max(1, chunk_size)
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.csv_dir = Path(csv_dir) if csv_dir else None
+        self.csv_threshold = csv_threshold
+
+    def _chunks(self, rows: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        return [
+            rows[i : i + self.chunk_size] for i in range(0, len(rows), self.chunk_size)
+        ]
+
+    async def _run_once(self, query: str, params: dict[str, Any]) -> int:
+        async with self._session_factory() as session:
+            result = await session.run(query, **params)
+            record = await result.single()
+            return int(record["count"]) if record else 0
+
+    async def _run_with_retry(
+        self, query: str, params: dict[str, Any], stats: BulkLoadStats | None
+    ) -> int:
+        attempt = 0
+        while True:
+            try:
+                return await self._run_once(query, params)
+            except TransientError as exc:  # noqa: PERF203
+                if attempt >= self.max_retries:
+                    raise
+                # full jitter: 동시에 실패한 청크들이 같은 시점에 다시 충돌하지 않도록
+                delay = random.uniform(0, self.retry_base_delay * 2**attempt)
+                attempt += 1
+                if stats is not None:
+                    stats.retries += 1
+                logger.debug(
+                    "Transient Neo4j error, retry %d in %.2fs: %s", attempt, delay, exc
+                )
+                await asyncio.sleep(delay)
+
+    async def write_chunks(
+        self,
+        query: str,
+        param_name: str,
+        rows: list[dict[str, Any]],
+        stats: BulkLoadStats | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> int:
+        """``rows`` 를 청크로 나눠 병렬로 실행하고 ``count`` 합을 반환합니다.
+
+        ``stats`` 가 None이면 재시도 후에도 실패한 첫 청크의 예외를 전파하고,
+        주어지면 실패한 청크 수를 기록하고 나머지 결과를 합산합니다.
+        ``semaphore`` 를 넘기면 여러 호출이 같은 동시 실행 한도를 공유합니다.
+        """
+        semaphore = semaphore or asyncio.Semaphore(self.concurrency)
+
+        async def run(chunk: list[dict[str, Any]]) -> int:
+            async with semaphore:
+                return await self._run_with_retry(query, {param_name: chunk}, stats)
+
+        chunks = self._chunks(rows)
+        results = await asyncio.gather(
+            *(run(chunk) for chunk in chunks), return_exceptions=True
+        )
+        total = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                if stats is None:
+                    raise result
+                stats.failed_chunks += 1
+                logger.error("Bulk load chunk failed: %s", result)
+                continue
+            total += result
+        if stats is not None:
+            stats.chunks += len(chunks)
+        return total
+
+    def _use_csv(self, rows: list[dict[str, Any]]) -> bool:
+        return (
+            self.csv_dir is not None
+            and self.csv_threshold is not None
+            and len(rows) >= self.csv_threshold
+        )
+
+    async def _load_csv(self, clause: str, row: str, rows: list[dict[str, Any]]) -> int:
+        csv_dir = self.csv_dir or Path()
+        path = export_csv(rows, csv_dir / f"bulk_{uuid.uuid4().hex}.csv")
+        query = (
+            f"LOAD CSV WITH HEADERS FROM $url AS {row}\n"
+            f"CALL {{\n WITH {row}\n {clause} RETURN count(*) AS c\n}}"
+            " IN TRANSACTIONS OF $batch ROWS\n"
+            "RETURN sum(c) AS count"
+        )
+        try:
+            return await self._run_once(
+                query, {"url": f"file:///{path.name}", "batch": CSV_TRANSACTION_ROWS}
+            )
+        finally:
+            path.unlink(missing_ok=True)
+
+    async def _load_batch(
+        self,
+        batch: NodeBatch | RelationshipBatch,
+        row: str,
+        stats: BulkLoadStats,
+        semaphore: asyncio.Semaphore,
+    ) -> int:
+        clause = batch.clause(row)
+        rows = dedupe_rows(batch.rows, batch.keys)
+        if self._use_csv(rows):
+            stats.csv_batches += 1
+            try:
+                async with semaphore:
+                    return await self._load_csv(clause, row, rows)
+            except Exception as exc:  # noqa: BLE001
+                stats.failed_chunks += 1
+                logger.error("LOAD CSV import failed: %s", exc)
+                return 0
+        query = f"UNWIND ${row}s AS {row}\n{clause}RETURN count(*) AS count"
+        return await self.write_chunks(query, f"{row}s", rows, stats, semaphore)
+
+    async def load(
+        self,
+        nodes: Sequence[NodeBatch] = (),
+        relationships: Sequence[RelationshipBatch] = (),
+    ) -> BulkLoadStats:
+        """노드를 모두 커밋한 뒤 관계를 적재하고 처리량을 반환합니다."""
+        stats = BulkLoadStats()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        started = time.perf_counter()
+        counts = await asyncio.gather(
+            *(
+                self._load_batch(batch, "node", stats, semaphore)
+                for batch in nodes
+                if batch.rows
+            )
+        )
+        stats.nodes = sum(counts)
+        stats.node_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        counts = await asyncio.gather(
+            *(
+                self._load_batch(batch, "rel", stats, semaphore)
+                for batch in relationships
+                if batch.rows
+            )
+        )
+        stats.relationships = sum(counts)
+        stats.relationship_seconds = time.perf_counter() - started
+
+        logger.info(
+            "Bulk load: %d nodes (%.1f/s), %d relationships (%.1f/s), "
+            "%d chunks, %d retries, %d failed",
+            stats.nodes,
+            stats.nodes_per_second,
+            stats.relationships,
+            stats.relationships_per_second,
+            stats.chunks,
+            stats.retries,
+            stats.failed_chunks,
+        )
+        return stats
+
+
+__all__ = [
+    "BulkLoadStats",
+    "Neo4jBulkLoader",
+    "NodeBatch",
+    "RelationshipBatch",
+    "dedupe_rows",
+    "export_csv",
+    "node_merge_clause",
+    "relationship_merge_clause",
+]
@@ -1,7 +1,24 @@
-"""성능 메트릭 자동 수집."""
+"""성능 메트릭 자동 수집.
 
+작업별로 고정 개수의 원형 시간 슬롯(기본 1분 × 60개)에 집계만 보관합니다.
+각 슬롯은 건수, 합계, 최소/최대, 병합 가능한 지연 스케치를 가지므로 기록은
+O(1), 조회는 O(슬롯 수)이고 메모리는 트래픽과 무관하게 일정합니다.
+
+기록 경로는 락을 쓰지 않습니다. 만료된 슬롯은 새 객체로 교체하고 필드만
+증가시키므로 이벤트 루프(단일 스레드)에서의 호출을 전제로 합니다.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
+
+SKETCH_RELATIVE_ACCURACY = 0.02
+SKETCH_MIN_VALUE_MS = 0.01
+SKETCH_MAX_VALUE_MS = 3_600_000.0
 
 
 @dataclass
@@ -16,27 +33,128 @@ class PerformanceMetric:
     status: str  # "success", "retry", "timeout"
 
 
+class LatencySketch:
+    """상대 오차가 보장되는 로그 버킷 히스토그램(DDSketch 방식).
+
+    값 범위를 [``SKETCH_MIN_VALUE_MS``, ``SKETCH_MAX_VALUE_MS``] 로 제한하므로
+    버킷 수는 상한이 있고, 같은 정확도의 스케치끼리 버킷별 합으로 병합됩니다.
+    """
+
+    __slots__ = ("_gamma_log", "bins", "count")
+
+    def __init__(self, relative_accuracy: float = SKETCH_RELATIVE_ACCURACY) -> None:
+        """빈 스케치를 만듭니다."""
+        gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._gamma_log = math.log(gamma)
+        self.bins: dict[int, int] = {}
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """값 하나를 추가합니다."""
+        clamped = min(max(value, SKETCH_MIN_VALUE_MS), SKETCH_MAX_VALUE_MS)
+        key = math.ceil(math.log(clamped) / self._gamma_log)
+        self.bins[key] = self.bins.get(key, 0) + 1
+        self.count += 1
+
+    def merge(self, other: LatencySketch) -> None:
+        """``other`` 의 버킷을 더합니다."""
+        for key, n in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + n
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """분위수 추정치(0 <= q <= 1). 비어 있으면 0."""
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                # 버킷 (gamma^(k-1), gamma^k] 의 중앙값(상대 오차 기준)
+                return (
+                    2
+                    * math.exp(key * self._gamma_log)
+                    / (1 + math.exp(self._gamma_log))
+                )
+        return 0.0
+
+
 @dataclass
-class _StatsData:
-    """Helper class for collecting stats data."""
+class _Slot:
+    """한 시간 구간의 집계."""
 
+    epoch: int
     count: int = 0
-    durations: list[float] = field(default_factory=list)
+    total_ms: float = 0.0
+    min_ms: float = math.inf
+    max_ms: float = -math.inf
     cache_hits: int = 0
     successes: int = 0
+    tokens: int = 0
+    sketch: LatencySketch = field(default_factory=LatencySketch)
+
+
+class _OperationWindow:
+    """작업 하나의 원형 슬롯 버퍼."""
+
+    __slots__ = ("slots",)
+
+    def __init__(self, size: int) -> None:
+        self.slots: list[_Slot | None] = [None] * size
+
+    def record(self, epoch: int, metric: PerformanceMetric) -> None:
+        index = epoch % len(self.slots)
+        slot = self.slots[index]
+        if slot is None or slot.epoch != epoch:
+            if slot is not None and slot.epoch > epoch:
+                return  # 이미 덮어쓴 과거 구간
+            slot = _Slot(epoch)
+            self.slots[index] = slot
+        duration = metric.duration_ms
+        slot.count += 1
+        slot.total_ms += duration
+        slot.min_ms = min(slot.min_ms, duration)
+        slot.max_ms = max(slot.max_ms, duration)
+        slot.tokens += metric.tokens_used
+        if metric.cache_hit:
+            slot.cache_hits += 1
+        if metric.status == "success":
+            slot.successes += 1
+        slot.sketch.add(duration)
+
+    def live(self, oldest_epoch: int) -> list[_Slot]:
+        return [s for s in self.slots if s is not None and s.epoch >= oldest_epoch]
 
 
 class PerformanceTracker:
     """성능 메트릭 추적."""
 
-    def __init__(self, window_minutes: int = 60):
+    def __init__(
+        self,
+        window_minutes: int = 60,
+        *,
+        slots: int | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
         """Initialize performance tracker.
 
         Args:
             window_minutes: 메트릭 윈도우 크기 (분 단위)
+            slots: 윈도우를 나눌 슬롯 수 (기본: 1분당 1개)
+            clock: 현재 시각(epoch 초)을 반환하는 함수
         """
-        self.window = timedelta(minutes=window_minutes)
-        self.metrics: list[PerformanceMetric] = []
+        self.window_seconds = window_minutes * 60.0
+        self.slot_count = max(1, slots or window_minutes)
+        self.slot_seconds = self.window_seconds / self.slot_count
+        self._clock = clock
+        self._operations: dict[str, _OperationWindow] = {}
+
+    def _epoch(self, seconds: float) -> int:
+        return int(seconds // self.slot_seconds)
+
+    def _oldest_live_epoch(self) -> int:
+        return self._epoch(self._clock()) - self.slot_count + 1
 
     def record(self, metric: PerformanceMetric) -> None:
         """메트릭 기록.
@@ -44,8 +162,15 @@ class PerformanceTracker:
         Args:
             metric: 기록할 메트릭 항목
         """
-        self.metrics.append(metric)
-        self._cleanup_old()
+        epoch = self._epoch(metric.timestamp.timestamp())
+        if epoch < self._oldest_live_epoch():
+            return
+        window = self._operations.get(metric.operation)
+        if window is None:
+            window = self._operations.setdefault(
+                metric.operation, _OperationWindow(self.slot_count)
+            )
+        window.record(epoch, metric)
 
     def get_stats(self, operation: str | None = None) -> dict[str, dict[str, float]]:
         """작업별 통계 반환.
@@ -60,63 +185,45 @@ class PerformanceTracker:
                     "avg_duration_ms": 234.5,
                     "min_duration_ms": 150,
                     "max_duration_ms": 400,
+                    "p50_duration_ms": 230.1,
+                    "p95_duration_ms": 390.2,
+                    "p99_duration_ms": 398.0,
                     "cache_hit_rate": 0.3,
                     "success_rate": 0.9,
                 }
             }
         """
-        filtered = self._filter_metrics(operation)
-        if not filtered:
-            return {}
-        aggregated = self._accumulate_by_operation(filtered)
-        return self._compute_stats(aggregated)
-
-    def _filter_metrics(self, operation: str | None) -> list[PerformanceMetric]:
-        return [
-            metric
-            for metric in self.metrics
-            if operation is None or metric.operation == operation
-        ]
-
-    def _accumulate_by_operation(
-        self,
-        metrics: list[PerformanceMetric],
-    ) -> dict[str, _StatsData]:
-        result: dict[str, _StatsData] = {}
-        for metric in metrics:
-            data = result.setdefault(metric.operation, _StatsData())
-            data.count += 1
-            data.durations.append(metric.duration_ms)
-            if metric.cache_hit:
-                data.cache_hits += 1
-            if metric.status == "success":
-                data.successes += 1
-        return result
-
-    def _compute_stats(
-        self,
-        aggregated: dict[str, _StatsData],
-    ) -> dict[str, dict[str, float]]:
+        oldest = self._oldest_live_epoch()
+        names = [operation] if operation is not None else list(self._operations)
         stats: dict[str, dict[str, float]] = {}
-        for op, data in aggregated.items():
-            if not data.durations:
+        for name in names:
+            window = self._operations.get(name)
+            if window is None:
                 continue
-            count = float(data.count)
-            durations = data.durations
-            stats[op] = {
-                "count": count,
-                "avg_duration_ms": sum(durations) / len(durations),
-                "min_duration_ms": min(durations),
-                "max_duration_ms": max(durations),
-                "cache_hit_rate": float(data.cache_hits) / count if count else 0.0,
-                "success_rate": float(data.successes) / count if count else 0.0,
-            }
+            op_stats = self._compute_stats(window.live(oldest))
+            if op_stats:
+                stats[name] = op_stats
         return stats
 
-    def _cleanup_old(self) -> None:
-        """윈도우 범위 밖 메트릭 제거."""
-        cutoff = datetime.now(timezone.utc) - self.window
-        self.metrics = [m for m in self.metrics if m.timestamp > cutoff]
+    @staticmethod
+    def _compute_stats(slots: list[_Slot]) -> dict[str, float]:
+        count = sum(s.count for s in slots)
+        if not count:
+            return {}
+        sketch = LatencySketch()
+        for slot in slots:
+            sketch.merge(slot.sketch)
+        return {
+            "count": float(count),
+            "avg_duration_ms": sum(s.total_ms for s in slots) / count,
+            "min_duration_ms": min(s.min_ms for s in slots),
+            "max_duration_ms": max(s.max_ms for s in slots),
+            "p50_duration_ms": sketch.quantile(0.5),
+            "p95_duration_ms": sketch.quantile(0.95),
+            "p99_duration_ms": sketch.quantile(0.99),
+            "cache_hit_rate": sum(s.cache_hits for s in slots) / count,
+            "success_rate": sum(s.successes for s in slots) / count,
+        }
 
 
 # 전역 트래커
@@ -1,30 +1,443 @@
-"""재시도 로직 및 데코레이터."""
+"""재시도 로직 및 데코레이터.
+
+모든 재시도 경로는 ``RetryEngine`` 하나를 공유합니다.
+
+- 요청 마감: ``deadline_scope`` 로 설정한 마감 시각이 contextvar 로 하위 호출과
+  태스크에 전파되고, 엔진은 남은 시간보다 긴 대기나 시도를 하지 않습니다.
+- 헤지 요청: ``HedgePolicy`` 가 최근 성공 지연의 분위수(기본 p95)를 넘긴 시도에
+  두 번째 시도를 띄우고 먼저 성공한 결과를 씁니다.
+- 재시도 예산: ``RetryBudget`` 이 재시도와 헤지를 최근 요청 수의 일정 비율로
+  제한해 장애 시 재시도 폭주가 부하를 증폭하지 않게 합니다.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
+import math
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
 from functools import wraps
 from typing import Any, TypeVar
 
-from tenacity import (
-    AsyncRetrying,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from src.infra.performance_tracker import LatencySketch
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+DEFAULT_RETRY_BUDGET_RATIO = 0.1
+DEFAULT_RETRY_BUDGET_WINDOW_SECONDS = 10
+DEFAULT_RETRY_BUDGET_MIN_RETRIES = 10
+DEFAULT_HEDGE_QUANTILE = 0.95
+DEFAULT_HEDGE_MIN_SAMPLES = 20
+DEFAULT_HEDGE_WINDOW_SECONDS = 60.0
+DEFAULT_HEDGE_MIN_DELAY_SECONDS = 0.05
+
+_request_deadline: ContextVar[float | None] = ContextVar(
+    "request_deadline", default=None
+)
+
+
+class DeadlineExceededError(asyncio.TimeoutError):
+    """요청 마감 시각이 지나 더 이상 시도할 수 없습니다."""
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[None]:
+    """현재 컨텍스트에 요청 마감 시각을 설정합니다.
+
+    바깥 범위의 마감보다 늦출 수는 없습니다. 블록 안에서 만든 태스크도
+    컨텍스트를 복사하므로 같은 마감을 따릅니다.
+
+    Args:
+        seconds: 지금부터 남은 시간 (초). None 이면 기존 마감을 유지합니다.
+    """
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _request_deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _request_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _request_deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """현재 요청 마감까지 남은 시간 (초). 마감이 없으면 None."""
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+class RetryBudget:
+    """최근 트래픽 대비 재시도 비율 상한.
+
+    ``window_seconds`` 동안의 요청 수 × ``ratio`` 에 ``min_retries`` 를 더한
+    만큼만 재시도(헤지 포함)를 허용합니다. 1초 단위 원형 슬롯에 건수만
+    보관하므로 메모리는 트래픽과 무관하게 일정합니다.
+    """
+
+    def __init__(
+        self,
+        ratio: float = DEFAULT_RETRY_BUDGET_RATIO,
+        *,
+        window_seconds: int = DEFAULT_RETRY_BUDGET_WINDOW_SECONDS,
+        min_retries: int = DEFAULT_RETRY_BUDGET_MIN_RETRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """재시도 예산을 초기화합니다.
+
+        Args:
+            ratio: 최근 요청 수 대비 허용할 재시도 비율
+            window_seconds: 최근 트래픽으로 볼 구간 (초)
+            min_retries: 트래픽이 적을 때도 허용할 구간당 재시도 수
+            clock: 단조 시계 (테스트 주입용)
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._clock = clock
+        self._size = max(1, window_seconds)
+        self._epochs = [-1] * self._size
+        self._requests = [0] * self._size
+        self._retries = [0] * self._size
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def _slot(self) -> int:
+        epoch = int(self._clock())
+        index = epoch % self._size
+        if self._epochs[index] != epoch:
+            self._epochs[index] = epoch
+            self._requests[index] = 0
+            self._retries[index] = 0
+        return index
+
+    def _totals(self) -> tuple[int, int]:
+        oldest = int(self._clock()) - self._size
+        requests = retries = 0
+        for epoch, req, ret in zip(
+            self._epochs, self._requests, self._retries, strict=True
+        ):
+            if epoch > oldest:
+                requests += req
+                retries += ret
+        return requests, retries
+
+    def record_request(self) -> None:
+        """새 요청(첫 시도) 하나를 기록합니다."""
+        with self._lock:
+            self._requests[self._slot()] += 1
+
+    def try_acquire(self) -> bool:
+        """재시도 하나를 쓸 수 있으면 차감하고 True 를 반환합니다."""
+        with self._lock:
+            index = self._slot()
+            requests, retries = self._totals()
+            if retries >= requests * self.ratio + self.min_retries:
+                self.rejected += 1
+                return False
+            self._retries[index] += 1
+            return True
+
+    def snapshot(self) -> dict[str, int]:
+        """최근 구간의 요청/재시도 수와 누적 거절 수."""
+        with self._lock:
+            requests, retries = self._totals()
+        return {"requests": requests, "retries": retries, "rejected": self.rejected}
+
+
+class HedgePolicy:
+    """최근 성공 지연의 분위수를 넘긴 시도에 헤지 요청을 띄우는 정책.
+
+    지연은 ``window_seconds`` 마다 교체되는 두 개의 ``LatencySketch`` 에
+    기록하므로 임계값은 최근 1~2 구간의 분포를 따릅니다. 표본이
+    ``min_samples`` 미만이면 헤지하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        quantile: float = DEFAULT_HEDGE_QUANTILE,
+        *,
+        min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES,
+        window_seconds: float = DEFAULT_HEDGE_WINDOW_SECONDS,
+        min_delay: float = DEFAULT_HEDGE_MIN_DELAY_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """헤지 정책을 초기화합니다.
+
+        Args:
+            quantile: 헤지 임계값으로 쓸 지연 분위수 (0 < q < 1)
+            min_samples: 헤지를 시작하기 위한 최소 표본 수
+            window_seconds: 지연 분포를 교체하는 주기 (초)
+            min_delay: 헤지 임계값 하한 (초)
+            clock: 단조 시계 (테스트 주입용)
+        """
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.window_seconds = window_seconds
+        self.min_delay = min_delay
+        self._clock = clock
+        self._current = LatencySketch()
+        self._previous = LatencySketch()
+        self._rotated_at = clock()
+        self._threshold: float | None = None
+
+    def _rotate(self) -> None:
+        now = self._clock()
+        elapsed = now - self._rotated_at
+        if elapsed < self.window_seconds:
+            return
+        self._previous = (
+            self._current if elapsed < 2 * self.window_seconds else LatencySketch()
+        )
+        self._current = LatencySketch()
+        self._rotated_at = now
+        self._threshold = None
+
+    def observe(self, seconds: float) -> None:
+        """성공한 시도 하나의 지연을 기록합니다."""
+        self._rotate()
+        self._current.add(seconds * 1000)
+        self._threshold = None
+
+    def delay(self) -> float | None:
+        """헤지 요청을 띄울 대기 시간 (초). 표본이 부족하면 None."""
+        self._rotate()
+        if self._threshold is None:
+            if self._current.count + self._previous.count < self.min_samples:
+                return None
+            merged = LatencySketch()
+            merged.merge(self._previous)
+            merged.merge(self._current)
+            self._threshold = max(self.min_delay, merged.quantile(self.quantile) / 1000)
+        return self._threshold
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """재시도 횟수와 지수 백오프 설정."""
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 10.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    retry_on: tuple[type[BaseException], ...] = (Exception,)
+
+    def backoff(self, attempt: int) -> float:
+        """``attempt`` 번째 시도 실패 후 대기 시간 (초)."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        if self.jitter:
+            return random.uniform(min(self.base_delay, delay), delay)
+        return delay
+
+
+@dataclass
+class RetryStats:
+    """재시도 엔진 하나의 누적 카운터."""
+
+    calls: int = 0
+    retries: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    budget_rejections: int = 0
+    deadline_skips: int = 0
+
+
+_stats: dict[str, RetryStats] = {}
+_stats_lock = threading.Lock()
+
+
+def get_retry_stats() -> dict[str, dict[str, int]]:
+    """엔진 이름별 재시도 카운터를 반환합니다."""
+    with _stats_lock:
+        return {name: asdict(stats) for name, stats in _stats.items()}
+
+
+def _stats_for(name: str) -> RetryStats:
+    with _stats_lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = RetryStats()
+        return stats
+
+
+class RetryEngine:
+    """마감·헤지·재시도 예산을 함께 적용하는 비동기 재시도 실행기.
+
+    Usage:
+        engine = RetryEngine(RetryPolicy(retry_on=(TimeoutError,)),
+                             budget=RetryBudget(), hedge=HedgePolicy(),
+                             name="gemini")
+        with deadline_scope(30):
+            text = await engine.run(lambda: client.execute(model, prompt))
+
+    ``func`` 는 시도마다 새 awaitable 을 만들어야 하며, 헤지가 켜져 있으면
+    동시에 두 번 호출될 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy | None = None,
+        *,
+        budget: RetryBudget | None = None,
+        hedge: HedgePolicy | None = None,
+        name: str = "default",
+    ) -> None:
+        """재시도 엔진을 초기화합니다.
+
+        Args:
+            policy: 재시도 횟수/백오프 설정
+            budget: 재시도와 헤지에 적용할 예산 (None 이면 무제한)
+            hedge: 헤지 정책 (None 이면 헤지하지 않음)
+            name: ``get_retry_stats`` 에 표시할 이름
+        """
+        self.policy = policy or RetryPolicy()
+        self.budget = budget
+        self.hedge = hedge
+        self.name = name
+        self.stats = _stats_for(name)
+
+    async def run(
+        self,
+        func: Callable[[], Awaitable[T]],
+        *,
+        policy: RetryPolicy | None = None,
+        on_retry: Callable[[int, BaseException, float], None] | None = None,
+    ) -> T:
+        """``func`` 를 정책에 따라 실행합니다.
+
+        Args:
+            func: 시도마다 호출할 awaitable 팩토리
+            policy: 이번 호출에만 쓸 정책 (None 이면 엔진 기본 정책)
+            on_retry: 재시도 직전 ``(실패한 시도 번호, 예외, 대기 시간)`` 으로
+                호출되는 콜백
+
+        Returns:
+            처음 성공한 시도의 결과
+
+        Raises:
+            DeadlineExceededError: 요청 마감이 지난 경우
+            마지막 시도에서 발생한 예외 (재시도 횟수·마감·예산 소진 시)
+        """
+        policy = policy or self.policy
+        self.stats.calls += 1
+        if self.budget is not None:
+            self.budget.record_request()
+        attempt = 1
+        while True:
+            remaining = remaining_time()
+            if remaining is not None and remaining <= 0:
+                raise DeadlineExceededError(
+                    f"{self.name}: request deadline exceeded before attempt {attempt}"
+                )
+            try:
+                return await self._attempt(func, remaining)
+            except policy.retry_on as exc:
+                if (
+                    isinstance(exc, DeadlineExceededError)
+                    or attempt >= policy.max_attempts
+                ):
+                    raise
+                delay = policy.backoff(attempt)
+                remaining = remaining_time()
+                if remaining is not None and delay >= remaining:
+                    self.stats.deadline_skips += 1
+                    raise
+                if self.budget is not None and not self.budget.try_acquire():
+                    self.stats.budget_rejections += 1
+                    raise
+                self.stats.retries += 1
+                if on_retry is not None:
+                    on_retry(attempt, exc, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _attempt(
+        self, func: Callable[[], Awaitable[T]], remaining: float | None
+    ) -> T:
+        hedge_after = self.hedge.delay() if self.hedge is not None else None
+        if hedge_after is not None and (remaining is None or hedge_after < remaining):
+            return await self._hedged(func, hedge_after, remaining)
+        started = time.monotonic()
+        if remaining is None:
+            result = await func()
+        else:
+            try:
+                result = await asyncio.wait_for(func(), remaining)
+            except asyncio.TimeoutError as exc:
+                if (remaining_time() or 0.0) > 0:
+                    raise
+                raise DeadlineExceededError(
+                    f"{self.name}: request deadline exceeded"
+                ) from exc
+        if self.hedge is not None:
+            self.hedge.observe(time.monotonic() - started)
+        return result
+
+    async def _hedged(
+        self,
+        func: Callable[[], Awaitable[T]],
+        hedge_after: float,
+        remaining: float | None,
+    ) -> T:
+        assert self.hedge is not None
+        deadline = None if remaining is None else time.monotonic() + remaining
+        primary: asyncio.Future[T] = asyncio.ensure_future(func())
+        tasks: dict[asyncio.Future[T], float] = {primary: time.monotonic()}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done and (self.budget is None or self.budget.try_acquire()):
+                self.stats.hedges += 1
+                tasks[asyncio.ensure_future(func())] = time.monotonic()
+            last_exc: BaseException | None = None
+            while tasks:
+                timeout = (
+                    None if deadline is None else max(0.0, deadline - time.monotonic())
+                )
+                done, _ = await asyncio.wait(
+                    tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise DeadlineExceededError(
+                        f"{self.name}: request deadline exceeded"
+                    )
+                for task in done:
+                    started = tasks.pop(task)
+                    exc = task.exception()
+                    if exc is None:
+                        self.hedge.observe(time.monotonic() - started)
+                        if task is not primary:
+                            self.stats.hedge_wins += 1
+                        return task.result()
+                    last_exc = exc
+            assert last_exc is not None
+            raise last_exc
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
 
 def async_retry(
     max_attempts: int = 3,
     min_wait: float = 1.0,
     max_wait: float = 10.0,
     retry_on: tuple[type[Exception], ...] = (Exception,),
+    *,
+    budget: RetryBudget | None = None,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """비동기 함수용 재시도 데코레이터.
 
@@ -33,30 +446,37 @@ def async_retry(
         min_wait: 최소 대기 시간 (초)
         max_wait: 최대 대기 시간 (초)
         retry_on: 재시도할 예외 타입들
+        budget: 여러 함수가 공유할 재시도 예산 (선택)
 
     Example:
         @async_retry(max_attempts=3, retry_on=(RetryableError,))
         async def my_function():
             ...
     """
+    policy = RetryPolicy(
+        max_attempts=max_attempts,
+        base_delay=min_wait,
+        max_delay=max_wait,
+        retry_on=retry_on,
+    )
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        name = getattr(func, "__qualname__", getattr(func, "__name__", "async_retry"))
+        engine = RetryEngine(policy, budget=budget, name=name)
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            async for attempt in AsyncRetrying(
-                stop=stop_after_attempt(max_attempts),
-                wait=wait_exponential(multiplier=1, min=min_wait, max=max_wait),
-                retry=retry_if_exception_type(retry_on),
-                reraise=True,
-            ):
-                with attempt:
-                    logger.debug(
-                        "Attempting %s (attempt %d/%d)",
-                        func.__name__,
-                        attempt.retry_state.attempt_number,
-                        max_attempts,
-                    )
-                    return await func(*args, **kwargs)
+            def _log_retry(attempt: int, exc: BaseException, delay: float) -> None:
+                logger.debug(
+                    "Retrying %s (attempt %d/%d) in %.2fs: %s",
+                    name,
+                    attempt + 1,
+                    max_attempts,
+                    delay,
+                    exc,
+                )
+
+            return await engine.run(lambda: func(*args, **kwargs), on_retry=_log_retry)
 
         return wrapper
 
@@ -87,38 +507,30 @@ async def retry_with_backoff(
     Raises:
         마지막 시도에서 발생한 예외
     """
-    last_exception = None
-    delay = initial_delay
+    name = getattr(func, "__name__", "retry_with_backoff")
+    engine = RetryEngine(
+        RetryPolicy(
+            max_attempts=max_attempts,
+            base_delay=initial_delay,
+            max_delay=math.inf,
+            multiplier=backoff_factor,
+            jitter=False,
+        ),
+        name=name,
+    )
 
-    for attempt in range(1, max_attempts + 1):
-        try:
-            logger.debug(
-                "Executing %s (attempt %d/%d)",
-                func.__name__,
-                attempt,
-                max_attempts,
-            )
-            return await func(*args, **kwargs)
-        except Exception as e:  # noqa: PERF203
-            last_exception = e
-            if attempt < max_attempts:
-                logger.warning(
-                    "%s failed on attempt %d/%d: %s. Retrying in %.1fs...",
-                    func.__name__,
-                    attempt,
-                    max_attempts,
-                    str(e),
-                    delay,
-                )
-                await asyncio.sleep(delay)
-                delay *= backoff_factor
-            else:
-                logger.error(
-                    "%s failed after %d attempts: %s",
-                    func.__name__,
-                    max_attempts,
-                    str(e),
-                )
+    def _log_retry(attempt: int, exc: BaseException, delay: float) -> None:
+        logger.warning(
+            "%s failed on attempt %d/%d: %s. Retrying in %.1fs...",
+            name,
+            attempt,
+            max_attempts,
+            str(exc),
+            delay,
+        )
 
-    if last_exception:
-        raise last_exception
+    try:
+        return await engine.run(lambda: func(*args, **kwargs), on_retry=_log_retry)
+    except Exception as e:
+        logger.error("%s failed after retries: %s", name, str(e))
+        raise
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
+from src.infra.logging import fast_json_dumps
+
 
 class JsonFormatter(logging.Formatter):
     """Simple JSON formatter for logs."""
@@ -48,7 +49,7 @@ class JsonFormatter(logging.Formatter):
             }:
                 continue
             payload[key] = value
-        return json.dumps(payload, ensure_ascii=False)
+        return fast_json_dumps(payload)
 
 
 def setup_structured_logging(log_level: str = "INFO") -> None:
@@ -1,4 +1,18 @@
-"""Lightweight OpenTelemetry helpers with graceful degradation."""
+"""Lightweight OpenTelemetry helpers with graceful degradation.
+
+Sampling (active once ``init_telemetry`` has configured an exporter):
+
+- Head sampling decides per root span (a web route or the first traced call)
+  whether the whole trace is recorded as real spans. Rates come from
+  ``TRACE_SAMPLE_RATE`` with per-route prefix overrides in
+  ``TRACE_SAMPLE_RATES``.
+- Traces that lose the head coin flip are still timed into a small in-memory
+  list. When the root finishes slower than ``TRACE_TAIL_LATENCY_MS`` or any
+  span raised, the list is replayed as full spans (tail sampling); otherwise
+  it is discarded without touching the OpenTelemetry SDK.
+- Finished spans are exported by ``BoundedBatchSpanProcessor``: a bounded
+  queue drained by a background thread, with an explicit overflow policy.
+"""
 # mypy: ignore-errors
 # ruff: noqa: PERF203
 
@@ -7,7 +21,13 @@ from __future__ import annotations
 import functools
 import logging
 import os
-from collections.abc import Callable
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any, TypeVar
 
 from typing_extensions import ParamSpec
@@ -24,7 +44,6 @@ try:  # pragma: no cover - optional dependency
     from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
     from opentelemetry.sdk.resources import Resource
     from opentelemetry.sdk.trace import TracerProvider
-    from opentelemetry.sdk.trace.export import BatchSpanProcessor
 except Exception as exc:  # pragma: no cover
     metrics = None
     trace = None
@@ -34,7 +53,6 @@ except Exception as exc:  # pragma: no cover
     PeriodicExportingMetricReader = None
     Resource = None
     TracerProvider = None
-    BatchSpanProcessor = None
     logger.debug("OpenTelemetry not installed: %s", exc)
 
 P = ParamSpec("P")
@@ -42,6 +60,246 @@ R = TypeVar("R")
 
 _tracer = None
 _meter = None
+_sampler: TraceSampler | None = None
+_processor: BoundedBatchSpanProcessor | None = None
+
+DEFAULT_SAMPLE_RATE = 1.0
+DEFAULT_TAIL_LATENCY_MS = 1000.0
+DEFAULT_MAX_SPANS_PER_TRACE = 256
+DEFAULT_EXPORT_QUEUE_SIZE = 2048
+DEFAULT_EXPORT_BATCH_SIZE = 512
+DEFAULT_EXPORT_INTERVAL_SECONDS = 5.0
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_DROP_NEWEST = "drop_newest"
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning("Invalid %s, using %s", name, default)
+        return default
+
+
+def _parse_rates(raw: str | None) -> dict[str, float]:
+    """Parse ``"prefix=rate,prefix=rate"`` into a mapping."""
+    rates: dict[str, float] = {}
+    for item in (raw or "").split(","):
+        prefix, sep, value = item.strip().partition("=")
+        if not sep:
+            continue
+        try:
+            rates[prefix.strip()] = float(value)
+        except ValueError:
+            logger.warning("Ignoring invalid trace sample rate: %s", item)
+    return rates
+
+
+class TraceSampler:
+    """Head sampling per route plus tail retention of slow or failed traces.
+
+    Args:
+        default_rate: Fraction of root spans recorded in full (0.0-1.0)
+        route_rates: Overrides keyed by root span name prefix; the longest
+            matching prefix wins (e.g. ``{"/health": 0.0, "gemini.": 0.5}``)
+        tail_latency_ms: Unsampled traces whose root took at least this long
+            are replayed in full
+        max_spans_per_trace: Cap on spans buffered for one unsampled trace
+    """
+
+    _CACHE_SIZE = 1024
+
+    def __init__(
+        self,
+        default_rate: float = DEFAULT_SAMPLE_RATE,
+        route_rates: Mapping[str, float] | None = None,
+        *,
+        tail_latency_ms: float = DEFAULT_TAIL_LATENCY_MS,
+        max_spans_per_trace: int = DEFAULT_MAX_SPANS_PER_TRACE,
+    ) -> None:
+        """Initialize the sampler."""
+        self.default_rate = default_rate
+        self.route_rates = sorted(
+            (route_rates or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.tail_latency_ns = int(tail_latency_ms * 1_000_000)
+        self.max_spans_per_trace = max_spans_per_trace
+        self._rates: dict[str, float] = {}
+        self.sampled = 0
+        self.unsampled = 0
+        self.tail_kept = 0
+
+    @classmethod
+    def from_env(cls) -> TraceSampler:
+        """Build a sampler from ``TRACE_*`` environment variables."""
+        return cls(
+            _env_float("TRACE_SAMPLE_RATE", DEFAULT_SAMPLE_RATE),
+            _parse_rates(os.getenv("TRACE_SAMPLE_RATES")),
+            tail_latency_ms=_env_float(
+                "TRACE_TAIL_LATENCY_MS", DEFAULT_TAIL_LATENCY_MS
+            ),
+        )
+
+    def rate_for(self, name: str) -> float:
+        """Return the head sampling rate for a root span name."""
+        rate = self._rates.get(name)
+        if rate is None:
+            rate = next(
+                (r for prefix, r in self.route_rates if name.startswith(prefix)),
+                self.default_rate,
+            )
+            if len(self._rates) < self._CACHE_SIZE:
+                self._rates[name] = rate
+        return rate
+
+    def head_sampled(self, name: str) -> bool:
+        """Decide whether a new trace rooted at ``name`` is recorded in full."""
+        rate = self.rate_for(name)
+        if rate >= 1.0 or (rate > 0.0 and random.random() < rate):
+            self.sampled += 1
+            return True
+        self.unsampled += 1
+        return False
+
+    def keep_tail(self, duration_ns: int, error: bool) -> str | None:
+        """Return why an unsampled trace should be kept, or None to drop it."""
+        if error:
+            reason = "error"
+        elif duration_ns >= self.tail_latency_ns:
+            reason = "latency"
+        else:
+            return None
+        self.tail_kept += 1
+        return reason
+
+
+class BoundedBatchSpanProcessor:
+    """Span processor with a bounded queue and background batch export.
+
+    ``on_end`` only appends to an in-memory deque, so instrumented code never
+    waits on the exporter. A daemon thread exports batches of up to
+    ``max_batch_size`` spans when a batch fills or every
+    ``schedule_delay_seconds``. When the queue is full, ``overflow`` decides
+    whether the oldest queued span or the incoming one is dropped.
+    """
+
+    def __init__(
+        self,
+        exporter: Any,
+        *,
+        max_queue_size: int = DEFAULT_EXPORT_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+        schedule_delay_seconds: float = DEFAULT_EXPORT_INTERVAL_SECONDS,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+    ) -> None:
+        """Initialize the processor and start its export thread."""
+        if overflow not in {OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEWEST}:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.exporter = exporter
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self.schedule_delay_seconds = schedule_delay_seconds
+        self.overflow = overflow
+        self._queue: deque[Any] = deque()
+        self._cond = threading.Condition()
+        self._export_lock = threading.Lock()
+        self._shutdown = False
+        self.dropped = 0
+        self.exported = 0
+        self.export_failures = 0
+        self._thread = threading.Thread(
+            target=self._run, name="span-export", daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def from_env(cls, exporter: Any) -> BoundedBatchSpanProcessor:
+        """Build a processor from ``TRACE_EXPORT_*`` environment variables."""
+        return cls(
+            exporter,
+            max_queue_size=int(
+                _env_float("TRACE_EXPORT_QUEUE_SIZE", DEFAULT_EXPORT_QUEUE_SIZE)
+            ),
+            max_batch_size=int(
+                _env_float("TRACE_EXPORT_BATCH_SIZE", DEFAULT_EXPORT_BATCH_SIZE)
+            ),
+            schedule_delay_seconds=_env_float(
+                "TRACE_EXPORT_INTERVAL_SECONDS", DEFAULT_EXPORT_INTERVAL_SECONDS
+            ),
+            overflow=os.getenv("TRACE_EXPORT_OVERFLOW", OVERFLOW_DROP_OLDEST),
+        )
+
+    def on_start(self, span: Any, parent_context: Any = None) -> None:
+        """No-op; spans are queued when they end."""
+
+    def on_end(self, span: Any) -> None:
+        """Queue a finished span, applying the overflow policy when full."""
+        with self._cond:
+            if self._shutdown:
+                return
+            if len(self._queue) >= self.max_queue_size:
+                self.dropped += 1
+                if self.overflow == OVERFLOW_DROP_NEWEST:
+                    return
+                self._queue.popleft()
+            self._queue.append(span)
+            if len(self._queue) >= self.max_batch_size:
+                self._cond.notify()
+
+    def _take_batch(self) -> list[Any]:
+        count = min(len(self._queue), self.max_batch_size)
+        return [self._queue.popleft() for _ in range(count)]
+
+    def _export(self, batch: list[Any]) -> None:
+        if not batch:
+            return
+        with self._export_lock:
+            try:
+                self.exporter.export(batch)
+                self.exported += len(batch)
+            except Exception as exc:  # noqa: BLE001
+                self.export_failures += 1
+                logger.debug("Span export failed: %s", exc)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._shutdown and len(self._queue) < self.max_batch_size:
+                    self._cond.wait(self.schedule_delay_seconds)
+                if self._shutdown and not self._queue:
+                    return
+                batch = self._take_batch()
+            self._export(batch)
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Export everything queued so far from the calling thread."""
+        deadline = time.monotonic() + timeout_millis / 1000
+        while time.monotonic() < deadline:
+            with self._cond:
+                batch = self._take_batch()
+            if not batch:
+                return True
+            self._export(batch)
+        return False
+
+    def shutdown(self) -> None:
+        """Stop the export thread after draining the queue."""
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify()
+        self._thread.join(timeout=self.schedule_delay_seconds + 5)
+        shutdown = getattr(self.exporter, "shutdown", None)
+        if shutdown is not None:
+            shutdown()
+
+    def stats(self) -> dict[str, int]:
+        """Return queue and export counters."""
+        return {
+            "queued": len(self._queue),
+            "dropped": self.dropped,
+            "exported": self.exported,
+            "export_failures": self.export_failures,
+        }
 
 
 def init_telemetry(
@@ -49,7 +307,7 @@ def init_telemetry(
     otlp_endpoint: str | None = None,
 ) -> None:
     """Initialize OpenTelemetry tracer and meter if available."""
-    global _tracer, _meter
+    global _meter, _processor, _tracer
     if trace is None:
         logger.info("Telemetry disabled (opentelemetry not installed)")
         return
@@ -62,11 +320,11 @@ def init_telemetry(
     resource = Resource.create({"service.name": service_name})
 
     trace_provider = TracerProvider(resource=resource)
-    trace_provider.add_span_processor(
-        BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint)),
-    )
+    _processor = BoundedBatchSpanProcessor.from_env(OTLPSpanExporter(endpoint=endpoint))
+    trace_provider.add_span_processor(_processor)
     trace.set_tracer_provider(trace_provider)
     _tracer = trace.get_tracer(__name__)
+    configure_sampling(TraceSampler.from_env())
 
     metric_reader = PeriodicExportingMetricReader(OTLPMetricExporter(endpoint=endpoint))
     meter_provider = MeterProvider(resource=resource, metric_readers=[metric_reader])
@@ -75,31 +333,38 @@ def init_telemetry(
     logger.info("Telemetry initialized with endpoint: %s", endpoint)
 
 
-def get_tracer():
-    """Return tracer or a no-op tracer."""
-    if trace is None:
+class _NoopSpan:
+    def __enter__(self) -> _NoopSpan:
+        return self
 
-        class _NoopSpan:
-            def __enter__(self) -> _NoopSpan:
-                return self
+    def __exit__(self, *args: object) -> None:
+        return None
 
-            def __exit__(self, *args: object) -> None:
-                return None
+    def set_attribute(self, *args: Any, **kwargs: Any) -> None:
+        return None
 
-            def set_attribute(self, *args: Any, **kwargs: Any) -> None:
-                return None
+    def record_exception(self, *args: Any, **kwargs: Any) -> None:
+        return None
 
-            def record_exception(self, *args: Any, **kwargs: Any) -> None:
-                return None
+    def set_status(self, *args: Any, **kwargs: Any) -> None:
+        return None
 
-            def set_status(self, *args: Any, **kwargs: Any) -> None:
-                return None
+    def update_name(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+
+class _NoopTracer:
+    def start_as_current_span(self, *_: Any, **__: Any) -> _NoopSpan:
+        return _NoopSpan()
 
-        class _NoopTracer:
-            def start_as_current_span(self, *_: Any, **__: Any) -> _NoopSpan:
-                return _NoopSpan()
 
-        return _NoopTracer()
+_NOOP_TRACER = _NoopTracer()
+
+
+def get_tracer():
+    """Return tracer or a no-op tracer."""
+    if trace is None:
+        return _NOOP_TRACER
     return _tracer or trace.get_tracer(__name__)
 
 
@@ -168,6 +433,205 @@ def _record_span_exception(span: Any, exc: Exception) -> None:
             return
 
 
+class _Trace:
+    """Per-request sampling state shared by every span in one trace."""
+
+    __slots__ = ("error", "records", "sampled")
+
+    def __init__(self, sampled: bool) -> None:
+        """Start an empty trace with the head sampling decision."""
+        self.sampled = sampled
+        self.error = False
+        # [name, attributes, start_ns, end_ns, parent_index, exception]
+        self.records: list[list[Any]] = []
+
+
+class SpanScope:
+    """Handle returned by ``begin_span`` and closed by ``end_span``."""
+
+    __slots__ = ("cm", "index", "parent_token", "root_token", "span", "trace")
+
+    def __init__(self, state: _Trace | None, root_token: Any = None) -> None:
+        """Bind the scope to its trace; ``root_token`` resets the trace on end."""
+        self.trace = state
+        self.root_token = root_token
+        self.cm: Any = None
+        self.span: Any = None
+        self.index = -1
+        self.parent_token: Any = None
+
+
+_current_trace: ContextVar[_Trace | None] = ContextVar("trace_state", default=None)
+_current_record: ContextVar[int] = ContextVar("trace_record", default=-1)
+
+
+def configure_sampling(sampler: TraceSampler | None) -> None:
+    """Install (or with None, remove) the process-wide trace sampler."""
+    global _sampler
+    _sampler = sampler
+
+
+def begin_span(
+    operation: str,
+    attributes: dict[str, Any] | None = None,
+    *,
+    child_only: bool = False,
+    sample_key: str | None = None,
+) -> SpanScope | None:
+    """Open a span according to the sampling state of the current trace.
+
+    Args:
+        operation: Span name; for a root span also the head sampling route
+        attributes: Span attributes
+        child_only: Only open a span inside an already active trace
+        sample_key: Head sampling route for a root span instead of
+            ``operation`` (e.g. the raw request path)
+
+    Returns:
+        A scope to pass to ``end_span``, or None if nothing was opened.
+    """
+    state = _current_trace.get()
+    sampler = _sampler
+    if state is not None:
+        scope = SpanScope(state)
+    elif child_only:
+        return None
+    elif sampler is None:
+        scope = SpanScope(None)
+    else:
+        state = _Trace(sampler.head_sampled(sample_key or operation))
+        scope = SpanScope(state, _current_trace.set(state))
+
+    if state is None or state.sampled:
+        scope.cm = get_tracer().start_as_current_span(operation)
+        scope.span = scope.cm.__enter__()
+        _set_span_attributes(scope.span, attributes)
+        return scope
+
+    records = state.records
+    if sampler is not None and len(records) < sampler.max_spans_per_trace:
+        scope.index = len(records)
+        records.append(
+            [operation, attributes, time.time_ns(), 0, _current_record.get(), None]
+        )
+        scope.parent_token = _current_record.set(scope.index)
+    return scope
+
+
+def rename_span(scope: SpanScope, name: str) -> None:
+    """Rename an open span, e.g. once the matched route template is known."""
+    if scope.span is not None:
+        scope.span.update_name(name)
+    elif scope.index >= 0 and scope.trace is not None:
+        scope.trace.records[scope.index][0] = name
+
+
+def end_span(scope: SpanScope, exc: BaseException | None = None) -> None:
+    """Close a scope opened by ``begin_span``.
+
+    Only ``Exception`` instances count as errors (not cancellation). For the
+    root of an unsampled trace this is where tail sampling decides whether the
+    buffered spans are replayed to the exporter.
+    """
+    if not isinstance(exc, Exception):
+        exc = None
+    if scope.cm is not None:
+        span = scope.span
+        if exc is None:
+            _set_span_status(span, "OK")
+        else:
+            _record_span_exception(span, exc)
+            _set_span_status(span, "ERROR", str(exc))
+        scope.cm.__exit__(None, None, None)
+    else:
+        state = scope.trace
+        if exc is not None:
+            state.error = True
+        if scope.index >= 0:
+            record = state.records[scope.index]
+            record[3] = time.time_ns()
+            record[5] = exc
+            _current_record.reset(scope.parent_token)
+
+    if scope.root_token is None:
+        return
+    _current_trace.reset(scope.root_token)
+    state = scope.trace
+    sampler = _sampler
+    if state.sampled or sampler is None or not state.records:
+        return
+    root = state.records[0]
+    reason = sampler.keep_tail(root[3] - root[2], state.error)
+    if reason is not None:
+        _replay(state.records, reason)
+
+
+def mark_trace_error() -> None:
+    """Flag the current trace as failed so tail sampling keeps it."""
+    state = _current_trace.get()
+    if state is not None:
+        state.error = True
+
+
+def _replay(records: list[list[Any]], reason: str) -> None:
+    """Re-create buffered span records as real spans with their timestamps."""
+    if trace is None:
+        return
+    tracer = get_tracer()
+    root_context = trace.set_span_in_context(trace.INVALID_SPAN)
+    spans: list[Any] = []
+    for name, attributes, start_ns, end_ns, parent, exc in records:
+        parent_span = spans[parent] if parent >= 0 else None
+        if not end_ns or (parent >= 0 and parent_span is None):
+            spans.append(None)
+            continue
+        context = (
+            root_context
+            if parent_span is None
+            else trace.set_span_in_context(parent_span)
+        )
+        span = tracer.start_span(name, context=context, start_time=start_ns)
+        _set_span_attributes(span, attributes)
+        if parent < 0:
+            _set_span_attributes(span, {"sampling.tail_reason": reason})
+        if exc is None:
+            _set_span_status(span, "OK")
+        else:
+            _record_span_exception(span, exc)
+            _set_span_status(span, "ERROR", str(exc))
+        span.end(end_time=end_ns)
+        spans.append(span)
+
+
+@contextmanager
+def start_span(
+    operation: str, attributes: dict[str, Any] | None = None
+) -> Iterator[SpanScope | None]:
+    """Context manager form of ``begin_span``/``end_span`` (e.g. per request)."""
+    scope = begin_span(operation, attributes)
+    try:
+        yield scope
+    except BaseException as exc:
+        end_span(scope, exc)
+        raise
+    end_span(scope)
+
+
+def get_telemetry_stats() -> dict[str, Any]:
+    """Return sampler and span export counters."""
+    sampler = _sampler
+    return {
+        "sampler": None
+        if sampler is None
+        else {
+            "sampled": sampler.sampled,
+            "unsampled": sampler.unsampled,
+            "tail_kept": sampler.tail_kept,
+        },
+        "export": None if _processor is None else _processor.stats(),
+    }
+
+
 def traced(
     operation: str,
     attributes: dict[str, Any] | None = None,
@@ -177,17 +641,14 @@ def traced(
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            tracer = get_tracer()
-            with tracer.start_as_current_span(operation) as span:
-                _set_span_attributes(span, attributes)
-                try:
-                    result = func(*args, **kwargs)
-                    _set_span_status(span, "OK")
-                    return result
-                except Exception as exc:
-                    _record_span_exception(span, exc)
-                    _set_span_status(span, "ERROR", str(exc))
-                    raise
+            scope = begin_span(operation, attributes)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as exc:
+                end_span(scope, exc)
+                raise
+            end_span(scope)
+            return result
 
         return wrapper
 
@@ -203,21 +664,34 @@ def traced_async(
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            tracer = get_tracer()
-            with tracer.start_as_current_span(operation) as span:
-                _set_span_attributes(span, attributes)
-                try:
-                    result = await func(*args, **kwargs)  # type: ignore[misc]
-                    _set_span_status(span, "OK")
-                    return result
-                except Exception as exc:
-                    _record_span_exception(span, exc)
-                    _set_span_status(span, "ERROR", str(exc))
-                    raise
+            scope = begin_span(operation, attributes)
+            try:
+                result = await func(*args, **kwargs)  # type: ignore[misc]
+            except BaseException as exc:
+                end_span(scope, exc)
+                raise
+            end_span(scope)
+            return result
 
         return wrapper
 
     return decorator
 
 
-__all__ = ["get_meter", "get_tracer", "init_telemetry", "traced", "traced_async"]
+__all__ = [
+    "BoundedBatchSpanProcessor",
+    "SpanScope",
+    "TraceSampler",
+    "begin_span",
+    "configure_sampling",
+    "end_span",
+    "get_meter",
+    "get_telemetry_stats",
+    "get_tracer",
+    "init_telemetry",
+    "mark_trace_error",
+    "rename_span",
+    "start_span",
+    "traced",
+    "traced_async",
+]
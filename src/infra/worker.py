@@ -3,6 +3,10 @@
 Background task processor for OCR/LLM workloads using FastStream and Redis.
 Supports LATS-based tree search, Data2Neo entity extraction, rate limiting,
 and dead-letter queue handling.
+
+Messages are handed to an in-process ``WorkerRuntime`` (bounded prefetch,
+configurable concurrency); results are appended in batches by a
+``BufferedJsonlWriter``.
 """
 
 import json
@@ -26,6 +30,7 @@ from src.features.lats import LATSSearcher, SearchState, ValidationResult
 
 # LATS logic delegated to separate module for maintainability
 from src.infra.lats_worker import run_lats_search
+from src.infra.worker_runtime import BufferedJsonlWriter, QuotaPacer, WorkerRuntime
 
 # Export private functions for backward compatibility with tests
 __all__ = [
@@ -40,10 +45,13 @@ __all__ = [
     "setup_redis",
     "close_redis",
     "check_rate_limit",
+    "wait_for_rate_limit",
     "ensure_redis_ready",
     "OCRTask",
     "DLQMessage",
     "handle_ocr_task",
+    "process_ocr_task",
+    "get_worker_metrics",
     "_append_jsonl",
     "_process_task",
     "_run_task_with_lats",
@@ -67,6 +75,13 @@ logger = logging.getLogger("worker")
 # Rough cost estimation (USD per token) for budgeting/cost guardrails
 MODEL_COST_PER_TOKEN = 1e-6
 
+# Shared Gemini quota key (Redis INCR counter per window)
+GLOBAL_RATE_LIMIT_KEY = "global_rate_limit"
+
+# Provider errors are retried in-process by the runtime before dead-lettering
+PROVIDER_MAX_RETRIES = 3
+PROVIDER_RETRY_BACKOFF_SECONDS = 2.0
+
 # Note: LATS constants moved to src.infra.lats_worker
 
 # Lazy loading for config (environment-driven; ignore call-arg check for BaseSettings)
@@ -92,6 +107,9 @@ lats_agent: GeminiAgent | None = None
 graph_provider = None
 data2neo_extractor: Data2NeoExtractor | None = None
 _providers_initialized = False
+_runtime: WorkerRuntime["OCRTask"] | None = None
+_result_writer: BufferedJsonlWriter | None = None
+_pacer: QuotaPacer | None = None
 
 
 def _init_providers() -> None:
@@ -153,15 +171,59 @@ async def setup_redis() -> None:
     config = get_config()
     redis_client = Redis.from_url(config.redis_url)
     _init_providers()
+    _start_runtime(config)
+
+
+def _start_runtime(config: AppConfig) -> None:
+    """Start the concurrent task runtime, quota pacer and result writer."""
+    global _runtime, _result_writer, _pacer
+    _pacer = QuotaPacer(
+        limit=config.worker_rate_limit,
+        window=config.worker_rate_window_seconds,
+        burst=config.worker_concurrency,
+    )
+    _result_writer = BufferedJsonlWriter(
+        RESULTS_DIR / "results.jsonl",
+        batch_size=config.worker_result_batch_size,
+        flush_interval=config.worker_result_flush_interval,
+    )
+    _runtime = WorkerRuntime(
+        process_ocr_task,
+        concurrency=config.worker_concurrency,
+        prefetch=config.worker_prefetch,
+        retry_on=(ProviderError,),
+        max_retries=PROVIDER_MAX_RETRIES,
+        retry_backoff=PROVIDER_RETRY_BACKOFF_SECONDS,
+        on_failure=_send_to_dlq,
+    )
+    _runtime.start()
 
 
 @app.on_shutdown
 async def close_redis() -> None:
-    """Close Redis connection on application shutdown."""
+    """Drain in-flight tasks, flush results and close Redis on shutdown."""
+    global _runtime, _result_writer
+    if _runtime is not None:
+        timeout = getattr(get_config(), "worker_drain_timeout", 30.0)
+        await _runtime.drain(timeout=timeout)
+        _runtime = None
+    if _result_writer is not None:
+        await _result_writer.close()
+        _result_writer = None
     if redis_client:
         await redis_client.close()
 
 
+def get_worker_metrics() -> dict[str, float]:
+    """Return throughput and queue-lag metrics of the running worker."""
+    if _runtime is None:
+        return {}
+    metrics = _runtime.metrics.snapshot()
+    if _result_writer is not None:
+        metrics["result_batches_flushed"] = float(_result_writer.flushed_batches)
+    return metrics
+
+
 RESULTS_DIR = Path("data/queue_results")
 
 
@@ -171,6 +233,7 @@ class OCRTask(BaseModel):
     request_id: str
     image_path: str
     session_id: str
+    enqueued_at: float | None = None  # producer wall-clock time, for queue lag
 
 
 class DLQMessage(BaseModel):
@@ -205,6 +268,31 @@ async def check_rate_limit(key: str, limit: int, window: int) -> bool:
     return bool(current <= limit)
 
 
+async def wait_for_rate_limit(key: str, limit: int, window: int) -> float:
+    """Wait until the shared rate limit admits one more task.
+
+    Unlike ``check_rate_limit`` this never rejects: callers are paced locally
+    and retry the shared counter until a slot frees up.
+
+    Returns:
+        Seconds spent waiting.
+    """
+    # Without a running runtime, a fresh pacer only retries the shared counter.
+    pacer = _pacer if _pacer is not None else QuotaPacer(limit, window)
+    waited = await pacer.acquire(lambda: check_rate_limit(key, limit, window))
+    if _runtime is not None:
+        _runtime.metrics.paced_seconds += waited
+    return waited
+
+
+async def _write_result(record: dict[str, Any]) -> None:
+    """Hand a result to the batched writer, or append directly without one."""
+    if _result_writer is not None:
+        await _result_writer.write(record)
+    else:
+        _append_jsonl(RESULTS_DIR / "results.jsonl", record)
+
+
 async def ensure_redis_ready() -> None:
     """Ping Redis once; raise if unavailable."""
     try:
@@ -340,9 +428,21 @@ async def _run_task_with_lats(task: OCRTask) -> dict[str, Any]:
     )
 
 
-@broker.subscriber("ocr_task")  # Low concurrency for pilot
+@broker.subscriber("ocr_task")
 async def handle_ocr_task(task: OCRTask) -> None:
-    """Handle incoming OCR tasks from the message queue."""
+    """Handle incoming OCR tasks from the message queue.
+
+    With the runtime started the task is only queued (blocking while the
+    prefetch buffer is full); otherwise it is processed inline.
+    """
+    if _runtime is not None and _runtime.running:
+        await _runtime.submit(task, enqueued_at=task.enqueued_at)
+        return
+    await process_ocr_task(task)
+
+
+async def process_ocr_task(task: OCRTask) -> None:
+    """Process one OCR task: pace to the quota, run it, store the result."""
     try:
         await ensure_redis_ready()
     except Exception as exc:  # noqa: BLE001
@@ -352,35 +452,44 @@ async def handle_ocr_task(task: OCRTask) -> None:
         redis_client = None
     logger.info(f"Received task: {task.request_id}")
 
-    allowed = await check_rate_limit("global_rate_limit", 10, 60)
-    if not allowed:
-        logger.warning(f"Rate limit exceeded for task {task.request_id}. Re-queuing...")
-        raise RateLimitError("Global rate limit exceeded")
+    config = get_config()
+    waited = await wait_for_rate_limit(
+        GLOBAL_RATE_LIMIT_KEY,
+        getattr(config, "worker_rate_limit", 10),
+        getattr(config, "worker_rate_window_seconds", 60),
+    )
+    if waited > 1.0:
+        logger.info("Task %s paced for %.1fs by rate limit", task.request_id, waited)
 
     try:
         # Feature flag priority: Data2Neo > LATS > Basic processing
         # Note: These features are mutually exclusive; only one runs per task
-        config = get_config()
         if getattr(config, "enable_data2neo", False):
             result = await _run_data2neo_extraction(task)
         elif getattr(config, "enable_lats", False):
             result = await _run_task_with_lats(task)
         else:
             result = await _process_task(task)
-        _append_jsonl(RESULTS_DIR / "results.jsonl", result)
+        await _write_result(result)
         logger.info(f"Task {task.request_id} completed successfully.")
     except ProviderError:
-        # Transient or provider-related errors should be retried by FastStream
+        # Transient or provider-related errors are retried by the caller:
+        # FastStream when processed inline, the WorkerRuntime otherwise
         raise
     except Exception as e:
         logger.error(f"Task {task.request_id} failed: {e}")
-        dlq_msg = DLQMessage(
-            request_id=task.request_id,
-            error_type=type(e).__name__,
-            payload=task.model_dump(),
-        )
-        await broker.publish(dlq_msg, "ocr_dlq")
-        logger.error(f"Sent task {task.request_id} to DLQ")
+        await _send_to_dlq(task, e)
+
+
+async def _send_to_dlq(task: OCRTask, exc: Exception) -> None:
+    """Publish a task that will not be retried to the dead-letter queue."""
+    dlq_msg = DLQMessage(
+        request_id=task.request_id,
+        error_type=type(exc).__name__,
+        payload=task.model_dump(),
+    )
+    await broker.publish(dlq_msg, "ocr_dlq")
+    logger.error(f"Sent task {task.request_id} to DLQ")
 
 
 if __name__ == "__main__":
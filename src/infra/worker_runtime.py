@@ -0,0 +1,439 @@
+"""In-process runtime for the FastStream OCR worker.
+
+Decouples message intake from processing so one worker process can keep
+several Gemini calls in flight:
+- ``WorkerRuntime``: bounded prefetch queue drained by N consumer tasks,
+  with retry/backoff for transient failures, a dead-letter hook and
+  graceful drain on shutdown.
+- ``QuotaPacer``: spreads tasks over the shared Gemini quota and waits for
+  capacity instead of failing the task.
+- ``BufferedJsonlWriter``: collects results and appends them in batches
+  off the event loop.
+- ``WorkerMetrics``: tasks/sec, queue lag and in-flight counts for sizing
+  worker replicas.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+from src.infra.file_lock import FileLock
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Completions kept for the tasks/sec estimate
+_THROUGHPUT_WINDOW_SECONDS = 60.0
+
+
+async def _sleep(delay: float) -> None:
+    """Module-level sleep so pacing and backoff waits can be patched in tests."""
+    await asyncio.sleep(delay)
+
+
+@dataclass
+class WorkerMetrics:
+    """Throughput and lag statistics for one worker process."""
+
+    completed: int = 0
+    failed: int = 0
+    retried: int = 0
+    in_flight: int = 0
+    queue_depth: int = 0
+    paced_seconds: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+    _completions: deque[float] = field(default_factory=deque, repr=False)
+    _lags: deque[float] = field(
+        default_factory=lambda: deque(maxlen=1000),
+        repr=False,
+    )
+
+    def record_start(self, queue_lag: float) -> None:
+        """Record that a task left the queue after ``queue_lag`` seconds."""
+        self.in_flight += 1
+        self._lags.append(max(0.0, queue_lag))
+
+    def record_finish(self, *, success: bool) -> None:
+        """Record a finished task."""
+        self.in_flight -= 1
+        if success:
+            self.completed += 1
+        else:
+            self.failed += 1
+        now = time.monotonic()
+        self._completions.append(now)
+        cutoff = now - _THROUGHPUT_WINDOW_SECONDS
+        while self._completions and self._completions[0] < cutoff:
+            self._completions.popleft()
+
+    @property
+    def tasks_per_second(self) -> float:
+        """Finished tasks per second over the last minute."""
+        if not self._completions:
+            return 0.0
+        elapsed = min(
+            _THROUGHPUT_WINDOW_SECONDS,
+            time.monotonic() - self.started_at,
+        )
+        return len(self._completions) / elapsed if elapsed > 0 else 0.0
+
+    def lag_percentile(self, percentile: float) -> float:
+        """Queue lag percentile (0-100) over recent tasks, in seconds."""
+        if not self._lags:
+            return 0.0
+        ordered = sorted(self._lags)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+
+    def snapshot(self) -> dict[str, float]:
+        """Return a JSON-serializable view of the metrics."""
+        return {
+            "completed": float(self.completed),
+            "failed": float(self.failed),
+            "retried": float(self.retried),
+            "in_flight": float(self.in_flight),
+            "queue_depth": float(self.queue_depth),
+            "tasks_per_second": round(self.tasks_per_second, 3),
+            "queue_lag_p50_s": round(self.lag_percentile(50), 3),
+            "queue_lag_p95_s": round(self.lag_percentile(95), 3),
+            "paced_seconds": round(self.paced_seconds, 3),
+        }
+
+
+class QuotaPacer:
+    """Pace callers to a request quota instead of rejecting them.
+
+    Local slots are scheduled ``window / limit`` seconds apart (GCRA), so
+    this process spreads its calls evenly over the window instead of
+    bursting at its start. The optional ``try_acquire`` callback (e.g. a
+    Redis counter) enforces the quota across processes and is retried
+    until it admits the caller.
+
+    Args:
+        limit: Requests allowed per window.
+        window: Window length in seconds.
+        burst: Requests that may start back to back after an idle period.
+    """
+
+    def __init__(self, limit: int, window: float, burst: int = 1) -> None:
+        """Initialize the pacer."""
+        self.limit = limit
+        self.window = window
+        self.burst = max(1, burst)
+        self._next_slot = 0.0
+
+    @property
+    def interval(self) -> float:
+        """Seconds between request slots."""
+        return self.window / max(1, self.limit)
+
+    def _reserve(self) -> float:
+        """Reserve the next local slot and return the delay until it."""
+        now = time.monotonic()
+        earliest = now - (self.burst - 1) * self.interval
+        slot = max(self._next_slot, earliest)
+        self._next_slot = slot + self.interval
+        return max(0.0, slot - now)
+
+    async def acquire(
+        self,
+        try_acquire: Callable[[], Awaitable[bool]] | None = None,
+    ) -> float:
+        """Wait until a request may be sent.
+
+        Args:
+            try_acquire: Shared quota check returning True when admitted.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        start = time.monotonic()
+        delay = self._reserve()
+        if delay > 0:
+            await _sleep(delay)
+        if try_acquire is not None:
+            while not await try_acquire():
+                # Jitter keeps waiting workers from retrying in lockstep.
+                await _sleep(self.interval * random.uniform(0.5, 1.5))
+        return time.monotonic() - start
+
+
+class BufferedJsonlWriter:
+    """Append JSON records to a JSONL file in batches.
+
+    Records are flushed when ``batch_size`` is reached or ``flush_interval``
+    seconds after the first buffered record, in a worker thread so disk
+    latency never blocks the event loop. Each batch is appended under an
+    exclusive ``FileLock`` so several worker processes can share one file.
+
+    Args:
+        path: Target JSONL file.
+        batch_size: Records per flush.
+        flush_interval: Maximum seconds a record waits in the buffer.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        batch_size: int = 20,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Initialize the writer."""
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.flushed_batches = 0
+        self.flushed_records = 0
+        self._buffer: list[dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.TimerHandle | None = None
+        self._pending: set[asyncio.Task[None]] = set()
+
+    async def write(self, record: dict[str, Any]) -> None:
+        """Buffer a record, flushing if the batch is full."""
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+        elif self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.flush_interval, self._flush_soon)
+
+    def _flush_soon(self) -> None:
+        self._timer = None
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def flush(self) -> None:
+        """Write all buffered records."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            await asyncio.to_thread(self._append_batch, batch)
+            self.flushed_batches += 1
+            self.flushed_records += len(batch)
+
+    def _append_batch(self, batch: list[dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in batch)
+        with FileLock(self.path), open(self.path, "a", encoding="utf-8") as f:
+            f.write(payload)
+
+    async def close(self) -> None:
+        """Flush remaining records and wait for scheduled flushes."""
+        await self.flush()
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+
+@dataclass
+class _QueuedItem(Generic[T]):
+    item: T
+    received_at: float
+    enqueued_at: float | None
+
+
+class WorkerRuntime(Generic[T]):
+    """Bounded prefetch queue processed by a fixed pool of consumers.
+
+    ``submit`` returns as soon as the item is queued, so the broker can
+    hand over the next message while earlier ones are processed. When the
+    prefetch queue is full ``submit`` blocks, which applies backpressure
+    to the subscriber.
+
+    The broker message is already acknowledged once it is queued, so the
+    runtime owns failures: ``retry_on`` errors are retried in place with
+    exponential backoff, and an item that still fails is handed to
+    ``on_failure`` (e.g. a dead-letter publisher).
+
+    Args:
+        handler: Coroutine processing one item; exceptions are logged.
+        concurrency: Number of items processed at once.
+        prefetch: Maximum items waiting in the queue.
+        metrics_interval: Seconds between metric log lines (0 disables).
+        retry_on: Exception types worth retrying.
+        max_retries: Retries per item before giving up.
+        retry_backoff: Delay before the first retry, doubled on each retry.
+        on_failure: Coroutine called with the item and the final error.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[T], Awaitable[None]],
+        concurrency: int = 4,
+        prefetch: int = 16,
+        metrics_interval: float = 60.0,
+        *,
+        retry_on: tuple[type[Exception], ...] = (),
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        on_failure: Callable[[T, Exception], Awaitable[None]] | None = None,
+    ) -> None:
+        """Initialize the runtime without starting consumers."""
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.prefetch = max(1, prefetch)
+        self.metrics_interval = metrics_interval
+        self.retry_on = retry_on
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self.on_failure = on_failure
+        self.metrics = WorkerMetrics()
+        self._queue: asyncio.Queue[_QueuedItem[T]] | None = None
+        self._consumers: list[asyncio.Task[None]] = []
+        self._reporter: asyncio.Task[None] | None = None
+        self._accepting = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the runtime accepts new items."""
+        return self._accepting
+
+    def start(self) -> None:
+        """Start consumer tasks on the running loop."""
+        if self._accepting:
+            return
+        self._queue = asyncio.Queue(maxsize=self.prefetch)
+        self.metrics = WorkerMetrics()
+        self._consumers = [
+            asyncio.create_task(self._consume(), name=f"worker-consumer-{i}")
+            for i in range(self.concurrency)
+        ]
+        if self.metrics_interval > 0:
+            self._reporter = asyncio.create_task(self._report())
+        self._accepting = True
+        logger.info(
+            "Worker runtime started (concurrency=%d, prefetch=%d)",
+            self.concurrency,
+            self.prefetch,
+        )
+
+    async def submit(self, item: T, enqueued_at: float | None = None) -> None:
+        """Queue an item, waiting while the prefetch buffer is full.
+
+        Args:
+            item: Item to process.
+            enqueued_at: Wall-clock time the producer published the item,
+                used for queue-lag metrics when known.
+
+        Raises:
+            RuntimeError: If the runtime is not running.
+        """
+        if not self._accepting or self._queue is None:
+            raise RuntimeError("Worker runtime is not running")
+        await self._queue.put(_QueuedItem(item, time.time(), enqueued_at))
+        self.metrics.queue_depth = self._queue.qsize()
+
+    async def _consume(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            queued = await queue.get()
+            self.metrics.queue_depth = queue.qsize()
+            origin = queued.enqueued_at or queued.received_at
+            self.metrics.record_start(time.time() - origin)
+            success = False
+            try:
+                await self._handle(queued.item)
+                success = True
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Worker task failed: %s", exc)
+                await self._give_up(queued.item, exc)
+            finally:
+                self.metrics.record_finish(success=success)
+                queue.task_done()
+
+    async def _handle(self, item: T) -> None:
+        """Run the handler, retrying ``retry_on`` errors with backoff."""
+        for attempt in range(self.max_retries):
+            exc = await self._attempt(item)
+            if exc is None:
+                return
+            delay = self.retry_backoff * 2**attempt
+            self.metrics.retried += 1
+            logger.warning(
+                "Worker task failed (%s), retry %d/%d in %.1fs",
+                exc,
+                attempt + 1,
+                self.max_retries,
+                delay,
+            )
+            await _sleep(delay)
+        # Last attempt: its error goes to the failure hook.
+        await self.handler(item)
+
+    async def _attempt(self, item: T) -> Exception | None:
+        """Run the handler once, returning a retryable error instead of raising."""
+        try:
+            await self.handler(item)
+        except self.retry_on as exc:
+            return exc
+        return None
+
+    async def _give_up(self, item: T, exc: Exception) -> None:
+        if self.on_failure is None:
+            return
+        try:
+            await self.on_failure(item, exc)
+        except Exception as hook_exc:  # noqa: BLE001
+            logger.error("Worker failure hook failed: %s", hook_exc)
+
+    async def _report(self) -> None:
+        while True:
+            await asyncio.sleep(self.metrics_interval)
+            logger.info("Worker metrics: %s", self.metrics.snapshot())
+
+    async def drain(self, timeout: float = 30.0) -> bool:
+        """Stop accepting items and wait for queued work to finish.
+
+        Args:
+            timeout: Maximum seconds to wait before cancelling consumers.
+
+        Returns:
+            True if every queued item finished before the timeout.
+        """
+        self._accepting = False
+        drained = True
+        if self._queue is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                drained = False
+                logger.warning(
+                    "Worker drain timed out with %d queued, %d in flight",
+                    self._queue.qsize(),
+                    self.metrics.in_flight,
+                )
+        tasks = [*self._consumers, *([self._reporter] if self._reporter else [])]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._consumers = []
+        self._reporter = None
+        logger.info("Worker runtime drained: %s", self.metrics.snapshot())
+        return drained
+
+
+__all__ = [
+    "BufferedJsonlWriter",
+    "QuotaPacer",
+    "WorkerMetrics",
+    "WorkerRuntime",
+]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 from typing import Any
 
@@ -21,17 +23,24 @@ class MockLLMProvider(LLMProvider):
         *,
         queries: list[str] | None = None,
         best_candidate: str = "A",
+        latency: float = 0.0,
+        seed: int | None = None,
     ) -> None:
         """Initialize the mock LLM provider.
 
         Args:
             queries: Optional list of predefined query strings.
             best_candidate: The candidate to return as best (A, B, or C).
+            latency: Simulated seconds per call, for concurrency benchmarks.
+            seed: When set, unstructured prompts return a score in [0, 1)
+                derived from the seed and the prompt instead of "OK".
         """
         self._queries = queries or ["테스트 질의 1", "테스트 질의 2", "테스트 질의 3"]
         self._best_candidate = (
             best_candidate if best_candidate in {"A", "B", "C"} else "A"
         )
+        self._latency = latency
+        self._seed = seed
 
     async def generate_content_async(
         self,
@@ -62,6 +71,8 @@ class MockLLMProvider(LLMProvider):
             max_output_tokens,
             kwargs,
         )
+        if self._latency > 0:
+            await asyncio.sleep(self._latency)
 
         if response_schema is QueryResult:
             payload: dict[str, Any] = {"queries": list(self._queries)}
@@ -116,11 +127,16 @@ class MockLLMProvider(LLMProvider):
 
         # Unstructured fallback
         return GenerationResult(
-            content="OK",
+            content="OK" if self._seed is None else self._seeded_score(prompt),
             usage={"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
             finish_reason="STOP",
         )
 
+    def _seeded_score(self, prompt: str) -> str:
+        """Score depending only on seed and prompt, independent of call order."""
+        digest = hashlib.sha256(f"{self._seed}:{prompt}".encode()).digest()
+        return f"{int.from_bytes(digest[:4], 'big') / 2**32:.4f}"
+
     async def count_tokens(self, text: str) -> int:
         """Count tokens as word count for testing purposes.
 
@@ -6,6 +6,7 @@ from src.monitoring.metrics import (
     record_api_call,
     record_api_error,
     record_cache_access,
+    record_http_request,
     record_token_usage,
     record_workflow_completion,
 )
@@ -18,6 +19,7 @@ __all__ = [
     "record_api_call",
     "record_api_error",
     "record_cache_access",
+    "record_http_request",
     "record_token_usage",
     "record_workflow_completion",
     "PROMETHEUS_AVAILABLE",
@@ -8,17 +8,16 @@ from __future__ import annotations
 
 import logging
 import time
-from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from starlette.responses import PlainTextResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.monitoring.metrics import (
     PROMETHEUS_AVAILABLE,
     get_metrics,
-    record_api_call,
+    record_http_request,
+    route_label,
 )
 
 if TYPE_CHECKING:
@@ -27,34 +26,43 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """HTTP 요청/응답 메트릭을 수집하는 미들웨어."""
+class MetricsMiddleware:
+    """HTTP 요청/응답 메트릭을 수집하는 순수 ASGI 미들웨어.
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    웹 API 는 request-id/로깅까지 함께 처리하는
+    ``src.web.middleware.ObservabilityMiddleware`` 를 사용합니다. 이 클래스는
+    메트릭만 필요한 앱을 위한 것으로 같은 라벨 체계를 씁니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """각 요청에 대한 메트릭을 기록합니다."""
+        # 메트릭 엔드포인트 자체는 기록에서 제외
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         try:
-            response = await call_next(request)
-            status = "success" if response.status_code < 400 else "error"
-        except Exception:
-            status = "error"
-            raise
+            await self.app(scope, receive, send_wrapper)
         finally:
-            latency = time.perf_counter() - start_time
-            # 메트릭 엔드포인트 자체는 기록에서 제외
-            if request.url.path != "/metrics":
-                record_api_call(
-                    model="http",
-                    status=status,
-                    latency_seconds=latency,
-                )
-
-        return response
+            record_http_request(
+                method=scope["method"],
+                route=route_label(scope),
+                status_code=status_code,
+                duration_seconds=time.perf_counter() - start_time,
+            )
 
 
 def add_metrics_endpoint(app: "FastAPI") -> None:
@@ -5,6 +5,9 @@
 
 from __future__ import annotations
 
+from collections.abc import MutableMapping
+from typing import Any
+
 # prometheus_client가 없을 경우 스텁 구현 사용
 try:
     from prometheus_client import Counter, Gauge, Histogram, generate_latest
@@ -101,6 +104,22 @@ api_errors = Counter(
     ["model", "error_type"],
 )
 
+# =============================================================================
+# HTTP 메트릭 (라벨은 라우트 템플릿으로 카디널리티 제한)
+# =============================================================================
+
+http_requests_total = Counter(
+    "http_requests_total",
+    "Total HTTP requests",
+    ["method", "route", "status"],
+)
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request duration until the response body completes",
+    ["method", "route"],
+)
+
 # =============================================================================
 # 캐시 메트릭
 # =============================================================================
@@ -196,6 +215,46 @@ def record_api_error(model: str, error_type: str) -> None:
         api_errors.labels(model=model, error_type=error_type).inc()
 
 
+def route_label(scope: MutableMapping[str, Any]) -> str:
+    """요청 scope 에서 메트릭 라벨용 라우트 템플릿을 구합니다.
+
+    라우팅 후 Starlette 가 ``scope["route"]`` 에 남기는 라우트의 경로
+    템플릿(예: ``/api/items/{item_id}``)을 사용하고, 매칭되지 않은 요청은
+    모두 ``"unmatched"`` 로 묶습니다.
+
+    Args:
+        scope: ASGI 요청 scope
+
+    Returns:
+        라우트 템플릿 문자열
+    """
+    path = getattr(scope.get("route"), "path", None)
+    return path if isinstance(path, str) and path else "unmatched"
+
+
+def record_http_request(
+    method: str,
+    route: str,
+    status_code: int,
+    duration_seconds: float,
+) -> None:
+    """HTTP 요청 메트릭 기록.
+
+    Args:
+        method: HTTP 메서드
+        route: 라우트 템플릿 (``route_label`` 결과)
+        status_code: 응답 상태 코드
+        duration_seconds: 응답 본문 완료까지의 시간 (초)
+    """
+    if PROMETHEUS_AVAILABLE:
+        http_requests_total.labels(
+            method=method, route=route, status=str(status_code)
+        ).inc()
+        http_request_duration.labels(method=method, route=route).observe(
+            duration_seconds
+        )
+
+
 def record_cache_access(cache_type: str, hit: bool) -> None:
     """캐시 접근 메트릭 기록.
 
@@ -244,11 +303,15 @@ __all__ = [
     "cache_size",
     "cost_usd",
     "get_metrics",
+    "http_request_duration",
+    "http_requests_total",
     "record_api_call",
     "record_api_error",
     "record_cache_access",
+    "record_http_request",
     "record_token_usage",
     "record_workflow_completion",
+    "route_label",
     "token_usage",
     "workflow_duration",
     "workflow_status",
@@ -3,28 +3,138 @@
 Selects the best-matching positive examples from Neo4j based on query type,
 context (table/chart presence, text density), and success rate.
 Tracks usage counts to ensure example diversity.
+
+질의 유형별 후보 풀을 메모리에 두고 그래프 스냅샷 버전(Rule/QueryType/Example
+지문)이 바뀔 때만 다시 읽습니다. 사용 횟수 증가분은 버퍼에 모았다가 주기적으로
+``UNWIND`` 한 번으로 기록하므로 선택 경로의 그래프 왕복은 버전 확인뿐입니다.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+from typing import Any, TypeVar, overload
 
+from src.infra.graph_snapshot import read_graph_snapshot
+from src.infra.kg_registry import shared_for_kg
 from src.qa.rag_system import QAKnowledgeGraph
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+MIN_SUCCESS_RATE = 0.8
+DENSITY_TOLERANCE = 0.2
+POOL_CHECK_INTERVAL_SECONDS = 60.0
+USAGE_FLUSH_INTERVAL_SECONDS = 5.0
+
+
+_POOL_QUERY = """
+MATCH (qt:QueryType {name: $query_type})
+MATCH (qt)<-[:FOR_TYPE]-(e:Example)
+WHERE e.type = 'positive' AND coalesce(e.success_rate, 0) > $min_rate
+RETURN e.text AS example,
+       coalesce(e.success_rate, 0) AS rate,
+       coalesce(e.usage_count, 0) AS usage,
+       coalesce(e.context_has_table, false) AS has_table,
+       e.text_density AS density
+"""
+
+_USAGE_UPDATE_QUERY = """
+UNWIND $rows AS row
+MATCH (e:Example {text: row.text})
+SET e.usage_count = coalesce(e.usage_count, 0) + row.count
+"""
+
+
+@dataclass
+class _CandidatePool:
+    """질의 유형 하나의 후보 예시 캐시."""
+
+    version: str
+    examples: list[dict[str, Any]] = field(default_factory=list)
+    checked_at: float = field(default_factory=time.monotonic)
+
 
 class DynamicExampleSelector:
     """현재 상황에 가장 적합한 예시를 그래프에서 선택."""
 
-    def __init__(self, kg: QAKnowledgeGraph):
+    def __init__(
+        self,
+        kg: QAKnowledgeGraph,
+        check_interval: float = POOL_CHECK_INTERVAL_SECONDS,
+        flush_interval: float = USAGE_FLUSH_INTERVAL_SECONDS,
+    ):
         """Initialize the dynamic example selector.
 
         Args:
             kg: QAKnowledgeGraph instance for graph queries.
+            check_interval: 그래프 스냅샷 버전을 다시 확인하기까지의 최소 간격(초).
+            flush_interval: 첫 사용 기록 후 그래프에 반영하기까지 대기 시간(초).
         """
         self.kg = kg
+        self.check_interval = check_interval
+        self.flush_interval = flush_interval
+        self._pools: dict[str, _CandidatePool] = {}
+        self._pending: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self.flushed = 0
+        self.dropped = 0
+
+    def _session_factory(self) -> Callable[[], AbstractContextManager[Any]] | None:
+        graph_session = getattr(self.kg, "graph_session", None)
+        if graph_session is not None:
+            return graph_session  # type: ignore[no-any-return]
+        graph = getattr(self.kg, "_graph", None)
+        if graph is None:
+            return None
+        return graph.session  # type: ignore[no-any-return]
+
+    def _candidates(self, session: Any, query_type: str) -> list[dict[str, Any]]:
+        """캐시된 후보 풀을 반환하고, 필요하면 스냅샷 버전을 확인해 다시 읽습니다."""
+        now = time.monotonic()
+        with self._lock:
+            pool = self._pools.get(query_type)
+            if pool is not None and now - pool.checked_at < self.check_interval:
+                return pool.examples
+
+        version = read_graph_snapshot(session).version
+        with self._lock:
+            pool = self._pools.get(query_type)
+            if pool is not None and pool.version == version:
+                pool.checked_at = now
+                return pool.examples
+
+        examples = [
+            dict(row)
+            for row in session.run(
+                _POOL_QUERY, query_type=query_type, min_rate=MIN_SUCCESS_RATE
+            )
+        ]
+        with self._lock:
+            # 아직 기록되지 않은 증가분은 새로 읽은 값에 없으므로 더해 둡니다.
+            for ex in examples:
+                ex["usage"] = ex.get("usage", 0) + self._pending.get(ex["example"], 0)
+            self._pools[query_type] = _CandidatePool(version, examples, now)
+        logger.debug(
+            "Example pool loaded: type=%s, %d candidates", query_type, len(examples)
+        )
+        return examples
+
+    def invalidate(self, query_type: str | None = None) -> None:
+        """후보 풀 캐시를 비웁니다(``query_type`` 이 None이면 전체)."""
+        with self._lock:
+            if query_type is None:
+                self._pools.clear()
+            else:
+                self._pools.pop(query_type, None)
 
     def select_best_examples(
         self,
@@ -35,67 +145,125 @@ class DynamicExampleSelector:
         """컨텍스트에 맞는 최적 예시 선택."""
         examples: list[dict[str, Any]] = []
         try:
-            graph_session = getattr(self.kg, "graph_session", None)
-            if graph_session is None:
-                graph = getattr(self.kg, "_graph", None)
-                if graph is None:
-                    logger.debug(
-                        "DynamicExampleSelector: no graph_session/_graph; returning []",
-                    )
-                    return []
-                session_ctx = graph.session
-            else:
-                session_ctx = graph_session
+            session_factory = self._session_factory()
+            if session_factory is None:
+                logger.debug(
+                    "DynamicExampleSelector: no graph_session/_graph; returning []",
+                )
+                return []
 
-            with session_ctx() as session:
+            with session_factory() as session:
                 if session is None:
                     logger.debug(
                         "DynamicExampleSelector: graph unavailable, returning []",
                     )
                     return []
-                conditions = []
-                params: dict[str, Any] = {"query_type": query_type, "k": k}
+                candidates = self._candidates(session, query_type)
 
-                if context.get("has_table_chart"):
-                    conditions.append("e.context_has_table = true")
+            need_table = bool(context.get("has_table_chart"))
+            min_density: float | None = None
+            if context.get("text_density") is not None:
+                min_density = float(context["text_density"]) - DENSITY_TOLERANCE
 
-                if context.get("text_density") is not None:
-                    conditions.append("e.text_density > $min_density")
-                    params["min_density"] = float(context["text_density"]) - 0.2
-
-                where_parts = [
-                    "e.type = 'positive'",
-                    "coalesce(e.success_rate, 0) > 0.8",
+            with self._lock:
+                matched = [
+                    ex
+                    for ex in candidates
+                    if (not need_table or ex.get("has_table"))
+                    and (
+                        min_density is None
+                        or (
+                            ex.get("density") is not None
+                            and ex["density"] > min_density
+                        )
+                    )
                 ]
-                where_parts.extend(conditions)
-                where_clause = " AND ".join(where_parts)
-
-                cypher = f"""
-                MATCH (qt:QueryType {{name: $query_type}})
-                MATCH (qt)<-[:FOR_TYPE]-(e:Example)
-                WHERE {where_clause}
-                RETURN e.text AS example,
-                       coalesce(e.success_rate, 0) AS rate,
-                       coalesce(e.usage_count, 0) AS usage
-                ORDER BY rate DESC, usage ASC
-                LIMIT $k
-                """
-
-                result = session.run(cypher, **params)
-
-                examples = result.data()
-
-                # 다양성 확보: 사용 횟수 업데이트
-                for ex in examples:
-                    session.run(
-                        """
-                        MATCH (e:Example {text: $text})
-                        SET e.usage_count = coalesce(e.usage_count, 0) + 1
-                        """,
-                        text=ex["example"],
+                matched.sort(key=lambda ex: (-ex["rate"], ex["usage"]))
+                for ex in matched[:k]:
+                    examples.append(
+                        {
+                            "example": ex["example"],
+                            "rate": ex["rate"],
+                            "usage": ex["usage"],
+                        }
                     )
+                    # 다양성 확보: 사용 횟수는 캐시에 즉시, 그래프에는 배치로 반영
+                    ex["usage"] += 1
+                    self._pending[ex["example"]] += 1
+                if examples:
+                    self._schedule_flush()
         except Exception as exc:  # noqa: BLE001
             logger.warning("Example selection failed: %s", exc)
             examples = []
 
         return examples
+
+    def _schedule_flush(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def pending(self) -> int:
+        """아직 기록되지 않은 사용 횟수 증가분의 합."""
+        with self._lock:
+            return sum(self._pending.values())
+
+    def flush(self) -> int:
+        """버퍼된 사용 횟수를 한 번의 ``UNWIND`` 쿼리로 기록합니다.
+
+        Returns:
+            반영한 예시 수. 실패 시 증가분은 버리고 0을 반환합니다.
+        """
+        with self._lock:
+            counts, self._pending = self._pending, Counter()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not counts:
+            return 0
+        rows = [{"text": text, "count": count} for text, count in counts.items()]
+        with self._flush_lock:
+            try:
+                session_factory = self._session_factory()
+                if session_factory is None:
+                    self.dropped += len(rows)
+                    return 0
+                with session_factory() as session:
+                    if session is None:
+                        self.dropped += len(rows)
+                        return 0
+                    session.run(_USAGE_UPDATE_QUERY, rows=rows)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Example usage update failed: %s", exc)
+                self.dropped += len(rows)
+                return 0
+        self.flushed += len(rows)
+        return len(rows)
+
+    def close(self) -> None:
+        """대기 중인 사용 횟수를 기록하고 타이머를 정리합니다."""
+        self.flush()
+
+
+@overload
+def get_example_selector(kg: Any) -> DynamicExampleSelector: ...
+
+
+@overload
+def get_example_selector(kg: Any, factory: Callable[[Any], T]) -> T: ...
+
+
+def get_example_selector(
+    kg: Any, factory: Callable[[Any], Any] = DynamicExampleSelector
+) -> Any:
+    """프로세스 전역에서 공유하는 선택기를 반환합니다.
+
+    Args:
+        kg: QAKnowledgeGraph 인스턴스.
+        factory: 선택기 클래스. 호출 측 모듈에서 교체할 수 있도록 받습니다.
+
+    Returns:
+        ``(factory, kg)`` 마다 한 번만 만들어지는 선택기.
+    """
+    return shared_for_kg(kg, factory)
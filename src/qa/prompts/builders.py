@@ -8,7 +8,10 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from src.processing.example_selector import DynamicExampleSelector
+from src.processing.example_selector import (
+    DynamicExampleSelector,
+    get_example_selector,
+)
 
 __all__ = [
     "DynamicExampleSelector",
@@ -36,7 +39,7 @@ def _load_fewshot_text(
     if kg is None:
         return ""
     try:
-        example_selector = DynamicExampleSelector(kg)
+        example_selector = get_example_selector(kg)
         fewshot_examples = example_selector.select_best_examples(
             example_key,
             {},
@@ -242,9 +242,9 @@ class UnifiedValidator:
         if not self.kg:
             return [], 1.0, []
         try:
-            from src.analysis.cross_validation import CrossValidationSystem
+            from src.analysis.cross_validation import get_cross_validator
 
-            validator = CrossValidationSystem(self.kg)
+            validator = get_cross_validator(self.kg)
             rule_check = validator._check_rule_compliance(  # noqa: SLF001
                 answer,
                 query_type,
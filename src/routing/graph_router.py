@@ -2,21 +2,37 @@
 
 Routes user queries to appropriate handlers based on Neo4j QueryType metadata.
 Uses Gemini to classify query intent and logs routing decisions for analysis.
+
+QueryType definitions are cached and only rebuilt into the keyword
+pre-classifier when their content version changes. Confident keyword matches
+skip the LLM call, and RoutingLog writes are buffered and flushed with
+``UNWIND`` in the background.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import inspect
+import json
 import logging
+import threading
+import time
 from collections.abc import Callable
+from contextlib import AbstractContextManager
 from typing import Any
 
 from neo4j.exceptions import Neo4jError
 
 from src.llm.gemini import GeminiModelClient
 from src.qa.rag_system import QAKnowledgeGraph
+from src.routing.preclassifier import SKIP_CONFIDENCE, KeywordRouteClassifier
+from src.routing.routing_log import RoutingLogWriter, RoutingStats
 
 logger = logging.getLogger(__name__)
 
+QUERY_TYPE_TTL_SECONDS = 300.0
+
 
 class GraphEnhancedRouter:
     """Neo4j 그래프의 QueryType 정보를 활용해 최적 체인을 선택하고 실행합니다."""
@@ -25,15 +41,70 @@ class GraphEnhancedRouter:
         self,
         kg: QAKnowledgeGraph | None = None,
         llm: GeminiModelClient | None = None,
+        query_type_ttl: float = QUERY_TYPE_TTL_SECONDS,
+        skip_confidence: float = SKIP_CONFIDENCE,
     ):
         """Initialize the graph-enhanced router.
 
         Args:
             kg: Optional QAKnowledgeGraph instance.
             llm: Optional Gemini model client.
+            query_type_ttl: Seconds before cached QueryTypes are re-checked.
+            skip_confidence: Keyword confidence at which the LLM is skipped.
         """
         self.kg = kg or QAKnowledgeGraph()
         self.llm = llm or GeminiModelClient()
+        self.query_type_ttl = query_type_ttl
+        self.skip_confidence = skip_confidence
+        self.stats = RoutingStats()
+        self.log_writer = RoutingLogWriter(self._graph_session)
+        self._qtypes: list[dict[str, Any]] = []
+        self._qtypes_version: str | None = None
+        self._qtypes_expires = 0.0
+        self._qtypes_lock = threading.Lock()
+        self._classifier = KeywordRouteClassifier([], skip_confidence=skip_confidence)
+
+    def _graph_session(self) -> AbstractContextManager[Any] | None:
+        graph = getattr(self.kg, "_graph", None)
+        return graph.session() if graph is not None else None
+
+    def _query_types_stale(self) -> bool:
+        return time.monotonic() >= self._qtypes_expires
+
+    def _refresh_query_types(self) -> list[dict[str, Any]]:
+        """Re-fetch QueryTypes; rebuild the classifier only if the version changed."""
+        rows = self._fetch_query_types()
+        with self._qtypes_lock:
+            self._qtypes_expires = time.monotonic() + self.query_type_ttl
+            if not rows and self._qtypes:
+                # 조회 실패 시 직전 정의를 유지합니다.
+                return self._qtypes
+            version = hashlib.sha1(
+                json.dumps(rows, sort_keys=True, default=str).encode("utf-8")
+            ).hexdigest()
+            if version != self._qtypes_version:
+                self._qtypes = rows
+                self._qtypes_version = version
+                self._classifier = KeywordRouteClassifier(
+                    rows, skip_confidence=self.skip_confidence
+                )
+            return self._qtypes
+
+    def _query_types(self) -> list[dict[str, Any]]:
+        if self._query_types_stale():
+            return self._refresh_query_types()
+        return self._qtypes
+
+    def invalidate_query_types(self) -> None:
+        """Force the next call to re-check QueryType definitions."""
+        self._qtypes_expires = 0.0
+
+    def _preclassify(self, user_input: str) -> str | None:
+        return self._classifier.classify(user_input).choice
+
+    def _finish(self, user_input: str, chosen: str, source: str, start: float) -> None:
+        self.stats.record(time.perf_counter() - start, llm_skipped=source != "llm")
+        self.log_writer.add(user_input, chosen, source)
 
     def route_and_generate(
         self,
@@ -44,11 +115,62 @@ class GraphEnhancedRouter:
 
         handlers: {"explanation": func, "summary": func, ...}
         """
-        qtypes = self._fetch_query_types()
-        prompt = self._build_router_prompt(user_input, qtypes)
-        choice = self.llm.generate(prompt, role="router").strip().lower()
+        start = time.perf_counter()
+        qtypes = self._query_types()
+        chosen = self._preclassify(user_input)
+        source = "keyword"
+        if chosen is None:
+            prompt = self._build_router_prompt(user_input, qtypes)
+            reply = self.llm.generate(prompt, role="router")
+            chosen, source = self._select_query_type(reply, qtypes), "llm"
+        self._finish(user_input, chosen, source, start)
+
+        output = None
+        if chosen in handlers:
+            output = handlers[chosen](user_input)
 
-        # 선택 결과 정규화
+        return {"choice": chosen, "output": output, "source": source}
+
+    async def aroute_and_generate(
+        self,
+        user_input: str,
+        handlers: dict[str, Callable[[str], Any]],
+    ) -> dict[str, Any]:
+        """``route_and_generate`` 의 비동기 버전.
+
+        캐시가 만료된 경우의 QueryType 조회와 LLM 호출만 워커 스레드에서
+        실행하므로 이벤트 루프를 막지 않습니다. 핸들러는 동기/비동기 모두
+        지원합니다.
+        """
+        start = time.perf_counter()
+        if self._query_types_stale():
+            qtypes = await asyncio.to_thread(self._refresh_query_types)
+        else:
+            qtypes = self._qtypes
+        chosen = self._preclassify(user_input)
+        source = "keyword"
+        if chosen is None:
+            prompt = self._build_router_prompt(user_input, qtypes)
+            reply = await asyncio.to_thread(self.llm.generate, prompt, role="router")
+            chosen, source = self._select_query_type(reply, qtypes), "llm"
+        self._finish(user_input, chosen, source, start)
+
+        output = None
+        if chosen in handlers:
+            output = handlers[chosen](user_input)
+            if inspect.isawaitable(output):
+                output = await output
+
+        return {"choice": chosen, "output": output, "source": source}
+
+    def close(self) -> None:
+        """Flush buffered RoutingLog entries."""
+        self.log_writer.close()
+
+    @staticmethod
+    def _select_query_type(reply: str, qtypes: list[dict[str, Any]]) -> str:
+        """LLM 응답을 등록된 QueryType 이름으로 정규화합니다."""
+        choice = reply.strip().lower()
         chosen: str | None = None
         for qt in qtypes:
             if qt["name"].lower() in choice:
@@ -62,14 +184,7 @@ class GraphEnhancedRouter:
                 chosen = str(first_name) if first_name is not None else "explanation"
             else:
                 chosen = "explanation"
-
-        output = None
-        if chosen in handlers:
-            output = handlers[chosen](user_input)
-
-        self._log_routing(user_input, chosen)
-
-        return {"choice": chosen, "output": output}
+        return chosen
 
     def _fetch_query_types(self) -> list[dict[str, Any]]:
         try:
@@ -116,28 +231,6 @@ class GraphEnhancedRouter:
 
 출력은 질의 유형 이름만 적으세요."""
 
-    def _log_routing(self, input_text: str, chosen: str) -> None:
-        try:
-            graph = getattr(self.kg, "_graph", None)
-            if graph is None:
-                return
-            with graph.session() as session:
-                session.run(
-                    """
-                    CREATE (r:RoutingLog {
-                        input: $input,
-                        chosen: $chosen,
-                        timestamp: datetime()
-                    })
-                    """,
-                    input=input_text,
-                    chosen=chosen,
-                )
-        except Neo4jError as exc:
-            logger.warning("Routing log write failed: %s", exc)
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Routing log write failed (unknown): %s", exc)
-
 
 # Alias for backward compatibility
 GraphRouter = GraphEnhancedRouter
@@ -0,0 +1,84 @@
+"""LLM 호출 전 로컬 키워드 기반 질의 유형 사전 분류기.
+
+QueryType 이름/한글명과 ``QUERY_TYPE_KEYWORDS`` 를 하나의 Aho-Corasick
+오토마톤으로 묶어 입력을 한 번만 스캔합니다. 한 유형의 키워드 점수가 전체
+점수의 대부분을 차지할 때만 결과를 확정하고, 애매하면 LLM 라우터에 맡깁니다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from src.graph.linking import AhoCorasick
+from src.graph.mappings import QUERY_TYPE_KEYWORDS
+
+SKIP_CONFIDENCE = 0.8
+MIN_KEYWORD_SCORE = 2
+
+
+@dataclass(frozen=True)
+class PreClassification:
+    """사전 분류 결과.
+
+    Attributes:
+        choice: 확정된 질의 유형. 신뢰도가 낮으면 None.
+        confidence: 최고 점수 유형이 전체 키워드 점수에서 차지하는 비율.
+        scores: 유형별 점수(일치한 서로 다른 키워드 길이의 합).
+    """
+
+    choice: str | None
+    confidence: float
+    scores: Mapping[str, int]
+
+
+class KeywordRouteClassifier:
+    """키워드 일치 점수로 질의 유형을 고르는 분류기.
+
+    Args:
+        query_types: QueryType 레코드(``name``, ``korean``).
+        keywords: 유형 이름 -> 추가 키워드 목록.
+        skip_confidence: LLM을 건너뛰기 위한 최소 신뢰도.
+        min_score: 결과를 확정하기 위한 최소 점수.
+    """
+
+    def __init__(
+        self,
+        query_types: Sequence[Mapping[str, Any]],
+        keywords: Mapping[str, Sequence[str]] = QUERY_TYPE_KEYWORDS,
+        skip_confidence: float = SKIP_CONFIDENCE,
+        min_score: int = MIN_KEYWORD_SCORE,
+    ) -> None:
+        """등록된 유형의 키워드로 오토마톤을 만듭니다."""
+        self.skip_confidence = skip_confidence
+        self.min_score = min_score
+        self._matcher: AhoCorasick[tuple[str, str]] = AhoCorasick(case_insensitive=True)
+        self.names: list[str] = []
+        for qt in query_types:
+            name = qt.get("name")
+            if not name:
+                continue
+            self.names.append(name)
+            patterns = {name, qt.get("korean") or "", *keywords.get(name, ())}
+            for pattern in patterns:
+                if pattern.strip():
+                    self._matcher.add(pattern, (name, pattern.lower()))
+
+    def classify(self, text: str) -> PreClassification:
+        """``text`` 의 질의 유형을 추정합니다."""
+        scores: dict[str, int] = {}
+        for name, pattern in set(self._matcher.iter_matches(text)):
+            scores[name] = scores.get(name, 0) + len(pattern)
+        total = sum(scores.values())
+        if not total:
+            return PreClassification(None, 0.0, scores)
+        best = max(scores, key=lambda n: (scores[n], -self.names.index(n)))
+        confidence = scores[best] / total
+        confident = (
+            confidence >= self.skip_confidence and scores[best] >= self.min_score
+        )
+        return PreClassification(best if confident else None, confidence, scores)
+
+
+__all__ = ["KeywordRouteClassifier", "PreClassification"]
@@ -0,0 +1,173 @@
+"""RoutingLog 버퍼 쓰기와 라우팅 지표.
+
+요청마다 ``CREATE (:RoutingLog)`` 를 실행하는 대신 결정을 메모리에 모았다가
+``UNWIND`` 한 번으로 기록합니다. 플러시는 배치가 차거나 짧은 지연 후에
+백그라운드 타이머 스레드에서 실행되므로 요청 경로는 쓰기를 기다리지 않습니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import datetime, timezone
+from typing import Any
+
+from neo4j.exceptions import Neo4jError
+
+logger = logging.getLogger(__name__)
+
+LOG_BATCH_SIZE = 100
+LOG_FLUSH_INTERVAL_SECONDS = 1.0
+LATENCY_WINDOW = 1000
+
+_ROUTING_LOG_QUERY = """
+UNWIND $rows AS row
+CREATE (r:RoutingLog {
+    input: row.input,
+    chosen: row.chosen,
+    source: row.source,
+    timestamp: datetime(row.timestamp)
+})
+"""
+
+
+class RoutingLogWriter:
+    """RoutingLog 노드를 모아서 ``UNWIND`` 로 기록하는 버퍼.
+
+    Args:
+        session_factory: Neo4j 세션 컨텍스트를 반환하는 callable. None을
+            반환하면 그래프가 없는 것으로 보고 버퍼를 비웁니다.
+        batch_size: 즉시 플러시를 시작하는 버퍼 크기.
+        flush_interval: 첫 항목 추가 후 플러시까지 최대 대기 시간(초).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractContextManager[Any] | None],
+        batch_size: int = LOG_BATCH_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        """빈 버퍼를 만듭니다."""
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self.written = 0
+        self.dropped = 0
+
+    def add(self, input_text: str, chosen: str, source: str) -> None:
+        """라우팅 결정을 버퍼에 추가합니다."""
+        row = {
+            "input": input_text,
+            "chosen": chosen,
+            "source": source,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        with self._lock:
+            self._buffer.append(row)
+            if len(self._buffer) >= self.batch_size:
+                self._cancel_timer()
+                threading.Thread(
+                    target=self.flush, name="routing-log-flush", daemon=True
+                ).start()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def pending(self) -> int:
+        """아직 기록되지 않은 항목 수."""
+        with self._lock:
+            return len(self._buffer)
+
+    def flush(self) -> int:
+        """버퍼를 한 번의 ``UNWIND`` 쿼리로 기록합니다.
+
+        Returns:
+            기록한 항목 수. 실패 시 항목은 버리고 0을 반환합니다.
+        """
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+            self._cancel_timer()
+        if not rows:
+            return 0
+        with self._flush_lock:
+            try:
+                session_ctx = self._session_factory()
+                if session_ctx is None:
+                    self.dropped += len(rows)
+                    return 0
+                with session_ctx as session:
+                    session.run(_ROUTING_LOG_QUERY, rows=rows)
+            except Neo4jError as exc:
+                logger.warning("Routing log write failed: %s", exc)
+                self.dropped += len(rows)
+                return 0
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Routing log write failed (unknown): %s", exc)
+                self.dropped += len(rows)
+                return 0
+            self.written += len(rows)
+            return len(rows)
+
+    def close(self) -> None:
+        """대기 중인 항목을 기록하고 타이머를 정리합니다."""
+        self.flush()
+
+
+class RoutingStats:
+    """LLM 생략률과 라우팅 지연 백분위를 집계합니다."""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        """최근 ``window`` 건의 지연을 보관합니다."""
+        self.total = 0
+        self.llm_skipped = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency_seconds: float, *, llm_skipped: bool) -> None:
+        """라우팅 한 건을 기록합니다."""
+        with self._lock:
+            self.total += 1
+            if llm_skipped:
+                self.llm_skipped += 1
+            self._latencies.append(latency_seconds)
+
+    @property
+    def llm_skip_rate(self) -> float:
+        """LLM 호출 없이 결정된 비율."""
+        return self.llm_skipped / self.total if self.total else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        """최근 라우팅 지연 백분위(0-100), 초 단위."""
+        with self._lock:
+            ordered = sorted(self._latencies)
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+
+    def snapshot(self) -> dict[str, float]:
+        """JSON 직렬화 가능한 지표."""
+        return {
+            "requests": float(self.total),
+            "llm_skipped": float(self.llm_skipped),
+            "llm_skip_rate": round(self.llm_skip_rate, 3),
+            "latency_p50_ms": round(self.latency_percentile(50) * 1000, 3),
+            "latency_p95_ms": round(self.latency_percentile(95) * 1000, 3),
+            "latency_p99_ms": round(self.latency_percentile(99) * 1000, 3),
+        }
+
+
+__all__ = ["RoutingLogWriter", "RoutingStats"]
@@ -10,15 +10,11 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Literal
-from uuid import uuid4
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
 
 from checks.detect_forbidden_patterns import find_violations
 from src.agent import GeminiAgent
@@ -26,16 +22,18 @@ from src.analysis.cross_validation import CrossValidationSystem
 from src.config import AppConfig
 from src.config.constants import DEFAULT_ANSWER_RULES
 from src.infra.health import (
+    DEFAULT_CHECK_INTERVAL,
     HealthChecker,
+    Neo4jProbe,
+    RedisProbe,
     check_gemini_api,
-    check_neo4j_with_params,
-    check_redis_with_url,
 )
 from src.infra.logging import setup_logging
 from src.infra.structured_logging import setup_structured_logging
 from src.qa.pipeline import IntegratedQAPipeline
 from src.qa.rag_system import QAKnowledgeGraph
 from src.qa.rule_loader import set_global_kg
+from src.web.middleware import REQUEST_ID_HEADER, ObservabilityMiddleware
 from src.web.routers import (
     analysis_router,
     cache_stats_router,
@@ -58,7 +56,7 @@ from src.web.routers import session as session_router_module
 from src.web.routers import stream as stream_router_module
 from src.web.routers import workspace as workspace_router_module
 from src.web.service_registry import get_registry
-from src.web.session import SessionManager, session_middleware
+from src.web.session import SessionManager, SessionMiddleware
 from src.web.utils import (
     detect_workflow,
     postprocess_answer,
@@ -86,7 +84,6 @@ kg: QAKnowledgeGraph | None = None
 pipeline: IntegratedQAPipeline | None = None
 session_manager = SessionManager()
 _log_listener: Any | None = None  # QueueListener for file logging
-REQUEST_ID_HEADER = "X-Request-Id"
 ENABLE_MULTIMODAL = os.getenv("ENABLE_MULTIMODAL", "true").lower() == "true"
 ENABLE_METRICS = os.getenv("ENABLE_METRICS", "true").lower() == "true"
 
@@ -98,107 +95,6 @@ if os.getenv("ENABLE_STRUCT_LOGGING", "").lower() == "true":
         logging.getLogger(__name__).warning("Structured logging init failed: %s", exc)
 
 
-def _get_request_id(request: Request) -> str:
-    return getattr(request.state, "request_id", "")
-
-
-async def _request_id_middleware(
-    request: Request,
-    call_next: RequestResponseEndpoint,
-) -> Response:
-    """Attach request_id to request.state and response headers."""
-    req_id = request.headers.get(REQUEST_ID_HEADER) or uuid4().hex
-    request.state.request_id = req_id
-    response = await call_next(request)
-    response.headers[REQUEST_ID_HEADER] = req_id
-    return response
-
-
-def _log_api_error(
-    message: str,
-    *,
-    request: Request,
-    exc: Exception,
-    logger_obj: logging.Logger,
-) -> None:
-    """Log structured error with request context."""
-    logger_obj.error(
-        message,
-        extra={
-            "request_id": getattr(request.state, "request_id", ""),
-            "path": request.url.path,
-            "method": request.method,
-            "client": getattr(request.client, "host", ""),
-            "user_agent": request.headers.get("user-agent", ""),
-            "error_type": exc.__class__.__name__,
-        },
-        exc_info=True,
-    )
-
-
-async def _error_logging_middleware(
-    request: Request,
-    call_next: RequestResponseEndpoint,
-) -> Response:
-    """Capture unhandled exceptions with request context."""
-    try:
-        return await call_next(request)
-    except HTTPException as http_exc:
-        logger.warning(
-            "HTTPException",
-            extra={
-                "request_id": _get_request_id(request),
-                "path": request.url.path,
-                "method": request.method,
-                "status_code": http_exc.status_code,
-                "error_type": http_exc.__class__.__name__,
-            },
-            exc_info=False,
-        )
-        raise
-    except Exception as exc:  # noqa: BLE001
-        _log_api_error(
-            "Unhandled API error",
-            request=request,
-            exc=exc,
-            logger_obj=logger,
-        )
-        return JSONResponse(
-            status_code=500,
-            content={
-                "detail": "Internal server error",
-                "request_id": _get_request_id(request),
-            },
-        )
-
-
-async def _performance_logging_middleware(
-    request: Request,
-    call_next: RequestResponseEndpoint,
-) -> Response:
-    """요청 처리 시간 로깅 (디버깅용)."""
-    from time import perf_counter
-
-    start = perf_counter()
-    response = await call_next(request)
-    duration_ms = (perf_counter() - start) * 1000
-
-    # 느린 요청만 로깅 (>100ms)
-    if duration_ms > 100:
-        logger.warning(
-            "Slow request",
-            extra={
-                "path": request.url.path,
-                "method": request.method,
-                "duration_ms": duration_ms,
-                "request_id": _get_request_id(request),
-            },
-        )
-
-    response.headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
-    return response
-
-
 # 정적 파일 & 템플릿 경로
 REPO_ROOT = Path(__file__).resolve().parents[2]
 # Alias for backward compatibility with tests
@@ -220,7 +116,12 @@ def get_config() -> AppConfig:
 
 
 # 헬스 체크 인스턴스
-health_checker = HealthChecker(version=os.getenv("APP_VERSION", "dev"))
+health_checker = HealthChecker(
+    version=os.getenv("APP_VERSION", "dev"),
+    default_interval=float(
+        os.getenv("HEALTH_CHECK_INTERVAL_SECONDS", str(DEFAULT_CHECK_INTERVAL))
+    ),
+)
 # Module-level config object (backward compatible name)
 config: AppConfig = get_config()
 
@@ -264,22 +165,23 @@ generate_single_qa_with_retry = qa_router_module.generate_single_qa_with_retry
 
 
 async def _init_health_checks() -> None:
-    """Register health checks based on environment."""
+    """Register health checks based on environment.
+
+    Neo4j/Redis 체크는 풀 연결을 재사용하는 프로브로 등록되며,
+    lifespan 에서 ``health_checker.start()`` 로 백그라운드 갱신됩니다.
+    """
     await asyncio.sleep(0)
     if os.getenv("NEO4J_URI"):
         health_checker.register_check(
             "neo4j",
-            lambda: check_neo4j_with_params(
+            Neo4jProbe(
                 os.getenv("NEO4J_URI", ""),
                 os.getenv("NEO4J_USER", "neo4j"),
                 os.getenv("NEO4J_PASSWORD", ""),
             ),
         )
     if os.getenv("REDIS_URL"):
-        health_checker.register_check(
-            "redis",
-            lambda: check_redis_with_url(os.getenv("REDIS_URL", "")),
-        )
+        health_checker.register_check("redis", RedisProbe(os.getenv("REDIS_URL", "")))
     if os.getenv("GEMINI_API_KEY"):
         health_checker.register_check("gemini", check_gemini_api)
 
@@ -416,8 +318,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     await init_resources()
     await _init_health_checks()
+    health_checker.start()
     yield
 
+    await health_checker.stop()
+
     # Cleanup: Stop log listener on shutdown
     if _log_listener is not None:
         _log_listener.stop()
@@ -435,10 +340,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.add_middleware(BaseHTTPMiddleware, dispatch=session_middleware(session_manager))
-app.add_middleware(BaseHTTPMiddleware, dispatch=_request_id_middleware)
-app.add_middleware(BaseHTTPMiddleware, dispatch=_error_logging_middleware)
-app.add_middleware(BaseHTTPMiddleware, dispatch=_performance_logging_middleware)
+app.add_middleware(SessionMiddleware, manager=session_manager)
+# request-id, 타이밍, 에러 로깅, HTTP 메트릭을 한 번에 처리 (최외곽)
+app.add_middleware(ObservabilityMiddleware)
 
 # 정적 파일 & 템플릿
 app.mount("/static", StaticFiles(directory=str(REPO_ROOT / "static")), name="static")
@@ -461,6 +365,7 @@ app.include_router(analysis_router)
 
 __all__ = [
     "DEFAULT_ANSWER_RULES",
+    "REQUEST_ID_HEADER",
     "CrossValidationSystem",
     "app",
     "config",
@@ -0,0 +1,183 @@
+"""관측성 ASGI 미들웨어.
+
+request-id 전파, 응답 시간 측정, 미처리 예외 로깅, Prometheus 기록을
+하나의 순수 ASGI 레이어에서 처리합니다. ``BaseHTTPMiddleware`` 와 달리
+응답을 태스크/메모리 스트림으로 감싸지 않으므로 SSE 스트리밍 응답의
+청크가 그대로 클라이언트로 전달됩니다.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Collection
+from time import perf_counter
+from uuid import uuid4
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infra.telemetry import begin_span, end_span, mark_trace_error, rename_span
+from src.monitoring.metrics import record_http_request, route_label
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID_HEADER = "X-Request-Id"
+RESPONSE_TIME_HEADER = "X-Response-Time"
+# 이 시간(ms)보다 첫 응답 헤더가 늦으면 "Slow request" 경고를 남깁니다.
+SLOW_REQUEST_MS = 100.0
+
+
+def get_request_id(request: Request) -> str:
+    """request.state 에 저장된 request-id (없으면 빈 문자열)."""
+    return getattr(request.state, "request_id", "")
+
+
+def log_api_error(
+    message: str,
+    *,
+    request: Request,
+    exc: Exception,
+    logger_obj: logging.Logger,
+) -> None:
+    """Log structured error with request context."""
+    logger_obj.error(
+        message,
+        extra={
+            "request_id": getattr(request.state, "request_id", ""),
+            "path": request.url.path,
+            "method": request.method,
+            "client": getattr(request.client, "host", ""),
+            "user_agent": request.headers.get("user-agent", ""),
+            "error_type": exc.__class__.__name__,
+        },
+        exc_info=True,
+    )
+
+
+class ObservabilityMiddleware:
+    """request-id, 타이밍, 에러 캡처, HTTP 메트릭을 한 번에 처리하는 ASGI 미들웨어.
+
+    - ``X-Request-Id`` 헤더를 재사용하거나 새로 발급해 ``request.state`` 와
+      응답 헤더에 넣습니다.
+    - ``X-Response-Time`` 은 응답 헤더가 나가는 시점까지의 시간(TTFB)입니다.
+    - Prometheus 에는 경로 대신 라우트 템플릿(``/api/items/{id}``)을 라벨로
+      기록해 카디널리티를 제한합니다.
+    - 요청 경로 이름의 루트 스팬을 열어 경로별 헤드 샘플링을 적용하고,
+      5xx 응답은 tail 샘플링에서 보존되도록 표시합니다.
+
+    Args:
+        app: 감쌀 ASGI 애플리케이션
+        slow_request_ms: 느린 요청 경고 임계값 (ms)
+        metrics_exclude: 메트릭 기록에서 제외할 경로
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        slow_request_ms: float = SLOW_REQUEST_MS,
+        metrics_exclude: Collection[str] = ("/metrics",),
+    ) -> None:
+        """Initialize the middleware."""
+        self.app = app
+        self.slow_request_ms = slow_request_ms
+        self.metrics_exclude = frozenset(metrics_exclude)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process one ASGI connection."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER) or uuid4().hex
+        scope.setdefault("state", {})["request_id"] = request_id
+        start = perf_counter()
+        status_code = 500
+        headers_sent = False
+        # 원시 경로는 샘플링 키와 속성으로만 쓰고, 스팬 이름은 라우팅 후
+        # 라우트 템플릿으로 정해 이름 카디널리티를 제한합니다.
+        span = begin_span(
+            f"HTTP {scope['method']}",
+            {"http.method": scope["method"], "http.target": scope["path"]},
+            sample_key=scope["path"],
+        )
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, headers_sent
+            if message["type"] == "http.response.start":
+                headers_sent = True
+                status_code = message["status"]
+                elapsed_ms = (perf_counter() - start) * 1000
+                headers = MutableHeaders(scope=message)
+                headers[REQUEST_ID_HEADER] = request_id
+                headers[RESPONSE_TIME_HEADER] = f"{elapsed_ms:.2f}ms"
+                if elapsed_ms > self.slow_request_ms:
+                    logger.warning(
+                        "Slow request",
+                        extra={
+                            "path": scope["path"],
+                            "method": scope["method"],
+                            "duration_ms": elapsed_ms,
+                            "request_id": request_id,
+                        },
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except HTTPException as http_exc:
+            status_code = http_exc.status_code
+            logger.warning(
+                "HTTPException",
+                extra={
+                    "request_id": request_id,
+                    "path": scope["path"],
+                    "method": scope["method"],
+                    "status_code": http_exc.status_code,
+                    "error_type": http_exc.__class__.__name__,
+                },
+                exc_info=False,
+            )
+            raise
+        except Exception as exc:
+            log_api_error(
+                "Unhandled API error",
+                request=Request(scope),
+                exc=exc,
+                logger_obj=logger,
+            )
+            if headers_sent:
+                raise
+            response = JSONResponse(
+                status_code=500,
+                content={
+                    "detail": "Internal server error",
+                    "request_id": request_id,
+                },
+            )
+            await response(scope, receive, send_wrapper)
+        finally:
+            if span is not None:
+                rename_span(span, f"{scope['method']} {route_label(scope)}")
+                if status_code >= 500:
+                    mark_trace_error()
+                end_span(span)
+            if scope["path"] not in self.metrics_exclude:
+                record_http_request(
+                    method=scope["method"],
+                    route=route_label(scope),
+                    status_code=status_code,
+                    duration_seconds=perf_counter() - start,
+                )
+
+
+__all__ = [
+    "REQUEST_ID_HEADER",
+    "RESPONSE_TIME_HEADER",
+    "ObservabilityMiddleware",
+    "get_request_id",
+    "log_api_error",
+]
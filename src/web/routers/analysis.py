@@ -8,6 +8,7 @@ Provides API endpoints for:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -32,12 +33,7 @@ async def run_semantic_analysis(
 
     from neo4j import GraphDatabase
 
-    from src.analysis.semantic import (
-        count_keywords,
-        create_topics,
-        fetch_blocks,
-        link_blocks_to_topics,
-    )
+    from src.analysis.semantic import run_semantic_pipeline
 
     uri = os.getenv("NEO4J_URI")
     user = os.getenv("NEO4J_USER")
@@ -48,23 +44,22 @@ async def run_semantic_analysis(
 
     try:
         driver = GraphDatabase.driver(uri, auth=(user, password))
-        blocks = fetch_blocks(driver)
-
-        if not blocks:
+        try:
+            summary = await asyncio.to_thread(
+                run_semantic_pipeline, driver, top_k=top_k
+            )
+        finally:
+            driver.close()
+
+        if not summary["blocks_processed"]:
             return {"status": "no_data", "message": "No blocks found"}
 
-        contents = [b["content"] for b in blocks if b.get("content")]
-        keyword_counter = count_keywords(contents)
-        keywords = keyword_counter.most_common(top_k)
-
-        create_topics(driver, keywords)
-        link_blocks_to_topics(driver, blocks, keywords)
-        driver.close()
-
+        keywords = summary["keywords"]
         return {
             "status": "success",
             "topics_created": len(keywords),
-            "blocks_processed": len(blocks),
+            "blocks_processed": summary["blocks_processed"],
+            "links_created": summary["links"],
             "top_keywords": keywords[:10],
         }
     except Exception as exc:
@@ -1,17 +1,16 @@
 # mypy: allow-untyped-decorators
-"""Logs streaming API via WebSocket - Optimized with aiofiles."""
+"""Logs streaming API via WebSocket - shared incremental tailer per log file."""
 
 from __future__ import annotations
 
-import asyncio
 import contextlib
 import logging
 from pathlib import Path
 
-import aiofiles
-import aiofiles.os
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from src.infra.log_tailer import get_log_tailer
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/ws", tags=["logs"])
@@ -23,25 +22,6 @@ def _get_log_file_path() -> Path:
     return repo_root / "app.log"
 
 
-async def _read_file_content(path: Path) -> str:
-    """Read file content asynchronously using aiofiles."""
-    async with aiofiles.open(path, mode="r", encoding="utf-8", errors="replace") as f:
-        return await f.read()
-
-
-async def _read_file_range(path: Path, start: int, end: int) -> str:
-    """Read a range of bytes from file asynchronously."""
-    async with aiofiles.open(path, mode="r", encoding="utf-8", errors="replace") as f:
-        await f.seek(start)
-        return await f.read(end - start)
-
-
-async def _get_file_size(path: Path) -> int:
-    """Get file size asynchronously."""
-    stat = await aiofiles.os.stat(path)
-    return stat.st_size
-
-
 async def _tail_log_file(
     websocket: WebSocket,
     log_path: Path,
@@ -49,60 +29,51 @@ async def _tail_log_file(
 ) -> None:
     """Stream log file content to WebSocket client.
 
+    Initial lines come from a reverse seek; updates come from the shared
+    ``LogTailer`` for the file, so concurrent viewers share one reader.
+
     Args:
         websocket: WebSocket connection
         log_path: Path to log file
-        buffer_size: Maximum lines to keep in buffer
+        buffer_size: Maximum lines to send initially
     """
     if not log_path.exists():
         await websocket.send_json({"type": "error", "message": "Log file not found"})
         return
 
-    # Send initial content (last N lines)
-    try:
-        content = await _read_file_content(log_path)
-        lines = content.splitlines()
-        initial_lines = lines[-buffer_size:] if len(lines) > buffer_size else lines
-
-        await websocket.send_json(
-            {
-                "type": "initial",
-                "lines": initial_lines,
-                "total_lines": len(lines),
-            }
-        )
-    except Exception as e:
-        await websocket.send_json({"type": "error", "message": str(e)})
-        return
-
-    # Track file position for new content
-    last_size = await _get_file_size(log_path)
-
-    # Stream new content
+    tailer = get_log_tailer(log_path)
+    queue = tailer.subscribe()
     try:
+        # Send initial content (last N lines)
+        try:
+            initial_lines, has_more = await tailer.read_initial(buffer_size)
+            await websocket.send_json(
+                {
+                    "type": "initial",
+                    "lines": initial_lines,
+                    "total_lines": len(initial_lines),
+                    "truncated": has_more,
+                }
+            )
+        except Exception as e:
+            await websocket.send_json({"type": "error", "message": str(e)})
+            return
+
+        # Stream appended lines as the tailer publishes them
         while True:
-            await asyncio.sleep(1)  # Poll every second
-
-            current_size = await _get_file_size(log_path)
-            if current_size > last_size:
-                # Read new content using aiofiles
-                new_content = await _read_file_range(log_path, last_size, current_size)
-                if new_content:
-                    new_lines = new_content.splitlines()
-                    await websocket.send_json(
-                        {
-                            "type": "update",
-                            "lines": new_lines,
-                        }
-                    )
-                last_size = current_size
-            elif current_size < last_size:
-                # File was truncated or rotated
-                last_size = 0
+            new_lines = await queue.get()
+            if new_lines is None:
+                await websocket.send_json(
+                    {"type": "error", "message": "Log tailing stopped"}
+                )
+                return
+            await websocket.send_json({"type": "update", "lines": new_lines})
     except WebSocketDisconnect:
         pass  # Normal disconnection
     except Exception as e:
         logger.warning("Log streaming error: %s", e)
+    finally:
+        tailer.unsubscribe(queue)
 
 
 @router.websocket("/logs")
@@ -13,6 +13,7 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 
 from src.config.constants import QA_BATCH_TYPES, QA_BATCH_TYPES_THREE
+from src.infra.retry import deadline_scope
 from src.web.models import GenerateQARequest
 
 # Import sub-routers
@@ -73,7 +74,8 @@ _T = TypeVar("_T")
 
 
 async def _await_with_qa_timeout(coro: Awaitable[_T]) -> _T:
-    with anyio.fail_after(_get_config().qa_single_timeout):
+    timeout = _get_config().qa_single_timeout
+    with deadline_scope(timeout), anyio.fail_after(timeout):
         return await coro
 
 
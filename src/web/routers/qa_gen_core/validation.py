@@ -9,6 +9,7 @@ from checks.detect_forbidden_patterns import (
     find_formatting_violations,
     find_violations,
 )
+from src.analysis.cross_validation import get_cross_validator
 from src.web.utils import strip_prose_bold
 
 logger = logging.getLogger(__name__)
@@ -51,7 +52,7 @@ def _collect_kg_rule_violations(
     if kg_wrapper is None or validator_class is None:
         return []
     try:
-        validator = validator_class(kg_wrapper)
+        validator = get_cross_validator(kg_wrapper, validator_class)
         rule_check = validator._check_rule_compliance(
             draft_answer,
             normalized_qtype,
@@ -17,7 +17,6 @@ from datetime import datetime
 from typing import Any, TypeAlias, cast
 
 from fastapi import APIRouter, HTTPException
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.agent import GeminiAgent
 from src.config.constants import (
@@ -25,6 +24,7 @@ from src.config.constants import (
     QA_BATCH_TYPES,
     QA_BATCH_TYPES_THREE,
 )
+from src.infra.retry import RetryBudget, RetryEngine, RetryPolicy, deadline_scope
 from src.web.models import GenerateQARequest
 from src.web.response import APIMetadata, build_response
 from src.web.semantic_cache import semantic_answer_cache
@@ -107,10 +107,11 @@ async def _generate_first_pair(
 ) -> tuple[dict[str, Any], str]:
     single_timeout = _get_config().qa_single_timeout
     try:
-        pair = await asyncio.wait_for(
-            generate_single_qa_with_retry(agent, ocr_text, qtype),
-            timeout=single_timeout,
-        )
+        with deadline_scope(single_timeout):
+            pair = await asyncio.wait_for(
+                generate_single_qa_with_retry(agent, ocr_text, qtype),
+                timeout=single_timeout,
+            )
         return pair, pair.get("query", "")
     except Exception as exc:  # noqa: BLE001
         return _fallback_pair(qtype, exc), ""
@@ -236,10 +237,12 @@ async def _process_single_request(
 ) -> dict[str, Any]:
     if not body.qtype:
         raise HTTPException(status_code=400, detail="qtype이 필요합니다.")
-    pair = await asyncio.wait_for(
-        generate_single_qa(agent, ocr_text, body.qtype),
-        timeout=_get_config().qa_single_timeout,
-    )
+    single_timeout = _get_config().qa_single_timeout
+    with deadline_scope(single_timeout):
+        pair = await asyncio.wait_for(
+            generate_single_qa(agent, ocr_text, body.qtype),
+            timeout=single_timeout,
+        )
     duration = (datetime.now() - start).total_seconds()
     meta = APIMetadata(duration=duration)
     return cast(
@@ -264,10 +267,12 @@ async def api_generate_qa(body: GenerateQARequest) -> dict[str, Any]:
     try:
         start = datetime.now()
         if body.mode in {"batch", "batch_three"}:
-            return await asyncio.wait_for(
-                _process_batch_request(body, current_agent, ocr_text, start),
-                timeout=_get_config().qa_batch_timeout,
-            )
+            batch_timeout = _get_config().qa_batch_timeout
+            with deadline_scope(batch_timeout):
+                return await asyncio.wait_for(
+                    _process_batch_request(body, current_agent, ocr_text, start),
+                    timeout=batch_timeout,
+                )
         return await _process_single_request(body, current_agent, ocr_text, start)
 
     except HTTPException:
@@ -283,11 +288,14 @@ async def api_generate_qa(body: GenerateQARequest) -> dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"생성 실패: {e!s}")
 
 
-@retry(
-    stop=stop_after_attempt(2),  # 1번 시도 + 1번 재시도
-    wait=wait_exponential(multiplier=1, min=2, max=10),
-    reraise=True,
+# 1번 시도 + 1번 재시도. 요청 마감(deadline_scope) 안에서만 재시도합니다.
+_qa_retry = RetryEngine(
+    RetryPolicy(max_attempts=2, base_delay=2.0, max_delay=10.0),
+    budget=RetryBudget(),
+    name="qa_generation",
 )
+
+
 async def generate_single_qa_with_retry(
     agent: GeminiAgent,
     ocr_text: str,
@@ -296,8 +304,10 @@ async def generate_single_qa_with_retry(
     explanation_answer: str | None = None,
 ) -> dict[str, Any]:
     """재시도 로직이 있는 QA 생성 래퍼."""
-    return await generate_single_qa(
-        agent, ocr_text, qtype, previous_queries, explanation_answer
+    return await _qa_retry.run(
+        lambda: generate_single_qa(
+            agent, ocr_text, qtype, previous_queries, explanation_answer
+        )
     )
 
 
@@ -4,7 +4,9 @@
 엔드포인트:
 - POST /api/qa/validate - QA 쌍 교차 검증
 - POST /api/qa/route - 질의 유형 자동 선택
+- GET /api/qa/route/stats - 라우팅 지표 (LLM 생략률, 지연 백분위)
 - GET /api/qa/suggest-next - 다음 질의 유형 추천
+- GET /api/qa/autocomplete - 입력 접두사 자동 완성
 """
 
 from __future__ import annotations
@@ -21,6 +23,9 @@ logger = logging.getLogger(__name__)
 _KG_NOT_AVAILABLE_ERROR = "Knowledge graph not available"
 _NEO4J_REQUIRED_MESSAGE = "Neo4j 연결 필요"
 
+# QueryType 캐시, 사전 분류기, RoutingLog 버퍼를 요청 간에 공유합니다.
+_graph_router: Any = None
+
 
 @router.post("/validate")
 async def validate_qa_pair(
@@ -90,6 +95,7 @@ async def route_query(user_input: str) -> dict[str, Any]:
     Returns:
         Chosen query type and routing decision
     """
+    global _graph_router
     from src.routing.graph_router import GraphEnhancedRouter
 
     from .qa_common import get_cached_kg
@@ -103,12 +109,15 @@ async def route_query(user_input: str) -> dict[str, Any]:
                 "message": _NEO4J_REQUIRED_MESSAGE,
             }
 
-        graph_router = GraphEnhancedRouter(kg=kg)
+        if _graph_router is None or _graph_router.kg is not kg:
+            if _graph_router is not None:
+                _graph_router.close()
+            _graph_router = GraphEnhancedRouter(kg=kg)
 
         # 간단 핸들러: 선택만 반환 (실제 생성은 별도 API에서)
         handlers: dict[str, Any] = {}
 
-        result = graph_router.route_and_generate(user_input, handlers)
+        result = await _graph_router.aroute_and_generate(user_input, handlers)
         chosen = result.get("choice", "unknown")
 
         logger.info("Query routed: input='%s...' -> %s", user_input[:50], chosen)
@@ -117,6 +126,7 @@ async def route_query(user_input: str) -> dict[str, Any]:
             "success": True,
             "data": {
                 "chosen_type": chosen,
+                "source": result.get("source"),
                 "user_input": user_input[:200],
             },
             "message": f"질의 유형: {chosen}",
@@ -130,6 +140,22 @@ async def route_query(user_input: str) -> dict[str, Any]:
         }
 
 
+@router.get("/route/stats")
+async def route_stats() -> dict[str, Any]:
+    """라우팅 지표 (LLM 생략률, 라우팅 지연 p50/p95/p99).
+
+    Returns:
+        Routing statistics of the shared router, or zeros before first use
+    """
+    if _graph_router is None:
+        from src.routing.routing_log import RoutingStats
+
+        stats = RoutingStats().snapshot()
+    else:
+        stats = _graph_router.stats.snapshot()
+    return {"success": True, "data": stats, "message": "라우팅 지표"}
+
+
 @router.get("/suggest-next")
 async def suggest_next_query_type(session: str = "[]") -> dict[str, Any]:
     """다음 질의 유형 추천 (현재 세션 기반).
@@ -183,4 +209,47 @@ async def suggest_next_query_type(session: str = "[]") -> dict[str, Any]:
         }
 
 
+@router.get("/autocomplete")
+async def autocomplete(prefix: str, limit: int = 10) -> dict[str, Any]:
+    """입력 접두사 자동 완성 (질의 유형, 규칙 키워드, 성공 질의).
+
+    메모리 인덱스에서만 응답하며 그래프 갱신은 백그라운드에서 진행됩니다.
+
+    Args:
+        prefix: 현재까지 입력한 텍스트 (한글 조합 중 입력, 초성 지원)
+        limit: 최대 후보 수
+
+    Returns:
+        Ranked suggestions
+    """
+    from dataclasses import asdict
+
+    from src.features.autocomplete import SmartAutocomplete
+
+    from .qa_common import get_cached_kg
+
+    try:
+        kg = get_cached_kg()
+        if kg is None:
+            return {
+                "success": False,
+                "error": _KG_NOT_AVAILABLE_ERROR,
+                "message": _NEO4J_REQUIRED_MESSAGE,
+            }
+
+        suggestions = SmartAutocomplete(kg).suggest(prefix, limit=limit)
+        return {
+            "success": True,
+            "data": {"suggestions": [asdict(s) for s in suggestions]},
+            "message": f"{len(suggestions)}개 자동 완성 후보",
+        }
+    except Exception as exc:  # noqa: BLE001
+        logger.error("Failed to autocomplete: %s", exc)
+        return {
+            "success": False,
+            "error": str(exc),
+            "message": "자동 완성 실패",
+        }
+
+
 __all__ = ["router"]
@@ -9,7 +9,9 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from fastapi import Request, Response
+from starlette.datastructures import MutableHeaders
 from starlette.middleware.base import RequestResponseEndpoint
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
 @dataclass
@@ -121,3 +123,48 @@ def session_middleware(
         return response
 
     return _middleware
+
+
+class SessionMiddleware:
+    """Pure ASGI variant of ``session_middleware``.
+
+    Attaches the session to ``request.state`` and appends the session cookie
+    to the response start message, so streaming responses are not buffered.
+    """
+
+    def __init__(self, app: ASGIApp, manager: SessionManager) -> None:
+        """Initialize with the wrapped app and session store."""
+        self.app = app
+        self.manager = manager
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process one ASGI connection."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        session_id = request.cookies.get("session_id") or request.headers.get(
+            "X-Session-Id",
+        )
+        session = self.manager.get_or_create(session_id)
+        scope.setdefault("state", {})["session"] = session
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                cookie = Response()
+                cookie.set_cookie(
+                    "session_id",
+                    session.session_id,
+                    httponly=True,
+                    samesite="strict",
+                    secure=True,
+                    max_age=self.manager.ttl_seconds,
+                )
+                headers = MutableHeaders(scope=message)
+                for key, value in cookie.raw_headers:
+                    if key == b"set-cookie":
+                        headers.append("set-cookie", value.decode("latin-1"))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
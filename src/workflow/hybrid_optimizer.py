@@ -12,7 +12,12 @@ from src.agent.core import GeminiAgent
 
 # 기존 features 패키지의 LATS 재사용
 from src.features.lats import LATSSearcher, SearchState
-from src.workflow.mcts_optimizer import MCTSWorkflowOptimizer
+from src.workflow.mcts_optimizer import (
+    MCTSWorkflowOptimizer,
+    PrefixCache,
+    RolloutScorer,
+    WorkflowStep,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,17 +28,45 @@ class HybridWorkflowOptimizer:
     or MCTS (Fast Optimization).
     """
 
-    def __init__(self, agent: GeminiAgent, templates: list[str]):
+    def __init__(
+        self,
+        agent: GeminiAgent,
+        templates: list[str],
+        *,
+        stages: list[list[str]] | None = None,
+        step: WorkflowStep | None = None,
+        scorer: RolloutScorer | None = None,
+        mcts_iterations: int = 20,
+        mcts_batch_size: int = 1,
+        prefix_cache: PrefixCache | None = None,
+    ):
         """Initialize the hybrid workflow optimizer.
 
         Args:
             agent: The Gemini agent for content generation.
             templates: List of template names available for optimization.
+            stages: Options for MCTS decisions after the template choice.
+            step: Runs one workflow stage for MCTS rollouts (memoized).
+            scorer: Scores a finished MCTS rollout.
+            mcts_iterations: MCTS rollouts per optimization.
+            mcts_batch_size: MCTS rollouts evaluated concurrently per wave.
+            prefix_cache: Prefix store shared by every MCTS optimization.
         """
         self.agent = agent
         # LATSSearcher 초기화 (llm_provider로 agent.llm_provider 사용)
         self.lats = LATSSearcher(llm_provider=agent.llm_provider)
-        self.mcts = MCTSWorkflowOptimizer(agent, templates)
+        # 같은 질의의 반복 최적화는 캐시된 prefix 결과를 재사용
+        self.prefix_cache = prefix_cache if prefix_cache is not None else PrefixCache()
+        self.mcts = MCTSWorkflowOptimizer(
+            agent,
+            templates,
+            iterations=mcts_iterations,
+            stages=stages,
+            step=step,
+            scorer=scorer,
+            batch_size=mcts_batch_size,
+            prefix_cache=self.prefix_cache,
+        )
 
     async def optimize(
         self,
@@ -81,8 +114,10 @@ class HybridWorkflowOptimizer:
         return {
             "optimizer": "MCTS",
             "best_template": result["best_template"],
+            "best_config": result.get("best_config", [result["best_template"]]),
             "score": result["score"],
             "strategy": "Template Selection",
+            "stats": result.get("stats", {}),
         }
 
     def _detect_complexity(self, query: str) -> str:
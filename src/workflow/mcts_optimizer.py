@@ -3,12 +3,24 @@
 Implements Monte Carlo Tree Search (MCTS) to optimize prompt templates and workflow parameters
 by exploring the search space of possible configurations and selecting the most promising ones
 based on simulated or actual rewards (e.g., latency, quality score).
+
+A workflow configuration is one decision per stage (template first, then e.g.
+parameters). When a ``step`` runner is given, each rollout executes the stages
+in order and the output of every configuration prefix is memoized in a
+content-addressed ``PrefixCache`` keyed by the prefix and the input hash, so
+rollouts sharing a prefix reuse its upstream LLM steps. Leaves are evaluated in
+waves of ``batch_size`` concurrent rollouts.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 import math
 import random
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
@@ -16,6 +28,11 @@ from src.agent.core import GeminiAgent
 
 logger = logging.getLogger(__name__)
 
+# (config prefix, query, upstream output) -> output of the prefix's last stage
+WorkflowStep = Callable[[tuple[str, ...], str, Any], Awaitable[Any]]
+# (full config, final output) -> reward
+RolloutScorer = Callable[[tuple[str, ...], Any], Awaitable[float]]
+
 
 @dataclass
 class MCTSNode:
@@ -33,6 +50,16 @@ class MCTSNode:
         """Calculate the average reward for this node."""
         return self.total_reward / self.visits if self.visits > 0 else 0.0
 
+    @property
+    def path(self) -> tuple[str, ...]:
+        """Decisions from the root to this node (root excluded)."""
+        states: list[str] = []
+        node: MCTSNode | None = self
+        while node is not None and node.parent is not None:
+            states.append(node.state)
+            node = node.parent
+        return tuple(reversed(states))
+
     def ucb1(self, exploration_weight: float = 1.414) -> float:
         """Calculate the UCB1 score for node selection.
 
@@ -51,6 +78,107 @@ class MCTSNode:
         )
 
 
+@dataclass
+class OptimizerStats:
+    """Throughput and reuse counters for one optimization run."""
+
+    rollouts: int = 0
+    waves: int = 0
+    prefix_lookups: int = 0
+    prefix_hits: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rollouts_per_minute(self) -> float:
+        """Completed rollouts per minute of wall-clock time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.rollouts * 60.0 / self.elapsed_seconds
+
+    @property
+    def cache_reuse_ratio(self) -> float:
+        """Share of prefix evaluations served from the cache."""
+        if not self.prefix_lookups:
+            return 0.0
+        return self.prefix_hits / self.prefix_lookups
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the counters as a plain dict for logging and results."""
+        return {
+            "rollouts": self.rollouts,
+            "waves": self.waves,
+            "prefix_lookups": self.prefix_lookups,
+            "prefix_hits": self.prefix_hits,
+            "rollouts_per_minute": round(self.rollouts_per_minute, 1),
+            "cache_reuse_ratio": round(self.cache_reuse_ratio, 3),
+        }
+
+
+class PrefixCache:
+    """Content-addressed store for outputs of workflow configuration prefixes.
+
+    Keys hash the decision prefix together with the input, so entries can be
+    shared by every optimizer working on the same query. Concurrent requests
+    for the same key wait for the single in-flight computation.
+
+    Args:
+        max_entries: Least recently used entries beyond this are evicted.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        """Initialize an empty cache."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    @staticmethod
+    def make_key(kind: str, prefix: tuple[str, ...], input_hash: str) -> str:
+        """Return the content address of a prefix result."""
+        raw = json.dumps([kind, list(prefix), input_hash], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> tuple[Any, bool]:
+        """Return the cached value for ``key`` or compute and store it.
+
+        Returns:
+            (value, hit) - ``hit`` is True when no computation was started.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key], True
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending), True
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # Waiters re-raise; mark retrieved so an unobserved error is not logged.
+                future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        self._entries[key] = value
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value, False
+
+
 class MCTSWorkflowOptimizer:
     """MCTS implementation for fast template/parameter selection."""
 
@@ -59,6 +187,13 @@ class MCTSWorkflowOptimizer:
         agent: GeminiAgent,
         available_templates: list[str],
         iterations: int = 20,
+        *,
+        stages: list[list[str]] | None = None,
+        step: WorkflowStep | None = None,
+        scorer: RolloutScorer | None = None,
+        batch_size: int = 1,
+        prefix_cache: PrefixCache | None = None,
+        seed: int | None = None,
     ):
         """Initialize the MCTS workflow optimizer.
 
@@ -66,31 +201,69 @@ class MCTSWorkflowOptimizer:
             agent: The Gemini agent for content generation.
             available_templates: List of template names to explore.
             iterations: Number of MCTS iterations to run.
+            stages: Options for decisions after the template choice.
+            step: Runs one workflow stage; enables memoized prefix execution.
+            scorer: Scores a finished rollout (defaults to a float output).
+            batch_size: Rollouts evaluated concurrently per wave.
+            prefix_cache: Shared prefix store (a private one is created if None).
+            seed: Seed for rollout and simulated rewards.
         """
         self.agent = agent
         self.templates = available_templates
         self.iterations = iterations
+        self.stages = [available_templates, *(stages or [])]
+        self.step = step
+        self.scorer = scorer
+        self.batch_size = max(1, batch_size)
+        self.prefix_cache = prefix_cache if prefix_cache is not None else PrefixCache()
+        self.stats = OptimizerStats()
+        self._rng = random.Random(seed)
 
     async def optimize_workflow(self, query: str) -> dict[str, Any]:
         """Run MCTS to find the best template for the query."""
         root = MCTSNode(state="ROOT", untried_actions=self.templates.copy())
+        self.stats = OptimizerStats()
+        started = time.perf_counter()
+
+        remaining = self.iterations
+        while remaining > 0:
+            wave: list[MCTSNode] = []
+            for _ in range(min(self.batch_size, remaining)):
+                node = self._select(root)
+                if node.untried_actions:
+                    node = self._expand(node)
+                # Count the pending rollout now so the next selection in this
+                # wave prefers other branches (virtual loss).
+                self._add_visit(node)
+                wave.append(node)
+            rewards = await asyncio.gather(
+                *(self._simulate(node, query) for node in wave)
+            )
+            for node, reward in zip(wave, rewards):
+                self._add_reward(node, reward)
+            remaining -= len(wave)
+            self.stats.waves += 1
 
-        for _ in range(self.iterations):
-            node = self._select(root)
-            if node.untried_actions:
-                node = self._expand(node)
-            reward = await self._simulate(node, query)
-            self._backpropagate(node, reward)
+        self.stats.rollouts = self.iterations
+        self.stats.elapsed_seconds = time.perf_counter() - started
+        logger.info("MCTS optimizer stats: %s", self.stats.as_dict())
 
         # Best child is the one with highest visit count (robustness)
         best_node = (
             max(root.children, key=lambda n: n.visits) if root.children else root
         )
+        best_config: list[str] = []
+        node = root
+        while node.children:
+            node = max(node.children, key=lambda n: n.visits)
+            best_config.append(node.state)
 
         return {
             "best_template": best_node.state,
+            "best_config": best_config,
             "score": best_node.avg_reward,
             "iterations": self.iterations,
+            "stats": self.stats.as_dict(),
         }
 
     def _select(self, node: MCTSNode) -> MCTSNode:
@@ -100,14 +273,24 @@ class MCTSWorkflowOptimizer:
 
     def _expand(self, node: MCTSNode) -> MCTSNode:
         action = node.untried_actions.pop()
-        child = MCTSNode(state=action, parent=node, untried_actions=[])
+        depth = len(node.path) + 1
+        next_options = self.stages[depth] if depth < len(self.stages) else []
+        child = MCTSNode(state=action, parent=node, untried_actions=list(next_options))
         node.children.append(child)
         return child
 
-    async def _simulate(self, node: MCTSNode, _: str) -> float:
+    def _rollout_config(self, node: MCTSNode) -> tuple[str, ...]:
+        """Complete the node's prefix with random choices for later stages."""
+        path = node.path
+        tail = [self._rng.choice(opts) for opts in self.stages[len(path) :] if opts]
+        return (*path, *tail)
+
+    async def _simulate(self, node: MCTSNode, query: str) -> float:
         """Simulate execution: In reality, this might use a lighter model or cache."""
         await asyncio.sleep(0)
         try:
+            if self.step is not None:
+                return await self._run_rollout(self._rollout_config(node), query)
             template_name = node.state
             # 실제 API 호출 대신 가벼운 시뮬레이션 또는 캐시된 결과 사용 권장
             # 여기서는 예시로 Agent 호출 (실제 구현 시 비용 고려 필요)
@@ -115,14 +298,66 @@ class MCTSWorkflowOptimizer:
 
             # Mock Reward Calculation (비용/길이 기반)
             # 실제로는 결과의 품질을 평가하는 로직이 필요함
-            latency_sim = random.uniform(0.5, 2.0) * (1.0 + len(template_name) / 1000)
+            latency_sim = self._rng.uniform(0.5, 2.0) * (
+                1.0 + len(template_name) / 1000
+            )
             return 1.0 / latency_sim  # 단순 예시: 빠를수록 높은 점수
-        except Exception:
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Rollout failed: %s", e)
             return 0.0
 
-    def _backpropagate(self, node: MCTSNode, reward: float) -> None:
+    async def _run_rollout(self, config: tuple[str, ...], query: str) -> float:
+        """Execute a configuration stage by stage, reusing memoized prefixes."""
+        assert self.step is not None
+        step = self.step
+        input_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        output: Any = None
+        for depth in range(1, len(config) + 1):
+            prefix = config[:depth]
+            upstream = output
+
+            async def run_stage(
+                prefix: tuple[str, ...] = prefix,
+                upstream: Any = upstream,
+            ) -> Any:
+                return await step(prefix, query, upstream)
+
+            output = await self._memoized("step", prefix, input_hash, run_stage)
+
+        async def score() -> float:
+            if self.scorer is not None:
+                return await self.scorer(config, output)
+            return float(output)
+
+        reward: float = await self._memoized("score", config, input_hash, score)
+        return reward
+
+    async def _memoized(
+        self,
+        kind: str,
+        prefix: tuple[str, ...],
+        input_hash: str,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        key = PrefixCache.make_key(kind, prefix, input_hash)
+        value, hit = await self.prefix_cache.get_or_compute(key, compute)
+        self.stats.prefix_lookups += 1
+        if hit:
+            self.stats.prefix_hits += 1
+        return value
+
+    def _add_visit(self, node: MCTSNode) -> None:
         current: MCTSNode | None = node
         while current:
             current.visits += 1
+            current = current.parent
+
+    def _add_reward(self, node: MCTSNode, reward: float) -> None:
+        current: MCTSNode | None = node
+        while current:
             current.total_reward += reward
             current = current.parent
+
+    def _backpropagate(self, node: MCTSNode, reward: float) -> None:
+        self._add_visit(node)
+        self._add_reward(node, reward)
@@ -6,9 +6,10 @@ from pathlib import Path
 import pytest
 from jinja2 import DictLoader, Environment
 
-from src.agent import GeminiAgent
+from src.agent import CostTracker, GeminiAgent
 from src.config.exceptions import BudgetExceededError
 from src.config import AppConfig
+from src.infra.budget import RedisBudgetLedger
 
 VALID_API_KEY = "AIza" + "D" * 35
 
@@ -56,3 +57,74 @@ def test_budget_warning_logs(caplog: pytest.LogCaptureFixture, tmp_path: Path) -
 def test_budget_ok(tmp_path: Path) -> None:
     agent = _agent_with_budget(1_000, 1_000, budget=1000.0, tmp_path=tmp_path)
     agent.check_budget()  # should not raise
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, float] = {}
+
+    def incrbyfloat(self, key: str, amount: float) -> float:
+        self.values[key] = self.values.get(key, 0.0) + amount
+        return self.values[key]
+
+    def get(self, key: str) -> str | None:
+        value = self.values.get(key)
+        return None if value is None else str(value)
+
+
+def test_shared_ledger_enforces_budget_across_trackers(tmp_path: Path) -> None:
+    redis_client = _FakeRedis()
+    config = _config(tmp_path, budget=0.015)
+    workers = [
+        CostTracker(config, ledger=RedisBudgetLedger(redis_client, "b"))
+        for _ in range(2)
+    ]
+
+    workers[0].add_tokens(10_000, 1_000)  # 호출당 $0.0055
+    workers[1].add_tokens(10_000, 1_000)
+    workers[0].check_budget()
+
+    workers[1].add_tokens(10_000, 1_000)  # 워커 단독 $0.011, 전체 $0.0165
+    with pytest.raises(BudgetExceededError, match="Shared cost"):
+        workers[1].check_budget()
+    assert redis_client.values["b"] == pytest.approx(
+        sum(w.get_total_cost() for w in workers)
+    )
+
+
+class _DownRedis:
+    def __init__(self) -> None:
+        self.up = False
+        self.values: dict[str, float] = {}
+
+    def incrbyfloat(self, key: str, amount: float) -> float:
+        if not self.up:
+            raise ConnectionError("redis down")
+        self.values[key] = self.values.get(key, 0.0) + amount
+        return self.values[key]
+
+    def get(self, key: str) -> str | None:
+        if not self.up:
+            raise ConnectionError("redis down")
+        value = self.values.get(key)
+        return None if value is None else str(value)
+
+
+def test_ledger_outage_uses_session_cost(tmp_path: Path) -> None:
+    redis_client = _DownRedis()
+    tracker = CostTracker(
+        _config(tmp_path, budget=0.01),
+        ledger=RedisBudgetLedger(redis_client, "b", retry_after=0),
+    )
+
+    tracker.add_tokens(10_000, 1_000)  # $0.0055
+    tracker.check_budget()
+    assert tracker.get_spent_cost() == pytest.approx(tracker.get_total_cost())
+
+    tracker.add_tokens(10_000, 1_000)  # 세션 $0.011
+    with pytest.raises(BudgetExceededError, match="Session cost"):
+        tracker.check_budget()
+
+    redis_client.up = True
+    tracker.add_tokens(1, 0)  # 밀린 증가분까지 한 번에 반영
+    assert redis_client.values["b"] == pytest.approx(tracker.get_total_cost())
@@ -135,7 +135,17 @@ def test_dynamic_example_selector(monkeypatch: pytest.MonkeyPatch) -> None:
                     return list(self_inner)
 
             if "RETURN e.text AS example" in query:
-                return _Result([{"example": "ex", "rate": 0.9, "usage": 0}])
+                return _Result(
+                    [
+                        {
+                            "example": "ex",
+                            "rate": 0.9,
+                            "usage": 0,
+                            "has_table": True,
+                            "density": 0.9,
+                        }
+                    ]
+                )
             if "SET e.usage_count" in query:
                 self.updated.append(str(params.get("text", "")))
                 return _Result([])
@@ -0,0 +1,149 @@
+"""Tests for ErrorPattern snapshots and batched novelty in CrossValidationSystem."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from src.analysis.cross_validation import (
+    CrossValidationSystem,
+    ErrorPatternSnapshot,
+    get_cross_validator,
+)
+
+
+class _Graph:
+    def __init__(self) -> None:
+        self.patterns = [
+            {"pattern": r"\d{4}년 현재", "description": "시의성 표현"},
+            {"pattern": "[invalid", "description": "broken"},
+        ]
+        self.fetches = 0
+
+    @contextmanager
+    def session(self) -> Iterator[Any]:
+        yield self
+
+    def run(self, query: str, **_params: Any) -> list[dict[str, Any]]:
+        assert "MATCH (e:ErrorPattern)" in query
+        self.fetches += 1
+        return [dict(p) for p in self.patterns]
+
+
+class _Embeddings:
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [[float(len(t))] for t in texts]
+
+
+class _VectorStore:
+    """Mimics Neo4jVector.query with one similarity score per embedding."""
+
+    index_name = "rule_embeddings"
+
+    def __init__(self) -> None:
+        self.embeddings = _Embeddings()
+        self.calls: list[dict[str, Any]] = []
+
+    def query(self, query: str, *, params: dict[str, Any]) -> list[dict[str, Any]]:
+        assert "db.index.vector.queryNodes" in query
+        self.calls.append(params)
+        return [
+            {"i": row["i"], "score": 0.99 if row["embedding"][0] == 3 else 0.5}
+            for row in params["rows"]
+        ]
+
+
+class _KG:
+    def __init__(self, graph: _Graph, store: Any = None) -> None:
+        self.graph_session = graph.session
+        self._vector_store = store
+
+    def get_constraints_for_query_type(self, _qt: str) -> list[dict[str, str]]:
+        return [{"type": "prohibition", "pattern": "금지", "description": "금지어"}]
+
+
+class TestErrorPatternSnapshot:
+    """Test compiled ErrorPattern caching."""
+
+    def test_snapshot_is_reused_within_interval(self) -> None:
+        graph = _Graph()
+        cvs = CrossValidationSystem(_KG(graph))  # type: ignore[arg-type]
+
+        first = cvs._check_rule_compliance("2024년 현재 금지 표현", "explanation")
+        cvs._check_rule_compliance("문제 없음", "explanation")
+
+        assert first["violations"] == ["금지어", "시의성 표현"]
+        assert graph.fetches == 1
+
+    def test_recompiles_only_when_patterns_change(self) -> None:
+        graph = _Graph()
+        cvs = CrossValidationSystem(_KG(graph), pattern_check_interval=0)  # type: ignore[arg-type]
+
+        cvs._collect_error_pattern_violations("x")
+        snapshot = cvs._snapshot
+        assert isinstance(snapshot, ErrorPatternSnapshot)
+        assert len(snapshot.patterns) == 1  # invalid regex skipped
+
+        cvs._collect_error_pattern_violations("x")
+        assert graph.fetches == 2
+        assert cvs._snapshot is not None
+        assert cvs._snapshot.patterns is snapshot.patterns
+
+        graph.patterns.append({"pattern": "최근", "description": "모호한 시점"})
+        assert cvs._collect_error_pattern_violations("최근 동향") == ["모호한 시점"]
+        assert cvs._snapshot.version != snapshot.version
+
+    def test_keeps_previous_snapshot_on_failure(self) -> None:
+        graph = _Graph()
+        cvs = CrossValidationSystem(_KG(graph))  # type: ignore[arg-type]
+        cvs._collect_error_pattern_violations("x")
+
+        def broken(*_args: Any, **_kwargs: Any) -> Any:
+            raise RuntimeError("down")
+
+        graph.run = broken  # type: ignore[method-assign]
+        cvs.invalidate_error_patterns()
+        assert cvs._collect_error_pattern_violations("2020년 현재") == ["시의성 표현"]
+
+
+class TestValidateMany:
+    """Test batched novelty lookups."""
+
+    def test_single_vector_query_for_all_pairs(self) -> None:
+        store = _VectorStore()
+        cvs = CrossValidationSystem(_KG(_Graph(), store))  # type: ignore[arg-type]
+        pairs = [
+            {"question": "abc", "answer": "abc 답", "query_type": "reasoning"},
+            {"question": "다른 질문", "answer": "답", "query_type": "target"},
+        ]
+
+        results = cvs.validate_many(pairs)
+
+        assert len(store.calls) == 1
+        assert len(store.calls[0]["rows"]) == 2
+        assert results[0]["novelty"] == {"score": 0.3, "too_similar": True}
+        assert results[1]["novelty"]["novel"] is True
+        assert (
+            results[0]["overall_score"]
+            == cvs.cross_validate_qa_pair("abc", "abc 답", "reasoning", {})[
+                "overall_score"
+            ]
+        )
+
+    def test_vector_failure_marks_all_unknown(self) -> None:
+        store = _VectorStore()
+        store.query = None  # type: ignore[assignment,method-assign]
+        cvs = CrossValidationSystem(_KG(_Graph(), store))  # type: ignore[arg-type]
+
+        results = cvs.validate_many([{"question": "q1"}, {"question": "q2"}])
+
+        assert [r["novelty"]["note"] for r in results] == ["유사도 조회 실패"] * 2
+
+
+def test_get_cross_validator_is_shared_per_kg() -> None:
+    kg = _KG(_Graph())
+
+    first = get_cross_validator(kg)
+    assert get_cross_validator(kg) is first
+    assert get_cross_validator(_KG(_Graph())) is not first
@@ -206,9 +206,18 @@ class TestHybridWorkflowOptimizerInit:
             patch("src.workflow.hybrid_optimizer.LATSSearcher"),
             patch("src.workflow.hybrid_optimizer.MCTSWorkflowOptimizer") as mock_mcts,
         ):
-            HybridWorkflowOptimizer(mock_agent, templates)
-
-            mock_mcts.assert_called_once_with(mock_agent, templates)
+            opt = HybridWorkflowOptimizer(mock_agent, templates, mcts_batch_size=4)
+
+            mock_mcts.assert_called_once_with(
+                mock_agent,
+                templates,
+                iterations=20,
+                stages=None,
+                step=None,
+                scorer=None,
+                batch_size=4,
+                prefix_cache=opt.prefix_cache,
+            )
 
 
 class TestHybridOptimizerDetectComplexity:
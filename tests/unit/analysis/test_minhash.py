@@ -0,0 +1,159 @@
+"""Tests for src/analysis/minhash.py and MinHash-based document comparison."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from typing_extensions import Self
+
+from src.analysis import document_compare
+from src.analysis.minhash import (
+    LSHIndex,
+    MinHasher,
+    cluster_signatures,
+    estimate_jaccard,
+    normalize_content,
+    shingles,
+)
+
+BASE = "답변은 반드시 존댓말로 작성하고 표의 수치를 그대로 인용해야 합니다"
+
+
+class TestMinHasher:
+    """Test shingling and signatures."""
+
+    def test_normalization_and_shingles(self) -> None:
+        assert normalize_content("  A\n\tB  ") == "a b"
+        assert shingles("") == set()
+        assert len(shingles("abc")) == 1
+        assert shingles("Hello  World") == shingles("hello world")
+
+    def test_signature_is_deterministic(self) -> None:
+        first, second = MinHasher(), MinHasher()
+
+        assert first.signature(BASE) == second.signature(BASE)
+        assert first.content_key(BASE) == second.content_key(f" {BASE} ")
+        assert MinHasher(num_perm=32).content_key(BASE) != first.content_key(BASE)
+        with pytest.raises(ValueError):
+            MinHasher(num_perm=0)
+
+    def test_similarity_tracks_overlap(self) -> None:
+        hasher = MinHasher(num_perm=128)
+        near = hasher.signature(BASE + ".")
+        far = hasher.signature("전혀 다른 내용의 블록으로 공통 shingle이 거의 없습니다")
+        base = hasher.signature(BASE)
+
+        assert estimate_jaccard(base, near) > 0.8
+        assert estimate_jaccard(base, far) < 0.2
+        with pytest.raises(ValueError):
+            estimate_jaccard(base, near[:10])
+
+
+class TestLSH:
+    """Test banded bucketing and clustering."""
+
+    def test_candidate_pairs_share_a_band(self) -> None:
+        index = LSHIndex(bands=2)
+        index.add(0, [1, 2, 3, 4])
+        index.add(1, [1, 2, 9, 9])
+        index.add(2, [7, 7, 3, 4])
+        index.add(3, [8, 8, 8, 8])
+
+        assert sorted(index.candidate_pairs()) == [(0, 1), (0, 2)]
+        with pytest.raises(ValueError):
+            index.add(4, [1, 2, 3])
+
+    def test_cluster_signatures_verifies_candidates(self) -> None:
+        hasher = MinHasher()
+        texts = [BASE, BASE + "!", "완전히 무관한 설명 블록입니다 " * 3, BASE.upper()]
+
+        clusters = cluster_signatures([hasher.signature(t) for t in texts])
+
+        assert clusters == [[0, 1, 3]]
+
+
+class _Result(list[Any]):
+    pass
+
+
+class _Graph:
+    """Serves block rows and records signature writes."""
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self.writes: list[dict[str, Any]] = []
+
+    def session(self) -> _Session:
+        return _Session(self)
+
+
+class _Session:
+    def __init__(self, graph: _Graph) -> None:
+        self.graph = graph
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def run(self, query: str, **params: Any) -> _Result:
+        assert "CONTAINS" not in query
+        if "minhash_key AS minhash_key" in query:
+            return _Result(
+                r for r in self.graph.rows if len(r["content"]) > params["min_length"]
+            )
+        if "SET b.minhash" in query:
+            self.graph.writes.extend(params["rows"])
+        return _Result()
+
+
+def _row(title: str, block_id: str, content: str, **stored: Any) -> dict[str, Any]:
+    return {
+        "title": title,
+        "id": block_id,
+        "content": content,
+        "minhash": stored.get("minhash"),
+        "minhash_key": stored.get("minhash_key"),
+    }
+
+
+class TestFindCommonContent:
+    """Test document_compare.find_common_content."""
+
+    def test_groups_near_duplicates_across_pages(self) -> None:
+        graph = _Graph(
+            [
+                _row("A", "a1", BASE),
+                _row("B", "b1", BASE),
+                _row("C", "c1", BASE + "!"),
+                _row("A", "a2", "A 페이지에만 있는 충분히 긴 고유한 문장입니다"),
+                _row("B", "b2", "짧음"),
+            ]
+        )
+
+        commons = document_compare.find_common_content(graph, limit=5)  # type: ignore[arg-type]
+
+        assert commons == [(BASE, ["A", "B", "C"])]
+        assert {w["id"] for w in graph.writes} == {"a1", "b1", "c1", "a2"}
+
+    def test_reuses_stored_signatures(self) -> None:
+        hasher = MinHasher()
+        key = hasher.content_key(BASE)
+        stored = list(hasher.signature(BASE))
+        graph = _Graph(
+            [
+                _row("A", "a1", BASE, minhash=stored, minhash_key=key),
+                _row("B", "b1", BASE, minhash=stored, minhash_key=key),
+            ]
+        )
+
+        class _NoCompute(MinHasher):
+            def signature(self, text: str) -> Any:
+                raise AssertionError("stored signature should be reused")
+
+        commons = document_compare.find_common_content(graph, hasher=_NoCompute())  # type: ignore[arg-type]
+
+        assert commons == [(BASE, ["A", "B"])]
+        assert graph.writes == []
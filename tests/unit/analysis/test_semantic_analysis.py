@@ -104,3 +104,103 @@ def test_main_env_missing_exits(
     )
     with pytest.raises(SystemExit):
         sa.main()
+
+
+class _PagedDriver:
+    """Serves keyset pages over in-memory blocks and records link writes."""
+
+    def __init__(self, blocks: list[dict[str, str]]) -> None:
+        self.blocks = blocks
+        self.page_queries: list[dict[str, Any]] = []
+        self.links: list[dict[str, str]] = []
+        self.topics: list[dict[str, Any]] = []
+
+    def session(self) -> Any:
+        driver = self
+
+        class _Tx:
+            def run(self, query: str, **params: Any) -> None:
+                if "TAGGED_WITH" in query:
+                    driver.links.extend(params["links"])
+                else:
+                    driver.topics.extend(params["topics"])
+
+        class _Session:
+            def __enter__(self) -> Any:
+                return self
+
+            def __exit__(self, *_exc: object) -> None:
+                return None
+
+            def run(self, _query: str, **params: Any) -> list[dict[str, Any]]:
+                driver.page_queries.append(params)
+                rows = [
+                    {"key": i, **b}
+                    for i, b in enumerate(driver.blocks)
+                    if i > params["after"]
+                ]
+                return rows[: params["limit"]]
+
+            def execute_write(self, fn: Any, *args: Any) -> None:
+                fn(_Tx(), *args)
+
+        return _Session()
+
+
+def test_space_saving_keeps_heavy_hitters_in_bounded_memory() -> None:
+    sketch = sa.SpaceSaving(capacity=10)
+    stream = []
+    for i in range(500):
+        stream.extend(["alpha", "beta", f"noise{i}"])
+        if i % 2 == 0:
+            stream.append("gamma")
+
+    sketch.update(stream)
+
+    assert len(sketch) <= 10
+    top = sketch.most_common(3)
+    assert [w for w, _ in top] == ["alpha", "beta", "gamma"]
+    assert top[0][1] >= 500
+
+
+def test_topic_matcher_matches_whole_tokens_only() -> None:
+    matcher = sa.compile_topic_matcher(["apple", "사과"])
+    assert matcher is not None
+
+    text = "Apple pineapple apples 사과나무 사과, apple's"
+    assert matcher.findall(text.lower()) == ["apple", "사과"]
+    assert sa.compile_topic_matcher([]) is None
+
+
+def test_iter_blocks_uses_keyset_pages() -> None:
+    blocks = [{"id": f"b{i}", "content": f"content {i}"} for i in range(5)]
+    driver = _PagedDriver(blocks)
+
+    assert list(sa.iter_blocks(driver, page_size=2)) == blocks  # type: ignore[arg-type]
+    assert [q["after"] for q in driver.page_queries] == [-1, 1, 3]
+
+
+def test_run_semantic_pipeline_streams_and_links(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from src.analysis import semantic as analysis_semantic
+
+    monkeypatch.setattr(analysis_semantic, "MIN_FREQ", 2)
+    monkeypatch.setattr(analysis_semantic, "REL_BATCH_SIZE", 1)
+    blocks = [
+        {"id": "b1", "content": "graph database graph"},
+        {"id": "b2", "content": "database schema"},
+        {"id": "b3", "content": "unrelated words"},
+    ]
+    driver = _PagedDriver(blocks)
+
+    summary = sa.run_semantic_pipeline(driver, top_k=5, page_size=2)  # type: ignore[arg-type]
+
+    assert summary["blocks_processed"] == 3
+    assert dict(summary["keywords"]) == {"graph": 2, "database": 2}
+    assert {(link["block_id"], link["topic"]) for link in driver.links} == {
+        ("b1", "graph"),
+        ("b1", "database"),
+        ("b2", "database"),
+    }
+    assert summary["links"] == 3
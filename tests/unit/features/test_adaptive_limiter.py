@@ -7,7 +7,11 @@ import asyncio
 
 import pytest
 
-from src.infra.adaptive_limiter import AdaptiveRateLimiter, AdaptiveStats
+from src.infra.adaptive_limiter import (
+    AdaptiveRateLimiter,
+    AdaptiveStats,
+    LimiterPriority,
+)
 
 
 class TestAdaptiveStats:
@@ -192,3 +196,132 @@ class TestAdaptiveRateLimiter:
 
         # After window_size requests, avg_latency should be updated
         assert limiter.stats.avg_latency >= 0.1
+
+
+class TestWaiterQueue:
+    """Tests for event-driven, FIFO and prioritized slot hand-off."""
+
+    @pytest.mark.asyncio
+    async def test_fifo_within_priority(self) -> None:
+        """Waiters of the same priority are served in arrival order."""
+        limiter = AdaptiveRateLimiter(initial_concurrency=1, window_size=100)
+        order: list[int] = []
+        gate = asyncio.Event()
+
+        async def holder() -> None:
+            async with limiter.acquire():
+                await gate.wait()
+
+        async def worker(i: int) -> None:
+            async with limiter.acquire():
+                order.append(i)
+
+        first = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        tasks = []
+        for i in range(5):
+            tasks.append(asyncio.create_task(worker(i)))
+            await asyncio.sleep(0)
+        assert limiter.waiting == 5
+
+        gate.set()
+        await asyncio.gather(first, *tasks)
+        assert order == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_interactive_preempts_batch(self) -> None:
+        """Queued interactive callers are granted before queued batch callers."""
+        limiter = AdaptiveRateLimiter(initial_concurrency=1, window_size=100)
+        order: list[str] = []
+        gate = asyncio.Event()
+
+        async def holder() -> None:
+            async with limiter.acquire():
+                await gate.wait()
+
+        async def worker(name: str, priority: LimiterPriority) -> None:
+            async with limiter.acquire(priority):
+                order.append(name)
+
+        first = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(worker("batch", LimiterPriority.BATCH)),
+            asyncio.create_task(worker("qa", LimiterPriority.INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+
+        gate.set()
+        await asyncio.gather(first, *tasks)
+        assert order == ["qa", "batch"]
+
+    @pytest.mark.asyncio
+    async def test_limit_increase_wakes_waiters(self) -> None:
+        """A raised limit grants queued callers without waiting for release."""
+        limiter = AdaptiveRateLimiter(initial_concurrency=1, window_size=100)
+        gate = asyncio.Event()
+        entered = asyncio.Event()
+
+        async def holder() -> None:
+            async with limiter.acquire():
+                await gate.wait()
+
+        async def waiter() -> None:
+            async with limiter.acquire():
+                entered.set()
+
+        first = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        second = asyncio.create_task(waiter())
+        await asyncio.sleep(0)
+        assert not entered.is_set()
+
+        limiter._latencies = [0.01]
+        limiter._update_limits()
+        await asyncio.wait_for(entered.wait(), timeout=1)
+
+        gate.set()
+        await asyncio.gather(first, second)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self) -> None:
+        """Cancelling a queued caller neither leaks nor steals a slot."""
+        limiter = AdaptiveRateLimiter(initial_concurrency=1, window_size=100)
+        gate = asyncio.Event()
+
+        async def holder() -> None:
+            async with limiter.acquire():
+                await gate.wait()
+
+        async def waiter() -> None:
+            async with limiter.acquire():
+                pass
+
+        first = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(waiter())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        assert limiter.waiting == 0
+        gate.set()
+        await first
+        assert limiter._active_count == 0
+
+
+def test_gradient_uses_min_rtt_and_p90() -> None:
+    """Inflated p90 relative to the windowed min RTT shrinks the limit."""
+    limiter = AdaptiveRateLimiter(initial_concurrency=8, target_latency=10.0)
+
+    limiter._latencies = [0.1] * 9 + [5.0]
+    limiter._update_limits()
+    assert limiter.current_limit == 9  # p90 == min RTT: additive increase
+    assert limiter.stats.min_rtt == 0.1
+    assert limiter.stats.p90_latency == 0.1
+
+    limiter._latencies = [0.2] * 10
+    limiter._update_limits()
+    assert limiter.stats.min_rtt == 0.1  # earlier window still counts
+    assert limiter.current_limit == 6  # gradient 0.75
@@ -38,6 +38,7 @@ from src.graph.entities import (
     Person,
     Relationship,
 )
+from src.infra.neo4j_bulk import BulkLoadStats
 
 
 @pytest.fixture
@@ -465,9 +466,22 @@ class TestData2NeoExtractor:
                 FeaturesRelationship(from_id="p1", to_id="o1", type="WORKS_AT"),
             ],
         )
+        mock_graph_provider.bulk_load = AsyncMock(
+            return_value=BulkLoadStats(nodes=2, relationships=1)
+        )
+
         counts = await extractor.import_to_graph(result)
-        assert mock_graph_provider.create_nodes.called
-        assert counts["nodes"] > 0
+
+        assert counts == {"nodes": 2, "relationships": 1}
+        mock_graph_provider.create_nodes.assert_not_called()
+        nodes, rels = mock_graph_provider.bulk_load.await_args.args
+        assert [(b.label, [r["id"] for r in b.rows]) for b in nodes] == [
+            ("Person", ["p1"]),
+            ("Organization", ["o1"]),
+        ]
+        assert [(b.rel_type, b.from_label, b.to_label) for b in rels] == [
+            ("WORKS_AT", "Person", "Organization")
+        ]
 
     @pytest.mark.asyncio
     async def test_extract_and_import(
@@ -1,12 +1,14 @@
 """Tests for Feature Flags."""
 
 import json
+import os
 from pathlib import Path
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
-from src.infra.feature_flags import FeatureFlags
+from src.infra.feature_flags import FeatureFlags, RedisFlagSource
 
 
 @pytest.fixture
@@ -200,58 +202,73 @@ def test_is_enabled_context_rules(
     )
 
 
-def test_check_rules_equals(temp_flags_file: Any) -> None:
+def _rules_match(
+    tmp_path: Path, rules: list[dict[str, Any]], context: dict[str, Any]
+) -> bool:
+    """Evaluate ``rules`` through a flag that only has context rules."""
+    config_file = tmp_path / "rules.json"
+    config_file.write_text(
+        json.dumps({"ruled": {"enabled": True, "rules": rules}}), encoding="utf-8"
+    )
+    return FeatureFlags(config_file=config_file).is_enabled("ruled", context=context)
+
+
+def test_check_rules_equals(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test equals rule operator."""
-    flags = FeatureFlags(config_file=temp_flags_file)
+    monkeypatch.setenv("ENVIRONMENT", "development")
     rules = [{"field": "tier", "operator": "equals", "value": "premium"}]
 
-    assert flags._check_rules(rules, {"tier": "premium"}) is True
-    assert flags._check_rules(rules, {"tier": "basic"}) is False
+    assert _rules_match(tmp_path, rules, {"tier": "premium"}) is True
+    assert _rules_match(tmp_path, rules, {"tier": "basic"}) is False
 
 
-def test_check_rules_not_equals(temp_flags_file: Any) -> None:
+def test_check_rules_not_equals(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test not_equals rule operator."""
-    flags = FeatureFlags(config_file=temp_flags_file)
+    monkeypatch.setenv("ENVIRONMENT", "development")
     rules = [{"field": "tier", "operator": "not_equals", "value": "premium"}]
 
-    assert flags._check_rules(rules, {"tier": "basic"}) is True
-    assert flags._check_rules(rules, {"tier": "premium"}) is False
+    assert _rules_match(tmp_path, rules, {"tier": "basic"}) is True
+    assert _rules_match(tmp_path, rules, {"tier": "premium"}) is False
 
 
-def test_check_rules_greater_than(temp_flags_file: Any) -> None:
+def test_check_rules_greater_than(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test greater_than rule operator."""
-    flags = FeatureFlags(config_file=temp_flags_file)
+    monkeypatch.setenv("ENVIRONMENT", "development")
     rules = [{"field": "score", "operator": "greater_than", "value": 50}]
 
-    assert flags._check_rules(rules, {"score": 75}) is True
-    assert flags._check_rules(rules, {"score": 25}) is False
+    assert _rules_match(tmp_path, rules, {"score": 75}) is True
+    assert _rules_match(tmp_path, rules, {"score": 25}) is False
 
 
-def test_check_rules_less_than(temp_flags_file: Any) -> None:
+def test_check_rules_less_than(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test less_than rule operator."""
-    flags = FeatureFlags(config_file=temp_flags_file)
+    monkeypatch.setenv("ENVIRONMENT", "development")
     rules = [{"field": "score", "operator": "less_than", "value": 50}]
 
-    assert flags._check_rules(rules, {"score": 25}) is True
-    assert flags._check_rules(rules, {"score": 75}) is False
+    assert _rules_match(tmp_path, rules, {"score": 25}) is True
+    assert _rules_match(tmp_path, rules, {"score": 75}) is False
 
 
-def test_check_rules_contains(temp_flags_file: Any) -> None:
+def test_check_rules_contains(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test contains rule operator."""
-    flags = FeatureFlags(config_file=temp_flags_file)
+    monkeypatch.setenv("ENVIRONMENT", "development")
     rules = [{"field": "tags", "operator": "contains", "value": "vip"}]
 
-    assert flags._check_rules(rules, {"tags": "vip,premium"}) is True
-    assert flags._check_rules(rules, {"tags": "basic"}) is False
+    assert _rules_match(tmp_path, rules, {"tags": "vip,premium"}) is True
+    assert _rules_match(tmp_path, rules, {"tags": "basic"}) is False
 
 
-def test_check_rules_in(temp_flags_file: Any) -> None:
+def test_check_rules_in(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test in rule operator."""
-    flags = FeatureFlags(config_file=temp_flags_file)
+    monkeypatch.setenv("ENVIRONMENT", "development")
     rules = [{"field": "region", "operator": "in", "value": ["us", "eu", "asia"]}]
 
-    assert flags._check_rules(rules, {"region": "us"}) is True
-    assert flags._check_rules(rules, {"region": "africa"}) is False
+    assert _rules_match(tmp_path, rules, {"region": "us"}) is True
+    assert _rules_match(tmp_path, rules, {"region": "africa"}) is False
 
 
 def test_get_variant(temp_flags_file: Any, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -357,3 +374,75 @@ def test_save_flags(temp_flags_file: Any) -> None:
     # Reload and verify
     flags2 = FeatureFlags(config_file=temp_flags_file)
     assert flags2.flags["test_feature"]["rollout_percent"] == 25
+
+
+def test_reloads_when_file_changes(
+    temp_flags_file: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that an mtime change swaps in the new evaluation table."""
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    flags = FeatureFlags(config_file=temp_flags_file, reload_interval=0)
+    assert flags.is_enabled("disabled_feature") is False
+
+    config = json.loads(temp_flags_file.read_text(encoding="utf-8"))
+    config["disabled_feature"]["enabled"] = True
+    temp_flags_file.write_text(json.dumps(config), encoding="utf-8")
+    stat = temp_flags_file.stat()
+    os.utime(temp_flags_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert flags.is_enabled("disabled_feature") is True
+
+    temp_flags_file.write_text("{broken", encoding="utf-8")
+    os.utime(temp_flags_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+
+    assert flags.is_enabled("disabled_feature") is True  # 기존 테이블 유지
+
+
+def test_redis_source_shares_updates(
+    temp_flags_file: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that saves publish to Redis and subscribers apply updates."""
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    client = MagicMock()
+    client.get.return_value = json.dumps({"shared": {"enabled": True}})
+    source = RedisFlagSource(client)
+
+    flags = FeatureFlags(config_file=temp_flags_file, source=source)
+
+    assert flags.is_enabled("shared") is True
+    assert flags.is_enabled("test_feature") is False
+    handler = client.pubsub.return_value.subscribe.call_args.kwargs[source.channel]
+
+    handler({"data": json.dumps({"pushed": {"enabled": True}})})
+    assert flags.is_enabled("pushed") is True
+
+    assert flags.disable_flag("pushed") is True
+    client.publish.assert_called_once()
+    assert json.loads(client.publish.call_args.args[1]) == {
+        "pushed": {"enabled": False}
+    }
+
+
+def test_redis_source_ignores_local_file(
+    temp_flags_file: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a configured source is the only source of truth."""
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    client = MagicMock()
+    client.get.return_value = json.dumps({"shared": {"enabled": True}})
+    original = temp_flags_file.read_text(encoding="utf-8")
+    flags = FeatureFlags(
+        config_file=temp_flags_file, source=RedisFlagSource(client), reload_interval=0
+    )
+
+    temp_flags_file.write_text(json.dumps({"local": {"enabled": True}}), "utf-8")
+    stat = temp_flags_file.stat()
+    os.utime(temp_flags_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert flags.is_enabled("local") is False
+    assert flags.is_enabled("shared") is True
+
+    temp_flags_file.write_text(original, encoding="utf-8")
+    assert flags.disable_flag("shared") is True
+    assert temp_flags_file.read_text(encoding="utf-8") == original
+    assert flags.is_enabled("shared") is False
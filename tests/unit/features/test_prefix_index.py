@@ -0,0 +1,193 @@
+"""Tests for src/features/prefix_index.py and SmartAutocomplete.suggest."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from src.features.autocomplete import SmartAutocomplete
+from src.features.prefix_index import (
+    KIND_QUERY,
+    KIND_QUERY_TYPE,
+    KIND_RULE_KEYWORD,
+    PrefixIndex,
+    choseong,
+    decompose_jamo,
+    extract_keywords,
+)
+from src.infra.graph_snapshot import SNAPSHOT_QUERY
+
+
+class TestJamo:
+    """Test Hangul decomposition helpers."""
+
+    def test_decompose_splits_compound_jamo(self) -> None:
+        assert decompose_jamo("닭") == "ㄷㅏㄹㄱ"
+        assert decompose_jamo("과") == "ㄱㅗㅏ"
+        assert decompose_jamo("  AB  c ") == "ab c"
+        assert decompose_jamo("ㄺ") == "ㄹㄱ"
+
+    def test_composing_syllable_is_a_prefix(self) -> None:
+        # "가로"를 입력하는 도중 IME에는 "갈"이 보입니다.
+        assert decompose_jamo("가로").startswith(decompose_jamo("갈"))
+
+    def test_choseong_and_keywords(self) -> None:
+        assert choseong("표 해석") == "ㅍㅎㅅ"
+        assert choseong("abc") == ""
+        assert extract_keywords("표의 수치를 a 그대로") == {"표의", "수치를", "그대로"}
+
+
+class TestPrefixIndex:
+    """Test trie ranking and maintenance."""
+
+    def test_search_ranks_by_weight(self) -> None:
+        index = PrefixIndex()
+        index.add("가로 막대", KIND_RULE_KEYWORD, 2)
+        index.add("가격", KIND_RULE_KEYWORD, 5)
+        index.add("나무", KIND_RULE_KEYWORD, 9)
+
+        assert [s.text for s in index.search("가")] == ["가격", "가로 막대"]
+        assert [s.text for s in index.search("갈")] == ["가로 막대"]
+        assert [s.text for s in index.search("ㄱㄹ")] == ["가로 막대"]
+        assert index.search("다") == []
+        assert index.search("") == []
+
+    def test_cached_top_is_invalidated_on_update(self) -> None:
+        index = PrefixIndex()
+        index.add("table", KIND_RULE_KEYWORD, 1)
+        assert [s.text for s in index.search("t")] == ["table"]
+
+        index.add("tail", KIND_RULE_KEYWORD, 3)
+        index.add("table", KIND_RULE_KEYWORD, 5)
+        assert [s.text for s in index.search("ta")] == ["table", "tail"]
+
+        index.remove("table", KIND_RULE_KEYWORD)
+        assert [s.text for s in index.search("t")] == ["tail"]
+        assert len(index) == 1
+        index.remove("missing", KIND_RULE_KEYWORD)
+
+    def test_queries_match_at_word_starts(self) -> None:
+        index = PrefixIndex()
+        index.add("표의 수치를 설명해줘", KIND_QUERY, 1)
+
+        assert [s.kind for s in index.search("수치")] == [KIND_QUERY]
+        assert index.search("치를") == []
+
+    def test_large_limit_bypasses_cache(self) -> None:
+        index = PrefixIndex()
+        for i in range(30):
+            index.add(f"k{i:02d}", KIND_RULE_KEYWORD, i)
+
+        assert len(index.search("k", limit=25)) == 25
+        assert index.search("k", limit=3)[0].text == "k29"
+
+
+class _Graph:
+    """Answers refresh queries from in-memory rules."""
+
+    def __init__(self, rules: dict[str, str]) -> None:
+        self.rules = rules
+        self.query_types: list[dict[str, Any]] = [
+            {"name": "reasoning", "korean": "추론", "limit": None, "priority": 2},
+            {"name": "explanation", "korean": "설명", "limit": 1, "priority": 1},
+        ]
+        self.examples = [{"text": "추론 근거를 표에서 찾아줘", "usage": 4}]
+        self.examples_updated_at = "2026-10-01T00:00:00"
+        self.queries: list[str] = []
+
+    @contextmanager
+    def session(self) -> Iterator[Any]:
+        yield self
+
+    def run(self, query: str, **params: Any) -> list[dict[str, Any]]:
+        self.queries.append(query)
+        if "RETURN r.id AS id, r.text AS text" in query:
+            return [
+                {"id": i, "text": self.rules[i]}
+                for i in params["ids"]
+                if i in self.rules
+            ]
+        if query == SNAPSHOT_QUERY:
+            return [
+                {
+                    "rule_ids": list(self.rules),
+                    "query_types": [list(qt.values()) for qt in self.query_types],
+                    "examples": len(self.examples),
+                    "examples_updated_at": self.examples_updated_at,
+                }
+            ]
+        if "MATCH (qt:QueryType)" in query:
+            return self.query_types
+        if "MATCH (e:Example)" in query:
+            return self.examples
+        return []
+
+
+class _KG:
+    def __init__(self, graph: _Graph) -> None:
+        self.graph_session = graph.session
+
+
+class TestRefresh:
+    """Test snapshot-driven refresh through SmartAutocomplete."""
+
+    def test_refresh_is_incremental(self) -> None:
+        graph = _Graph({"r1": "수치 반올림 금지", "r2": "수치 단위 표기"})
+        sa = SmartAutocomplete(_KG(graph), index=PrefixIndex())  # type: ignore[arg-type]
+
+        assert sa.refresh_index(background=False) is True
+        top = sa.index.search("수", limit=5)
+        assert top[0].text == "수치" and top[0].weight == 2
+        # 성공 질의(usage 4 + 1)가 질의 유형(priority 2 + 1)보다 앞섭니다.
+        assert [s.kind for s in sa.index.search("추론")] == [
+            KIND_QUERY,
+            KIND_QUERY_TYPE,
+        ]
+
+        queries = len(graph.queries)
+        assert sa.refresh_index(background=False) is False
+        assert len(graph.queries) == queries + 1  # version check only
+
+        del graph.rules["r1"]
+        graph.rules["r3"] = "단위 변환"
+        assert sa.refresh_index(background=False) is True
+        fetched = [q for q in graph.queries if "r.text AS text" in q]
+        assert len(fetched) == 2
+        assert sa.index.search("반올림") == []
+        assert sa.index.search("단위")[0].weight == 2
+        assert sa.index.search("수치")[0].weight == 1
+
+    def test_refresh_picks_up_query_type_and_example_changes(self) -> None:
+        graph = _Graph({"r1": "수치 반올림 금지"})
+        sa = SmartAutocomplete(_KG(graph), index=PrefixIndex())  # type: ignore[arg-type]
+        assert sa.refresh_index(background=False) is True
+
+        graph.query_types.append(
+            {"name": "summary", "korean": "요약", "limit": None, "priority": 0}
+        )
+        assert sa.refresh_index(background=False) is True
+        assert [s.text for s in sa.index.search("요")] == ["요약"]
+
+        graph.examples = [{"text": "요약 길이를 줄여줘", "usage": 0}]
+        graph.examples_updated_at = "2026-10-19T00:00:00"
+        assert sa.refresh_index(background=False) is True
+        assert sa.index.search("추론 근거") == []
+        assert [s.kind for s in sa.index.search("요약")] == [
+            KIND_QUERY_TYPE,
+            KIND_QUERY,
+        ]
+        assert sa.refresh_index(background=False) is False
+
+    def test_suggest_uses_index_after_background_load(self) -> None:
+        graph = _Graph({"r1": "차트 축 라벨"})
+        sa = SmartAutocomplete(_KG(graph), index=PrefixIndex())  # type: ignore[arg-type]
+
+        sa.suggest("차")
+        sa.index.wait_for_refresh(timeout=5)
+        assert [s.text for s in sa.suggest("차트")] == ["차트"]
+
+        graph.queries.clear()
+        suggestions = sa.suggest_next_query_type([{"type": "explanation"}])
+        assert [s["name"] for s in suggestions] == ["reasoning"]
+        assert graph.queries == []
@@ -0,0 +1,186 @@
+"""Tests for src/graph/block_tree.py and bulk rule extraction."""
+
+from __future__ import annotations
+
+import threading
+import types
+from typing import Any
+
+from typing_extensions import Self
+
+from src.graph.block_tree import (
+    BlockForest,
+    BlockRecord,
+    group_page_rules,
+    section_rules,
+)
+from src.graph.builder import QAGraphBuilder
+
+
+def _block(block_id: str, block_type: str, content: str | None, order: int) -> Any:
+    return BlockRecord(id=block_id, type=block_type, content=content, order=order)
+
+
+def _edge(
+    parent: str | None, block_id: str, block_type: str, content: str, order: int
+) -> Any:
+    return {
+        "parent_id": parent,
+        "id": block_id,
+        "type": block_type,
+        "content": content,
+        "order": order,
+    }
+
+
+class TestBlockForest:
+    """Test in-memory tree reconstruction."""
+
+    def test_descendants_in_document_order(self) -> None:
+        forest = BlockForest(
+            [
+                _edge("col", "b", "paragraph", "B", 1),
+                _edge("col", "a", "column", "", 0),
+                _edge("a", "a1", "paragraph", "A1", 0),
+            ]
+        )
+
+        assert [b.id for b in forest.descendants("col")] == ["a", "a1", "b"]
+        assert list(forest.descendants("missing")) == []
+
+    def test_cycles_are_visited_once(self) -> None:
+        forest = BlockForest(
+            [_edge("x", "y", "column", "", 0), _edge("y", "x", "column", "", 0)]
+        )
+
+        assert [b.id for b in forest.descendants("x")] == ["y", "x"]
+
+
+class TestGroupPageRules:
+    """Test heading-to-rule grouping."""
+
+    def test_sections_stop_at_next_heading(self) -> None:
+        blocks = [
+            _block("h1", "heading_1", "자주 틀리는 A", 0),
+            _block("p1", "paragraph", "rule A1", 1),
+            _block("c1", "column_list", None, 2),
+            _block("h2", "heading_1", "자주 틀리는 B", 3),
+            _block("p2", "callout", "rule B1", 4),
+            _block("x", "image", "ignored", 5),
+        ]
+        forest = BlockForest(
+            [
+                _edge("c1", "col", "column", "", 0),
+                _edge("col", "d1", "bulleted_list_item", "nested rule", 0),
+                _edge("col", "d2", "paragraph", "", 1),
+            ]
+        )
+        headings = [{"start_order": 0}, {"start_order": 3}]
+
+        grouped = group_page_rules(blocks, headings, forest)
+
+        assert [rules for _, rules in grouped] == [
+            ["rule A1", "nested rule"],
+            ["rule B1"],
+        ]
+        assert section_rules(blocks, 3, forest) == ["rule B1"]
+
+    def test_unordered_blocks_are_ignored(self) -> None:
+        blocks = [
+            _block("h", "heading_1", "자주 틀리는", 0),
+            BlockRecord(id="n", type="paragraph", content="no order"),
+        ]
+
+        assert section_rules(blocks, 0, BlockForest()) == []
+
+
+class _FakeGraph:
+    """Evaluates the heading and page tree queries over in-memory pages."""
+
+    def __init__(self, pages: dict[str, list[dict[str, Any]]]) -> None:
+        self.pages = pages
+        self.queries: list[str] = []
+        self.threads: set[int] = set()
+        self.written: list[dict[str, Any]] = []
+        self.lock = threading.Lock()
+
+    def session(self) -> Any:
+        return _FakeSession(self)
+
+
+class _FakeSession:
+    def __init__(self, graph: _FakeGraph) -> None:
+        self.graph = graph
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def run(self, query: str, **params: Any) -> Any:
+        with self.graph.lock:
+            self.graph.queries.append(query)
+            self.graph.threads.add(threading.get_ident())
+        if "자주 틀리는" in query:
+            rows = [
+                {"page_id": pid, "start_order": b["order"], "section": b["content"]}
+                for pid, blocks in self.graph.pages.items()
+                for b in blocks
+                if b["parent_id"] is None
+                and b["type"] == "heading_1"
+                and "자주 틀리는" in b["content"]
+            ]
+            return types.SimpleNamespace(data=lambda: rows)
+        if "UNION ALL" in query:
+            return list(self.graph.pages[params["page_id"]])
+        if "MERGE (r:Rule" in query:
+            self.graph.written.extend(params["batch"])
+        return None
+
+
+def _page(page: str, sections: int) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    order = 0
+    for s in range(sections):
+        rows.append(_edge(None, f"{page}h{s}", "heading_1", f"자주 틀리는 {s}", order))
+        rows.append(
+            _edge(None, f"{page}p{s}", "paragraph", f"{page} top rule {s}", order + 1)
+        )
+        rows.append(_edge(None, f"{page}c{s}", "column_list", "", order + 2))
+        rows.append(
+            _edge(f"{page}c{s}", f"{page}d{s}", "callout", f"{page} nested {s}", 0)
+        )
+        order += 3
+    return rows
+
+
+class TestExtractRulesBulk:
+    """Test QAGraphBuilder.extract_rules_from_notion query shape."""
+
+    def _builder(self, graph: _FakeGraph) -> QAGraphBuilder:
+        builder = QAGraphBuilder.__new__(QAGraphBuilder)
+        builder.driver = graph  # type: ignore[assignment]
+        return builder
+
+    def test_one_tree_query_per_page(self) -> None:
+        graph = _FakeGraph({"p1": _page("p1", 20), "p2": _page("p2", 20)})
+
+        self._builder(graph).extract_rules_from_notion(max_workers=1)
+
+        tree_queries = [q for q in graph.queries if "UNION ALL" in q]
+        assert len(tree_queries) == 2
+        assert len(graph.queries) == 4  # headings + 2 pages + rule MERGE
+        texts = [r["text"] for r in graph.written]
+        assert texts[:2] == ["p1 top rule 0", "p1 nested 0"]
+        assert len(texts) == 80
+
+    def test_parallel_pages_keep_heading_order(self) -> None:
+        pages = {f"p{i}": _page(f"p{i}", 3) for i in range(6)}
+        serial, parallel = _FakeGraph(pages), _FakeGraph(pages)
+
+        self._builder(serial).extract_rules_from_notion(max_workers=1)
+        self._builder(parallel).extract_rules_from_notion(max_workers=4)
+
+        assert parallel.written == serial.written
+        assert len(serial.threads) == 1
@@ -127,9 +127,9 @@ class TestQAGraphBuilder:
             with patch("builtins.print"):
                 builder.link_rules_to_constraints()
 
-            # Should run base query + one per keyword + count query
-            expected_calls = 1 + len(CONSTRAINT_KEYWORDS) + 1
-            assert mock_session.run.call_count == expected_calls
+            # Rules fetch + constraints fetch + count query (no pairs to write)
+            assert CONSTRAINT_KEYWORDS
+            assert mock_session.run.call_count == 3
 
     def test_link_rules_to_constraints_no_result(self) -> None:
         """Test link_rules_to_constraints handles None result."""
@@ -208,7 +208,7 @@ class TestQAGraphBuilder:
             with patch("builtins.print"):
                 builder.link_examples_to_rules()
 
-            # With batch processing: DEMONSTRATES + VIOLATES + batch mapping + count = 4 calls
+            # Rules fetch + examples fetch + batch mapping + count = 4 calls
             assert mock_session.run.call_count == 4
 
     def test_link_examples_to_rules_no_result(self) -> None:
@@ -319,7 +319,9 @@ class TestQAGraphBuilder:
             with patch("builtins.print"):
                 builder.link_rules_to_query_types()
 
-            assert mock_session.run.call_count == len(QUERY_TYPE_KEYWORDS)
+            # Single rules fetch; links are matched client-side
+            assert QUERY_TYPE_KEYWORDS
+            assert mock_session.run.call_count == 1
 
 
 class TestRequireEnv:
@@ -374,16 +376,20 @@ class TestExtractRulesFromNotion:
                 }
             ]
 
-            # Mock siblings query - returns iterator of records
+            # Mock page tree query - returns iterator of records
             mock_sibling1 = {
+                "parent_id": None,
                 "id": "b1",
                 "content": "규칙 내용 길이가 10자 이상입니다",
                 "type": "paragraph",
+                "order": 1,
             }
             mock_sibling2 = {
+                "parent_id": None,
                 "id": "b2",
                 "content": "또 다른 규칙입니다 길이가 충분함",
                 "type": "bulleted_list_item",
+                "order": 2,
             }
             mock_siblings_result = MagicMock()
             mock_siblings_result.__iter__ = MagicMock(
@@ -391,12 +397,11 @@ class TestExtractRulesFromNotion:
             )
 
             # Set up the mock to return different results for different queries
-            # First call returns headings, second returns siblings, then MERGE calls return None
+            # First call returns headings, second the page tree, then the rule MERGE
             mock_session.run.side_effect = [
                 mock_headings_result,
                 mock_siblings_result,
-                None,  # First MERGE for rule
-                None,  # Second MERGE for rule
+                None,  # UNWIND MERGE for rules
             ]
 
             from src.graph.builder import QAGraphBuilder
@@ -406,6 +411,12 @@ class TestExtractRulesFromNotion:
             with patch("builtins.print"):
                 builder.extract_rules_from_notion()
 
+            batch = mock_session.run.call_args_list[2].kwargs["batch"]
+            assert [r["text"] for r in batch] == [
+                mock_sibling1["content"],
+                mock_sibling2["content"],
+            ]
+
     def test_extract_rules_skips_short_content(self) -> None:
         """Test extract_rules_from_notion skips content <= 10 chars."""
         with patch("src.graph.builder.GraphDatabase") as mock_gd:
@@ -425,7 +436,15 @@ class TestExtractRulesFromNotion:
             mock_siblings_result = MagicMock()
             mock_siblings_result.__iter__ = MagicMock(
                 return_value=iter(
-                    [{"id": "b1", "content": "짧은", "type": "paragraph"}]
+                    [
+                        {
+                            "parent_id": None,
+                            "id": "b1",
+                            "content": "짧은",
+                            "type": "paragraph",
+                            "order": 1,
+                        }
+                    ]
                 )
             )
 
@@ -438,7 +457,7 @@ class TestExtractRulesFromNotion:
             with patch("builtins.print"):
                 builder.extract_rules_from_notion()
 
-            # Should only call run twice (headings + siblings), no rule creation
+            # Should only call run twice (headings + page tree), no rule creation
             assert mock_session.run.call_count == 2
 
 
@@ -1,10 +1,10 @@
 import pytest
 import types
-from typing import Any
 
 from neo4j.exceptions import Neo4jError
 
 from src.routing.graph_router import GraphEnhancedRouter
+from src.routing.routing_log import RoutingLogWriter
 
 
 class _FakeLLM:
@@ -25,12 +25,15 @@ def test_route_and_generate_match(monkeypatch: pytest.MonkeyPatch) -> None:
             {"name": "summary", "korean": "요약"},
         ],
     )
-    monkeypatch.setattr(router, "_log_routing", lambda input_text, chosen: None)
+    monkeypatch.setattr(
+        router, "log_writer", RoutingLogWriter(lambda: None, flush_interval=60)
+    )
 
     handlers = {"summary": lambda text: f"handled:{text}"}
     result = router.route_and_generate("hello", handlers)
     assert result["choice"] == "summary"
     assert result["output"] == "handled:hello"
+    assert router.log_writer.pending() == 1
 
 
 def test_route_and_generate_fallback_first(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -43,12 +46,15 @@ def test_route_and_generate_fallback_first(monkeypatch: pytest.MonkeyPatch) -> N
             {"name": "summary", "korean": "요약"},
         ],
     )
-    monkeypatch.setattr(router, "_log_routing", lambda input_text, chosen: None)
+    monkeypatch.setattr(
+        router, "log_writer", RoutingLogWriter(lambda: None, flush_interval=60)
+    )
 
     handlers = {"explanation": lambda text: f"exp:{text}"}
     result = router.route_and_generate("world", handlers)
     assert result["choice"] == "explanation"
     assert result["output"] == "exp:world"
+    assert router.log_writer.pending() == 1
 
 
 def test_build_router_prompt_no_qtypes() -> None:
@@ -69,27 +75,3 @@ def test_fetch_query_types_error(monkeypatch: pytest.MonkeyPatch) -> None:
     )
     qtypes = router._fetch_query_types()
     assert qtypes == []
-
-
-def test_log_routing_success_path() -> None:
-    class _GraphSession:
-        def __enter__(self) -> "_GraphSession":
-            return self
-
-        def __exit__(
-            self,
-            exc_type: Any,
-            exc: Any,
-            tb: Any,
-        ) -> None:
-            return None
-
-        def run(self, *_args: Any, **_kwargs: Any) -> None:
-            return None
-
-    fake_graph = types.SimpleNamespace(session=lambda: _GraphSession())
-    router = GraphEnhancedRouter(
-        kg=types.SimpleNamespace(_graph=fake_graph),  # type: ignore[arg-type]
-        llm=_FakeLLM("any"),  # type: ignore[arg-type]
-    )
-    router._log_routing("input", "explanation")  # noqa: SLF001
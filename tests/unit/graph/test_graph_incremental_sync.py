@@ -0,0 +1,130 @@
+"""Tests for incremental rule sync in src/graph/builder.py."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typing_extensions import Self
+
+from src.graph.builder import QAGraphBuilder, main
+
+
+def _rule_id(text: str) -> str:
+    return f"rule_{hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]}"
+
+
+class _Result(list[Any]):
+    def data(self) -> list[Any]:
+        return list(self)
+
+    def single(self) -> Any:
+        return self[0] if self else None
+
+
+class _Session:
+    def __init__(self, existing: set[str]) -> None:
+        self.existing = existing
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def run(self, query: str, **params: Any) -> _Result:
+        self.calls.append((query, params))
+        if "WHERE p.rules_dirty RETURN" in query:
+            return _Result([{"id": "p1"}])
+        if "자주 틀리는" in query:
+            assert params["page_ids"] == ["p1"]
+            return _Result([{"page_id": "p1", "start_order": 0, "section": "S"}])
+        if "UNION ALL" in query:
+            return _Result(
+                {
+                    "parent_id": None,
+                    "id": f"b{order}",
+                    "type": "paragraph",
+                    "content": text,
+                    "order": order,
+                }
+                for order, text in enumerate(
+                    ["unchanged rule text", "brand new rule text"], start=1
+                )
+            )
+        if "MATCH (r:Rule {id: id}) RETURN" in query:
+            return _Result({"id": i} for i in params["ids"] if i in self.existing)
+        if "DETACH DELETE r" in query:
+            return _Result([{"deleted": 1}])
+        return _Result()
+
+    def query(self, fragment: str) -> dict[str, Any]:
+        return next(params for q, params in self.calls if fragment in q)
+
+
+class TestSyncRulesForPages:
+    """Test QAGraphBuilder.sync_rules_for_pages."""
+
+    def _builder(self, session: _Session) -> QAGraphBuilder:
+        builder = QAGraphBuilder.__new__(QAGraphBuilder)
+        builder.driver = MagicMock()
+        builder.driver.session.return_value = session
+        return builder
+
+    def test_links_only_new_rules_and_clears_dirty_flag(self) -> None:
+        session = _Session(existing={_rule_id("unchanged rule text")})
+        builder = self._builder(session)
+        with (
+            patch.object(builder, "link_rules_to_constraints") as constraints,
+            patch.object(builder, "link_rules_to_query_types") as query_types,
+            patch.object(builder, "link_examples_to_rules") as examples,
+            patch("builtins.print"),
+        ):
+            touched = builder.sync_rules_for_pages()
+
+        new_id = _rule_id("brand new rule text")
+        assert touched == {new_id}
+        for link in (constraints, query_types, examples):
+            link.assert_called_once_with(rule_ids={new_id})
+        batch = session.query("MERGE (r:Rule")["batch"]
+        assert {item["page_id"] for item in batch} == {"p1"}
+        stale = session.query("DETACH DELETE r")["pages"]
+        assert stale == [{"page": "p1", "keep": sorted([*session.existing, new_id])}]
+        assert "rules_dirty = false" in session.calls[-1][0]
+
+    def test_no_dirty_pages_is_noop(self) -> None:
+        session = _Session(existing=set())
+        session.run = MagicMock(return_value=_Result())  # type: ignore[method-assign]
+        builder = self._builder(session)
+
+        with patch("builtins.print"):
+            assert builder.sync_rules_for_pages() == set()
+        assert session.run.call_count == 1
+
+    def test_select_rules_filters_ids(self) -> None:
+        rules = {"r1": "a", "r2": "b"}
+
+        assert QAGraphBuilder._select_rules(rules, None) == rules
+        assert QAGraphBuilder._select_rules(rules, {"r2"}) == {"r2": "b"}
+
+
+def test_main_incremental_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NEO4J_URI", "bolt://localhost:7687")
+    monkeypatch.setenv("NEO4J_USER", "neo4j")
+    monkeypatch.setenv("NEO4J_PASSWORD", "password")
+    monkeypatch.setenv("NOTION_SYNC_MODE", "incremental")
+
+    with (
+        patch("src.graph.builder.GraphDatabase"),
+        patch.object(QAGraphBuilder, "sync_rules_for_pages") as sync,
+        patch.object(QAGraphBuilder, "extract_rules_from_notion") as full,
+        patch.object(QAGraphBuilder, "create_schema_constraints"),
+        patch("builtins.print"),
+    ):
+        main()
+
+    sync.assert_called_once_with()
+    full.assert_not_called()
@@ -0,0 +1,179 @@
+"""Tests for src/graph/linking.py and the client-side linking in QAGraphBuilder."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+from src.graph.linking import AhoCorasick, LinkStats, chunked, contains_pairs
+from src.graph.mappings import CONSTRAINT_KEYWORDS
+
+RULES = {
+    "rule_1": "표나 그래프를 참고하라는 질의는 금지합니다.",
+    "rule_2": "질문은 3-4턴 이내로 session_turns 규칙을 따릅니다.",
+    "rule_3": "계산 요청은 한 세션에 한 번만 허용합니다.",
+    "rule_4": "설명문과 요약문을 동시에 요청하지 않습니다.",
+    "rule_5": "Use a TABLE only when asked.",
+}
+CONSTRAINTS = {
+    "session_turns": "세션당 3-4턴",
+    "calculation_limit": "계산 요청은 한 세션에 한 번만 허용합니다.",
+    "table_chart_prohibition": "표/그래프 참조 금지",
+    "explanation_summary_limit": "설명문과 요약문 동시 생성 금지",
+}
+EXAMPLES = {
+    "ex_pos": (
+        "positive",
+        "⭕ 계산 요청은 한 세션에 한 번만 허용합니다. 예: 합계만 묻기",
+    ),
+    "ex_neg": ("negative", "❌ 표나 그래프를 참고하라는 질의는 금지합니다."),
+    "ex_short": ("positive", "Use a TABLE"),
+}
+
+
+def _naive_rule_constraint_links() -> set[tuple[str, str]]:
+    """Python transcription of the former Cypher cross-product queries."""
+    links = {
+        (rid, cid)
+        for rid, text in RULES.items()
+        for cid, desc in CONSTRAINTS.items()
+        if desc in text or cid in text
+    }
+    links |= {
+        (rid, cid)
+        for rid, text in RULES.items()
+        for cid, keywords in CONSTRAINT_KEYWORDS.items()
+        if cid in CONSTRAINTS and any(kw.lower() in text.lower() for kw in keywords)
+    }
+    return links
+
+
+class TestAhoCorasick:
+    """Test AhoCorasick matching semantics."""
+
+    def test_matches_overlapping_patterns(self) -> None:
+        automaton: AhoCorasick[str] = AhoCorasick()
+        for pattern in ("he", "she", "his", "hers"):
+            automaton.add(pattern, pattern)
+
+        assert automaton.search("ushers") == {"he", "she", "hers"}
+
+    def test_case_insensitive_and_empty_pattern(self) -> None:
+        automaton: AhoCorasick[int] = AhoCorasick(case_insensitive=True)
+        automaton.add("Chart", 1)
+        automaton.add("", 2)
+
+        assert automaton.search("see the CHART") == {1, 2}
+        assert automaton.search("nothing") == {2}
+
+    def test_equivalent_to_substring_check(self) -> None:
+        patterns = ["ab", "bab", "a", "abc", "cab", "bca"]
+        automaton: AhoCorasick[str] = AhoCorasick()
+        for pattern in patterns:
+            automaton.add(pattern, pattern)
+
+        for text in ("abcabcab", "bbbb", "cabbca", ""):
+            assert automaton.search(text) == {p for p in patterns if p in text}
+
+
+class TestContainsPairs:
+    """Test contains_pairs against the former cross-product semantics."""
+
+    def test_same_links_as_cartesian_queries(self) -> None:
+        stats = LinkStats("Rule-Constraint", len(RULES), len(CONSTRAINTS))
+        pairs = contains_pairs(
+            RULES, [*CONSTRAINTS.items(), *((c, c) for c in CONSTRAINTS)], stats=stats
+        )
+        pairs |= contains_pairs(
+            RULES,
+            [(c, kw) for c, kws in CONSTRAINT_KEYWORDS.items() for kw in kws],
+            case_insensitive=True,
+            stats=stats,
+        )
+
+        assert pairs == _naive_rule_constraint_links()
+        assert stats.candidate_pairs >= len(pairs)
+        assert stats.cartesian_pairs == len(RULES) * len(CONSTRAINTS)
+
+    def test_chunked_splits_rows(self) -> None:
+        rows = [{"src": str(i), "dst": "x"} for i in range(5)]
+
+        assert [len(c) for c in chunked(rows, 2)] == [2, 2, 1]
+
+
+class _Session:
+    """Fake Neo4j session serving fixture nodes and capturing UNWIND writes."""
+
+    def __init__(self) -> None:
+        self.writes: dict[str, list[dict[str, Any]]] = {}
+
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> Any:
+        return False
+
+    def run(self, query: str, **kwargs: Any) -> Any:
+        if "RETURN r.id AS id, r.text AS text" in query:
+            return [{"id": k, "text": v} for k, v in RULES.items()]
+        if "RETURN c.id AS id, c.description AS text" in query:
+            return [{"id": k, "text": v} for k, v in CONSTRAINTS.items()]
+        if "RETURN e.id AS id" in query:
+            return [
+                {"id": k, "type": t, "text": text} for k, (t, text) in EXAMPLES.items()
+            ]
+        if "item.src" in query:
+            rel = query.split("MERGE")[1].strip()
+            self.writes.setdefault(rel, []).extend(kwargs["batch"])
+            return []
+        return _Single()
+
+
+class _Single:
+    def single(self) -> dict[str, int]:
+        return {"links": 0}
+
+
+def _builder(session: _Session) -> Any:
+    with patch("src.graph.builder.GraphDatabase") as mock_gd:
+        mock_gd.driver.return_value.session.return_value = session
+        from src.graph.builder import QAGraphBuilder
+
+        return QAGraphBuilder("bolt://localhost:7687", "neo4j", "password")
+
+
+def _pairs(rows: list[dict[str, Any]]) -> set[tuple[str, str]]:
+    return {(row["src"], row["dst"]) for row in rows}
+
+
+class TestBuilderLinking:
+    """Test QAGraphBuilder writes the same links as the former queries."""
+
+    def test_rule_constraint_links(self) -> None:
+        session = _Session()
+        with patch("builtins.print"):
+            _builder(session).link_rules_to_constraints()
+
+        assert _pairs(session.writes["(r)-[:ENFORCES]->(c)"]) == (
+            _naive_rule_constraint_links()
+        )
+
+    def test_example_rule_links(self) -> None:
+        session = _Session()
+        with patch("builtins.print"):
+            _builder(session).link_examples_to_rules()
+
+        expected: dict[str, set[tuple[str, str]]] = {
+            "positive": set(),
+            "negative": set(),
+        }
+        for eid, (ex_type, text) in EXAMPLES.items():
+            for rid, rule in RULES.items():
+                if rule in text or text in rule:
+                    expected[ex_type].add((eid, rid))
+
+        assert (
+            _pairs(session.writes["(e)-[:DEMONSTRATES]->(r)"]) == (expected["positive"])
+        )
+        assert _pairs(session.writes["(e)-[:VIOLATES]->(r)"]) == expected["negative"]
+        assert ("ex_short", "rule_5") in expected["positive"]
@@ -30,19 +30,39 @@ def test_graph_schema_builder_runs_with_stubbed_driver(
         def run(self, query: Any, **_kwargs: Any) -> Any:
             if "heading_1" in query and "자주 틀리는" in query:
                 return _Result([{"page_id": "p1", "start_order": 0, "section": "S"}])
-            if "WHERE b.order >" in query:
+            if "UNION ALL" in query:
                 return _Result(
                     [
                         {
+                            "parent_id": None,
                             "id": "b1",
                             "content": "This is a useful rule text",
                             "type": "paragraph",
+                            "order": 1,
+                        },
+                        {
+                            "parent_id": None,
+                            "id": "c1",
+                            "content": None,
+                            "type": "column_list",
+                            "order": 2,
+                        },
+                        {
+                            "parent_id": "c1",
+                            "id": "c2",
+                            "content": "Child rule text is long enough",
+                            "type": "paragraph",
+                            "order": 0,
+                        },
+                        {
+                            "parent_id": None,
+                            "id": "b2",
+                            "content": "Stop",
+                            "type": "heading_1",
+                            "order": 3,
                         },
-                        {"id": "b2", "content": "Stop", "type": "heading_1"},
                     ]
                 )
-            if "MATCH (b:Block {id:" in query:
-                return _Result([{"content": "Child rule text is long enough"}])
             if "RETURN DISTINCT b.content AS text" in query:
                 return _Result([{"text": "⭕ 좋은 예시 텍스트", "type": "positive"}])
             if "RETURN count(" in query:
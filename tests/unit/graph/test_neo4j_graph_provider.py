@@ -123,6 +123,42 @@ class TestNeo4jGraphProviderCreateNodes:
         assert result == 6  # 3 batches * 2 returned per batch
         assert mock_session.run.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_create_nodes_dedupes_keys_across_batches(self) -> None:
+        """A key repeated across batches is written in one batch only."""
+        provider = Neo4jGraphProvider(
+            uri="bolt://localhost:7687",
+            user="neo4j",
+            password="password",
+            batch_size=2,
+        )
+
+        mock_result = AsyncMock()
+        mock_result.single = AsyncMock(return_value={"count": 2})
+
+        mock_session = AsyncMock()
+        mock_session.run = AsyncMock(return_value=mock_result)
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+
+        mock_driver = AsyncMock()
+        mock_driver.session = MagicMock(return_value=mock_session)
+
+        provider._driver = mock_driver
+
+        nodes = [
+            {"id": "1", "name": "Alice"},
+            {"id": "2", "name": "Bob"},
+            {"id": "1", "name": "Alice B."},
+            {"id": "3", "name": "Charlie"},
+        ]
+        await provider.create_nodes(nodes, "Person")
+
+        batches = [c.kwargs["nodes"] for c in mock_session.run.call_args_list]
+        ids = [node["id"] for batch in batches for node in batch]
+        assert sorted(ids) == ["1", "2", "3"]
+        assert {"id": "1", "name": "Alice B."} in batches[0]
+
     @pytest.mark.asyncio
     async def test_create_nodes_with_merge_keys(self) -> None:
         """Uses merge keys correctly in query."""
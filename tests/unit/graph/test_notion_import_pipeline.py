@@ -0,0 +1,193 @@
+"""Tests for incremental sync in notion-neo4j-graph/import_pipeline.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import types
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip("notion_client")
+pytest.importorskip("neo4j")
+pytest.importorskip("dotenv")
+
+_PIPELINE_PATH = (
+    Path(__file__).resolve().parents[3] / "notion-neo4j-graph" / "import_pipeline.py"
+)
+_spec = importlib.util.spec_from_file_location("import_pipeline", _PIPELINE_PATH)
+assert _spec is not None and _spec.loader is not None
+pipeline: Any = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(pipeline)
+
+
+def _paragraph(block_id: str, text: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "id": block_id,
+        "type": "paragraph",
+        "paragraph": {"rich_text": [{"plain_text": text}]},
+        **extra,
+    }
+
+
+def _page(last_edited_time: str = "2026-10-19T00:00:00.000Z") -> dict[str, Any]:
+    return {
+        "id": "page-1",
+        "url": "https://notion.so/page-1",
+        "last_edited_time": last_edited_time,
+        "properties": {"title": {"title": [{"plain_text": "Rules"}]}},
+    }
+
+
+class _Session:
+    def __init__(self, stored: dict[str, str]) -> None:
+        self.stored = stored
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def run(self, query: str, **params: Any) -> Any:
+        self.calls.append((query, params))
+        if "b.hash AS hash" in query:
+            return [{"id": k, "hash": v} for k, v in self.stored.items()]
+        return types.SimpleNamespace(single=lambda: None)
+
+    def close(self) -> None:
+        return None
+
+    def params_for(self, fragment: str) -> list[dict[str, Any]]:
+        return [params for query, params in self.calls if fragment in query]
+
+
+def _importer(session: _Session) -> Any:
+    importer = pipeline.Neo4jAuraImporter.__new__(pipeline.Neo4jAuraImporter)
+    importer.driver = types.SimpleNamespace(session=lambda: session)
+    return importer
+
+
+def _stored_hashes(blocks: list[dict[str, Any]]) -> dict[str, str]:
+    """Hashes a previous import of ``blocks`` would have stored."""
+    importer = _importer(_Session({}))
+    return {b["id"]: b["hash"] for b in importer._flatten_blocks("page1", blocks)}
+
+
+class TestBlockDiff:
+    """Test BlockDiff.compute classification."""
+
+    def test_classifies_insert_update_delete(self) -> None:
+        stored = {"kept": "h1", "edited": "h2", "gone": "h3"}
+        blocks = [
+            {"id": "kept", "hash": "h1"},
+            {"id": "edited", "hash": "h2-new"},
+            {"id": "added", "hash": "h4"},
+        ]
+
+        diff = pipeline.BlockDiff.compute(stored, blocks)
+
+        assert [b["id"] for b in diff.inserts] == ["added"]
+        assert [b["id"] for b in diff.updates] == ["edited"]
+        assert diff.deletes == ["gone"]
+        assert diff.unchanged == 1
+        assert diff.changed
+        assert diff.touched_ids == ["added", "edited"]
+
+    def test_identical_blocks_are_unchanged(self) -> None:
+        blocks = [{"id": "a", "hash": "h1"}, {"id": "b", "hash": "h2"}]
+
+        diff = pipeline.BlockDiff.compute({"a": "h1", "b": "h2"}, blocks)
+
+        assert not diff.changed
+        assert diff.unchanged == 2
+        assert diff.touched_ids == []
+
+
+class TestSyncPage:
+    """Test sync_page writes only the changed blocks."""
+
+    def test_writes_added_changed_and_removed_blocks(self) -> None:
+        before = [
+            _paragraph("a", "same"),
+            _paragraph("b", "old text"),
+            _paragraph("c", "removed"),
+        ]
+        after = [
+            _paragraph("a", "same"),
+            _paragraph("b", "new text"),
+            _paragraph("d", "added"),
+        ]
+        session = _Session(_stored_hashes(before))
+
+        diff = _importer(session).sync_page(_page(), after)
+
+        assert diff.touched_ids == ["d", "b"]
+        assert diff.deletes == ["c"]
+        [deleted] = session.params_for("DETACH DELETE b")
+        assert deleted["ids"] == ["c"]
+        [detached] = session.params_for("DELETE r, m")
+        assert detached["ids"] == ["b"]
+        [created] = session.params_for("MERGE (b:Block {id: block_data.id})")
+        assert [b["id"] for b in created["blocks"]] == ["b", "d"]
+        [page] = session.params_for("MERGE (p:Page {id: $id})")
+        assert page["rules_dirty"] is True
+
+    def test_unchanged_page_writes_no_blocks(self) -> None:
+        blocks = [_paragraph("a", "same", children=[_paragraph("a1", "child")])]
+        session = _Session(_stored_hashes(blocks))
+
+        diff = _importer(session).sync_page(_page(), blocks)
+
+        assert not diff.changed
+        assert diff.unchanged == 2
+        assert session.params_for("MERGE (b:Block {id: block_data.id})") == []
+        [page] = session.params_for("MERGE (p:Page {id: $id})")
+        assert page["rules_dirty"] is False
+
+
+class _Extractor:
+    def __init__(self, page: dict[str, Any]) -> None:
+        self.page = page
+        self.block_requests: list[str] = []
+
+    def get_page(self, _page_id: str) -> dict[str, Any]:
+        return self.page
+
+    def get_blocks(self, page_id: str) -> list[dict[str, Any]]:
+        self.block_requests.append(page_id)
+        return [_paragraph("a", "text")]
+
+
+class _Importer:
+    def __init__(self, stored_watermark: str) -> None:
+        self.stored_watermark = stored_watermark
+        self.synced: list[str] = []
+
+    def get_page_state(self, _page_id: str) -> dict[str, Any]:
+        return {"last_edited_time": self.stored_watermark}
+
+    def sync_page(self, page_data: dict[str, Any], blocks: list[Any]) -> Any:
+        self.synced.append(page_data["id"])
+        return pipeline.BlockDiff(inserts=[{"id": "a"}])
+
+
+class TestImportPages:
+    """Test the last_edited_time watermark check."""
+
+    def test_skips_page_when_watermark_unchanged(self) -> None:
+        page = _page("2026-10-19T00:00:00.000Z")
+        extractor = _Extractor(page)
+        importer = _Importer(stored_watermark=page["last_edited_time"])
+
+        touched = pipeline.import_pages(extractor, importer, ["page-1"], True)
+
+        assert touched == []
+        assert extractor.block_requests == []
+        assert importer.synced == []
+
+    def test_syncs_page_when_watermark_moved(self) -> None:
+        extractor = _Extractor(_page("2026-10-19T01:00:00.000Z"))
+        importer = _Importer(stored_watermark="2026-10-19T00:00:00.000Z")
+
+        touched = pipeline.import_pages(extractor, importer, ["page-1"], True)
+
+        assert touched == ["a"]
+        assert extractor.block_requests == ["page-1"]
+        assert importer.synced == ["page-1"]
@@ -348,6 +348,39 @@ async def test_run_task_with_lats_llm_budget(monkeypatch: pytest.MonkeyPatch) ->
     assert isinstance(result, dict)
 
 
+@pytest.mark.asyncio
+async def test_run_task_with_lats_shares_agent_rate_limiter(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from src.agent.rate_limiter import RateLimiter
+    from src.features.lats import LATSSearcher, SearchNode
+
+    limiter = RateLimiter(max_concurrency=2)
+    monkeypatch.setattr(
+        worker,
+        "lats_agent",
+        types.SimpleNamespace(rate_limiter=limiter),
+        raising=False,
+    )
+    monkeypatch.setattr(worker, "llm_provider", None, raising=False)
+    monkeypatch.setattr(worker, "graph_provider", None, raising=False)
+    config = types.SimpleNamespace(lats_parallelism=8, max_concurrency=16)
+    monkeypatch.setattr(worker, "get_config", lambda: config)
+    searchers: list[LATSSearcher] = []
+
+    async def _run(self: LATSSearcher, _state: Any = None) -> SearchNode:
+        searchers.append(self)
+        return SearchNode(state=worker.SearchState())
+
+    monkeypatch.setattr(LATSSearcher, "run", _run)
+    task = worker.OCRTask(request_id="t3", image_path="img", session_id="s3")
+    await worker._run_task_with_lats(task)
+
+    [searcher] = searchers
+    assert searcher.rate_limiter is limiter
+    assert searcher.parallelism == 2
+
+
 def test_budget_tracker_with_individual_token_args() -> None:
     """Test budget tracker with individual token arguments."""
     tracker = budget_tracker.BudgetTracker(budget_limit_usd=1.0)
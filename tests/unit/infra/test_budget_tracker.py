@@ -0,0 +1,203 @@
+"""Tests for the aggregated BudgetTracker and the Redis budget ledger."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.infra.budget import BudgetTracker, RedisBudgetLedger, ledger_from_env
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, float] = {}
+        self.gets = 0
+        self.expires: list[tuple[str, int]] = []
+
+    def incrbyfloat(self, key: str, amount: float) -> float:
+        self.values[key] = self.values.get(key, 0.0) + amount
+        return self.values[key]
+
+    def get(self, key: str) -> str | None:
+        self.gets += 1
+        value = self.values.get(key)
+        return None if value is None else str(value)
+
+    def expire(self, key: str, seconds: int) -> None:
+        self.expires.append((key, seconds))
+
+
+class _DownRedis:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def incrbyfloat(self, key: str, amount: float) -> float:
+        self.calls += 1
+        raise ConnectionError("redis down")
+
+    def get(self, key: str) -> str | None:
+        self.calls += 1
+        raise TimeoutError("redis slow")
+
+
+class _FlakyRedis(_FakeRedis):
+    def __init__(self) -> None:
+        super().__init__()
+        self.up = False
+
+    def incrbyfloat(self, key: str, amount: float) -> float:
+        if not self.up:
+            raise ConnectionError("redis down")
+        return super().incrbyfloat(key, amount)
+
+
+def test_memory_is_bounded_and_aggregates_are_exact() -> None:
+    tracker = BudgetTracker(budget_limit_usd=100.0, recent_records=5)
+
+    for i in range(1_000):
+        tracker.record_usage(
+            {"prompt_tokens": 1_000, "completion_tokens": 100},
+            metadata={"query_type": "explanation" if i % 2 else "reasoning"},
+            model="gemini-flash-latest" if i % 4 else "gemini-pro",
+        )
+
+    stats = tracker.get_statistics()
+    assert len(tracker.records) == 5
+    assert stats["total_calls"] == 1_000
+    assert stats["by_query_type"]["explanation"]["calls"] == 500
+    assert stats["by_model"]["gemini-pro"]["calls"] == 250
+    assert sum(a.cost_usd for a in tracker.by_model.values()) == pytest.approx(
+        tracker.total_cost_usd
+    )
+
+
+def test_time_buckets_expire() -> None:
+    now = [0.0]
+    tracker = BudgetTracker(bucket_seconds=60, bucket_count=3, clock=lambda: now[0])
+
+    for minute in range(5):
+        now[0] = minute * 60.0
+        tracker.record_usage({"prompt_tokens": 10 * (minute + 1)})
+
+    recent = tracker.get_recent_usage()
+    assert [b["bucket_start"] for b in recent] == [120, 180, 240]
+    assert [b["input_tokens"] for b in recent] == [30, 40, 50]
+
+
+def test_spill_file_rotates(tmp_path: Path) -> None:
+    spill = tmp_path / "usage" / "usage.jsonl"
+    tracker = BudgetTracker(spill_path=spill, spill_max_bytes=600, spill_backups=2)
+
+    for _ in range(20):
+        tracker.record_usage({"prompt_tokens": 1}, metadata={"query_type": "q"})
+    tracker.close()
+
+    assert (tmp_path / "usage" / "usage.jsonl.1").exists()
+    first = json.loads(spill.read_text(encoding="utf-8").splitlines()[0])
+    assert first["metadata"] == {"query_type": "q"}
+
+
+def test_ledger_shares_budget_between_trackers() -> None:
+    redis_client = _FakeRedis()
+    trackers = [
+        BudgetTracker(
+            budget_limit_usd=0.01,
+            ledger=RedisBudgetLedger(redis_client, "budget", ttl_seconds=86_400),
+        )
+        for _ in range(2)
+    ]
+
+    trackers[0].record_usage({"completion_tokens": 2_500})  # $0.00625
+    assert not trackers[0].is_budget_exceeded()
+    trackers[1].record_usage({"completion_tokens": 2_500})
+
+    assert trackers[1].is_budget_exceeded()
+    assert redis_client.values["budget"] == pytest.approx(0.0125)
+    assert redis_client.expires == [("budget", 86_400)]
+
+
+def test_ledger_caches_reads() -> None:
+    redis_client = _FakeRedis()
+    now = [0.0]
+    ledger = RedisBudgetLedger(redis_client, "budget", clock=lambda: now[0])
+
+    for _ in range(10):
+        ledger.spent_usd()
+    redis_client.values["budget"] = 0.5
+    now[0] = 2.0
+
+    assert ledger.spent_usd() == 0.5
+    assert redis_client.gets == 2
+
+
+def test_ledger_key_is_scoped_to_period() -> None:
+    redis_client = _FakeRedis()
+    now = [7_200.0]
+    ledger = RedisBudgetLedger(
+        redis_client, "budget", period_seconds=3_600, clock=lambda: now[0]
+    )
+
+    ledger.add(0.5)
+    assert redis_client.values == {"budget:2": 0.5}
+    assert redis_client.expires == [("budget:2", 3_600)]
+
+    now[0] = 10_800.0
+    assert ledger.spent_usd() == 0.0
+    ledger.add(0.25)
+    assert redis_client.values["budget:3"] == 0.25
+
+
+def test_ledger_failure_falls_back_to_local_total() -> None:
+    redis_client = _DownRedis()
+    now = [0.0]
+    tracker = BudgetTracker(
+        budget_limit_usd=1.0,
+        ledger=RedisBudgetLedger(
+            redis_client, "budget", retry_after=30, clock=lambda: now[0]
+        ),
+    )
+
+    tracker.record_usage({"completion_tokens": 2_500})
+    assert tracker.get_spent_usd() == pytest.approx(tracker.total_cost_usd)
+    assert not tracker.is_budget_exceeded()
+    assert redis_client.calls == 1  # 실패 후 재시도 대기 동안 건너뜀
+
+    now[0] = 31.0
+    assert tracker.get_spent_usd() == pytest.approx(tracker.total_cost_usd)
+    assert redis_client.calls == 2
+
+
+def test_ledger_catches_up_after_outage() -> None:
+    redis_client = _FlakyRedis()
+    tracker = BudgetTracker(
+        budget_limit_usd=1.0,
+        ledger=RedisBudgetLedger(redis_client, "budget", retry_after=0),
+    )
+
+    tracker.record_usage({"completion_tokens": 2_500})
+    tracker.record_usage({"completion_tokens": 2_500})
+    assert redis_client.values == {}
+
+    redis_client.up = True
+    tracker.record_usage({"completion_tokens": 1})  # 밀린 증가분까지 한 번에 반영
+    assert redis_client.values["budget"] == pytest.approx(tracker.total_cost_usd)
+
+
+def test_ledger_from_env_sets_timeouts_and_period(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pytest.importorskip("redis")
+    monkeypatch.setenv("BUDGET_LEDGER_KEY", "budget")
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
+    monkeypatch.setenv("BUDGET_LEDGER_PERIOD_SECONDS", "3600")
+
+    with patch("redis.Redis.from_url") as from_url:
+        ledger = ledger_from_env()
+
+    assert ledger is not None
+    assert ledger.period_seconds == ledger.ttl_seconds == 3_600
+    kwargs = from_url.call_args.kwargs
+    assert kwargs["socket_connect_timeout"] == kwargs["socket_timeout"] == 0.5
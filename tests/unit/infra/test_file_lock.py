@@ -5,15 +5,18 @@ This module tests the cross-platform file locking functionality.
 
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
 import sys
 import threading
 import time
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import Any
 
 import pytest
 
-from src.infra.file_lock import FileLock, FileLockError
+from src.infra import file_lock
+from src.infra.file_lock import FileLock, FileLockError, get_lock_stats
 
 
 class TestFileLockInit:
@@ -28,7 +31,8 @@ class TestFileLockInit:
         assert lock.lock_path == Path(path + ".lock")
         assert lock.timeout == 10.0
         assert lock.poll_interval == 0.1
-        assert lock._lock_file is None
+        assert lock.shared is False
+        assert not lock.is_locked
 
     def test_init_with_path_object(self, tmp_path: Path) -> None:
         """Test initialization with Path object."""
@@ -53,6 +57,13 @@ class TestFileLockInit:
         assert lock.poll_interval == 0.5
 
 
+def _hold_lock_in_child(path: Path, ready: Any, release: Any) -> None:
+    lock = FileLock(path)
+    lock.acquire()
+    ready.set()
+    release.wait(5)
+
+
 class TestFileLockAcquire:
     """Test FileLock.acquire method."""
 
@@ -65,72 +76,182 @@ class TestFileLockAcquire:
 
         assert result is True
         assert lock.lock_path.exists()
+        assert lock.is_locked
         lock.release()
 
-    def test_acquire_writes_pid(self, tmp_path: Path) -> None:
-        """Test that acquire writes PID to lock file."""
+    def test_stale_lock_file_does_not_block(self, tmp_path: Path) -> None:
+        """A lock file left behind by a dead process is not a held lock."""
         path = tmp_path / "test.txt"
-        lock = FileLock(path)
-
-        lock.acquire()
+        path.with_suffix(".txt.lock").write_text("12345", encoding="utf-8")
 
-        # On Windows, the lock file is locked so we can't read it directly
-        # Verify lock file exists and PID was written by checking _lock_file
-        assert lock._lock_file is not None
-        assert lock.lock_path.exists()
-        lock.release()
+        with FileLock(path, timeout=0.1) as lock:
+            assert lock.is_locked
 
     def test_acquire_timeout(self, tmp_path: Path) -> None:
         """Test that acquire raises FileLockError on timeout."""
         path = tmp_path / "test.txt"
-        lock_file = path.with_suffix(".txt.lock")
-
-        # Create existing lock file
-        lock_file.write_text("12345", encoding="utf-8")
-
-        lock = FileLock(path, timeout=0.3, poll_interval=0.1)
+        holder = FileLock(path)
+        holder.acquire()
 
+        lock = FileLock(path, timeout=0.2)
         with pytest.raises(FileLockError) as exc_info:
             lock.acquire()
+        holder.release()
 
         assert "timeout" in str(exc_info.value).lower()
+        assert not lock.is_locked
+        with FileLock(path, timeout=0.5):  # 포기한 대기자가 락을 붙잡지 않음
+            pass
+
+    def test_timed_out_waits_keep_thread_count_bounded(self, tmp_path: Path) -> None:
+        """Abandoned waits reuse the bounded pool and unlock once granted."""
+        path = tmp_path / "test.txt"
+        holder = FileLock(path)
+        holder.acquire()
+
+        for _ in range(file_lock._WAIT_WORKERS + 4):
+            with pytest.raises(FileLockError):
+                FileLock(path, timeout=0.02).acquire()
+        waiters = [t for t in threading.enumerate() if t.name.startswith("file-lock")]
+        holder.release()
+
+        assert len(waiters) <= file_lock._WAIT_WORKERS
+        with FileLock(path, timeout=1.0):  # 늦게 잡힌 락은 워커가 닫아 풀어줌
+            pass
 
-    def test_acquire_retry_on_file_exists(self, tmp_path: Path) -> None:
-        """Test that acquire retries when lock file exists."""
+    def test_acquire_wakes_when_released(self, tmp_path: Path) -> None:
+        """Test that a blocked acquire returns right after release."""
         path = tmp_path / "test.txt"
-        lock_file = path.with_suffix(".txt.lock")
-        lock = FileLock(path, timeout=1.0, poll_interval=0.1)
+        holder = FileLock(path)
+        holder.acquire()
+        threading.Timer(0.2, holder.release).start()
 
-        # Create lock file that will be deleted after short time
-        lock_file.write_text("12345", encoding="utf-8")
+        start = time.monotonic()
+        with FileLock(path, timeout=2.0):
+            waited = time.monotonic() - start
 
-        def delete_after_delay() -> None:
-            time.sleep(0.2)
-            lock_file.unlink()
+        assert 0.15 <= waited < 0.6
 
-        thread = threading.Thread(target=delete_after_delay)
-        thread.start()
+    def test_double_acquire_raises(self, tmp_path: Path) -> None:
+        """Test that a held instance is not reentrant."""
+        lock = FileLock(tmp_path / "test.txt")
+        with lock, pytest.raises(FileLockError):
+            lock.acquire()
 
-        result = lock.acquire()
-        thread.join()
 
-        assert result is True
-        lock.release()
+@pytest.mark.skipif(sys.platform == "win32", reason="flock modes are Unix-only")
+class TestSharedLocks:
+    """Test shared (read) and exclusive (write) modes."""
+
+    def test_readers_share_and_exclude_writers(self, tmp_path: Path) -> None:
+        """Shared locks coexist; an exclusive lock waits for all of them."""
+        path = tmp_path / "test.txt"
+        readers = [FileLock(path, shared=True, timeout=0.1) for _ in range(2)]
+        for reader in readers:
+            reader.acquire()
+
+        with pytest.raises(FileLockError):
+            FileLock(path, timeout=0.1).acquire()
+
+        for reader in readers:
+            reader.release()
+        with FileLock(path, timeout=0.1), pytest.raises(FileLockError):
+            FileLock(path, shared=True, timeout=0.1).acquire()
+
+    def test_lock_released_when_holder_process_dies(self, tmp_path: Path) -> None:
+        """The kernel drops the lock when the holding process exits."""
+        path = tmp_path / "test.txt"
+        ctx = multiprocessing.get_context("fork")
+        ready, release = ctx.Event(), ctx.Event()
+        child = ctx.Process(target=_hold_lock_in_child, args=(path, ready, release))
+        child.start()
+        assert ready.wait(5)
+
+        with pytest.raises(FileLockError):
+            FileLock(path, timeout=0.1).acquire()
+        child.kill()
+        child.join()
+
+        with FileLock(path, timeout=1.0) as lock:
+            assert lock.is_locked
+
+
+class TestAsyncFileLock:
+    """Test the asyncio API."""
+
+    @pytest.mark.asyncio
+    async def test_async_wait_does_not_block_event_loop(self, tmp_path: Path) -> None:
+        """Other tasks keep running while a lock is contended."""
+        path = tmp_path / "test.txt"
+        holder = FileLock(path)
+        holder.acquire()
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        asyncio.get_running_loop().call_later(0.2, holder.release)
+        async with FileLock(path, timeout=2.0) as lock:
+            assert lock.is_locked
+        task.cancel()
+
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_async_timeout_and_cancel(self, tmp_path: Path) -> None:
+        """Timeouts raise FileLockError and cancellation leaves no lock held."""
+        path = tmp_path / "test.txt"
+        holder = FileLock(path)
+        holder.acquire()
+
+        with pytest.raises(FileLockError):
+            await FileLock(path, timeout=0.1).acquire_async()
+        waiter = asyncio.create_task(FileLock(path, timeout=5).acquire_async())
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        holder.release()
+
+        async with FileLock(path, timeout=0.5):
+            pass
+
+    @pytest.mark.asyncio
+    async def test_contention_stats(self, tmp_path: Path) -> None:
+        """Contended acquisitions and timeouts are counted per lock file."""
+        path = tmp_path / "stats.txt"
+        holder = FileLock(path)
+        holder.acquire()
+        with pytest.raises(FileLockError):
+            await FileLock(path, timeout=0.05).acquire_async()
+        asyncio.get_running_loop().call_later(0.05, holder.release)
+        async with FileLock(path, timeout=1.0):
+            pass
+
+        stats = get_lock_stats()[str(holder.lock_path)]
+        assert stats["acquisitions"] == 2
+        assert stats["contended"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["max_wait_seconds"] > 0
 
 
 class TestFileLockRelease:
     """Test FileLock.release method."""
 
-    def test_release_removes_lock_file(self, tmp_path: Path) -> None:
-        """Test that release removes the lock file."""
+    def test_release_keeps_lock_file(self, tmp_path: Path) -> None:
+        """Release drops the lock but leaves the lock file for reuse."""
         path = tmp_path / "test.txt"
         lock = FileLock(path)
 
         lock.acquire()
-        assert lock.lock_path.exists()
-
         lock.release()
-        assert not lock.lock_path.exists()
+
+        assert not lock.is_locked
+        assert lock.lock_path.exists()
 
     def test_release_when_not_acquired(self, tmp_path: Path) -> None:
         """Test release when lock was not acquired."""
@@ -156,25 +277,23 @@ class TestFileLockContextManager:
     def test_context_manager_acquires_and_releases(self, tmp_path: Path) -> None:
         """Test that context manager acquires and releases lock."""
         path = tmp_path / "test.txt"
-        lock_file = path.with_suffix(".txt.lock")
         lock = FileLock(path)
 
         with lock:
-            assert lock_file.exists()
+            assert lock.is_locked
 
-        assert not lock_file.exists()
+        assert not lock.is_locked
 
     def test_context_manager_releases_on_exception(self, tmp_path: Path) -> None:
         """Test that context manager releases lock even on exception."""
         path = tmp_path / "test.txt"
-        lock_file = path.with_suffix(".txt.lock")
         lock = FileLock(path)
 
         with pytest.raises(ValueError), lock:
-            assert lock_file.exists()
+            assert lock.is_locked
             raise ValueError("Test exception")
 
-        assert not lock_file.exists()
+        assert not lock.is_locked
 
     def test_context_manager_returns_self(self, tmp_path: Path) -> None:
         """Test that __enter__ returns the lock instance."""
@@ -229,103 +348,6 @@ class TestFileLockError:
         assert issubclass(FileLockError, Exception)
 
 
-class TestFileLockCleanup:
-    """Test internal cleanup methods."""
-
-    def test_cleanup_failed_lock(self, tmp_path: Path) -> None:
-        """Test _cleanup_failed_lock method."""
-        path = tmp_path / "test.txt"
-        lock = FileLock(path)
-
-        # Create a mock lock file
-        mock_file = MagicMock()
-        lock._lock_file = mock_file
-        lock.lock_path.write_text("test", encoding="utf-8")
-
-        lock._cleanup_failed_lock()
-
-        assert lock._lock_file is None
-        mock_file.close.assert_called_once()  # type: ignore[unreachable]
-
-    def test_cleanup_failed_lock_handles_oserror(self, tmp_path: Path) -> None:
-        """Test _cleanup_failed_lock handles OSError gracefully."""
-        path = tmp_path / "test.txt"
-        lock = FileLock(path)
-
-        # Set up mock that doesn't exist
-        mock_file = MagicMock()
-        mock_file.close = MagicMock()
-        lock._lock_file = mock_file
-
-        # Should not raise even if unlink fails
-        lock._cleanup_failed_lock()
-
-
-class TestAttemptLock:
-    """Test _attempt_lock method."""
-
-    def test_attempt_lock_success(self, tmp_path: Path) -> None:
-        """Test successful lock attempt."""
-        path = tmp_path / "test.txt"
-        lock = FileLock(path)
-
-        success, error = lock._attempt_lock()
-
-        assert success is True
-        assert error is None
-        lock.release()
-
-    def test_attempt_lock_file_exists(self, tmp_path: Path) -> None:
-        """Test lock attempt when file already exists."""
-        path = tmp_path / "test.txt"
-        lock_file = path.with_suffix(".txt.lock")
-        lock_file.write_text("12345", encoding="utf-8")
-
-        lock = FileLock(path)
-        success, error = lock._attempt_lock()
-
-        assert success is False
-        assert error is None  # FileExistsError returns None error
-
-    def test_attempt_lock_os_error(self, tmp_path: Path) -> None:
-        """Test lock attempt with OSError."""
-        path = tmp_path / "test.txt"
-        lock = FileLock(path)
-
-        with patch("builtins.open", side_effect=OSError("Permission denied")):
-            success, error = lock._attempt_lock()
-
-        assert success is False
-        assert isinstance(error, OSError)
-
-
-class TestTryCreateLockFile:
-    """Test _try_create_lock_file method."""
-
-    def test_try_create_lock_file_success(self, tmp_path: Path) -> None:
-        """Test successful lock file creation."""
-        path = tmp_path / "test.txt"
-        lock = FileLock(path)
-
-        result = lock._try_create_lock_file()
-
-        assert result is True
-        assert lock._lock_file is not None
-        assert lock.lock_path.exists()
-        lock.release()
-
-    def test_try_create_lock_file_already_exists(self, tmp_path: Path) -> None:
-        """Test lock file creation when file already exists."""
-        path = tmp_path / "test.txt"
-        lock_file = path.with_suffix(".txt.lock")
-        lock_file.write_text("12345", encoding="utf-8")
-
-        lock = FileLock(path)
-
-        with pytest.raises(FileExistsError):
-            lock._try_create_lock_file()
-
-
 class TestModuleExports:
     """Test module exports."""
 
@@ -336,6 +358,7 @@ class TestModuleExports:
         assert hasattr(file_lock, "__all__")
         assert "FileLock" in file_lock.__all__
         assert "FileLockError" in file_lock.__all__
+        assert "get_lock_stats" in file_lock.__all__
 
 
 class TestPlatformSpecificLocking:
@@ -348,7 +371,7 @@ class TestPlatformSpecificLocking:
         lock = FileLock(path)
 
         lock.acquire()
-        assert lock._lock_file is not None
+        assert lock.is_locked
         lock.release()
 
     @pytest.mark.skipif(sys.platform == "win32", reason="Unix-specific test")
@@ -358,5 +381,5 @@ class TestPlatformSpecificLocking:
         lock = FileLock(path)
 
         lock.acquire()
-        assert lock._lock_file is not None
+        assert lock.is_locked
         lock.release()
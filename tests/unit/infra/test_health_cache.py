@@ -0,0 +1,161 @@
+"""Tests for background-refreshed, cached health checks."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.infra.health import HealthChecker, HealthStatus, RedisProbe
+
+
+class _CountingCheck:
+    def __init__(self, result: dict[str, Any] | None = None) -> None:
+        self.calls = 0
+        self.closed = False
+        self.result = result or {"status": "up"}
+
+    async def __call__(self) -> dict[str, Any]:
+        self.calls += 1
+        return self.result
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_check_all_serves_cache_while_running() -> None:
+    check = _CountingCheck()
+    checker = HealthChecker(default_interval=60)
+    checker.register_check("redis", check)
+
+    checker.start()
+    await asyncio.sleep(0.01)
+    try:
+        results = [await checker.check_all() for _ in range(20)]
+    finally:
+        await checker.stop()
+
+    assert check.calls == 1
+    assert all(r.status == HealthStatus.HEALTHY for r in results)
+    assert check.closed
+    assert not checker.running
+
+
+@pytest.mark.asyncio
+async def test_pending_and_stale_results_are_unhealthy() -> None:
+    checker = HealthChecker(default_interval=60, max_staleness=30)
+    checker.register_check("redis", _CountingCheck())
+
+    assert checker.snapshot().components["redis"].message == "Check pending"
+
+    checker.start()
+    await asyncio.sleep(0.01)
+    await checker.stop()
+    assert checker.snapshot().status == HealthStatus.HEALTHY
+
+    with patch("src.infra.health.time.monotonic", return_value=1e12):
+        stale = checker.snapshot()
+
+    assert stale.status == HealthStatus.UNHEALTHY
+    message = stale.components["redis"].message
+    assert isinstance(message, str)
+    assert message.startswith("Stale result")
+
+
+@pytest.mark.asyncio
+async def test_slow_check_times_out() -> None:
+    async def hang() -> dict[str, Any]:
+        await asyncio.sleep(10)
+        return {"status": "up"}
+
+    checker = HealthChecker()
+    checker.register_check("neo4j", hang, timeout=0.01)
+    checker.register_check("gemini", lambda: {"status": "configured"})
+
+    result = await checker.check_all()
+
+    assert result.status == HealthStatus.DEGRADED
+    assert result.components["neo4j"].status == HealthStatus.UNHEALTHY
+    assert "Timeout" in (result.components["neo4j"].message or "")
+
+
+@pytest.mark.asyncio
+async def test_check_registered_after_start_is_refreshed() -> None:
+    checker = HealthChecker(default_interval=60)
+    checker.register_check("redis", _CountingCheck())
+    checker.start()
+
+    late = _CountingCheck()
+    checker.register_check("neo4j", late)
+    await asyncio.sleep(0.01)
+    try:
+        result = await checker.check_all()
+    finally:
+        await checker.stop()
+
+    assert late.calls == 1
+    assert result.components["neo4j"].status == HealthStatus.HEALTHY
+    assert late.closed
+
+
+@pytest.mark.asyncio
+async def test_sync_check_runs_off_loop_with_timeout() -> None:
+    release = threading.Event()
+
+    def blocking() -> dict[str, Any]:
+        release.wait(5)
+        return {"status": "up"}
+
+    checker = HealthChecker()
+    checker.register_check("disk", blocking, timeout=0.05)
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    ticking = asyncio.create_task(ticker())
+    try:
+        result = await checker.check_all()
+    finally:
+        release.set()
+        ticking.cancel()
+
+    assert result.components["disk"].status == HealthStatus.UNHEALTHY
+    assert "Timeout" in (result.components["disk"].message or "")
+    assert ticks > 1
+
+
+@pytest.mark.asyncio
+async def test_reported_down_status_is_unhealthy() -> None:
+    checker = HealthChecker()
+    checker.register_check("redis", _CountingCheck({"status": "down", "error": "x"}))
+
+    result = await checker.check_all()
+
+    assert result.status == HealthStatus.UNHEALTHY
+    assert result.components["redis"].message == "x"
+
+
+@pytest.mark.asyncio
+async def test_redis_probe_reuses_one_client() -> None:
+    client = MagicMock()
+    client.ping = AsyncMock(return_value=True)
+    client.aclose = AsyncMock()
+
+    probe = RedisProbe("redis://localhost:6379")
+    with patch("redis.asyncio.from_url", return_value=client) as from_url:
+        first = await probe()
+        second = await probe()
+        await probe.aclose()
+
+    assert first["status"] == second["status"] == "up"
+    from_url.assert_called_once()
+    assert client.ping.await_count == 2
+    client.aclose.assert_awaited_once()
@@ -0,0 +1,57 @@
+"""Tests for the per-kg shared instance registry."""
+
+from __future__ import annotations
+
+import gc
+from typing import Any
+
+from src.infra import kg_registry
+from src.infra.kg_registry import close_all, shared_for_kg
+
+
+class _KG:
+    pass
+
+
+class _Selector:
+    def __init__(self, kg: Any) -> None:
+        self.kg = kg
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _Validator(_Selector):
+    pass
+
+
+def test_instances_are_shared_per_kg_and_factory() -> None:
+    kg = _KG()
+
+    selector = shared_for_kg(kg, _Selector)
+
+    assert shared_for_kg(kg, _Selector) is selector
+    assert shared_for_kg(kg, _Validator) is not selector
+    assert shared_for_kg(_KG(), _Selector) is not selector
+
+
+def test_entry_is_released_with_kg() -> None:
+    kg = _KG()
+    shared_for_kg(kg, _Selector)
+    assert kg in kg_registry._instances
+
+    del kg
+    gc.collect()
+
+    assert all(not isinstance(k, _KG) for k in kg_registry._instances)
+
+
+def test_close_all_closes_and_clears() -> None:
+    kg = _KG()
+    selector = shared_for_kg(kg, _Selector)
+
+    close_all()
+
+    assert selector.closed
+    assert shared_for_kg(kg, _Selector) is not selector
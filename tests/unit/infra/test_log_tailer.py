@@ -0,0 +1,240 @@
+"""Tests for src/infra/log_tailer.py module.
+
+This module tests reverse-seek reads and the shared incremental tailer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from src.infra.log_tailer import LogTailer, get_log_tailer, read_last_lines
+
+
+async def _next_lines(queue: asyncio.Queue[list[str] | None]) -> list[str] | None:
+    return await asyncio.wait_for(queue.get(), timeout=3.0)
+
+
+class TestReadLastLines:
+    """Test read_last_lines function."""
+
+    def test_returns_last_lines_across_blocks(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("".join(f"Line {i}\n" for i in range(500)), encoding="utf-8")
+
+        lines, has_more = read_last_lines(path, 10, block_size=16)
+
+        assert lines == [f"Line {i}" for i in range(490, 500)]
+        assert has_more is True
+
+    def test_small_file_returns_everything(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("a\nb\nc", encoding="utf-8")
+
+        lines, has_more = read_last_lines(path, 10)
+
+        assert lines == ["a", "b", "c"]
+        assert has_more is False
+
+    def test_reads_only_needed_bytes(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.log"
+        path.write_bytes(b"x" * 1_000_000 + b"\nlast 1\nlast 2\n")
+
+        lines, _ = read_last_lines(path, 2, block_size=64)
+
+        assert lines == ["last 1", "last 2"]
+
+    def test_respects_end_offset(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("one\ntwo\nthree\n", encoding="utf-8")
+
+        lines, _ = read_last_lines(path, 5, end=len("one\ntwo\n"))
+
+        assert lines == ["one", "two"]
+
+    def test_multibyte_split_across_blocks(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("머리\n한글 로그 라인\n", encoding="utf-8")
+
+        lines, _ = read_last_lines(path, 1, block_size=3)
+
+        assert lines == ["한글 로그 라인"]
+
+
+class TestLogTailer:
+    """Test LogTailer incremental following."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    async def test_publishes_appended_lines(
+        self, tmp_path: Path, use_inotify: bool
+    ) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("old\n", encoding="utf-8")
+        tailer = LogTailer(path, poll_interval=0.05, use_inotify=use_inotify)
+
+        queue = tailer.subscribe()
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("new 1\nnew 2\n")
+            assert await _next_lines(queue) == ["new 1", "new 2"]
+        finally:
+            tailer.unsubscribe(queue)
+
+    @pytest.mark.asyncio
+    async def test_partial_line_is_held_until_complete(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("", encoding="utf-8")
+        tailer = LogTailer(path, poll_interval=0.05, use_inotify=False)
+
+        queue = tailer.subscribe()
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("par")
+            await asyncio.sleep(0.2)
+            assert queue.empty()
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("tial\n")
+            assert await _next_lines(queue) == ["partial"]
+        finally:
+            tailer.unsubscribe(queue)
+
+    @pytest.mark.asyncio
+    async def test_partial_line_at_start_is_published_once(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("done\npar", encoding="utf-8")
+        tailer = LogTailer(path, poll_interval=0.05, use_inotify=False)
+
+        queue = tailer.subscribe()
+        try:
+            lines, _ = await tailer.read_initial(10)
+            assert lines == ["done"]
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("tial\n")
+            assert await _next_lines(queue) == ["partial"]
+        finally:
+            tailer.unsubscribe(queue)
+
+    @pytest.mark.asyncio
+    async def test_reader_failure_ends_every_stream(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("", encoding="utf-8")
+        tailer = LogTailer(path, poll_interval=0.05, use_inotify=False)
+
+        def _fail() -> tuple[list[str], int]:
+            raise PermissionError("denied")
+
+        monkeypatch.setattr(tailer, "_read_appended", _fail)
+        first = tailer.subscribe()
+        second = tailer.subscribe()
+
+        assert await _next_lines(first) is None
+        assert await _next_lines(second) is None
+        assert tailer.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_fans_out_to_all_subscribers(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("", encoding="utf-8")
+        tailer = LogTailer(path, poll_interval=0.05, use_inotify=False)
+
+        first = tailer.subscribe()
+        second = tailer.subscribe()
+        try:
+            assert tailer.subscriber_count == 2
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("shared\n")
+            assert await _next_lines(first) == ["shared"]
+            assert await _next_lines(second) == ["shared"]
+        finally:
+            tailer.unsubscribe(first)
+            tailer.unsubscribe(second)
+        assert tailer.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_truncation_restarts_from_beginning(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("long line of content\n" * 20, encoding="utf-8")
+        tailer = LogTailer(path, poll_interval=0.05, use_inotify=False)
+
+        queue = tailer.subscribe()
+        try:
+            path.write_text("after truncate\n", encoding="utf-8")
+            assert await _next_lines(queue) == ["after truncate"]
+        finally:
+            tailer.unsubscribe(queue)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    async def test_rotation_follows_new_file(
+        self, tmp_path: Path, use_inotify: bool
+    ) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("before\n", encoding="utf-8")
+        tailer = LogTailer(path, poll_interval=0.05, use_inotify=use_inotify)
+
+        queue = tailer.subscribe()
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("tail of old\n")
+            assert await _next_lines(queue) == ["tail of old"]
+
+            os.rename(path, tmp_path / "app.log.1")
+            path.write_text("rotated\n", encoding="utf-8")
+
+            received: list[str] = []
+            while "rotated" not in received:
+                received.extend(await _next_lines(queue))
+            assert received == ["rotated"]
+        finally:
+            tailer.unsubscribe(queue)
+
+    @pytest.mark.asyncio
+    async def test_read_initial_excludes_unpublished_bytes(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("a\nb\n", encoding="utf-8")
+        tailer = LogTailer(path, poll_interval=10.0, use_inotify=False)
+
+        queue = tailer.subscribe()
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("c\n")
+            lines, has_more = await tailer.read_initial(10)
+            assert lines == ["a", "b"]
+            assert has_more is False
+        finally:
+            tailer.unsubscribe(queue)
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_oldest_batch(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("", encoding="utf-8")
+        tailer = LogTailer(path, poll_interval=0.05, queue_size=1, use_inotify=False)
+
+        queue = tailer.subscribe()
+        try:
+            tailer._publish(["first"])
+            tailer._publish(["second"])
+            assert tailer.dropped_batches == 1
+            assert queue.get_nowait() == ["second"]
+        finally:
+            tailer.unsubscribe(queue)
+
+
+class TestGetLogTailer:
+    """Test get_log_tailer registry."""
+
+    def test_returns_same_tailer_per_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.log"
+
+        assert get_log_tailer(path) is get_log_tailer(tmp_path / "." / "app.log")
+        assert get_log_tailer(path) is not get_log_tailer(tmp_path / "other.log")
@@ -0,0 +1,123 @@
+"""Tests for the bounded, sampled logging queue in src/infra/logging.py."""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.infra.logging import (
+    BoundedQueueHandler,
+    SamplingFilter,
+    SensitiveDataFilter,
+    fast_json_dumps,
+    get_logging_stats,
+    setup_logging,
+)
+
+
+def _record(
+    name: str = "src.test", level: int = logging.DEBUG, msg: str = "m", args: Any = ()
+) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+class TestBoundedQueueHandler:
+    """Test the drop-or-sample overflow policy."""
+
+    def test_drops_when_full_without_blocking(self) -> None:
+        handler = BoundedQueueHandler(queue.Queue(2))
+
+        for _ in range(5):
+            handler.handle(_record(level=logging.ERROR))
+
+        assert handler.bounded_queue.qsize() == 2
+        assert handler.dropped == 3
+
+    def test_samples_debug_above_high_watermark(self) -> None:
+        handler = BoundedQueueHandler(queue.Queue(100))
+        for _ in range(80):
+            handler.handle(_record(level=logging.ERROR))
+
+        for _ in range(20):
+            handler.handle(_record(level=logging.DEBUG))
+        handler.handle(_record(level=logging.WARNING))
+
+        assert handler.sampled == 18
+        assert handler.bounded_queue.qsize() == 80 + 2 + 1
+        assert handler.dropped == 0
+
+
+class TestSamplingFilter:
+    """Test per-logger deterministic sampling."""
+
+    def test_keeps_one_in_n_for_longest_prefix(self) -> None:
+        filt = SamplingFilter({"src": 0.5, "src.caching": 0.1})
+
+        cache_kept = sum(filt.filter(_record("src.caching.redis")) for _ in range(30))
+        other_kept = sum(filt.filter(_record("src.agent")) for _ in range(30))
+        unrelated = sum(filt.filter(_record("srcx")) for _ in range(5))
+
+        assert cache_kept == 3
+        assert other_kept == 15
+        assert unrelated == 5
+        assert filt.sampled == 27 + 15
+
+    def test_info_and_above_are_never_sampled(self) -> None:
+        filt = SamplingFilter({"src": 0.0})
+
+        assert filt.filter(_record(level=logging.INFO))
+        assert not filt.filter(_record(level=logging.DEBUG))
+
+
+class _Exploding:
+    def __str__(self) -> str:
+        raise AssertionError("message should not be formatted")
+
+
+def test_sensitive_filter_skips_formatting_without_key() -> None:
+    record = _record(msg="value %s", args=(_Exploding(),))
+
+    assert SensitiveDataFilter().filter(record)
+    assert record.args is not None
+
+
+def test_fast_json_dumps_handles_non_native_values() -> None:
+    when = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    data = json.loads(fast_json_dumps({"t": when, 1: "one", "p": Path("x")}))
+
+    assert data == {"t": "2026-01-01T00:00:00+00:00", "1": "one", "p": "x"}
+
+
+def test_setup_logging_reports_counters(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("LOG_FILE", str(tmp_path / "app.log"))
+    monkeypatch.setenv("ERROR_LOG_FILE", str(tmp_path / "error.log"))
+    _, listener = setup_logging(
+        env="production",
+        log_level="DEBUG",
+        queue_size=50,
+        sample_rates={"noisy": 0.25},
+    )
+    try:
+        noisy = logging.getLogger("noisy")
+        for i in range(8):
+            noisy.debug("event %d", i)
+        logging.getLogger("app").info("key %s", "AIza" + "0" * 35)
+    finally:
+        listener.stop()
+        stats = get_logging_stats()
+        logging.getLogger().handlers.clear()
+
+    assert stats["sampled"] == 6
+    assert stats["dropped"] == 0
+    lines = (tmp_path / "app.log").read_text(encoding="utf-8").splitlines()
+    messages = [json.loads(line)["message"] for line in lines]
+    assert messages == ["event 0", "event 4", "key [FILTERED_API_KEY]"]
@@ -0,0 +1,190 @@
+"""Tests for src/infra/neo4j_bulk.py."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import pytest
+from neo4j.exceptions import TransientError
+
+from src.infra.neo4j_bulk import (
+    Neo4jBulkLoader,
+    NodeBatch,
+    RelationshipBatch,
+    dedupe_rows,
+    export_csv,
+)
+
+
+class _Result:
+    def __init__(self, count: int) -> None:
+        self.count = count
+
+    async def single(self) -> dict[str, int]:
+        return {"count": self.count}
+
+
+class _Graph:
+    """Records writes and tracks how many sessions are open at once."""
+
+    def __init__(self, deadlocks: int = 0) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.open = 0
+        self.max_open = 0
+        self.deadlocks = deadlocks
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[Any]:
+        self.open += 1
+        self.max_open = max(self.max_open, self.open)
+        try:
+            yield self
+        finally:
+            self.open -= 1
+
+    async def run(self, query: str, **params: Any) -> _Result:
+        await asyncio.sleep(0.01)
+        if self.deadlocks:
+            self.deadlocks -= 1
+            raise TransientError("DeadlockDetected")
+        self.calls.append((query, params))
+        rows = params.get("nodes") or params.get("rels") or []
+        return _Result(len(rows) if rows else 7)
+
+
+def _nodes(label: str, n: int) -> NodeBatch:
+    return NodeBatch(label, [{"id": f"{label}{i}", "name": str(i)} for i in range(n)])
+
+
+class TestNeo4jBulkLoader:
+    """Test chunking, ordering, retries and throughput stats."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_chunks_with_bounded_concurrency(self) -> None:
+        graph = _Graph()
+        loader = Neo4jBulkLoader(graph.session, chunk_size=2, concurrency=3)
+
+        stats = await loader.load([_nodes("Person", 9), _nodes("Org", 4)])
+
+        assert stats.nodes == 13
+        assert stats.chunks == 7
+        assert graph.max_open == 3
+        assert stats.nodes_per_second > 0
+        query = graph.calls[0][0]
+        assert "UNWIND $nodes AS node" in query
+        assert "SET n.name = node.name" in query
+
+    @pytest.mark.asyncio
+    async def test_relationships_start_after_nodes(self) -> None:
+        graph = _Graph()
+        loader = Neo4jBulkLoader(graph.session, chunk_size=1, concurrency=4)
+        rels = RelationshipBatch(
+            "WORKS_AT",
+            "Person",
+            "Org",
+            [
+                {"from_id": f"Person{i}", "to_id": "Org0", "since": 2020}
+                for i in range(3)
+            ],
+        )
+
+        stats = await loader.load([_nodes("Person", 3), _nodes("Org", 2)], [rels])
+
+        kinds = ["rels" if "$rels" in q else "nodes" for q, _ in graph.calls]
+        assert kinds == ["nodes"] * 5 + ["rels"] * 3
+        assert "MERGE (a)-[r:WORKS_AT {since: rel.since}]->(b)" in graph.calls[-1][0]
+        assert stats.relationships == 3
+        assert stats.as_dict()["relationships"] == 3.0
+
+    @pytest.mark.asyncio
+    async def test_repeated_keys_are_merged_once(self) -> None:
+        graph = _Graph()
+        loader = Neo4jBulkLoader(graph.session, chunk_size=2, concurrency=4)
+        people = NodeBatch(
+            "Person",
+            [
+                {"id": "a", "name": "first"},
+                {"id": "b", "name": "b"},
+                {"id": "c", "name": "c"},
+                {"id": "a", "name": "last"},
+                {"id": "d", "name": "d"},
+            ],
+        )
+        rel = {"from_id": "a", "to_id": "b", "since": 2020}
+        rels = RelationshipBatch(
+            "KNOWS", "Person", "Person", [rel, {**rel, "to_id": "c"}, rel]
+        )
+
+        stats = await loader.load([people], [rels])
+
+        node_ids = [
+            [row["id"] for row in params["nodes"]]
+            for _, params in graph.calls
+            if "nodes" in params
+        ]
+        assert sorted(node_ids) == [["a", "b"], ["c", "d"]]
+        written = {row["id"]: row for _, p in graph.calls for row in p.get("nodes", [])}
+        assert written["a"]["name"] == "last"
+        assert stats.nodes == 4
+        assert stats.relationships == 2
+
+    @pytest.mark.asyncio
+    async def test_deadlocks_are_retried(self) -> None:
+        graph = _Graph(deadlocks=2)
+        loader = Neo4jBulkLoader(graph.session, chunk_size=10, retry_base_delay=0)
+
+        stats = await loader.load([_nodes("Person", 3)])
+
+        assert stats.nodes == 3
+        assert stats.retries == 2
+        assert stats.failed_chunks == 0
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries(self) -> None:
+        loader = Neo4jBulkLoader(
+            _Graph(deadlocks=10).session, max_retries=1, retry_base_delay=0
+        )
+
+        stats = await loader.load([_nodes("Person", 1)])
+        assert stats.failed_chunks == 1
+        assert stats.nodes == 0
+
+        with pytest.raises(TransientError):
+            await loader.write_chunks("Q", "nodes", [{"id": 1}])
+
+    @pytest.mark.asyncio
+    async def test_large_batches_use_load_csv(self, tmp_path: Path) -> None:
+        graph = _Graph()
+        loader = Neo4jBulkLoader(graph.session, csv_dir=tmp_path, csv_threshold=5)
+
+        stats = await loader.load([_nodes("Person", 5), _nodes("Org", 2)])
+
+        csv_calls = [(q, p) for q, p in graph.calls if "LOAD CSV" in q]
+        assert stats.csv_batches == 1
+        assert len(csv_calls) == 1
+        query, params = csv_calls[0]
+        assert params["url"].startswith("file:///bulk_")
+        assert "IN TRANSACTIONS OF $batch ROWS" in query
+        assert "MERGE (n:Person {id: node.id})" in query
+        assert list(tmp_path.iterdir()) == []  # 적재 후 임시 CSV 삭제
+        assert stats.nodes == 7 + 2
+
+
+def test_export_csv_unions_columns(tmp_path: Path) -> None:
+    path = export_csv([{"id": 1}, {"id": 2, "name": "b"}], tmp_path / "x" / "n.csv")
+
+    with path.open(encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [{"id": "1", "name": ""}, {"id": "2", "name": "b"}]
+
+
+def test_dedupe_rows_keeps_last_row_in_first_position() -> None:
+    rows = [{"id": 1, "v": "x"}, {"id": 2, "v": "y"}, {"id": 1, "v": "z"}]
+
+    assert dedupe_rows(rows, ["id"]) == [{"id": 1, "v": "z"}, {"id": 2, "v": "y"}]
+    assert dedupe_rows(rows, ["id", "v"]) == rows
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 
 from src.infra.performance_tracker import (
+    LatencySketch,
     PerformanceMetric,
     PerformanceTracker,
     get_tracker,
@@ -80,7 +81,7 @@ def test_cleanup_old_metrics() -> None:
             status="success",
         ),
     )
-    assert tracker.metrics == []
+    assert tracker.get_stats() == {}
 
     tracker.record(
         PerformanceMetric(
@@ -92,7 +93,62 @@ def test_cleanup_old_metrics() -> None:
             status="success",
         ),
     )
-    assert len(tracker.metrics) == 1
+    assert tracker.get_stats()["query_generation"]["count"] == 1.0
+
+
+def _metric(duration_ms: float, seconds: float, op: str = "op") -> PerformanceMetric:
+    return PerformanceMetric(
+        operation=op,
+        duration_ms=duration_ms,
+        tokens_used=1,
+        cache_hit=False,
+        timestamp=datetime.fromtimestamp(seconds, timezone.utc),
+        status="success",
+    )
+
+
+def test_slots_expire_and_are_reused() -> None:
+    clock = [600.0]
+    tracker = PerformanceTracker(window_minutes=3, clock=lambda: clock[0])
+
+    tracker.record(_metric(10, 600))
+    tracker.record(_metric(30, 660))
+    assert tracker.get_stats()["op"]["count"] == 2.0
+
+    clock[0] = 780.0  # 600초 슬롯이 윈도우 밖으로 밀려남
+    tracker.record(_metric(50, 780))
+    stats = tracker.get_stats()["op"]
+    assert stats["count"] == 2.0
+    assert stats["min_duration_ms"] == 30
+    assert stats["max_duration_ms"] == 50
+    assert len(tracker._operations["op"].slots) == 3
+
+
+def test_percentiles_from_sketch() -> None:
+    tracker = PerformanceTracker(window_minutes=5, clock=lambda: 300.0)
+    for i in range(1, 101):
+        tracker.record(_metric(float(i), 60 * (1 + i % 5)))
+
+    stats = tracker.get_stats()["op"]
+    assert stats["count"] == 100.0
+    assert abs(stats["p50_duration_ms"] - 50) <= 50 * 0.03
+    assert abs(stats["p95_duration_ms"] - 95) <= 95 * 0.03
+    assert abs(stats["p99_duration_ms"] - 99) <= 99 * 0.03
+
+
+def test_sketch_merge_matches_single_sketch() -> None:
+    left, right, both = LatencySketch(), LatencySketch(), LatencySketch()
+    for v in range(1, 50):
+        left.add(float(v))
+        both.add(float(v))
+    for v in range(50, 500):
+        right.add(float(v))
+        both.add(float(v))
+
+    left.merge(right)
+    assert left.count == both.count
+    assert left.quantile(0.9) == both.quantile(0.9)
+    assert LatencySketch().quantile(0.5) == 0.0
 
 
 def test_global_tracker_singleton() -> None:
@@ -104,3 +104,83 @@ async def test_retry_with_backoff_max_attempts_exceeded():
         await retry_with_backoff(
             always_fails, max_attempts=3, initial_delay=0.1, backoff_factor=2.0
         )
+
+
+@pytest.mark.asyncio
+async def test_deadline_scope_nests_and_skips_retry_past_deadline():
+    """남은 마감보다 긴 백오프는 기다리지 않고 바로 실패."""
+    from src.infra.retry import RetryEngine, RetryPolicy, deadline_scope, remaining_time
+
+    mock_func = AsyncMock(side_effect=TimeoutError("slow"))
+    engine = RetryEngine(
+        RetryPolicy(base_delay=5.0, jitter=False), name="test-deadline"
+    )
+
+    assert remaining_time() is None
+    with deadline_scope(60), deadline_scope(1):
+        assert 0 < remaining_time() <= 1
+        with pytest.raises(TimeoutError, match="slow"):
+            await engine.run(mock_func)
+
+    assert mock_func.call_count == 1
+    assert engine.stats.deadline_skips == 1
+
+
+@pytest.mark.asyncio
+async def test_attempt_is_cut_at_deadline():
+    """마감이 지나면 시도를 중단하고 DeadlineExceededError."""
+    import asyncio
+
+    from src.infra.retry import DeadlineExceededError, RetryEngine, deadline_scope
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    with deadline_scope(0.05), pytest.raises(DeadlineExceededError):
+        await RetryEngine(name="test-cut").run(hang)
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_caps_retries():
+    """재시도 예산이 소진되면 더 이상 재시도하지 않음."""
+    from src.infra.retry import RetryBudget, RetryEngine, RetryPolicy
+
+    budget = RetryBudget(ratio=0.0, min_retries=1, clock=lambda: 100.0)
+    engine = RetryEngine(
+        RetryPolicy(base_delay=0.0, jitter=False), budget=budget, name="test-budget"
+    )
+    mock_func = AsyncMock(side_effect=Exception("down"))
+
+    for _ in range(3):
+        with pytest.raises(Exception, match="down"):
+            await engine.run(mock_func)
+
+    # 첫 요청만 재시도 1회(두 번째 재시도부터 거절), 이후 요청은 1회씩만 시도
+    assert mock_func.call_count == 2 + 1 + 1
+    assert budget.snapshot() == {"requests": 3, "retries": 1, "rejected": 3}
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_wins_over_slow_primary():
+    """p95를 넘긴 시도에는 헤지 요청을 띄우고 먼저 끝난 결과를 사용."""
+    import asyncio
+
+    from src.infra.retry import HedgePolicy, RetryEngine, get_retry_stats
+
+    hedge = HedgePolicy(0.5, min_samples=5, min_delay=0.01)
+    for _ in range(5):
+        hedge.observe(0.02)
+    engine = RetryEngine(hedge=hedge, name="test-hedge")
+    calls = 0
+
+    async def flaky_latency():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(5 if calls == 1 else 0)
+        return calls
+
+    result = await asyncio.wait_for(engine.run(flaky_latency), timeout=1)
+
+    assert result == 2
+    assert get_retry_stats()["test-hedge"]["hedges"] == 1
+    assert get_retry_stats()["test-hedge"]["hedge_wins"] == 1
@@ -19,11 +19,13 @@ class TestInitTelemetry:
     """Tests for init_telemetry function."""
 
     @patch.dict(os.environ, {"OTEL_EXPORTER_OTLP_ENDPOINT": "http://localhost:4317"})
+    @patch("src.infra.telemetry._sampler", None)
+    @patch("src.infra.telemetry._processor", None)
     @patch("src.infra.telemetry.trace")
     @patch("src.infra.telemetry.metrics")
     @patch("src.infra.telemetry.Resource")
     @patch("src.infra.telemetry.TracerProvider")
-    @patch("src.infra.telemetry.BatchSpanProcessor")
+    @patch("src.infra.telemetry.BoundedBatchSpanProcessor")
     @patch("src.infra.telemetry.OTLPSpanExporter")
     @patch("src.infra.telemetry.MeterProvider")
     @patch("src.infra.telemetry.PeriodicExportingMetricReader")
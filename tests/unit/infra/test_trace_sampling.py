@@ -0,0 +1,185 @@
+"""Tests for head/tail trace sampling and the bounded span processor."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.infra import telemetry
+from src.infra.metrics import measure_latency
+from src.infra.telemetry import (
+    BoundedBatchSpanProcessor,
+    TraceSampler,
+    begin_span,
+    configure_sampling,
+    end_span,
+    rename_span,
+    start_span,
+    traced,
+)
+
+
+@pytest.fixture
+def replayed() -> Iterator[list[tuple[list[list[Any]], str]]]:
+    calls: list[tuple[list[list[Any]], str]] = []
+    with patch.object(
+        telemetry, "_replay", lambda records, reason: calls.append((records, reason))
+    ):
+        yield calls
+    configure_sampling(None)
+
+
+class _Exporter:
+    def __init__(self) -> None:
+        self.batches: list[list[Any]] = []
+        self.exported = threading.Event()
+
+    def export(self, batch: list[Any]) -> None:
+        self.batches.append(batch)
+        self.exported.set()
+
+
+def test_route_rates_use_longest_prefix() -> None:
+    sampler = TraceSampler(0.5, {"/api": 0.2, "/api/health": 0.0})
+
+    assert sampler.rate_for("/api/health/ready") == 0.0
+    assert sampler.rate_for("/api/qa") == 0.2
+    assert sampler.rate_for("gemini.generate_query") == 0.5
+    assert not sampler.head_sampled("/api/health")
+
+
+def test_fast_unsampled_trace_is_dropped(replayed: list[Any]) -> None:
+    configure_sampling(TraceSampler(0.0, tail_latency_ms=10_000))
+
+    @traced("inner")
+    def inner() -> int:
+        return 1
+
+    with start_span("/api/qa"):
+        assert inner() == 1
+
+    assert replayed == []
+
+
+def test_slow_trace_is_replayed_with_children(replayed: list[Any]) -> None:
+    configure_sampling(TraceSampler(0.0, tail_latency_ms=0))
+
+    @measure_latency("kg.search")
+    def search() -> str:
+        return "hit"
+
+    with start_span("/api/qa", {"http.method": "POST"}):
+        search()
+
+    [(records, reason)] = replayed
+    assert reason == "latency"
+    assert [(r[0], r[4]) for r in records] == [("/api/qa", -1), ("kg.search", 0)]
+    assert all(r[3] >= r[2] for r in records)
+
+
+def test_errored_trace_is_kept(replayed: list[Any]) -> None:
+    configure_sampling(TraceSampler(0.0, tail_latency_ms=10_000))
+
+    @traced("fails")
+    def fails() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError), start_span("/api/qa"):
+        fails()
+
+    [(records, reason)] = replayed
+    assert reason == "error"
+    assert isinstance(records[1][5], ValueError)
+    assert telemetry.get_telemetry_stats()["sampler"]["tail_kept"] == 1
+
+
+def test_sampled_trace_records_real_spans(replayed: list[Any]) -> None:
+    configure_sampling(TraceSampler(1.0))
+    tracer = MagicMock()
+
+    with (
+        patch.object(telemetry, "get_tracer", return_value=tracer),
+        start_span("/api/qa"),
+    ):
+        traced("child")(lambda: None)()
+
+    names = [c.args[0] for c in tracer.start_as_current_span.call_args_list]
+    assert names == ["/api/qa", "child"]
+    assert replayed == []
+
+
+def test_sample_key_routes_head_sampling_and_span_is_renamed(
+    replayed: list[Any],
+) -> None:
+    configure_sampling(TraceSampler(1.0, {"/api/health": 0.0}, tail_latency_ms=0))
+    tracer = MagicMock()
+
+    with patch.object(telemetry, "get_tracer", return_value=tracer):
+        scope = begin_span("HTTP GET", sample_key="/api/health/ready")
+        assert scope is not None
+        rename_span(scope, "GET /api/health/ready")
+        end_span(scope)
+
+    tracer.start_as_current_span.assert_not_called()
+    [(records, _)] = replayed
+    assert records[0][0] == "GET /api/health/ready"
+
+
+def test_processor_overflow_policies() -> None:
+    for overflow, kept in (("drop_oldest", [2, 3]), ("drop_newest", [1, 2])):
+        exporter = _Exporter()
+        processor = BoundedBatchSpanProcessor(
+            exporter,
+            max_queue_size=2,
+            max_batch_size=10,
+            schedule_delay_seconds=60,
+            overflow=overflow,
+        )
+        for span in (1, 2, 3):
+            processor.on_end(span)
+
+        assert processor.force_flush()
+        assert exporter.batches == [kept]
+        assert processor.stats()["dropped"] == 1
+        processor.shutdown()
+
+
+def test_processor_exports_full_batch_in_background() -> None:
+    exporter = _Exporter()
+    processor = BoundedBatchSpanProcessor(
+        exporter, max_batch_size=2, schedule_delay_seconds=60
+    )
+    processor.on_end("a")
+    processor.on_end("b")
+
+    assert exporter.exported.wait(2)
+    assert exporter.batches == [["a", "b"]]
+    processor.shutdown()
+
+
+def test_replay_rebuilds_span_tree() -> None:
+    tracer = MagicMock()
+    records = [
+        ["/api/qa", None, 100, 900, -1, None],
+        ["kg.search", {"k": 1}, 200, 300, 0, None],
+        ["still.running", None, 400, 0, 0, None],
+    ]
+
+    with (
+        patch.object(telemetry, "trace", MagicMock()),
+        patch.object(telemetry, "get_tracer", return_value=tracer),
+    ):
+        telemetry._replay(records, "latency")
+
+    starts = [
+        (c.args[0], c.kwargs["start_time"]) for c in tracer.start_span.call_args_list
+    ]
+    assert starts == [("/api/qa", 100), ("kg.search", 200)]
+    ends = [
+        c.kwargs["end_time"] for c in tracer.start_span.return_value.end.call_args_list
+    ]
+    assert ends == [900, 300]
@@ -202,21 +202,43 @@ async def test_handle_ocr_task_success(
 
 
 @pytest.mark.asyncio
-async def test_handle_ocr_task_rate_limited(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_handle_ocr_task_rate_limited_is_paced(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     from src.infra import worker as infra_worker
+    from src.infra import worker_runtime
 
     async def _ready() -> None:
         return None
 
     monkeypatch.setattr(infra_worker, "ensure_redis_ready", _ready)
 
-    async def _deny(*_args: Any, **_kwargs: Any) -> bool:
-        return False
+    decisions = [False, False, True]
+
+    async def _check(*_args: Any, **_kwargs: Any) -> bool:
+        return decisions.pop(0)
+
+    monkeypatch.setattr(infra_worker, "check_rate_limit", _check)
+    sleeps: list[float] = []
 
-    monkeypatch.setattr(infra_worker, "check_rate_limit", _deny)
+    async def _sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(worker_runtime, "_sleep", _sleep)
+    written: list[dict[str, Any]] = []
+    monkeypatch.setattr(
+        infra_worker, "_append_jsonl", lambda _p, rec: written.append(rec)
+    )
+
+    async def _proc(task: Any) -> dict[str, Any]:
+        return {"request_id": task.request_id}
+
+    monkeypatch.setattr(infra_worker, "_process_task", _proc)
     task = worker.OCRTask(request_id="r4", image_path="img", session_id="s4")
-    with pytest.raises(worker.RateLimitError):
-        await infra_worker.handle_ocr_task(task)
+    await infra_worker.handle_ocr_task(task)
+    assert decisions == []
+    assert len(sleeps) == 2
+    assert written == [{"request_id": "r4"}]
 
 
 @pytest.mark.asyncio
@@ -256,6 +278,73 @@ async def test_handle_ocr_task_sends_dlq(monkeypatch: pytest.MonkeyPatch) -> Non
     assert getattr(msg, "request_id") == "r5"
 
 
+@pytest.mark.asyncio
+async def test_runtime_retries_provider_error_then_sends_dlq(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from src.infra import worker as infra_worker
+    from src.infra import worker_runtime
+
+    async def _ready() -> None:
+        return None
+
+    monkeypatch.setattr(infra_worker, "ensure_redis_ready", _ready)
+
+    async def _allow(*_args: Any, **_kwargs: Any) -> bool:
+        return True
+
+    monkeypatch.setattr(infra_worker, "check_rate_limit", _allow)
+    sleeps: list[float] = []
+
+    async def _sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(worker_runtime, "_sleep", _sleep)
+    attempts: list[str] = []
+
+    async def _proc(task: Any) -> None:
+        attempts.append(task.request_id)
+        raise worker.ProviderError("quota")
+
+    monkeypatch.setattr(infra_worker, "_process_task", _proc)
+
+    class _Broker:
+        def __init__(self) -> None:
+            self.published: list[Any] = []
+
+        async def publish(self, msg: Any, channel: str) -> None:
+            self.published.append((channel, msg))
+
+    broker = _Broker()
+    monkeypatch.setattr(infra_worker, "broker", broker)
+    for name in ("_runtime", "_result_writer", "_pacer"):
+        monkeypatch.setattr(infra_worker, name, None)
+    config = types.SimpleNamespace(
+        worker_rate_limit=100,
+        worker_rate_window_seconds=60,
+        worker_concurrency=8,  # burst covers every attempt, so no pacing sleeps
+        worker_prefetch=4,
+        worker_result_batch_size=10,
+        worker_result_flush_interval=1.0,
+    )
+    monkeypatch.setattr(infra_worker, "get_config", lambda: config)
+    infra_worker._start_runtime(config)  # type: ignore[arg-type]
+    runtime = infra_worker._runtime
+    assert runtime is not None
+
+    task = worker.OCRTask(request_id="r6", image_path="img", session_id="s6")
+    await infra_worker.handle_ocr_task(task)
+    assert await runtime.drain(timeout=5.0) is True
+
+    assert attempts == ["r6"] * (infra_worker.PROVIDER_MAX_RETRIES + 1)
+    assert sleeps == [2.0, 4.0, 8.0]
+    [(channel, msg)] = broker.published
+    assert channel == "ocr_dlq"
+    assert msg.request_id == "r6"
+    assert msg.error_type == "ProviderError"
+    assert runtime.metrics.retried == infra_worker.PROVIDER_MAX_RETRIES
+
+
 @pytest.mark.asyncio
 async def test_handle_ocr_task_lats_toggle(monkeypatch: pytest.MonkeyPatch) -> None:
     from src.infra import worker as infra_worker
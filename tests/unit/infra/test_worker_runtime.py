@@ -0,0 +1,232 @@
+"""Tests for src/infra/worker_runtime.py module."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from src.infra.worker_runtime import (
+    BufferedJsonlWriter,
+    QuotaPacer,
+    WorkerMetrics,
+    WorkerRuntime,
+)
+
+
+class TestWorkerRuntime:
+    """Test WorkerRuntime concurrency, backpressure and drain."""
+
+    @pytest.mark.asyncio
+    async def test_processes_items_concurrently(self) -> None:
+        active = 0
+        peak = 0
+
+        async def handler(_item: int) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+
+        runtime: WorkerRuntime[int] = WorkerRuntime(
+            handler, concurrency=4, prefetch=8, metrics_interval=0
+        )
+        runtime.start()
+        for i in range(8):
+            await runtime.submit(i)
+        assert await runtime.drain(timeout=5.0) is True
+
+        assert peak == 4
+        assert runtime.metrics.completed == 8
+        assert runtime.metrics.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_submit_blocks_when_prefetch_full(self) -> None:
+        release = asyncio.Event()
+
+        async def handler(_item: int) -> None:
+            await release.wait()
+
+        runtime: WorkerRuntime[int] = WorkerRuntime(
+            handler, concurrency=1, prefetch=1, metrics_interval=0
+        )
+        runtime.start()
+        await runtime.submit(1)
+        await asyncio.sleep(0)  # consumer takes item 1
+        await runtime.submit(2)  # fills the prefetch slot
+
+        blocked = asyncio.create_task(runtime.submit(3))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        release.set()
+        await asyncio.wait_for(blocked, timeout=1.0)
+        await runtime.drain(timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted_not_raised(self) -> None:
+        async def handler(item: int) -> None:
+            if item == 1:
+                raise RuntimeError("boom")
+
+        runtime: WorkerRuntime[int] = WorkerRuntime(
+            handler, concurrency=2, metrics_interval=0
+        )
+        runtime.start()
+        await runtime.submit(0)
+        await runtime.submit(1)
+        await runtime.drain(timeout=1.0)
+
+        assert runtime.metrics.completed == 1
+        assert runtime.metrics.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors_then_calls_failure_hook(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src.infra import worker_runtime
+
+        sleeps: list[float] = []
+
+        async def _sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr(worker_runtime, "_sleep", _sleep)
+        calls: dict[int, int] = {}
+
+        async def handler(item: int) -> None:
+            calls[item] = calls.get(item, 0) + 1
+            if item == 0 and calls[item] < 3:
+                raise ConnectionError("flaky")
+            if item == 1:
+                raise ConnectionError("down")
+            if item == 2:
+                raise ValueError("bad input")
+
+        failed: list[tuple[int, str]] = []
+
+        async def on_failure(item: int, exc: Exception) -> None:
+            failed.append((item, type(exc).__name__))
+
+        runtime: WorkerRuntime[int] = WorkerRuntime(
+            handler,
+            concurrency=1,
+            metrics_interval=0,
+            retry_on=(ConnectionError,),
+            max_retries=2,
+            retry_backoff=0.5,
+            on_failure=on_failure,
+        )
+        runtime.start()
+        for i in range(3):
+            await runtime.submit(i)
+        await runtime.drain(timeout=1.0)
+
+        assert calls == {0: 3, 1: 3, 2: 1}
+        assert sleeps == [0.5, 1.0, 0.5, 1.0]
+        assert failed == [(1, "ConnectionError"), (2, "ValueError")]
+        assert runtime.metrics.completed == 1
+        assert runtime.metrics.failed == 2
+        assert runtime.metrics.retried == 4
+
+    @pytest.mark.asyncio
+    async def test_drain_timeout_and_rejects_new_items(self) -> None:
+        async def handler(_item: int) -> None:
+            await asyncio.sleep(10)
+
+        runtime: WorkerRuntime[int] = WorkerRuntime(
+            handler, concurrency=1, metrics_interval=0
+        )
+        runtime.start()
+        await runtime.submit(0)
+        assert await runtime.drain(timeout=0.05) is False
+        with pytest.raises(RuntimeError):
+            await runtime.submit(1)
+
+
+class TestQuotaPacer:
+    """Test QuotaPacer pacing instead of rejecting."""
+
+    @pytest.mark.asyncio
+    async def test_spaces_requests_after_burst(self) -> None:
+        pacer = QuotaPacer(limit=20, window=1.0, burst=2)
+
+        waits = [await pacer.acquire() for _ in range(3)]
+
+        assert waits[0] < 0.01
+        assert waits[1] < 0.01
+        assert waits[2] == pytest.approx(0.05, abs=0.03)
+
+    @pytest.mark.asyncio
+    async def test_retries_shared_quota_until_admitted(self) -> None:
+        pacer = QuotaPacer(limit=100, window=1.0)
+        answers = [False, False, True]
+
+        async def try_acquire() -> bool:
+            return answers.pop(0)
+
+        waited = await pacer.acquire(try_acquire)
+
+        assert answers == []
+        assert waited > 0
+
+
+class TestBufferedJsonlWriter:
+    """Test BufferedJsonlWriter batching."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_full(self, tmp_path: Path) -> None:
+        path = tmp_path / "out" / "results.jsonl"
+        writer = BufferedJsonlWriter(path, batch_size=3, flush_interval=60)
+
+        await writer.write({"id": 1})
+        await writer.write({"id": 2})
+        assert not path.exists()
+        await writer.write({"id": 3})
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+        assert writer.flushed_batches == 1
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_interval(self, tmp_path: Path) -> None:
+        path = tmp_path / "results.jsonl"
+        writer = BufferedJsonlWriter(path, batch_size=100, flush_interval=0.05)
+
+        await writer.write({"id": "한글"})
+        await asyncio.sleep(0.2)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"id": "한글"}
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_remaining(self, tmp_path: Path) -> None:
+        path = tmp_path / "results.jsonl"
+        writer = BufferedJsonlWriter(path, batch_size=100, flush_interval=60)
+
+        await writer.write({"id": 1})
+        await writer.close()
+
+        assert writer.flushed_records == 1
+        assert path.read_text(encoding="utf-8").count("\n") == 1
+
+
+class TestWorkerMetrics:
+    """Test WorkerMetrics snapshot."""
+
+    def test_snapshot_reports_lag_and_throughput(self) -> None:
+        metrics = WorkerMetrics()
+        for lag in (0.1, 0.2, 3.0):
+            metrics.record_start(lag)
+            metrics.record_finish(success=True)
+
+        snapshot = metrics.snapshot()
+        assert snapshot["completed"] == 3
+        assert snapshot["in_flight"] == 0
+        assert snapshot["queue_lag_p50_s"] == 0.2
+        assert snapshot["queue_lag_p95_s"] == 3.0
+        assert snapshot["tasks_per_second"] > 0
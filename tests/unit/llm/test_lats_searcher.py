@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import math
 from typing import Any, List, Optional
 
@@ -155,3 +156,270 @@ async def test_evaluate_updates_budget_on_error() -> None:
     best = await searcher.run(SearchState())
     assert best.reward == -1.0
     assert best.reflection is not None
+
+
+def test_canonical_key_ignores_action_order_but_keeps_last_action() -> None:
+    ab = SearchState().add_turn("a").add_turn("b")
+    ba = SearchState().add_turn("b").add_turn("a")
+    cab = SearchState().add_turn("c").add_turn("a").add_turn("b")
+    acb = SearchState().add_turn("a").add_turn("c").add_turn("b")
+
+    assert cab.canonical_key() == acb.canonical_key()
+    assert ab.canonical_key() != ba.canonical_key()
+    assert ab.canonical_key() == ab.update_budget(tokens=50).canonical_key()
+
+
+@pytest.mark.asyncio
+async def test_transpositions_share_expansion_and_evaluation() -> None:
+    proposals = 0
+    evaluated: list[str] = []
+
+    async def propose(node: SearchNode) -> Any:
+        nonlocal proposals
+        proposals += 1
+        return [a for a in ("x", "y", "z") if a not in node.state.focus_history]
+
+    async def evaluate(node: SearchNode) -> float:
+        evaluated.append(node.state.canonical_key())
+        return 0.5
+
+    searcher = LATSSearcher(
+        llm_provider=None,
+        propose_actions=propose,
+        evaluate_action=evaluate,
+        max_visits=12,
+        max_depth=3,
+    )
+    await searcher.run(SearchState())
+
+    assert len(evaluated) == len(set(evaluated))
+    assert searcher.stats.transposition_hits > 0
+    assert searcher.stats.llm_evaluations == len(evaluated)
+    assert 0 < searcher.stats.transposition_hit_rate <= 1
+
+
+@pytest.mark.asyncio
+async def test_eval_cache_reused_across_runs() -> None:
+    from src.caching.redis_cache import RedisEvalCache
+
+    calls = 0
+
+    async def propose(node: SearchNode) -> Any:  # noqa: ARG001
+        return ["a1", "a2"] if node.action is None else []
+
+    async def evaluate(node: SearchNode) -> float:
+        nonlocal calls
+        calls += 1
+        return 0.9 if node.action == "a2" else 0.1
+
+    cache = RedisEvalCache(redis_client=None)
+    for _ in range(2):
+        searcher = LATSSearcher(
+            llm_provider=None,
+            propose_actions=propose,
+            evaluate_action=evaluate,
+            eval_cache=cache,
+            cache_namespace="task-1:",
+            max_visits=3,
+        )
+        best = await searcher.run(SearchState())
+        assert best.action == "a2"
+
+    assert calls == 2
+    assert searcher.stats.llm_evaluations == 0
+    assert searcher.stats.cache_hits == 2
+
+
+@pytest.mark.asyncio
+async def test_evaluation_budget_caps_evaluator_calls() -> None:
+    calls = 0
+
+    async def propose(node: SearchNode) -> Any:
+        return [f"{node.action or 'root'}-{i}" for i in range(3)]
+
+    async def evaluate(node: SearchNode) -> float:  # noqa: ARG001
+        nonlocal calls
+        calls += 1
+        return 0.5
+
+    searcher = LATSSearcher(
+        llm_provider=None,
+        propose_actions=propose,
+        evaluate_action=evaluate,
+        max_llm_evaluations=4,
+        max_visits=10,
+    )
+    await searcher.run(SearchState())
+
+    assert calls == 4
+    assert searcher.stats.budget_skips == 2
+    assert searcher.evaluation_budget_exhausted
+
+
+def _branching_proposer(width: int) -> Any:
+    async def propose(node: SearchNode) -> list[str]:
+        prefix = node.action or "root"
+        return [f"{prefix}/{i}" for i in range(width)]
+
+    return propose
+
+
+async def _peak_concurrency_search(parallelism: int) -> tuple[int, LATSSearcher]:
+    active = 0
+    peak = 0
+
+    async def evaluate(node: SearchNode) -> float:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return 0.5 + 0.01 * len(node.action or "")
+
+    searcher = LATSSearcher(
+        llm_provider=None,
+        propose_actions=_branching_proposer(3),
+        evaluate_action=evaluate,
+        max_visits=8,
+        max_depth=4,
+        concurrency_limit=32,
+        parallelism=parallelism,
+        seed=1,
+    )
+    await searcher.run(SearchState())
+    return peak, searcher
+
+
+@pytest.mark.asyncio
+async def test_parallel_search_overlaps_iterations() -> None:
+    serial_peak, serial = await _peak_concurrency_search(parallelism=1)
+    parallel_peak, parallel = await _peak_concurrency_search(parallelism=4)
+
+    assert serial.total_visits == parallel.total_visits == 8
+    # One expansion evaluates its 3 children at once; parallel workers
+    # overlap several expansions.
+    assert serial_peak == 3
+    assert parallel_peak > serial_peak
+
+
+@pytest.mark.asyncio
+async def test_failed_iteration_cancels_sibling_workers() -> None:
+    cancelled = 0
+
+    async def propose(node: SearchNode) -> list[str]:
+        nonlocal cancelled
+        if node.action is None:
+            return ["a", "b"]
+        if node.action == "a":
+            await asyncio.sleep(0.01)
+            raise RuntimeError("proposer down")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        return []
+
+    async def evaluate(node: SearchNode) -> float:
+        return 0.5
+
+    searcher = LATSSearcher(
+        llm_provider=None,
+        propose_actions=propose,
+        evaluate_action=evaluate,
+        max_visits=8,
+        parallelism=2,
+    )
+
+    with pytest.raises(RuntimeError, match="proposer down"):
+        await asyncio.wait_for(searcher.run(SearchState()), timeout=2.0)
+    assert cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_virtual_loss_spreads_workers_over_branches() -> None:
+    selected: list[str] = []
+    release = asyncio.Event()
+
+    async def propose(node: SearchNode) -> list[str]:
+        if node.action is None:
+            return ["a", "b", "c"]
+        selected.append(node.action)
+        await release.wait()
+        return []
+
+    async def evaluate(node: SearchNode) -> float:
+        return 0.5
+
+    searcher = LATSSearcher(
+        llm_provider=None,
+        propose_actions=propose,
+        evaluate_action=evaluate,
+        max_visits=4,
+        parallelism=3,
+    )
+    task = asyncio.create_task(searcher.run(SearchState()))
+    while len(selected) < 3:
+        await asyncio.sleep(0.01)
+    release.set()
+    await task
+
+    assert sorted(selected[:3]) == ["a", "b", "c"]
+    assert all(n.virtual_visits == 0 for n in [task.result(), *task.result().children])
+
+
+@pytest.mark.asyncio
+async def test_parallel_search_is_reproducible_with_seed() -> None:
+    from src.llm.mock_provider import MockLLMProvider
+
+    async def run_once() -> list[tuple[str | None, int]]:
+        searcher = LATSSearcher(
+            llm_provider=MockLLMProvider(latency=0.005, seed=7),
+            propose_actions=_branching_proposer(3),
+            max_visits=10,
+            max_depth=3,
+            parallelism=3,
+            seed=7,
+        )
+        best = await searcher.run(SearchState())
+        path: list[tuple[str | None, int]] = []
+        node: SearchNode | None = best
+        while node:
+            path.append((node.action, node.visits))
+            node = node.parent
+        return path
+
+    assert await run_once() == await run_once()
+
+
+@pytest.mark.asyncio
+async def test_parallelism_capped_by_rate_limiter() -> None:
+    from src.agent.rate_limiter import RateLimiter
+
+    searcher = LATSSearcher(
+        llm_provider=None,
+        parallelism=8,
+        concurrency_limit=8,
+        rate_limiter=RateLimiter(max_concurrency=2),
+    )
+
+    assert searcher.parallelism == 2
+    assert searcher.concurrency_limit == 2
+
+
+@pytest.mark.asyncio
+async def test_target_score_stops_search_early() -> None:
+    async def evaluate(node: SearchNode) -> float:
+        return 1.0 if node.action == "root/1" else 0.1
+
+    searcher = LATSSearcher(
+        llm_provider=None,
+        propose_actions=_branching_proposer(2),
+        evaluate_action=evaluate,
+        max_visits=10,
+        target_score=0.9,
+    )
+    best = await searcher.run(SearchState())
+
+    assert best.action == "root/1"
+    assert searcher.total_visits == 1
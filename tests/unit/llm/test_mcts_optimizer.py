@@ -1,12 +1,13 @@
 """Tests for the MCTS workflow optimizer module."""
 
+import asyncio
 import math
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
-from src.workflow.mcts_optimizer import MCTSNode, MCTSWorkflowOptimizer
+from src.workflow.mcts_optimizer import MCTSNode, MCTSWorkflowOptimizer, PrefixCache
 
 
 class TestMCTSNode:
@@ -180,3 +181,121 @@ class TestMCTSWorkflowOptimizer:
         # Simulate should not raise, even if internal logic fails
         reward = await optimizer._simulate(node, "Test query")
         assert isinstance(reward, float)
+
+
+class TestMemoizedRollouts:
+    """Tests for prefix memoization and batched waves."""
+
+    @pytest.fixture
+    def mock_agent(self) -> Any:
+        """Create a mock GeminiAgent."""
+        return MagicMock()
+
+    @pytest.mark.asyncio
+    async def test_shared_prefixes_run_once(self, mock_agent: Any) -> None:
+        """Test that each configuration prefix is executed only once."""
+        calls: list[tuple[str, ...]] = []
+
+        async def step(prefix: tuple[str, ...], _query: str, upstream: Any) -> Any:
+            calls.append(prefix)
+            return (upstream or 0.0) + (0.5 if prefix[-1] in {"b", "hi"} else 0.1)
+
+        optimizer = MCTSWorkflowOptimizer(
+            mock_agent,
+            ["a", "b"],
+            iterations=12,
+            stages=[["lo", "hi"]],
+            step=step,
+            seed=0,
+        )
+        result = await optimizer.optimize_workflow("query")
+
+        assert len(calls) == len(set(calls))
+        assert len(calls) <= 2 + 4
+        assert result["stats"]["cache_reuse_ratio"] > 0.5
+        assert result["best_template"] == "b"
+        assert result["best_config"][0] == "b"
+
+    @pytest.mark.asyncio
+    async def test_prefix_cache_shared_across_runs(self, mock_agent: Any) -> None:
+        """Test that a shared cache serves repeated optimizations of a query."""
+        calls = 0
+
+        async def step(_prefix: tuple[str, ...], _query: str, _upstream: Any) -> Any:
+            nonlocal calls
+            calls += 1
+            return 1.0
+
+        cache = PrefixCache()
+        for _ in range(2):
+            optimizer = MCTSWorkflowOptimizer(
+                mock_agent, ["a", "b"], iterations=4, step=step, prefix_cache=cache
+            )
+            await optimizer.optimize_workflow("same query")
+
+        assert calls == 2
+        assert optimizer.stats.cache_reuse_ratio == 1.0
+
+    @pytest.mark.asyncio
+    async def test_batched_waves_run_concurrently(self, mock_agent: Any) -> None:
+        """Test that rollouts in one wave are scheduled together."""
+        active = 0
+        peak = 0
+
+        async def step(prefix: tuple[str, ...], _query: str, _upstream: Any) -> Any:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return float(len(prefix[-1]))
+
+        optimizer = MCTSWorkflowOptimizer(
+            mock_agent,
+            ["a", "bb", "ccc", "dddd"],
+            iterations=8,
+            step=step,
+            batch_size=4,
+        )
+        result = await optimizer.optimize_workflow("query")
+
+        assert peak == 4
+        assert result["stats"]["waves"] == 2
+        assert result["stats"]["rollouts_per_minute"] > 0
+
+    @pytest.mark.asyncio
+    async def test_prefix_cache_deduplicates_inflight(self) -> None:
+        """Test that concurrent lookups of one key share a computation."""
+        cache = PrefixCache()
+        calls = 0
+
+        async def compute() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(
+            cache.get_or_compute("k", compute), cache.get_or_compute("k", compute)
+        )
+
+        assert calls == 1
+        assert sorted(hit for _, hit in results) == [False, True]
+
+    def test_prefix_cache_evicts_least_recent(self) -> None:
+        """Test LRU eviction beyond max_entries."""
+        cache = PrefixCache(max_entries=1)
+
+        async def fill() -> None:
+            await cache.get_or_compute("a", _const(1))
+            await cache.get_or_compute("b", _const(2))
+
+        asyncio.run(fill())
+        assert len(cache) == 1
+
+
+def _const(value: int) -> Any:
+    async def compute() -> int:
+        return value
+
+    return compute
@@ -197,6 +197,31 @@ class TestMockLLMProviderCountTokens:
         assert count == 0  # split removes all whitespace
 
 
+class TestMockLLMProviderSeededScores:
+    """Tests for seeded unstructured responses used by search benchmarks."""
+
+    @pytest.mark.asyncio
+    async def test_seeded_score_depends_only_on_prompt(self) -> None:
+        """Test that the same seed and prompt always yield the same score."""
+        first = MockLLMProvider(seed=3)
+        second = MockLLMProvider(seed=3)
+        a = await first.generate_content_async(prompt="score a")
+        await second.generate_content_async(prompt="score b")
+        b = await second.generate_content_async(prompt="score a")
+
+        assert a.content == b.content
+        assert 0.0 <= float(a.content) < 1.0
+
+    @pytest.mark.asyncio
+    async def test_different_seeds_differ(self) -> None:
+        """Test that the seed changes the generated score."""
+        scores = {
+            (await MockLLMProvider(seed=s).generate_content_async("p")).content
+            for s in range(5)
+        }
+        assert len(scores) > 1
+
+
 class TestMockLLMProviderConstants:
     """Tests for MockLLMProvider class constants."""
 
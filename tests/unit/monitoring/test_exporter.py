@@ -1,7 +1,7 @@
 """Tests for src/monitoring/exporter.py module.
 
 This module tests the Prometheus metrics exporter functionality including:
-- MetricsMiddleware for HTTP request/response metrics
+- MetricsMiddleware for HTTP request/response metrics (pure ASGI)
 - add_metrics_endpoint for registering /metrics endpoint
 - setup_metrics for complete metrics setup
 """
@@ -12,158 +12,83 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
 
 
-class TestMetricsMiddleware:
-    """Test MetricsMiddleware class."""
-
-    @pytest.mark.asyncio
-    async def test_dispatch_success_status(self) -> None:
-        """Test dispatch records success status for 2xx responses."""
-        from src.monitoring.exporter import MetricsMiddleware
-
-        # Create mock app
-        mock_app = MagicMock()
-        middleware = MetricsMiddleware(mock_app)
-
-        # Create mock request
-        mock_request = MagicMock(spec=Request)
-        mock_request.url.path = "/api/test"
-
-        # Create mock response with success status
-        mock_response = MagicMock(spec=Response)
-        mock_response.status_code = 200
-
-        # Create mock call_next that returns the response
-        async def mock_call_next(request: Any) -> Response:
-            return mock_response
-
-        with patch("src.monitoring.exporter.record_api_call") as mock_record:
-            result = await middleware.dispatch(mock_request, mock_call_next)
-
-            assert result == mock_response
-            mock_record.assert_called_once()
-            call_args = mock_record.call_args
-            assert call_args.kwargs["model"] == "http"
-            assert call_args.kwargs["status"] == "success"
-            assert "latency_seconds" in call_args.kwargs
-
-    @pytest.mark.asyncio
-    async def test_dispatch_error_status_4xx(self) -> None:
-        """Test dispatch records error status for 4xx responses."""
-        from src.monitoring.exporter import MetricsMiddleware
-
-        mock_app = MagicMock()
-        middleware = MetricsMiddleware(mock_app)
-
-        mock_request = MagicMock(spec=Request)
-        mock_request.url.path = "/api/error"
-
-        mock_response = MagicMock(spec=Response)
-        mock_response.status_code = 400
-
-        async def mock_call_next(request: Any) -> Response:
-            return mock_response
-
-        with patch("src.monitoring.exporter.record_api_call") as mock_record:
-            result = await middleware.dispatch(mock_request, mock_call_next)
-
-            assert result == mock_response
-            mock_record.assert_called_once()
-            assert mock_record.call_args.kwargs["status"] == "error"
-
-    @pytest.mark.asyncio
-    async def test_dispatch_error_status_5xx(self) -> None:
-        """Test dispatch records error status for 5xx responses."""
-        from src.monitoring.exporter import MetricsMiddleware
-
-        mock_app = MagicMock()
-        middleware = MetricsMiddleware(mock_app)
+def _metrics_client(raise_server_exceptions: bool = True) -> TestClient:
+    from src.monitoring.exporter import MetricsMiddleware
 
-        mock_request = MagicMock(spec=Request)
-        mock_request.url.path = "/api/server-error"
+    async def ok(request: Request) -> Response:
+        return PlainTextResponse(request.path_params.get("item_id", "ok"))
 
-        mock_response = MagicMock(spec=Response)
-        mock_response.status_code = 500
+    async def bad(_request: Request) -> Response:
+        return PlainTextResponse("bad", status_code=400)
 
-        async def mock_call_next(request: Any) -> Response:
-            return mock_response
+    async def boom(_request: Request) -> Response:
+        raise ValueError("Test exception")
 
-        with patch("src.monitoring.exporter.record_api_call") as mock_record:
-            result = await middleware.dispatch(mock_request, mock_call_next)
+    app = Starlette(
+        routes=[
+            Route("/api/items/{item_id}", ok),
+            Route("/api/error", bad),
+            Route("/api/exception", boom),
+            Route("/metrics", ok),
+        ],
+        middleware=[Middleware(MetricsMiddleware)],
+    )
+    return TestClient(app, raise_server_exceptions=raise_server_exceptions)
 
-            assert result == mock_response
-            assert mock_record.call_args.kwargs["status"] == "error"
 
-    @pytest.mark.asyncio
-    async def test_dispatch_exception_records_error(self) -> None:
-        """Test dispatch records error status when exception is raised."""
-        from src.monitoring.exporter import MetricsMiddleware
-
-        mock_app = MagicMock()
-        middleware = MetricsMiddleware(mock_app)
-
-        mock_request = MagicMock(spec=Request)
-        mock_request.url.path = "/api/exception"
-
-        async def mock_call_next_raises(request: Any) -> Response:
-            raise ValueError("Test exception")
-
-        with patch("src.monitoring.exporter.record_api_call") as mock_record:
+class TestMetricsMiddleware:
+    """Test MetricsMiddleware (pure ASGI)."""
+
+    def test_records_route_template_and_status(self) -> None:
+        """Path parameters collapse into the route template label."""
+        with patch("src.monitoring.exporter.record_http_request") as mock_record:
+            client = _metrics_client()
+            client.get("/api/items/1")
+            client.get("/api/items/2")
+
+        labels = {c.kwargs["route"] for c in mock_record.call_args_list}
+        assert labels == {"/api/items/{item_id}"}
+        kwargs = mock_record.call_args.kwargs
+        assert kwargs["method"] == "GET"
+        assert kwargs["status_code"] == 200
+        assert isinstance(kwargs["duration_seconds"], float)
+        assert kwargs["duration_seconds"] >= 0
+
+    def test_error_status_and_unmatched_route(self) -> None:
+        """4xx responses and unknown paths are recorded with bounded labels."""
+        with patch("src.monitoring.exporter.record_http_request") as mock_record:
+            client = _metrics_client()
+            client.get("/api/error")
+            client.get("/no/such/path")
+
+        calls = [c.kwargs for c in mock_record.call_args_list]
+        assert (calls[0]["route"], calls[0]["status_code"]) == ("/api/error", 400)
+        assert (calls[1]["route"], calls[1]["status_code"]) == ("unmatched", 404)
+
+    def test_exception_records_500(self) -> None:
+        """Unhandled exceptions are recorded as 500 and re-raised."""
+        with patch("src.monitoring.exporter.record_http_request") as mock_record:
+            client = _metrics_client()
             with pytest.raises(ValueError, match="Test exception"):
-                await middleware.dispatch(mock_request, mock_call_next_raises)
-
-            mock_record.assert_called_once()
-            assert mock_record.call_args.kwargs["status"] == "error"
-
-    @pytest.mark.asyncio
-    async def test_dispatch_metrics_endpoint_excluded(self) -> None:
-        """Test that /metrics endpoint requests are not recorded."""
-        from src.monitoring.exporter import MetricsMiddleware
-
-        mock_app = MagicMock()
-        middleware = MetricsMiddleware(mock_app)
-
-        mock_request = MagicMock(spec=Request)
-        mock_request.url.path = "/metrics"
-
-        mock_response = MagicMock(spec=Response)
-        mock_response.status_code = 200
-
-        async def mock_call_next(request: Any) -> Response:
-            return mock_response
-
-        with patch("src.monitoring.exporter.record_api_call") as mock_record:
-            result = await middleware.dispatch(mock_request, mock_call_next)
-
-            assert result == mock_response
-            mock_record.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_dispatch_measures_latency(self) -> None:
-        """Test that latency is measured correctly."""
-        from src.monitoring.exporter import MetricsMiddleware
-
-        mock_app = MagicMock()
-        middleware = MetricsMiddleware(mock_app)
-
-        mock_request = MagicMock(spec=Request)
-        mock_request.url.path = "/api/latency-test"
-
-        mock_response = MagicMock(spec=Response)
-        mock_response.status_code = 200
+                client.get("/api/exception")
 
-        async def mock_call_next(request: Any) -> Response:
-            return mock_response
+        mock_record.assert_called_once()
+        assert mock_record.call_args.kwargs["status_code"] == 500
 
-        with patch("src.monitoring.exporter.record_api_call") as mock_record:
-            await middleware.dispatch(mock_request, mock_call_next)
+    def test_metrics_endpoint_excluded(self) -> None:
+        """Requests to /metrics are not recorded."""
+        with patch("src.monitoring.exporter.record_http_request") as mock_record:
+            _metrics_client().get("/metrics")
 
-            latency = mock_record.call_args.kwargs["latency_seconds"]
-            assert isinstance(latency, float)
-            assert latency >= 0
+        mock_record.assert_not_called()
 
 
 class TestAddMetricsEndpoint:
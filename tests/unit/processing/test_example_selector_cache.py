@@ -0,0 +1,177 @@
+"""Tests for the pooled, batched DynamicExampleSelector."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from src.infra.graph_snapshot import SNAPSHOT_QUERY
+from src.processing.example_selector import (
+    DynamicExampleSelector,
+    get_example_selector,
+)
+
+
+class _Graph:
+    """Answers selector queries from in-memory examples."""
+
+    def __init__(self) -> None:
+        self.rules = ["r1"]
+        self.examples_updated_at: str | None = None
+        self.examples = [
+            {
+                "example": "a",
+                "rate": 0.9,
+                "usage": 0,
+                "has_table": True,
+                "density": 0.5,
+            },
+            {
+                "example": "b",
+                "rate": 0.9,
+                "usage": 1,
+                "has_table": False,
+                "density": 0.9,
+            },
+            {
+                "example": "c",
+                "rate": 0.95,
+                "usage": 5,
+                "has_table": True,
+                "density": None,
+            },
+        ]
+        self.queries: list[str] = []
+        self.updates: list[dict[str, Any]] = []
+
+    @contextmanager
+    def session(self) -> Iterator[Any]:
+        yield self
+
+    def run(self, query: str, **params: Any) -> list[dict[str, Any]]:
+        self.queries.append(query)
+        if query == SNAPSHOT_QUERY:
+            return [
+                {
+                    "rule_ids": self.rules,
+                    "query_types": [],
+                    "examples": len(self.examples),
+                    "examples_updated_at": self.examples_updated_at,
+                }
+            ]
+        if "RETURN e.text AS example" in query:
+            return [dict(ex) for ex in self.examples]
+        if "UNWIND $rows" in query:
+            self.updates.extend(params["rows"])
+        return []
+
+    def count(self, fragment: str) -> int:
+        return sum(fragment in q for q in self.queries)
+
+
+class _KG:
+    def __init__(self, graph: _Graph) -> None:
+        self.graph_session = graph.session
+
+
+def _selector(graph: _Graph, **kwargs: Any) -> DynamicExampleSelector:
+    return DynamicExampleSelector(_KG(graph), flush_interval=60, **kwargs)  # type: ignore[arg-type]
+
+
+class TestCandidatePool:
+    """Test pool caching and in-memory filtering."""
+
+    def test_pool_is_reused_within_check_interval(self) -> None:
+        graph = _Graph()
+        selector = _selector(graph)
+
+        picks = [
+            [ex["example"] for ex in selector.select_best_examples("qt", {}, k=2)]
+            for _ in range(3)
+        ]
+
+        # 사용 횟수가 캐시에 반영되어 같은 성공률이면 덜 쓰인 예시가 앞섭니다.
+        assert picks == [["c", "a"], ["c", "a"], ["c", "b"]]
+        assert graph.count("RETURN e.text AS example") == 1
+        assert graph.count("MATCH (r:Rule)") == 1
+
+    def test_context_filters(self) -> None:
+        selector = _selector(_Graph())
+
+        table = selector.select_best_examples("t", {"has_table_chart": True}, k=5)
+        dense = selector.select_best_examples("t", {"text_density": 0.8}, k=5)
+
+        assert {ex["example"] for ex in table} == {"a", "c"}
+        assert [ex["example"] for ex in dense] == ["b"]
+
+    def test_reloads_only_on_rule_version_change(self) -> None:
+        graph = _Graph()
+        selector = _selector(graph, check_interval=0)
+
+        selector.select_best_examples("t", {}, k=1)
+        selector.select_best_examples("t", {}, k=1)
+        assert graph.count("RETURN e.text AS example") == 1
+        assert graph.count("MATCH (r:Rule)") == 2
+
+        graph.rules.append("r2")
+        graph.examples[0]["usage"] = 10
+        result = selector.select_best_examples("t", {}, k=3)
+        assert graph.count("RETURN e.text AS example") == 2
+        # 다시 읽은 값에 아직 기록되지 않은 증가분(c 2회)이 더해집니다.
+        assert {ex["example"]: ex["usage"] for ex in result} == {
+            "c": 7,
+            "b": 1,
+            "a": 10,
+        }
+
+    def test_reloads_when_examples_change(self) -> None:
+        graph = _Graph()
+        selector = _selector(graph, check_interval=0)
+
+        selector.select_best_examples("t", {}, k=1)
+        graph.examples[1]["rate"] = 0.99
+        graph.examples_updated_at = "2026-10-19T00:00:00Z"
+        [best] = selector.select_best_examples("t", {}, k=1)
+
+        assert graph.count("RETURN e.text AS example") == 2
+        assert best["example"] == "b"
+
+
+class TestUsageBuffer:
+    """Test batched usage-count writes."""
+
+    def test_flush_writes_single_unwind(self) -> None:
+        graph = _Graph()
+        selector = _selector(graph)
+
+        for _ in range(3):
+            selector.select_best_examples("t", {}, k=2)
+        assert graph.updates == []
+        assert selector.pending() == 6
+
+        assert selector.flush() == 3
+        assert graph.count("UNWIND $rows") == 1
+        assert sum(row["count"] for row in graph.updates) == 6
+        assert selector.pending() == 0
+        assert selector.flush() == 0
+
+    def test_failed_flush_drops_counts(self) -> None:
+        graph = _Graph()
+        selector = _selector(graph)
+        selector.select_best_examples("t", {}, k=1)
+
+        def broken(*_args: Any, **_kwargs: Any) -> Any:
+            raise RuntimeError("down")
+
+        graph.run = broken  # type: ignore[method-assign]
+        assert selector.flush() == 0
+        assert selector.dropped == 1
+
+
+def test_get_example_selector_is_shared_per_kg() -> None:
+    kg = _KG(_Graph())
+
+    first = get_example_selector(kg)
+    assert get_example_selector(kg) is first
+    assert get_example_selector(_KG(_Graph())) is not first
@@ -245,7 +245,7 @@ class TestUnifiedValidator:
 
         mock_kg = Mock()
 
-        with patch("src.analysis.cross_validation.CrossValidationSystem") as mock_cvs:
+        with patch("src.analysis.cross_validation.get_cross_validator") as mock_cvs:
             mock_validator_instance = Mock()
             mock_validator_instance._check_rule_compliance.return_value = {
                 "score": 1.0,
@@ -271,7 +271,7 @@ class TestUnifiedValidator:
 
         mock_kg = Mock()
 
-        with patch("src.analysis.cross_validation.CrossValidationSystem") as mock_cvs:
+        with patch("src.analysis.cross_validation.get_cross_validator") as mock_cvs:
             mock_validator_instance = Mock()
             mock_validator_instance._check_rule_compliance.return_value = {
                 "score": 0.7,
@@ -299,7 +299,7 @@ class TestUnifiedValidator:
 
         mock_kg = Mock()
 
-        with patch("src.analysis.cross_validation.CrossValidationSystem") as mock_cvs:
+        with patch("src.analysis.cross_validation.get_cross_validator") as mock_cvs:
             mock_cvs.side_effect = RuntimeError("KG error")
 
             validator = UnifiedValidator(kg=mock_kg)
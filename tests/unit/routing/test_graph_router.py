@@ -4,7 +4,6 @@ Covers:
 - GraphEnhancedRouter initialization and routing
 - _fetch_query_types() with exception handling
 - _build_router_prompt() prompt building
-- _log_routing() with exception handling
 - Fallback selection logic
 """
 
@@ -175,66 +174,6 @@ class TestBuildRouterPrompt:
         assert " ()" in prompt
 
 
-class TestLogRouting:
-    """Tests for _log_routing method."""
-
-    def test_log_routing_success(self) -> None:
-        """Test successful routing log."""
-        mock_kg = MagicMock()
-        mock_llm = MagicMock()
-        mock_session = MagicMock()
-        mock_graph = MagicMock()
-
-        mock_kg._graph = mock_graph
-        mock_graph.session.return_value.__enter__ = MagicMock(return_value=mock_session)
-        mock_graph.session.return_value.__exit__ = MagicMock(return_value=False)
-
-        router = GraphEnhancedRouter(kg=mock_kg, llm=mock_llm)
-        router._log_routing("test input", "explanation")
-
-        mock_session.run.assert_called_once()
-
-    def test_log_routing_no_graph(self) -> None:
-        """Test log routing when no graph available."""
-        mock_kg = MagicMock()
-        mock_llm = MagicMock()
-        mock_kg._graph = None
-
-        router = GraphEnhancedRouter(kg=mock_kg, llm=mock_llm)
-        # Should not raise
-        router._log_routing("test input", "explanation")
-
-    def test_log_routing_neo4j_error(self) -> None:
-        """Test log routing handles Neo4jError gracefully."""
-        mock_kg = MagicMock()
-        mock_llm = MagicMock()
-        mock_graph = MagicMock()
-
-        mock_kg._graph = mock_graph
-        mock_graph.session.return_value.__enter__ = MagicMock(
-            side_effect=Neo4jError("Write failed")
-        )
-
-        router = GraphEnhancedRouter(kg=mock_kg, llm=mock_llm)
-        # Should not raise
-        router._log_routing("test input", "explanation")
-
-    def test_log_routing_unknown_exception(self) -> None:
-        """Test log routing handles unknown exceptions gracefully."""
-        mock_kg = MagicMock()
-        mock_llm = MagicMock()
-        mock_graph = MagicMock()
-
-        mock_kg._graph = mock_graph
-        mock_graph.session.return_value.__enter__ = MagicMock(
-            side_effect=RuntimeError("Unexpected error")
-        )
-
-        router = GraphEnhancedRouter(kg=mock_kg, llm=mock_llm)
-        # Should not raise
-        router._log_routing("test input", "explanation")
-
-
 class TestRouteAndGenerate:
     """Tests for route_and_generate method."""
 
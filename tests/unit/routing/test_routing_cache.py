@@ -0,0 +1,187 @@
+"""Tests for cached, pre-classified and buffered routing."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from typing_extensions import Self
+
+from src.routing.graph_router import GraphEnhancedRouter
+from src.routing.preclassifier import KeywordRouteClassifier
+from src.routing.routing_log import RoutingLogWriter, RoutingStats
+
+QTYPES = [
+    {"name": "explanation", "korean": "전체 설명문", "limit": 1},
+    {"name": "summary", "korean": "전체 요약문", "limit": 1},
+    {"name": "reasoning", "korean": "추론 질의", "limit": 1},
+]
+
+
+class _Session:
+    def __init__(self, graph: _Graph) -> None:
+        self.graph = graph
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def run(self, query: str, **params: Any) -> list[dict[str, Any]]:
+        self.graph.queries.append(query)
+        if "MATCH (qt:QueryType)" in query:
+            return [dict(q) for q in self.graph.qtypes]
+        if "UNWIND $rows" in query:
+            self.graph.logged.extend(params["rows"])
+        return []
+
+
+class _Graph:
+    def __init__(self) -> None:
+        self.qtypes = list(QTYPES)
+        self.queries: list[str] = []
+        self.logged: list[dict[str, Any]] = []
+
+    def session(self) -> _Session:
+        return _Session(self)
+
+
+def _router(graph: _Graph, reply: str = "summary") -> GraphEnhancedRouter:
+    kg = MagicMock()
+    kg._graph = graph
+    llm = MagicMock()
+    llm.generate.return_value = reply
+    return GraphEnhancedRouter(kg=kg, llm=llm)
+
+
+class TestKeywordRouteClassifier:
+    """Test the local pre-classifier."""
+
+    def test_confident_match(self) -> None:
+        result = KeywordRouteClassifier(QTYPES).classify("금리 전망을 추론해 주세요")
+
+        assert result.choice == "reasoning"
+        assert result.confidence == 1.0
+
+    def test_ambiguous_or_unknown_defers_to_llm(self) -> None:
+        classifier = KeywordRouteClassifier(QTYPES)
+
+        mixed = classifier.classify("요약 말고 설명문으로")
+        assert mixed.choice is None
+        assert 0 < mixed.confidence < 1
+        assert classifier.classify("안녕하세요").choice is None
+
+    def test_only_registered_types(self) -> None:
+        classifier = KeywordRouteClassifier([{"name": "summary"}])
+
+        assert classifier.classify("금리 추론").choice is None
+
+
+class TestCachedRouting:
+    """Test QueryType caching, LLM skipping and buffered logs."""
+
+    def test_query_types_are_cached_until_invalidated(self) -> None:
+        graph = _Graph()
+        router = _router(graph)
+
+        for _ in range(3):
+            router.route_and_generate("안녕", {})
+        fetches = [q for q in graph.queries if "MATCH (qt:QueryType)" in q]
+        assert len(fetches) == 1
+
+        classifier = router._classifier
+        router.invalidate_query_types()
+        router.route_and_generate("안녕", {})
+        assert router._classifier is classifier  # same version, no rebuild
+
+        graph.qtypes.append({"name": "target", "korean": "이미지 내 타겟"})
+        router.invalidate_query_types()
+        router.route_and_generate("안녕", {})
+        assert router._classifier is not classifier
+
+    def test_keyword_match_skips_llm_and_buffers_log(self) -> None:
+        graph = _Graph()
+        router = _router(graph)
+
+        result = router.route_and_generate("물가 전망 추론", {"reasoning": str.upper})
+        router.route_and_generate("이건 뭐예요", {})
+
+        assert result == {
+            "choice": "reasoning",
+            "output": "물가 전망 추론",
+            "source": "keyword",
+        }
+        router.llm.generate.assert_called_once()  # type: ignore[attr-defined]
+        assert graph.logged == []
+        assert router.log_writer.pending() == 2
+
+        router.close()
+        assert [(r["chosen"], r["source"]) for r in graph.logged] == [
+            ("reasoning", "keyword"),
+            ("summary", "llm"),
+        ]
+        stats = router.stats.snapshot()
+        assert stats["requests"] == 2
+        assert stats["llm_skip_rate"] == 0.5
+
+    def test_async_route_awaits_handlers(self) -> None:
+        graph = _Graph()
+        router = _router(graph, reply="explanation")
+
+        async def handler(text: str) -> str:
+            return f"async:{text}"
+
+        result = asyncio.run(
+            router.aroute_and_generate("질문", {"explanation": handler})
+        )
+
+        assert result["choice"] == "explanation"
+        assert result["source"] == "llm"
+        assert result["output"] == "async:질문"
+
+
+class TestRoutingLogWriter:
+    """Test batching and failure handling."""
+
+    def test_flushes_when_batch_is_full(self) -> None:
+        graph = _Graph()
+        writer = RoutingLogWriter(graph.session, batch_size=2, flush_interval=60)
+
+        writer.add("a", "summary", "keyword")
+        writer.add("b", "summary", "keyword")
+        for _ in range(100):
+            if writer.written == 2:
+                break
+            time.sleep(0.01)
+
+        assert writer.written == 2
+        assert sum("UNWIND $rows" in q for q in graph.queries) == 1
+
+    def test_failures_drop_rows(self) -> None:
+        def broken() -> Any:
+            raise RuntimeError("down")
+
+        writer = RoutingLogWriter(broken, flush_interval=60)
+        writer.add("a", "summary", "llm")
+        assert writer.flush() == 0
+        assert writer.dropped == 1
+
+        no_graph = RoutingLogWriter(lambda: None, flush_interval=60)
+        no_graph.add("a", "summary", "llm")
+        no_graph.close()
+        assert no_graph.dropped == 1
+
+
+def test_routing_stats_percentiles() -> None:
+    stats = RoutingStats(window=100)
+    for i in range(1, 101):
+        stats.record(i / 1000, llm_skipped=i % 4 == 0)
+
+    snapshot = stats.snapshot()
+    assert snapshot["llm_skip_rate"] == 0.25
+    assert snapshot["latency_p50_ms"] == pytest.approx(51.0)
+    assert snapshot["latency_p99_ms"] == pytest.approx(100.0)
@@ -32,7 +32,18 @@ def test_compare_documents_helpers(monkeypatch: pytest.MonkeyPatch) -> None:
                     },
                     {"title": "Doc B", "total_blocks": 1, "types": ["paragraph"]},
                 ]
-            return [{"content": "공통 내용", "pages": ["Doc A", "Doc B"]}]
+            if "b.minhash_key AS minhash_key" in query:
+                return [
+                    {
+                        "title": title,
+                        "id": f"b-{title}",
+                        "content": "두 문서에 공통으로 들어 있는 내용입니다",
+                        "minhash": None,
+                        "minhash_key": None,
+                    }
+                    for title in ("Doc A", "Doc B")
+                ]
+            return []
 
     driver = types.SimpleNamespace(session=lambda: _CompareSession())
     structures = compare_documents.compare_structure(driver)
@@ -97,9 +108,18 @@ def test_compare_documents_main_flow(
                     },
                     {"title": "Page B", "total_blocks": 1, "types": ["paragraph"]},
                 ]
-            return [
-                {"content": "content text long enough", "pages": ["Page A", "Page B"]}
-            ]
+            if "b.minhash_key AS minhash_key" in query:
+                return [
+                    {
+                        "title": title,
+                        "id": f"b-{title}",
+                        "content": "content text long enough",
+                        "minhash": None,
+                        "minhash_key": None,
+                    }
+                    for title in ("Page A", "Page B")
+                ]
+            return []
 
     class _Driver:
         def session(self) -> _Session:
@@ -40,25 +40,26 @@ class TestSemanticAnalysisEndpoint:
         monkeypatch.setenv("NEO4J_PASSWORD", "password")
 
         mock_driver = MagicMock()
-        mock_blocks = [
-            {"id": "1", "content": "test content keyword"},
-            {"id": "2", "content": "another test"},
-        ]
-        mock_counter = MagicMock()
-        mock_counter.most_common.return_value = [("keyword", 3), ("test", 2)]
+        summary = {
+            "blocks_processed": 2,
+            "keywords": [("keyword", 3), ("test", 2)],
+            "links": 3,
+        }
 
         with (
             patch("neo4j.GraphDatabase.driver", return_value=mock_driver),
-            patch("src.analysis.semantic.fetch_blocks", return_value=mock_blocks),
-            patch("src.analysis.semantic.count_keywords", return_value=mock_counter),
-            patch("src.analysis.semantic.create_topics"),
-            patch("src.analysis.semantic.link_blocks_to_topics"),
+            patch(
+                "src.analysis.semantic.run_semantic_pipeline", return_value=summary
+            ) as pipeline,
         ):
             response = client.post("/api/analysis/semantic", params={"top_k": 10})
 
             assert response.status_code == 200
             data = response.json()
             assert data["status"] == "success"
+            assert data["links_created"] == 3
+            pipeline.assert_called_once_with(mock_driver, top_k=10)
+            mock_driver.close.assert_called_once()
 
     def test_semantic_no_blocks(
         self, client: TestClient, monkeypatch: pytest.MonkeyPatch
@@ -72,7 +73,10 @@ class TestSemanticAnalysisEndpoint:
 
         with (
             patch("neo4j.GraphDatabase.driver", return_value=mock_driver),
-            patch("src.analysis.semantic.fetch_blocks", return_value=[]),
+            patch(
+                "src.analysis.semantic.run_semantic_pipeline",
+                return_value={"blocks_processed": 0, "keywords": [], "links": 0},
+            ),
         ):
             response = client.post("/api/analysis/semantic")
 
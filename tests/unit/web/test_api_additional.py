@@ -41,26 +41,26 @@ def test_structured_logging_exception_handling() -> None:
 
 
 def test_get_request_id_with_request_id() -> None:
-    """Test _get_request_id extracts request_id from request.state."""
-    from src.web.api import _get_request_id
+    """Test get_request_id extracts request_id from request.state."""
+    from src.web.middleware import get_request_id
 
     # Mock request with request_id
     mock_request = Mock()
     mock_request.state.request_id = "test-request-id-123"
 
-    result = _get_request_id(mock_request)
+    result = get_request_id(mock_request)
     assert result == "test-request-id-123"
 
 
 def test_get_request_id_without_request_id() -> None:
-    """Test _get_request_id returns empty string when no request_id."""
-    from src.web.api import _get_request_id
+    """Test get_request_id returns empty string when no request_id."""
+    from src.web.middleware import get_request_id
 
     # Mock request without request_id
     mock_request = Mock()
     del mock_request.state.request_id  # Ensure it doesn't exist
 
-    result = _get_request_id(mock_request)
+    result = get_request_id(mock_request)
     assert result == ""
 
 
@@ -9,43 +9,39 @@ import pytest
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from starlette.requests import Request
-from starlette.responses import Response
 
 from src.web.api import (
-    _error_logging_middleware,
-    _get_request_id,
-    _log_api_error,
-    _request_id_middleware,
     app,
     get_config,
     init_resources,
 )
+from src.web.middleware import get_request_id, log_api_error
 
 
 class TestHelperFunctions:
     """Test helper functions."""
 
     def test_get_request_id_exists(self) -> None:
-        """Test _get_request_id when request_id exists."""
+        """Test get_request_id when request_id exists."""
         mock_request = MagicMock(spec=Request)
         mock_request.state.request_id = "test-request-123"
 
-        result = _get_request_id(mock_request)
+        result = get_request_id(mock_request)
 
         assert result == "test-request-123"
 
     def test_get_request_id_missing(self) -> None:
-        """Test _get_request_id when request_id is missing."""
+        """Test get_request_id when request_id is missing."""
         mock_request = MagicMock(spec=Request)
         mock_request.state = MagicMock()
         delattr(mock_request.state, "request_id")
 
-        result = _get_request_id(mock_request)
+        result = get_request_id(mock_request)
 
         assert result == ""
 
     def test_log_api_error(self) -> None:
-        """Test _log_api_error logs with proper context."""
+        """Test log_api_error logs with proper context."""
         mock_request = MagicMock(spec=Request)
         mock_request.state.request_id = "req-456"
         mock_request.url.path = "/api/test"
@@ -56,7 +52,7 @@ class TestHelperFunctions:
         mock_logger = MagicMock()
         test_exc = ValueError("Test error")
 
-        _log_api_error(
+        log_api_error(
             "Test message", request=mock_request, exc=test_exc, logger_obj=mock_logger
         )
 
@@ -68,79 +64,6 @@ class TestHelperFunctions:
         assert call_args[1]["extra"]["error_type"] == "ValueError"
 
 
-class TestMiddleware:
-    """Test middleware functions."""
-
-    @pytest.mark.asyncio
-    async def test_request_id_middleware_generates_id(self) -> None:
-        """Test _request_id_middleware generates request ID if missing."""
-        mock_request = MagicMock(spec=Request)
-        mock_request.headers.get.return_value = None
-        mock_request.state = MagicMock()
-
-        mock_response = MagicMock(spec=Response)
-        mock_response.headers = {}
-
-        async def mock_call_next(request: Request) -> Response:
-            return mock_response
-
-        result = await _request_id_middleware(mock_request, mock_call_next)
-
-        assert hasattr(mock_request.state, "request_id")
-        assert len(mock_request.state.request_id) > 0
-        assert "X-Request-Id" in result.headers
-
-    @pytest.mark.asyncio
-    async def test_request_id_middleware_uses_existing_id(self) -> None:
-        """Test _request_id_middleware uses existing header."""
-        mock_request = MagicMock(spec=Request)
-        mock_request.headers.get.return_value = "existing-id-789"
-        mock_request.state = MagicMock()
-
-        mock_response = MagicMock(spec=Response)
-        mock_response.headers = {}
-
-        async def mock_call_next(request: Request) -> Response:
-            return mock_response
-
-        result = await _request_id_middleware(mock_request, mock_call_next)
-
-        assert mock_request.state.request_id == "existing-id-789"
-        assert result.headers["X-Request-Id"] == "existing-id-789"
-
-    @pytest.mark.asyncio
-    async def test_error_logging_middleware_http_exception(self) -> None:
-        """Test _error_logging_middleware handles HTTPException."""
-        mock_request = MagicMock(spec=Request)
-        mock_request.state.request_id = "req-error-1"
-        mock_request.url.path = "/api/fail"
-        mock_request.method = "GET"
-
-        async def mock_call_next(request: Request) -> Response:
-            raise HTTPException(status_code=404, detail="Not found")
-
-        with pytest.raises(HTTPException) as exc_info:
-            await _error_logging_middleware(mock_request, mock_call_next)
-
-        assert exc_info.value.status_code == 404
-
-    @pytest.mark.asyncio
-    async def test_error_logging_middleware_generic_exception(self) -> None:
-        """Test _error_logging_middleware handles generic exceptions."""
-        mock_request = MagicMock(spec=Request)
-        mock_request.state.request_id = "req-error-2"
-        mock_request.url.path = "/api/crash"
-        mock_request.method = "POST"
-
-        async def mock_call_next(request: Request) -> Response:
-            raise ValueError("Unexpected error")
-
-        response = await _error_logging_middleware(mock_request, mock_call_next)
-
-        assert response.status_code == 500
-        # Response body should be JSON with error details
-
-
 class TestConfigInitialization:
     """Test configuration initialization."""
 
@@ -25,78 +25,6 @@ class TestGetLogFilePath:
         assert result.name == "app.log"
 
 
-class TestReadFileContent:
-    """Test _read_file_content function."""
-
-    @pytest.mark.asyncio
-    async def test_read_file_content(self, tmp_path: Path) -> None:
-        """Test reading file content asynchronously."""
-        from src.web.routers.logs_api import _read_file_content
-
-        test_file = tmp_path / "test.log"
-        test_content = "Line 1\nLine 2\nLine 3"
-        test_file.write_text(test_content, encoding="utf-8")
-
-        result = await _read_file_content(test_file)
-        assert result == test_content
-
-    @pytest.mark.asyncio
-    async def test_read_file_content_with_unicode(self, tmp_path: Path) -> None:
-        """Test reading file with unicode content."""
-        from src.web.routers.logs_api import _read_file_content
-
-        test_file = tmp_path / "test_unicode.log"
-        test_content = "한글 테스트\n日本語テスト"
-        test_file.write_text(test_content, encoding="utf-8")
-
-        result = await _read_file_content(test_file)
-        assert result == test_content
-
-
-class TestReadFileRange:
-    """Test _read_file_range function."""
-
-    @pytest.mark.asyncio
-    async def test_read_file_range(self, tmp_path: Path) -> None:
-        """Test reading a range of bytes from file."""
-        from src.web.routers.logs_api import _read_file_range
-
-        test_file = tmp_path / "test_range.log"
-        test_content = "0123456789ABCDEF"
-        test_file.write_text(test_content, encoding="utf-8")
-
-        result = await _read_file_range(test_file, 5, 10)
-        assert result == "56789"
-
-    @pytest.mark.asyncio
-    async def test_read_file_range_start_zero(self, tmp_path: Path) -> None:
-        """Test reading from start of file."""
-        from src.web.routers.logs_api import _read_file_range
-
-        test_file = tmp_path / "test_range2.log"
-        test_content = "Hello World"
-        test_file.write_text(test_content, encoding="utf-8")
-
-        result = await _read_file_range(test_file, 0, 5)
-        assert result == "Hello"
-
-
-class TestGetFileSize:
-    """Test _get_file_size function."""
-
-    @pytest.mark.asyncio
-    async def test_get_file_size(self, tmp_path: Path) -> None:
-        """Test getting file size asynchronously."""
-        from src.web.routers.logs_api import _get_file_size
-
-        test_file = tmp_path / "test_size.log"
-        test_content = "1234567890"
-        test_file.write_text(test_content, encoding="utf-8")
-
-        result = await _get_file_size(test_file)
-        assert result == 10
-
-
 class TestTailLogFile:
     """Test _tail_log_file function."""
 
@@ -150,7 +78,7 @@ class TestTailLogFile:
 
         test_file = tmp_path / "test_large.log"
         # Create file with more lines than buffer
-        test_content = "\n".join([f"Line {i}" for i in range(2000)])
+        test_content = "".join([f"Line {i}\n" for i in range(2000)])
         test_file.write_text(test_content, encoding="utf-8")
 
         mock_websocket = AsyncMock()
@@ -169,7 +97,9 @@ class TestTailLogFile:
         first_call = mock_websocket.send_json.call_args_list[0][0][0]
         assert first_call["type"] == "initial"
         assert len(first_call["lines"]) == 100  # Buffer size limit
-        assert first_call["total_lines"] == 2000
+        assert first_call["lines"][-1] == "Line 1999"
+        assert first_call["total_lines"] == 100
+        assert first_call["truncated"] is True
 
     @pytest.mark.asyncio
     async def test_tail_log_file_exception_handling(self, tmp_path: Path) -> None:
@@ -182,7 +112,7 @@ class TestTailLogFile:
         mock_websocket = AsyncMock()
 
         with patch(
-            "src.web.routers.logs_api._read_file_content",
+            "src.infra.log_tailer.read_last_lines",
             side_effect=PermissionError("Access denied"),
         ):
             await _tail_log_file(mock_websocket, test_file)
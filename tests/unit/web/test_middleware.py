@@ -0,0 +1,162 @@
+"""Tests for the pure ASGI web middlewares."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import patch
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.infra import telemetry
+from src.infra.telemetry import TraceSampler, configure_sampling
+from src.web.middleware import REQUEST_ID_HEADER, ObservabilityMiddleware
+from src.web.session import SessionManager, SessionMiddleware
+
+
+def _app(manager: SessionManager | None = None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str, request: Request) -> dict[str, Any]:
+        session = getattr(request.state, "session", None)
+        return {
+            "item_id": item_id,
+            "request_id": request.state.request_id,
+            "session_id": getattr(session, "session_id", None),
+        }
+
+    @app.get("/missing")
+    async def missing() -> None:
+        raise HTTPException(status_code=404, detail="Not found")
+
+    @app.get("/crash")
+    async def crash() -> None:
+        raise ValueError("Unexpected error")
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[str]:
+            for i in range(3):
+                yield f"data: {i}\n\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    if manager is not None:
+        app.add_middleware(SessionMiddleware, manager=manager)
+    app.add_middleware(ObservabilityMiddleware, slow_request_ms=10_000)
+    return app
+
+
+class TestObservabilityMiddleware:
+    """Test request-id, timing, error capture and metrics in one layer."""
+
+    def test_generates_and_propagates_request_id(self) -> None:
+        client = TestClient(_app())
+
+        response = client.get("/items/1")
+
+        request_id = response.headers[REQUEST_ID_HEADER]
+        assert len(request_id) == 32
+        assert response.json()["request_id"] == request_id
+        assert response.headers["X-Response-Time"].endswith("ms")
+
+    def test_reuses_incoming_request_id(self) -> None:
+        client = TestClient(_app())
+
+        response = client.get("/items/1", headers={REQUEST_ID_HEADER: "req-789"})
+
+        assert response.headers[REQUEST_ID_HEADER] == "req-789"
+        assert response.json()["request_id"] == "req-789"
+
+    def test_unhandled_exception_returns_json_500(self) -> None:
+        client = TestClient(_app(), raise_server_exceptions=False)
+
+        with patch("src.web.middleware.log_api_error") as mock_log:
+            response = client.get("/crash", headers={REQUEST_ID_HEADER: "req-err"})
+
+        assert response.status_code == 500
+        assert response.json() == {
+            "detail": "Internal server error",
+            "request_id": "req-err",
+        }
+        assert response.headers[REQUEST_ID_HEADER] == "req-err"
+        assert mock_log.call_args.kwargs["exc"].__class__ is ValueError
+
+    def test_records_route_template_labels(self) -> None:
+        client = TestClient(_app(), raise_server_exceptions=False)
+
+        with patch("src.web.middleware.record_http_request") as mock_record:
+            client.get("/items/1")
+            client.get("/items/2")
+            client.get("/missing")
+            client.get("/crash")
+
+        calls = [
+            (c.kwargs["route"], c.kwargs["status_code"])
+            for c in mock_record.call_args_list
+        ]
+        assert calls == [
+            ("/items/{item_id}", 200),
+            ("/items/{item_id}", 200),
+            ("/missing", 404),
+            ("/crash", 500),
+        ]
+
+    def test_root_span_is_named_by_route_template(self) -> None:
+        client = TestClient(_app())
+        replayed: list[list[list[Any]]] = []
+        configure_sampling(TraceSampler(0.0, tail_latency_ms=0))
+        try:
+            with patch.object(
+                telemetry, "_replay", lambda records, _reason: replayed.append(records)
+            ):
+                client.get("/items/1")
+                client.get("/items/2")
+        finally:
+            configure_sampling(None)
+
+        roots = [records[0] for records in replayed]
+        assert [r[0] for r in roots] == ["GET /items/{item_id}"] * 2
+        assert [r[1]["http.target"] for r in roots] == ["/items/1", "/items/2"]
+
+    def test_streaming_response_passes_through(self) -> None:
+        client = TestClient(_app())
+
+        with client.stream("GET", "/stream") as response:
+            chunks = list(response.iter_text())
+
+        assert "".join(chunks) == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+        assert REQUEST_ID_HEADER in response.headers
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+
+class TestSessionMiddleware:
+    """Test the pure ASGI session middleware."""
+
+    def test_creates_session_and_sets_cookie(self) -> None:
+        manager = SessionManager()
+        client = TestClient(_app(manager), base_url="https://testserver")
+
+        response = client.get("/items/1")
+
+        session_id = response.json()["session_id"]
+        assert session_id in manager._store
+        cookie = response.headers["set-cookie"]
+        assert f"session_id={session_id}" in cookie
+        assert "HttpOnly" in cookie
+        assert "SameSite=strict" in cookie
+
+    def test_reuses_session_from_header(self) -> None:
+        manager = SessionManager()
+        existing = manager.create()
+        client = TestClient(_app(manager))
+
+        response = client.get(
+            "/items/1",
+            headers={"X-Session-Id": existing.session_id},
+        )
+
+        assert response.json()["session_id"] == existing.session_id
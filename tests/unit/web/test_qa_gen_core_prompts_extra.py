@@ -42,10 +42,10 @@ def test_build_length_constraint_branches() -> None:
 def test_build_extra_instructions_inserts_fewshot(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    # Patch at the actual module where DynamicExampleSelector is used
+    # Patch at the actual module where the shared selector is looked up
     from src.qa.prompts import builders
 
-    monkeypatch.setattr(builders, "DynamicExampleSelector", _FakeSelector)
+    monkeypatch.setattr(builders, "get_example_selector", _FakeSelector)
     txt = prompts.build_extra_instructions("reasoning", "reasoning", kg=object())
     assert "example-reasoning" in txt
 
@@ -50,23 +50,42 @@ async def test_route_query_success(monkeypatch: pytest.MonkeyPatch) -> None:
         def __init__(self, kg: Any) -> None:
             self.kg = kg
 
-        def route_and_generate(
+        async def aroute_and_generate(
             self,
             user_input: str,
             handlers: dict[str, Any],
         ) -> dict[str, str]:
-            return {"choice": "summary"}
+            return {"choice": "summary", "source": "keyword"}
+
+        def close(self) -> None:
+            return None
 
     monkeypatch.setitem(
         sys.modules,
         "src.routing.graph_router",
         types.SimpleNamespace(GraphEnhancedRouter=_FakeRouter),
     )
-    monkeypatch.setattr("src.web.routers.qa_common.get_cached_kg", lambda: object())
+    monkeypatch.setattr(qa_tools, "_graph_router", None)
+    kg = object()
+    monkeypatch.setattr("src.web.routers.qa_common.get_cached_kg", lambda: kg)
 
     result = await qa_tools.route_query("hello")
     assert result["success"] is True
     assert result["data"]["chosen_type"] == "summary"
+    assert result["data"]["source"] == "keyword"
+
+    shared = qa_tools._graph_router
+    await qa_tools.route_query("again")
+    assert qa_tools._graph_router is shared
+
+
+@pytest.mark.asyncio
+async def test_route_stats_before_first_route(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(qa_tools, "_graph_router", None)
+
+    result = await qa_tools.route_stats()
+    assert result["data"]["requests"] == 0
+    assert result["data"]["llm_skip_rate"] == 0
 
 
 @pytest.mark.asyncio
@@ -95,3 +114,30 @@ async def test_suggest_next_query_type_success(monkeypatch: pytest.MonkeyPatch)
     result = await qa_tools.suggest_next_query_type(session="[]")
     assert result["success"] is True
     assert result["data"]["suggestions"] == ["reasoning"]
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_returns_index_suggestions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from src.features.prefix_index import Suggestion
+
+    class _FakeAutocomplete:
+        def __init__(self, _kg: Any) -> None:
+            pass
+
+        def suggest(self, prefix: str, limit: int = 10) -> list[Suggestion]:
+            return [Suggestion(prefix + "트", "rule_keyword", 2.0)][:limit]
+
+    monkeypatch.setitem(
+        sys.modules,
+        "src.features.autocomplete",
+        types.SimpleNamespace(SmartAutocomplete=_FakeAutocomplete),
+    )
+    monkeypatch.setattr("src.web.routers.qa_common.get_cached_kg", lambda: object())
+
+    result = await qa_tools.autocomplete(prefix="차", limit=5)
+    assert result["success"] is True
+    assert result["data"]["suggestions"] == [
+        {"text": "차트", "kind": "rule_keyword", "weight": 2.0}
+    ]